@@ -5,48 +5,269 @@ Main HTTPS function for real-time streaming responses.
 """
 
 import json
+import re
 import uuid
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from functools import cache
+from typing import Optional, TYPE_CHECKING
 from pathlib import Path
 
 from firebase_functions import https_fn, params, options
 from firebase_admin import firestore, auth
-from google import genai
-from google.genai import types
-from jinja2 import Environment, FileSystemLoader
-
-from models import (
-    Conversation,
-    Message,
-    MessageRole,
-    UserEntities,
-    UserHoroscopes,
-    UserProfile,
-    MemoryCollection,
-    CompressedHoroscope
-)
-from entity_extraction import get_top_entities_by_importance
-from posthog_utils import capture_llm_generation
 
 # Import shared secrets (centralized to avoid duplicate declarations)
 from firebase_secrets import GEMINI_API_KEY
+from stage_timer import StageTimer
 
 # Template path relative to this file - include both conversation and parent for voice.md
 TEMPLATES_BASE = Path(__file__).parent / 'templates'
 TEMPLATE_DIR = TEMPLATES_BASE / 'conversation'
-template_env = Environment(loader=FileSystemLoader([str(TEMPLATE_DIR), str(TEMPLATES_BASE)]))
+
+# models, google-genai and Jinja load on the first request, not at cold start
+if TYPE_CHECKING:
+    from models import CompressedHoroscope, Conversation, Entity, MemoryCollection, Message, UserProfile
+
+# Connections scanned for names mentioned in the question
+MAX_CONNECTIONS = 20
+
+# Entities included in the prompt
+MAX_ENTITIES = 15
+
+_CONTEXT_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ask-context")
+
+
+@cache
+def _template_env():
+    from jinja2 import Environment
+    from assets import template_loader
+    return Environment(loader=template_loader("templates/conversation", "templates"))
+
+
+# =============================================================================
+# Context loading
+# =============================================================================
+
+class ContextNotFound(LookupError):
+    """A document the question needs (user, horoscope) does not exist."""
+
+
+@dataclass
+class AskContext:
+    """Everything the prompt is rendered from."""
+    user_profile: "UserProfile"
+    horoscope_date: str
+    horoscope: "CompressedHoroscope"
+    top_entities: "list[Entity]"
+    memory: "MemoryCollection"
+    conversation: "Optional[Conversation]" = None
+    # Last PROMPT_MESSAGE_WINDOW messages of the conversation
+    conversation_messages: "list[Message]" = field(default_factory=list)
+    mentioned_connections: list[dict] = field(default_factory=list)
+
+
+def find_mentioned_connections(question: str, connections: list[dict]) -> list[dict]:
+    """
+    Connections whose name shares a word with the question.
+
+    "John" matches "John Smith" and vice versa; "Johnny" does not match "John".
+    """
+    question_words = set(re.findall(r'\b\w+\b', question.lower()))
+    mentioned = []
+    for conn in connections:
+        conn_name = (conn.get('name') or '').lower()
+        if conn_name and set(re.findall(r'\b\w+\b', conn_name)) & question_words:
+            mentioned.append(conn)
+    return mentioned
+
+
+def _query_connections(db, user_id: str) -> list[dict]:
+    docs = db.collection('users').document(user_id).collection('connections').limit(MAX_CONNECTIONS).get()
+    connections = []
+    for doc in docs:
+        conn = doc.to_dict()
+        conn['connection_id'] = doc.id
+        connections.append(conn)
+    return connections
+
+
+def _backfill_synastry_aspects(db, user_id: str, natal_chart: Optional[dict], connections: list[dict]) -> None:
+    """
+    Compute synastry_aspects for connections that predate the cached field.
+
+    calculate_and_cache_synastry stores them when a connection is created, so
+    this only runs once per older connection: the result is written back.
+    """
+    missing = [c for c in connections if not c.get('synastry_aspects') and c.get('birth_date')]
+    if not missing or not natal_chart:
+        return
+
+    from astro import NatalChartData, compute_birth_chart
+    from compatibility import calculate_synastry_aspects
+    from connections import format_synastry_aspects
+
+    user_chart = NatalChartData(**natal_chart)
+    for conn in missing:
+        try:
+            conn_chart_dict, _ = compute_birth_chart(
+                birth_date=conn['birth_date'],
+                birth_time=conn.get('birth_time'),
+                birth_timezone=conn.get('birth_timezone'),
+                birth_lat=conn.get('birth_lat'),
+                birth_lon=conn.get('birth_lon')
+            )
+            aspects = calculate_synastry_aspects(user_chart, NatalChartData(**conn_chart_dict))
+            conn['synastry_aspects'] = format_synastry_aspects(aspects)
+        except Exception as e:
+            print(f"[ask_the_stars] Failed to calc synastry for {conn.get('name')}: {e}")
+            continue
+
+        # Written off the request path; the next question reads the cached field
+        conn_ref = (
+            db.collection('users').document(user_id)
+            .collection('connections').document(conn['connection_id'])
+        )
+        _CONTEXT_EXECUTOR.submit(conn_ref.update, {'synastry_aspects': conn['synastry_aspects']})
+
+
+def load_ask_context(
+    db,
+    user_id: str,
+    question: str,
+    conversation_id: Optional[str] = None,
+    timer: Optional[StageTimer] = None
+) -> AskContext:
+    """
+    Load everything the prompt needs in one Firestore round-trip.
+
+    The user, horoscopes/latest, entities/index, memory and conversation
+    documents come from one batched get_all while the connections query and
+    the conversation's last messages query run alongside. Mentioned
+    connections use their cached synastry_aspects.
+
+    Args:
+        db: Firestore client
+        user_id: Asking user
+        question: The question (matched against connection names)
+        conversation_id: Conversation being continued (optional)
+        timer: Records the "reads", "connections" and "synastry" stages (optional)
+
+    Returns:
+        AskContext
+
+    Raises:
+        ContextNotFound: User or horoscopes/latest missing or empty, or
+            conversation_id is not one of the user's conversations
+    """
+    from models import (
+        CompressedHoroscope,
+        Conversation,
+        MemoryCollection,
+        UserEntities,
+        UserHoroscopes,
+        UserProfile,
+        create_empty_memory,
+    )
+    from entity_extraction import get_top_entities_by_importance
+    from entity_store import entity_index_ref, legacy_entities_ref, top_entities_from_index
+    from conversation_store import (
+        PROMPT_MESSAGE_WINDOW,
+        conversation_ref,
+        load_recent_messages,
+        message_window,
+    )
+
+    timer = timer or StageTimer()
+    user_ref = db.collection('users').document(user_id)
+    refs = {
+        'user': user_ref,
+        'horoscopes': user_ref.collection('horoscopes').document('latest'),
+        'entities': entity_index_ref(db, user_id),
+        # Users not migrated to the sharded entity store yet (entity_store.py)
+        'legacy_entities': legacy_entities_ref(db, user_id),
+        'memory': db.collection('memory').document(user_id),
+    }
+    if conversation_id:
+        refs['conversation'] = conversation_ref(db, conversation_id)
+
+    with timer.stage("reads"):
+        connections_future = _CONTEXT_EXECUTOR.submit(timer.timed("connections", _query_connections), db, user_id)
+        recent_future = None
+        if conversation_id:
+            recent_future = _CONTEXT_EXECUTOR.submit(
+                load_recent_messages, db, conversation_id, PROMPT_MESSAGE_WINDOW
+            )
+        snapshots = {snapshot.reference.path: snapshot for snapshot in db.get_all(list(refs.values()))}
+        docs = {
+            name: snapshots[ref.path] if ref.path in snapshots and snapshots[ref.path].exists else None
+            for name, ref in refs.items()
+        }
+
+        if docs['user'] is None:
+            raise ContextNotFound("User not found")
+        user_data = docs['user'].to_dict()
+        user_profile = UserProfile(**user_data)
+
+        if docs['horoscopes'] is None:
+            raise ContextNotFound("No horoscopes found")
+        horoscopes_data = UserHoroscopes(**docs['horoscopes'].to_dict())
+        if not horoscopes_data.horoscopes:
+            raise ContextNotFound("No horoscopes found")
+        # Use the most recent horoscope (sorted by date descending)
+        horoscope_date = sorted(horoscopes_data.horoscopes.keys(), reverse=True)[0]
+        horoscope = CompressedHoroscope(**horoscopes_data.horoscopes[horoscope_date])
+
+        top_entities = None
+        if docs['entities'] is not None:
+            top_entities = top_entities_from_index(docs['entities'].to_dict(), limit=MAX_ENTITIES)
+        if top_entities is None:
+            top_entities = []
+            if docs['legacy_entities'] is not None:
+                user_entities = UserEntities(**docs['legacy_entities'].to_dict())
+                top_entities = get_top_entities_by_importance(user_entities.entities, limit=MAX_ENTITIES)
+
+        if docs['memory'] is not None:
+            memory = MemoryCollection(**docs['memory'].to_dict())
+        else:
+            memory = create_empty_memory(user_id)
+
+        conversation = None
+        conversation_messages = []
+        if conversation_id:
+            if docs['conversation'] is None:
+                raise ContextNotFound("Conversation not found")
+            conversation = Conversation(**docs['conversation'].to_dict())
+            if conversation.user_id != user_id:
+                raise ContextNotFound("Conversation not found")
+            conversation_messages = message_window(conversation, recent_future.result(), PROMPT_MESSAGE_WINDOW)
+
+        mentioned_connections = find_mentioned_connections(question, connections_future.result())
+
+    with timer.stage("synastry"):
+        _backfill_synastry_aspects(db, user_id, user_data.get('natal_chart'), mentioned_connections)
+
+    return AskContext(
+        user_profile=user_profile,
+        horoscope_date=horoscope_date,
+        horoscope=horoscope,
+        top_entities=top_entities,
+        memory=memory,
+        conversation=conversation,
+        conversation_messages=conversation_messages,
+        mentioned_connections=mentioned_connections,
+    )
 
 
 def stream_ask_the_stars_response(
     question: str,
     horoscope_date: str,
-    user_profile: UserProfile,
-    horoscope: CompressedHoroscope,
+    user_profile: "UserProfile",
+    horoscope: "CompressedHoroscope",
     entities: list,
-    memory: MemoryCollection,
-    conversation_messages: list[Message],
+    memory: "MemoryCollection",
+    conversation_messages: "list[Message]",
     mentioned_connections: Optional[list] = None,
     posthog_api_key: Optional[str] = None,
     api_key: Optional[str] = None,
@@ -55,7 +276,11 @@ def stream_ask_the_stars_response(
     max_tokens: int = 500
 ):
     """Stream LLM response for Ask the Stars question (synchronous generator)."""
+    from google.genai import types
+    from posthog_utils import capture_llm_generation
+    from gemini_client import get_gemini_client
     import time
+
     start_time = time.time()
 
     # Get API key (same pattern as llm.py)
@@ -64,14 +289,14 @@ def stream_ask_the_stars_response(
     if not api_key:
         raise ValueError("GOOGLE_API_KEY or GEMINI_API_KEY not provided")
 
-    # Create client (same pattern as llm.py)
-    gemini_client = genai.Client(api_key=api_key)
+    # Shared client (same pattern as llm.py)
+    gemini_client = get_gemini_client(api_key)
 
     # Calculate age from birth date
     birth_year = int(user_profile.birth_date.split("-")[0])
     age = datetime.now().year - birth_year
 
-    template = template_env.get_template('ask_the_stars.j2')
+    template = _template_env().get_template('ask_the_stars.j2')
     prompt = template.render(
         user_first_name=user_profile.name.split()[0],  # Extract first name only
         sun_sign=user_profile.sun_sign,
@@ -172,6 +397,8 @@ def ask_the_stars(req: https_fn.Request) -> https_fn.Response:
     if req.method == "OPTIONS":
         return https_fn.Response(status=204)
 
+    timer = StageTimer()
+
     # Parse request
     try:
         body = req.get_json()
@@ -226,134 +453,18 @@ def ask_the_stars(req: https_fn.Request) -> https_fn.Response:
             headers={"Content-Type": "application/json"}
         )
 
-    # Fetch data (4-5 reads total)
-    db = firestore.client(database_id="(default)")
+    from models import Conversation, Message, MessageRole
+    from conversation_store import append_messages
 
+    db = firestore.client(database_id="(default)")
     try:
-        # 1. User profile
-        user_doc = db.collection('users').document(user_id).get()
-        if not user_doc.exists:
-            return https_fn.Response(
-                json.dumps({"error": "User not found"}),
-                status=404,
-                headers={"Content-Type": "application/json"}
-            )
-        user_data = user_doc.to_dict()
-        user_profile = UserProfile(**user_data)
-
-        # 2. Horoscope (compressed) - use most recent from latest document
-        horoscope_doc = db.collection('users').document(user_id).collection('horoscopes').document('latest').get()
-        if not horoscope_doc.exists:
-            return https_fn.Response(
-                json.dumps({"error": "No horoscopes found"}),
-                status=404,
-                headers={"Content-Type": "application/json"}
-            )
-        horoscopes_data = UserHoroscopes(**horoscope_doc.to_dict())
-        if not horoscopes_data.horoscopes:
-            return https_fn.Response(
-                json.dumps({"error": "No horoscopes found"}),
-                status=404,
-                headers={"Content-Type": "application/json"}
-            )
-        # Use the most recent horoscope (sorted by date descending)
-        from models import CompressedHoroscope
-        latest_date = sorted(horoscopes_data.horoscopes.keys(), reverse=True)[0]
-        horoscope = CompressedHoroscope(**horoscopes_data.horoscopes[latest_date])
-
-        # 3. Entities
-        entities_doc = db.collection('users').document(user_id).collection('entities').document('all').get()
-        if entities_doc.exists:
-            user_entities = UserEntities(**entities_doc.to_dict())
-            top_entities = get_top_entities_by_importance(user_entities.entities, limit=15)
-        else:
-            top_entities = []
-
-        # 3b. Connections - check if question mentions any connection names
-        connections_ref = db.collection('users').document(user_id).collection('connections')
-        connections_docs = connections_ref.limit(20).get()
-        all_connections = []
-        mentioned_connections = []
-
-        # Normalize question for matching (lowercase, split into words)
-        import re
-        question_lower = question.lower()
-        question_words = set(re.findall(r'\b\w+\b', question_lower))
-
-        for doc in connections_docs:
-            conn_data = doc.to_dict()
-            conn_data['connection_id'] = doc.id
-            all_connections.append(conn_data)
-
-            # Check if connection name (or any part of it) appears in question
-            # This handles "John" matching "John Smith" and vice versa
-            conn_name = conn_data.get('name', '').lower()
-            if not conn_name:
-                continue
-
-            conn_name_words = set(re.findall(r'\b\w+\b', conn_name))
-
-            # Match if ANY word from connection name appears in question
-            # This catches "John" in "What about John?" or "Johnny" won't match "John"
-            if conn_name_words & question_words:  # Set intersection
-                mentioned_connections.append(conn_data)
-
-        # 3c. Calculate synastry aspects for mentioned connections on-the-fly
-        if mentioned_connections and user_data.get('natal_chart'):
-            from astro import NatalChartData, compute_birth_chart
-            from compatibility import calculate_synastry_aspects
-
-            user_chart = NatalChartData(**user_data['natal_chart'])
-
-            for conn in mentioned_connections:
-                # Skip if already has cached synastry_aspects
-                if conn.get('synastry_aspects'):
-                    continue
-
-                # Calculate on-the-fly if not cached
-                if conn.get('birth_date'):
-                    try:
-                        conn_chart_dict, _ = compute_birth_chart(
-                            birth_date=conn['birth_date'],
-                            birth_time=conn.get('birth_time'),
-                            birth_timezone=conn.get('birth_timezone'),
-                            birth_lat=conn.get('birth_lat'),
-                            birth_lon=conn.get('birth_lon')
-                        )
-                        conn_chart = NatalChartData(**conn_chart_dict)
-                        aspects = calculate_synastry_aspects(user_chart, conn_chart)
-
-                        # Get top 5 tightest aspects
-                        sorted_aspects = sorted(aspects, key=lambda a: a.orb)[:5]
-                        conn['synastry_aspects'] = [
-                            {
-                                "user_planet": asp.user_planet,
-                                "their_planet": asp.their_planet,
-                                "aspect_type": asp.aspect_type,
-                                "is_harmonious": asp.is_harmonious
-                            }
-                            for asp in sorted_aspects
-                        ]
-                        print(f"[ask_the_stars] Synastry calculated for {conn.get('name')}: {conn['synastry_aspects']}")
-                    except Exception as e:
-                        print(f"[ask_the_stars] Failed to calc synastry for {conn.get('name')}: {e}")
-
-        # 4. Memory
-        memory_doc = db.collection('memory').document(user_id).get()
-        if memory_doc.exists:
-            memory = MemoryCollection(**memory_doc.to_dict())
-        else:
-            from models import create_empty_memory
-            memory = create_empty_memory(user_id)
-
-        # 5. Conversation (optional)
-        conversation_messages = []
-        if conversation_id:
-            conv_doc = db.collection('conversations').document(conversation_id).get()
-            if conv_doc.exists:
-                conversation = Conversation(**conv_doc.to_dict())
-                conversation_messages = conversation.messages
-
+        context = load_ask_context(db, user_id, question, conversation_id, timer=timer)
+    except ContextNotFound as e:
+        return https_fn.Response(
+            json.dumps({"error": str(e)}),
+            status=404,
+            headers={"Content-Type": "application/json"}
+        )
     except Exception as e:
         return https_fn.Response(
             json.dumps({"error": f"Failed to fetch data: {str(e)}"}),
@@ -361,20 +472,24 @@ def ask_the_stars(req: https_fn.Request) -> https_fn.Response:
             headers={"Content-Type": "application/json"}
         )
 
+    latest_date = context.horoscope_date
+
     # Stream response
     def generate():
         full_response = ""
         for chunk in stream_ask_the_stars_response(
             question=question,
             horoscope_date=latest_date,
-            user_profile=user_profile,
-            horoscope=horoscope,
-            entities=top_entities,
-            memory=memory,
-            conversation_messages=conversation_messages,
-            mentioned_connections=mentioned_connections,
+            user_profile=context.user_profile,
+            horoscope=context.horoscope,
+            entities=context.top_entities,
+            memory=context.memory,
+            conversation_messages=context.conversation_messages,
+            mentioned_connections=context.mentioned_connections,
             api_key=GEMINI_API_KEY.value
         ):
+            if "first_chunk" not in timer.timings_ms:
+                timer.mark("first_chunk")
             chunk_data = json.loads(chunk.split('data: ')[1])
             full_response += chunk_data.get('text', '')
             yield chunk
@@ -394,26 +509,22 @@ def ask_the_stars(req: https_fn.Request) -> https_fn.Response:
             timestamp=datetime.now().isoformat()
         )
 
-        # Create or update conversation
+        # Create the conversation or append to it
         if not conversation_id:
-            new_conversation_id = f"conv_{uuid.uuid4().hex[:8]}"
             conversation = Conversation(
-                conversation_id=new_conversation_id,
+                conversation_id=f"conv_{uuid.uuid4().hex[:8]}",
                 user_id=user_id,
                 horoscope_date=latest_date,
-                messages=[user_message, assistant_message],
                 created_at=datetime.now().isoformat(),
                 updated_at=datetime.now().isoformat()
             )
-            db.collection('conversations').document(new_conversation_id).set(conversation.model_dump())
-            final_conversation_id = new_conversation_id
+            append_messages(db, conversation, [user_message, assistant_message], create=True)
         else:
-            conversation_messages.extend([user_message, assistant_message])
-            db.collection('conversations').document(conversation_id).update({
-                'messages': [m.model_dump() for m in conversation_messages],
-                'updated_at': datetime.now().isoformat()
-            })
-            final_conversation_id = conversation_id
+            conversation = context.conversation
+            append_messages(db, conversation, [user_message, assistant_message])
+        final_conversation_id = conversation.conversation_id
+
+        print(f"[ask_the_stars] user={user_id} stages_ms={timer.finish()}")
 
         # Done event
         yield f"data: {json.dumps({'type': 'done', 'conversation_id': final_conversation_id, 'message_id': assistant_message.message_id})}\n\n"
@@ -0,0 +1,275 @@
+"""
+Prebuilt bundle of the static label, profile and template files.
+
+Meter and group labels, word banks, headline examples, sun sign profiles,
+compatibility and relationship labels and the Jinja templates are ~60 small
+files, each read and JSON-parsed on first use. build_assets.py compiles them
+into one zlib-compressed bundle (JSON files parsed and validated, sun sign
+profiles checked against SunSignProfile, templates parsed by Jinja), so an
+instance reads a single file and parses it once. The bundle is built on
+deploy (firebase.json predeploy), so deployed instances always have a
+current one.
+
+load_json() returns frozen structures (FrozenDict, tuples) shared by every
+caller in the process; copy them before changing anything. Without a bundle
+(local development) assets are read from their source files, so an edited
+label is picked up on the next process start without a rebuild. A bundle
+built from other sources than the ones on disk is still served: rebuild it
+after editing labels (tests/unit/test_assets.py flags a stale bundle).
+
+Usage:
+    from assets import load_json, template_loader
+
+    labels = load_json("astrometers/labels/clarity.json")
+    env = Environment(loader=template_loader("templates"))
+"""
+
+import hashlib
+import json
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+ASSET_ROOT = Path(__file__).parent
+
+# Bump when the bundle layout changes; bundles of other versions are ignored
+ASSET_BUNDLE_VERSION = 1
+ASSET_BUNDLE_PATH = ASSET_ROOT / f"assets_v{ASSET_BUNDLE_VERSION}.bundle"
+
+# Source files compiled into the bundle (globs relative to ASSET_ROOT)
+ASSET_SOURCES = (
+    "astrometers/labels/*.json",
+    "astrometers/labels/groups/*.json",
+    "signs/*.json",
+    "compatibility_labels/labels/*.json",
+    "compatibility_labels/labels/*/*.json",
+    "relationships/labels.json",
+    "templates/*.md",
+    "templates/*/*.j2",
+)
+
+_BUNDLE_MAGIC = b"ARCA-ASSETS\n"
+
+_BUNDLE: Optional[Dict[str, Any]] = None
+_BUNDLE_LOADED = False
+_BUNDLE_LOCK = threading.Lock()
+
+# Source-file fallback, parsed once per process
+_SOURCE_CACHE: Dict[str, Any] = {}
+
+
+class FrozenDict(dict):
+    """Read-only dict (still a dict for isinstance, json and Pydantic)."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Asset data is read-only; copy it before changing it")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        # copy / deepcopy / pickle produce a plain (mutable) dict
+        return (dict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to FrozenDict and lists to tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def _key(path: str | Path) -> str:
+    path = Path(path)
+    if path.is_absolute():
+        path = path.relative_to(ASSET_ROOT)
+    return path.as_posix()
+
+
+def source_paths(root: Path = ASSET_ROOT) -> List[str]:
+    """Relative paths of every file ASSET_SOURCES matches, sorted."""
+    return sorted({
+        path.relative_to(root).as_posix()
+        for pattern in ASSET_SOURCES
+        for path in root.glob(pattern)
+        if path.is_file()
+    })
+
+
+def sources_sha256(root: Path = ASSET_ROOT) -> str:
+    """Hash of the source files' paths and bytes (to detect a stale bundle)."""
+    digest = hashlib.sha256()
+    for relative in source_paths(root):
+        digest.update(relative.encode() + b"\0")
+        digest.update((root / relative).read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+def _validate(relative: str, content: Any) -> None:
+    """Build-time checks beyond JSON parsing."""
+    if relative.startswith("signs/"):
+        from astro import SunSignProfile
+        SunSignProfile(**content)
+    elif relative.endswith(".j2"):
+        from jinja2 import Environment
+        Environment().parse(content)
+
+
+def build_asset_bundle(path: str | Path = ASSET_BUNDLE_PATH, root: Path = ASSET_ROOT) -> Path:
+    """
+    Compile the asset source files into one bundle.
+
+    This is a build step, run via build_assets.py before deploying. Raises
+    if a JSON file does not parse, a sun sign profile does not validate or a
+    template does not compile, so a broken asset fails the build instead of
+    the first request that reads it.
+
+    Args:
+        path: Output bundle path
+        root: Directory the ASSET_SOURCES globs are relative to
+
+    Returns:
+        Path of the written bundle
+    """
+    files = {}
+    for relative in source_paths(root):
+        text = (root / relative).read_text()
+        content = json.loads(text) if relative.endswith(".json") else text
+        try:
+            _validate(relative, content)
+        except Exception as e:
+            raise ValueError(f"Invalid asset {relative}: {e}") from e
+        files[relative] = content
+
+    payload = json.dumps({
+        "version": ASSET_BUNDLE_VERSION,
+        "source_sha256": sources_sha256(root),
+        "files": files,
+    }, separators=(",", ":"), ensure_ascii=False).encode()
+
+    path = Path(path)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(_BUNDLE_MAGIC + zlib.compress(payload, 9))
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_asset_bundle(path: str | Path = ASSET_BUNDLE_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Read and decode a bundle.
+
+    Returns:
+        {"version", "source_sha256", "files"} (files frozen), or None if the
+        bundle is missing, corrupt or of another ASSET_BUNDLE_VERSION
+    """
+    try:
+        raw = Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+
+    try:
+        if not raw.startswith(_BUNDLE_MAGIC):
+            raise ValueError("bad header")
+        bundle = json.loads(zlib.decompress(raw[len(_BUNDLE_MAGIC):]))
+    except (ValueError, zlib.error) as e:
+        print(f"Warning: Ignoring asset bundle {path}: {e}")
+        return None
+
+    if bundle.get("version") != ASSET_BUNDLE_VERSION:
+        print(f"Warning: Ignoring asset bundle {path} (version {bundle.get('version')})")
+        return None
+
+    bundle["files"] = {k: freeze(v) for k, v in bundle["files"].items()}
+    return bundle
+
+
+def _load_bundle() -> Optional[Dict[str, Any]]:
+    """Read the bundle once per process (None if not built)."""
+    global _BUNDLE, _BUNDLE_LOADED
+
+    if _BUNDLE_LOADED:
+        return _BUNDLE
+
+    with _BUNDLE_LOCK:
+        if not _BUNDLE_LOADED:
+            _BUNDLE = read_asset_bundle(ASSET_BUNDLE_PATH)
+            _BUNDLE_LOADED = True
+
+    return _BUNDLE
+
+
+def clear_asset_cache() -> None:
+    """Forget the loaded bundle and parsed source files (tests, rebuilds)."""
+    global _BUNDLE, _BUNDLE_LOADED
+    with _BUNDLE_LOCK:
+        _BUNDLE = None
+        _BUNDLE_LOADED = False
+        _SOURCE_CACHE.clear()
+
+
+def _load(path: str | Path) -> Any:
+    key = _key(path)
+    bundle = _load_bundle()
+    if bundle is not None and key in bundle["files"]:
+        return bundle["files"][key]
+
+    if key not in _SOURCE_CACHE:
+        text = (ASSET_ROOT / key).read_text()
+        _SOURCE_CACHE[key] = freeze(json.loads(text)) if key.endswith(".json") else text
+    return _SOURCE_CACHE[key]
+
+
+def asset_exists(path: str | Path) -> bool:
+    """Whether an asset is in the bundle or on disk."""
+    key = _key(path)
+    bundle = _load_bundle()
+    if bundle is not None and key in bundle["files"]:
+        return True
+    return (ASSET_ROOT / key).is_file()
+
+
+def load_json(path: str | Path) -> Any:
+    """
+    Parsed JSON asset, frozen and shared by every caller.
+
+    Args:
+        path: Path relative to the functions directory (or absolute under it)
+
+    Raises:
+        FileNotFoundError: Asset is neither bundled nor on disk
+    """
+    return _load(path)
+
+
+def load_text(path: str | Path) -> str:
+    """Text asset (templates, voice.md); same lookup as load_json()."""
+    return _load(path)
+
+
+def template_loader(*search_dirs: str):
+    """
+    Jinja loader for templates under `search_dirs` (relative to ASSET_ROOT).
+
+    Serves the bundled sources when a bundle is loaded; otherwise a plain
+    FileSystemLoader, so templates edited during development reload.
+    """
+    from jinja2 import FileSystemLoader, FunctionLoader
+
+    if _load_bundle() is None:
+        return FileSystemLoader([str(ASSET_ROOT / d) for d in search_dirs])
+
+    files = _load_bundle()["files"]
+
+    def load(name: str):
+        for directory in search_dirs:
+            key = f"{directory}/{name}"
+            if key in files:
+                return files[key], str(ASSET_ROOT / key), lambda: True
+        return None
+
+    return FunctionLoader(load)
@@ -1,12 +1,19 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Literal, Optional, Tuple
-from natal import Data
-from datetime import datetime
+from typing import Callable, Literal, Optional, Tuple
+from datetime import date as date_type, datetime, timedelta
+from abc import ABC, abstractmethod
 from enum import Enum
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cache
+import os
 import re
 import json
+import threading
 from pathlib import Path
 
+import numpy as np
+
 
 class ZodiacSign(str, Enum):
     """Zodiac sign enumeration."""
@@ -589,10 +596,14 @@ def get_sun_sign(birth_date: str) -> ZodiacSign:
         return ZodiacSign.PISCES
 
 
+@cache
 def get_sun_sign_profile(sun_sign: ZodiacSign) -> Optional[SunSignProfile]:
     """
     Load comprehensive sun sign profile from JSON file.
 
+    Validated once per sign per process; every caller shares the returned
+    profile, so treat it as read-only.
+
     Args:
         sun_sign: ZodiacSign enum value
 
@@ -609,18 +620,14 @@ def get_sun_sign_profile(sun_sign: ZodiacSign) -> Optional[SunSignProfile]:
         >>> profile.domain_profiles.love_and_relationships.style
         'Direct, passionate, spontaneous'
     """
-    # Path to signs directory (relative to this file, within functions/)
-    signs_dir = Path(__file__).parent / "signs"
-    sign_file = signs_dir / f"{sun_sign.value}.json"
+    from assets import asset_exists, load_json
 
-    if not sign_file.exists():
+    sign_file = f"signs/{sun_sign.value}.json"
+    if not asset_exists(sign_file):
         return None
 
     try:
-        # Read and parse JSON file
-        content = sign_file.read_text()
-        data = json.loads(content)
-        return SunSignProfile(**data)
+        return SunSignProfile(**load_json(sign_file))
     except Exception:
         # Return None if any parsing errors occur
         return None
@@ -655,6 +662,9 @@ def get_astro_chart(
         >>> print(chart.angles.ascendant.sign)
         'virgo'
     """
+    # natal (and its ephemeris) loads on the first chart, not at import
+    from natal import Data
+
     # Create natal Data object - this calculates everything automatically
     data = Data(
         name="User",
@@ -949,6 +959,433 @@ def compute_birth_chart(
     return chart.model_dump(mode='json'), exact_chart
 
 
+# =============================================================================
+# Shared Sky Cache (Transit Charts)
+# =============================================================================
+#
+# Every user's transit chart for a given day is computed from the same inputs
+# (noon UTC at 0,0), so it only needs to be computed once per date. The sky
+# cache keeps recent dates in a bounded per-instance LRU and can optionally be
+# backed by a persistent store (Firestore `sky/{date}` or a local directory)
+# shared by every instance of the deployment.
+#
+# Charts handed out by the cache are shared between callers: treat them as
+# read-only.
+
+# Bump when the chart dict format changes so persisted entries are recomputed
+SKY_CACHE_VERSION = 1
+
+# Dates kept per instance (today, yesterday, the 7-day look-ahead, plus slack)
+SKY_CACHE_MAX_DATES = 32
+
+
+class SkyStore(ABC):
+    """
+    Persistent tier behind the in-memory sky cache.
+
+    Implementations return None on a miss and must never raise: a failing
+    store only costs a recomputation.
+    """
+
+    @abstractmethod
+    def get(self, date: str) -> Optional[dict]:
+        """Return the stored transit chart dict for a date, or None."""
+
+    @abstractmethod
+    def put(self, date: str, chart: dict) -> None:
+        """Store the transit chart dict for a date."""
+
+
+class FileSkyStore(SkyStore):
+    """
+    Sky store backed by one JSON file per date in a local directory.
+
+    Useful for local runs, benchmarks and the writable /tmp of a Cloud
+    Functions instance.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+
+    def _path(self, date: str) -> Path:
+        return self.directory / f"sky_v{SKY_CACHE_VERSION}_{date}.json"
+
+    def get(self, date: str) -> Optional[dict]:
+        try:
+            data = json.loads(self._path(date).read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def put(self, date: str, chart: dict) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(date)
+            # Write-then-rename so concurrent readers never see a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(chart))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not persist sky chart for {date}: {e}")
+
+
+class FirestoreSkyStore(SkyStore):
+    """
+    Sky store backed by Firestore documents at `sky/{date}`.
+
+    Takes a client factory rather than a client so the Firestore client is only
+    created when the cache actually misses.
+    """
+
+    def __init__(self, client_factory: Callable, collection: str = "sky"):
+        self._client_factory = client_factory
+        self.collection = collection
+
+    def get(self, date: str) -> Optional[dict]:
+        try:
+            doc = self._client_factory().collection(self.collection).document(date).get()
+            if not doc.exists:
+                return None
+            data = doc.to_dict()
+        except Exception as e:
+            print(f"Warning: Could not read sky/{date}: {e}")
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != SKY_CACHE_VERSION:
+            return None
+        chart = data.get("chart")
+        return chart if isinstance(chart, dict) else None
+
+    def put(self, date: str, chart: dict) -> None:
+        try:
+            self._client_factory().collection(self.collection).document(date).set({
+                "date": date,
+                "version": SKY_CACHE_VERSION,
+                "chart": chart,
+                "computed_at": datetime.now().isoformat(),
+            })
+        except Exception as e:
+            print(f"Warning: Could not write sky/{date}: {e}")
+
+
+class SkyCache:
+    """
+    Bounded LRU of transit charts keyed by date, with an optional persistent tier.
+
+    Lookup order: in-memory LRU -> persistent store -> compute_birth_chart().
+    Thread-safe; two threads missing the same date may both compute it, and
+    the first result stored wins.
+    """
+
+    def __init__(self, maxsize: int = SKY_CACHE_MAX_DATES, store: Optional[SkyStore] = None):
+        self.maxsize = maxsize
+        self.store = store
+        self._lock = threading.Lock()
+        self._charts: OrderedDict[str, dict] = OrderedDict()
+        self._models: dict[str, NatalChartData] = {}
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def _lookup(self, date: str) -> Optional[dict]:
+        with self._lock:
+            chart = self._charts.get(date)
+            if chart is not None:
+                self._charts.move_to_end(date)
+                self.hits += 1
+            return chart
+
+    def _insert(self, date: str, chart: dict) -> dict:
+        with self._lock:
+            existing = self._charts.get(date)
+            if existing is not None:
+                self._charts.move_to_end(date)
+                return existing
+            self._charts[date] = chart
+            while len(self._charts) > self.maxsize:
+                evicted, _ = self._charts.popitem(last=False)
+                self._models.pop(evicted, None)
+            return chart
+
+    def get_chart(self, date: str) -> dict:
+        """
+        Get the transit chart dict for a date (YYYY-MM-DD).
+
+        Raises:
+            ValueError: If date is not a valid YYYY-MM-DD string
+        """
+        date = datetime.strptime(date, "%Y-%m-%d").strftime("%Y-%m-%d")
+
+        chart = self._lookup(date)
+        if chart is not None:
+            return chart
+
+        if self.store is not None:
+            chart = self.store.get(date)
+            if chart is not None:
+                with self._lock:
+                    self.store_hits += 1
+                return self._insert(date, chart)
+
+        chart, _ = compute_birth_chart(birth_date=date, birth_time="12:00")
+        with self._lock:
+            self.misses += 1
+        chart = self._insert(date, chart)
+
+        if self.store is not None:
+            self.store.put(date, chart)
+
+        return chart
+
+    def get_chart_data(self, date: str) -> NatalChartData:
+        """Get the transit chart for a date as a validated NatalChartData model."""
+        chart = self.get_chart(date)
+        with self._lock:
+            model = self._models.get(date)
+        if model is None:
+            model = NatalChartData(**chart)
+            with self._lock:
+                if date in self._charts:
+                    self._models[date] = model
+        return model
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the persistent store is untouched)."""
+        with self._lock:
+            self._charts.clear()
+            self._models.clear()
+            self.hits = self.store_hits = self.misses = 0
+
+
+_SKY_CACHE = SkyCache()
+
+
+def get_transit_chart(date: str) -> dict:
+    """
+    Get the shared transit chart for a date.
+
+    Equivalent to compute_birth_chart(date, birth_time="12:00")[0], but each
+    date is computed once per instance (and, with a persistent store
+    configured, once per deployment). The returned dict is shared: do not
+    mutate it.
+
+    Args:
+        date: Date string "YYYY-MM-DD"
+
+    Returns:
+        Transit chart as NatalChartData dict
+
+    Example:
+        >>> transit = get_transit_chart("2025-10-17")
+        >>> transit is get_transit_chart("2025-10-17")
+        True
+    """
+    return _SKY_CACHE.get_chart(date)
+
+
+def get_transit_chart_data(date: str) -> NatalChartData:
+    """
+    Get the shared transit chart for a date as a NatalChartData model.
+
+    Args:
+        date: Date string "YYYY-MM-DD"
+
+    Returns:
+        NatalChartData for the transit chart (shared, do not mutate)
+    """
+    return _SKY_CACHE.get_chart_data(date)
+
+
+def configure_sky_cache(
+    store: Optional[SkyStore] = None,
+    maxsize: Optional[int] = None
+) -> SkyCache:
+    """
+    Configure the process-wide sky cache.
+
+    Args:
+        store: Persistent tier (FirestoreSkyStore, FileSkyStore) or None for memory only
+        maxsize: Max dates kept in memory (default SKY_CACHE_MAX_DATES)
+
+    Returns:
+        The configured SkyCache
+    """
+    with _SKY_CACHE._lock:
+        _SKY_CACHE.store = store
+        if maxsize is not None:
+            _SKY_CACHE.maxsize = maxsize
+    return _SKY_CACHE
+
+
+def clear_sky_cache() -> None:
+    """Clear the in-memory sky cache (mainly for tests)."""
+    _SKY_CACHE.clear()
+
+
+# =============================================================================
+# Precomputed Ephemeris Table (Transit Positions)
+# =============================================================================
+#
+# Transit lookups only need planet positions, not the full chart (houses,
+# aspects, distributions). build_ephemeris_table() precomputes the noon UTC
+# (0,0) transit positions for every day in EPHEMERIS_START..EPHEMERIS_END into
+# a float32 .npy file of shape [day, body, field]. get_transit_positions()
+# reads it through a memory map, so a lookup is an index, not an ephemeris call.
+#
+# Fields hold the values exactly as get_astro_chart() rounds them (2 decimals
+# for degrees, 4 for speed), which float32 represents losslessly at these
+# magnitudes, so rows rebuild the same planet dicts as compute_birth_chart().
+# A body the ephemeris did not return for a day is stored as NaN and left out
+# of that day's chart, as compute_birth_chart() leaves it out.
+#
+# The table is built on deploy (firebase.json predeploy runs build_ephemeris.py)
+# and is not committed.
+
+EPHEMERIS_VERSION = 1
+EPHEMERIS_START = date_type(1900, 1, 1)
+EPHEMERIS_END = date_type(2100, 12, 31)
+EPHEMERIS_BODIES = [p.value for p in Planet]
+EPHEMERIS_FIELDS = ("absolute_degree", "speed", "degree_in_sign", "house", "retrograde")
+EPHEMERIS_TABLE_PATH = Path(__file__).parent / "ephemeris" / f"sky_noon_v{EPHEMERIS_VERSION}.npy"
+
+_SIGNS_IN_ORDER = list(ZodiacSign)
+_ELEMENTS_IN_ORDER = [Element.FIRE, Element.EARTH, Element.AIR, Element.WATER]
+_MODALITIES_IN_ORDER = [Modality.CARDINAL, Modality.FIXED, Modality.MUTABLE]
+
+_EPHEMERIS_TABLE = None
+_EPHEMERIS_LOADED = False
+_EPHEMERIS_LOCK = threading.Lock()
+
+
+def build_ephemeris_table(
+    path: str | Path = EPHEMERIS_TABLE_PATH,
+    start: date_type = EPHEMERIS_START,
+    end: date_type = EPHEMERIS_END
+) -> Path:
+    """
+    Precompute daily transit positions into a memory-mappable .npy table.
+
+    This is a build step (it calls the ephemeris once per day in the range),
+    run via build_ephemeris.py before deploying.
+
+    Args:
+        path: Output .npy path
+        start: First date in the table (must be EPHEMERIS_START to be served)
+        end: Last date in the table (inclusive)
+
+    Returns:
+        Path of the written table
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    days = (end - start).days + 1
+    body_index = {name: i for i, name in enumerate(EPHEMERIS_BODIES)}
+
+    tmp_path = path.with_suffix(".tmp.npy")
+    table = np.lib.format.open_memmap(
+        tmp_path,
+        mode="w+",
+        dtype=np.float32,
+        shape=(days, len(EPHEMERIS_BODIES), len(EPHEMERIS_FIELDS))
+    )
+    table[:] = np.nan
+
+    for day in range(days):
+        current = start + timedelta(days=day)
+        chart, _ = compute_birth_chart(current.strftime("%Y-%m-%d"), birth_time="12:00")
+        for planet in chart["planets"]:
+            table[day, body_index[planet["name"]]] = (
+                planet["absolute_degree"],
+                planet["speed"],
+                planet["degree_in_sign"],
+                planet["house"],
+                1.0 if planet["retrograde"] else 0.0,
+            )
+        if current.month == 1 and current.day == 1:
+            print(f"  {current.year}")
+
+    table.flush()
+    del table
+    os.replace(tmp_path, path)
+    return path
+
+
+def _load_ephemeris_table():
+    """Memory-map the ephemeris table once per process (None if not built)."""
+    global _EPHEMERIS_TABLE, _EPHEMERIS_LOADED
+
+    if _EPHEMERIS_LOADED:
+        return _EPHEMERIS_TABLE
+
+    with _EPHEMERIS_LOCK:
+        if not _EPHEMERIS_LOADED:
+            try:
+                table = np.load(EPHEMERIS_TABLE_PATH, mmap_mode="r")
+                if table.shape[1:] != (len(EPHEMERIS_BODIES), len(EPHEMERIS_FIELDS)):
+                    print(f"Warning: Ephemeris table has unexpected shape {table.shape}, ignoring")
+                    table = None
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ephemeris table not loaded ({e}), computing transit charts")
+                table = None
+            _EPHEMERIS_TABLE = table
+            _EPHEMERIS_LOADED = True
+
+    return _EPHEMERIS_TABLE
+
+
+def get_transit_positions(date: str) -> Optional[dict]:
+    """
+    Get transit planet positions for a date from the precomputed table.
+
+    Returns a light transit chart: a dict with only `datetime_utc` and
+    `planets`, each planet carrying the same name/sign/degree/speed/house/
+    retrograde/element/modality values as compute_birth_chart() would. This
+    is everything aspect detection and astrometers read from a transit chart.
+
+    Args:
+        date: Date string "YYYY-MM-DD"
+
+    Returns:
+        Light transit chart dict, or None if the table is not built or does
+        not cover the date (callers fall back to get_transit_chart()).
+
+    Raises:
+        ValueError: If date is not a valid YYYY-MM-DD string
+
+    Example:
+        >>> transit = get_transit_positions("2025-10-17") or get_transit_chart("2025-10-17")
+        >>> aspects = find_natal_transit_aspects(natal, transit)
+    """
+    day = (datetime.strptime(date, "%Y-%m-%d").date() - EPHEMERIS_START).days
+
+    table = _load_ephemeris_table()
+    if table is None or not 0 <= day < table.shape[0]:
+        return None
+
+    rows = np.asarray(table[day], dtype=np.float64).tolist()
+    planets = []
+    for name, (absolute_degree, speed, degree_in_sign, house, retrograde) in zip(EPHEMERIS_BODIES, rows):
+        if np.isnan(absolute_degree):
+            continue  # Not returned by the ephemeris for this day
+        absolute_degree = round(absolute_degree, 2)
+        degree_in_sign = round(degree_in_sign, 2)
+        # Sign start = absolute - in-sign degree (robust to the 29.99 clamps)
+        sign_index = round((absolute_degree - degree_in_sign) / 30) % 12
+        planets.append({
+            "name": name,
+            "sign": _SIGNS_IN_ORDER[sign_index].value,
+            "degree_in_sign": degree_in_sign,
+            "absolute_degree": absolute_degree,
+            "house": int(house),
+            "speed": round(speed, 4),
+            "retrograde": retrograde >= 0.5,
+            "element": _ELEMENTS_IN_ORDER[sign_index % 4].value,
+            "modality": _MODALITIES_IN_ORDER[sign_index % 3].value,
+        })
+
+    return {"datetime_utc": f"{date} 12:00", "planets": planets}
+
+
 def calculate_solar_house(sun_sign: str, transit_sign: str) -> House:
     """
     Calculate the Solar House for a transiting planet using whole sign houses.
@@ -1658,6 +2095,208 @@ class NatalTransitAspect(BaseModel):
         return AspectType(v.lower())
 
 
+# Major aspects checked between natal and transit planets: angle, meaning
+NATAL_TRANSIT_ASPECTS = {
+    AspectType.CONJUNCTION: (0, "fusion of energies"),
+    AspectType.SEXTILE: (60, "opportunity"),
+    AspectType.SQUARE: (90, "tension requiring action"),
+    AspectType.TRINE: (120, "natural flow"),
+    AspectType.OPPOSITION: (180, "awareness through contrast")
+}
+
+_ASPECT_TYPES = list(NATAL_TRANSIT_ASPECTS)
+_ASPECT_ANGLES = np.array([deg for deg, _ in NATAL_TRANSIT_ASPECTS.values()], dtype=np.float64)
+
+
+@dataclass(frozen=True)
+class NatalTransitArrays:
+    """
+    Raw natal-transit aspect hits as parallel NumPy arrays.
+
+    One entry per (natal planet, transit planet, aspect) within the orb, in
+    natal x transit x aspect order. Index natal_planets/transit_planets with
+    natal_idx/transit_idx and _ASPECT_TYPES with aspect_idx.
+    """
+    natal_planets: list[dict]
+    transit_planets: list[dict]
+    orb: float
+    natal_idx: np.ndarray
+    transit_idx: np.ndarray
+    aspect_idx: np.ndarray
+    angle_diff: np.ndarray
+    applying: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.angle_diff)
+
+    def within(self, orb: float) -> "NatalTransitArrays":
+        """Hits within a tighter orb (same order, no recomputation)."""
+        if orb >= self.orb:
+            return self
+        keep = self.angle_diff <= orb
+        return NatalTransitArrays(
+            natal_planets=self.natal_planets,
+            transit_planets=self.transit_planets,
+            orb=orb,
+            natal_idx=self.natal_idx[keep],
+            transit_idx=self.transit_idx[keep],
+            aspect_idx=self.aspect_idx[keep],
+            angle_diff=self.angle_diff[keep],
+            applying=self.applying[keep],
+        )
+
+    def aspect_type(self, hit: int) -> AspectType:
+        return _ASPECT_TYPES[self.aspect_idx[hit]]
+
+    def priority(self, hit: int) -> int:
+        """calculate_aspect_priority() for one hit."""
+        natal_planet = self.natal_planets[self.natal_idx[hit]]
+        transit_planet = self.transit_planets[self.transit_idx[hit]]
+        transit_planet_enum = Planet(transit_planet["name"])
+        speed_enum, _ = analyze_planet_speed(transit_planet_enum, transit_planet["speed"])
+        return calculate_aspect_priority(
+            transit_planet_enum,
+            Planet(natal_planet["name"]),
+            self.aspect_type(hit),
+            float(self.angle_diff[hit]),
+            bool(self.applying[hit]),
+            speed_enum,
+            natal_house=natal_planet["house"],
+            transit_house=transit_planet["house"],
+            transit_retrograde=transit_planet["retrograde"],
+            transit_sign=ZodiacSign(transit_planet["sign"])
+        )
+
+    def priorities(self) -> list[int]:
+        """calculate_aspect_priority() for every hit."""
+        return [self.priority(hit) for hit in range(len(self))]
+
+    def ranked(
+        self,
+        sort_by_priority: bool = True,
+        priorities: Optional[list[int]] = None
+    ) -> list[int]:
+        """
+        Hit indices in find_natal_transit_aspects() order.
+
+        By priority (highest first, then tightest rounded orb) or by rounded orb.
+        Pass precomputed priorities to avoid scoring hits twice.
+        """
+        orbs = [round(d, 2) for d in self.angle_diff.tolist()]
+        if sort_by_priority:
+            if priorities is None:
+                priorities = self.priorities()
+            return sorted(range(len(orbs)), key=lambda h: (-priorities[h], orbs[h]))
+        return sorted(range(len(orbs)), key=lambda h: orbs[h])
+
+
+def compute_natal_transit_arrays(
+    natal_chart: dict,
+    transit_chart: dict,
+    orb: float = 3.0
+) -> NatalTransitArrays:
+    """
+    Compute all natal-transit aspect hits within an orb, vectorized.
+
+    Builds the natal x transit angular separation matrix once and tests all
+    five major aspects against it in one pass. Callers that only need numbers
+    (astrometers) can read the arrays directly; find_natal_transit_aspects()
+    materializes NatalTransitAspect objects from them.
+
+    Args:
+        natal_chart: Natal chart dict from compute_birth_chart()
+        transit_chart: Transit chart dict (full or from get_transit_positions())
+        orb: Maximum orb in degrees
+
+    Returns:
+        NatalTransitArrays with one entry per hit
+    """
+    # Same de-duplication by name as the dict lookups used elsewhere
+    natal_planets = list({p["name"]: p for p in natal_chart["planets"]}.values())
+    transit_planets = list({p["name"]: p for p in transit_chart["planets"]}.values())
+
+    natal_deg = np.array([p["absolute_degree"] for p in natal_planets], dtype=np.float64)
+    natal_speed = np.array([p.get("speed", 0) for p in natal_planets], dtype=np.float64)
+    transit_deg = np.array([p["absolute_degree"] for p in transit_planets], dtype=np.float64)
+    transit_speed = np.array([p["speed"] for p in transit_planets], dtype=np.float64)
+
+    # Separation in [0, 180] for every natal x transit pair
+    diff = np.abs(np.mod(transit_deg[None, :] - natal_deg[:, None], 360))
+    diff = np.where(diff > 180, 360 - diff, diff)
+
+    # Distance from each exact aspect angle: [natal, transit, aspect]
+    angle_diff = np.abs(diff[:, :, None] - _ASPECT_ANGLES[None, None, :])
+    natal_idx, transit_idx, aspect_idx = np.nonzero(angle_diff <= orb)
+
+    # Simplified: if transit is moving faster, it's applying
+    applying = transit_speed[transit_idx] > natal_speed[natal_idx]
+
+    return NatalTransitArrays(
+        natal_planets=natal_planets,
+        transit_planets=transit_planets,
+        orb=orb,
+        natal_idx=natal_idx,
+        transit_idx=transit_idx,
+        aspect_idx=aspect_idx,
+        angle_diff=angle_diff[natal_idx, transit_idx, aspect_idx],
+        applying=applying,
+    )
+
+
+def natal_transit_aspects_from_arrays(
+    arrays: NatalTransitArrays,
+    sort_by_priority: bool = True
+) -> list[NatalTransitAspect]:
+    """Materialize NatalTransitAspect objects for precomputed hits."""
+    aspects_found = []
+    priorities = arrays.priorities()
+
+    for hit in arrays.ranked(sort_by_priority, priorities):
+        natal_planet = arrays.natal_planets[arrays.natal_idx[hit]]
+        transit_planet = arrays.transit_planets[arrays.transit_idx[hit]]
+        aspect_type = arrays.aspect_type(hit)
+        exact_deg, meaning = NATAL_TRANSIT_ASPECTS[aspect_type]
+        angle_diff = float(arrays.angle_diff[hit])
+
+        speed_enum, speed_desc = analyze_planet_speed(
+            Planet(transit_planet["name"]),
+            transit_planet["speed"]
+        )
+
+        # Check critical degrees
+        natal_critical = check_critical_degrees(
+            natal_planet["degree_in_sign"], ZodiacSign(natal_planet["sign"])
+        )
+        transit_critical = check_critical_degrees(
+            transit_planet["degree_in_sign"], ZodiacSign(transit_planet["sign"])
+        )
+
+        aspects_found.append(
+            NatalTransitAspect(
+                natal_planet=natal_planet["name"],
+                natal_sign=natal_planet["sign"],
+                natal_degree=natal_planet["absolute_degree"],
+                natal_house=natal_planet["house"],
+                transit_planet=transit_planet["name"],
+                transit_sign=transit_planet["sign"],
+                transit_degree=transit_planet["absolute_degree"],
+                transit_speed=speed_enum,
+                transit_speed_description=speed_desc,
+                aspect_type=aspect_type,
+                exact_degree=exact_deg,
+                orb=round(angle_diff, 2),
+                applying=bool(arrays.applying[hit]),
+                meaning=meaning,
+                priority_score=priorities[hit],
+                # Convert critical degree tuples to serializable format
+                natal_critical_degrees=[(cd.value, desc) for cd, desc in natal_critical],
+                transit_critical_degrees=[(cd.value, desc) for cd, desc in transit_critical]
+            )
+        )
+
+    return aspects_found
+
+
 def find_natal_transit_aspects(
     natal_chart: dict,
     transit_chart: dict,
@@ -1693,102 +2332,8 @@ def find_natal_transit_aspects(
         ...     print(f"Priority {top.priority_score}: {top.transit_planet.value} {top.aspect_type.value} natal {top.natal_planet.value}")
         'Priority 85: saturn square natal sun'
     """
-    aspects_found = []
-
-    # Create lookup dicts
-    natal_planets = {p["name"]: p for p in natal_chart["planets"]}
-    transit_planets = {p["name"]: p for p in transit_chart["planets"]}
-
-    # Major aspects to check
-    aspect_definitions = {
-        AspectType.CONJUNCTION: (0, "fusion of energies"),
-        AspectType.SEXTILE: (60, "opportunity"),
-        AspectType.SQUARE: (90, "tension requiring action"),
-        AspectType.TRINE: (120, "natural flow"),
-        AspectType.OPPOSITION: (180, "awareness through contrast")
-    }
-
-    for natal_name, natal_planet in natal_planets.items():
-        for transit_name, transit_planet in transit_planets.items():
-            natal_deg = natal_planet["absolute_degree"]
-            transit_deg = transit_planet["absolute_degree"]
-
-            for aspect_type, (exact_deg, meaning) in aspect_definitions.items():
-                # Calculate angle difference
-                diff = abs((transit_deg - natal_deg) % 360)
-                if diff > 180:
-                    diff = 360 - diff
-
-                angle_diff = abs(diff - exact_deg)
-
-                if angle_diff <= orb:
-                    # Determine if applying or separating
-                    # Simplified: if transit is moving faster, it's applying
-                    applying = transit_planet["speed"] > natal_planet.get("speed", 0)
-
-                    # Analyze transit speed
-                    transit_planet_enum = Planet(transit_name)
-                    speed_enum, speed_desc = analyze_planet_speed(
-                        transit_planet_enum,
-                        transit_planet["speed"]
-                    )
-
-                    # Calculate priority score with all modifiers
-                    natal_planet_enum = Planet(natal_name)
-                    transit_sign_enum = ZodiacSign(transit_planet["sign"])
-                    priority = calculate_aspect_priority(
-                        transit_planet_enum,
-                        natal_planet_enum,
-                        aspect_type,
-                        angle_diff,
-                        applying,
-                        speed_enum,
-                        natal_house=natal_planet["house"],
-                        transit_house=transit_planet["house"],
-                        transit_retrograde=transit_planet["retrograde"],
-                        transit_sign=transit_sign_enum
-                    )
-
-                    # Check critical degrees
-                    natal_deg_in_sign = natal_planet["degree_in_sign"]
-                    natal_sign_enum = ZodiacSign(natal_planet["sign"])
-                    natal_critical = check_critical_degrees(natal_deg_in_sign, natal_sign_enum)
-
-                    transit_deg_in_sign = transit_planet["degree_in_sign"]
-                    transit_sign_enum = ZodiacSign(transit_planet["sign"])
-                    transit_critical = check_critical_degrees(transit_deg_in_sign, transit_sign_enum)
-
-                    # Convert critical degree tuples to serializable format
-                    natal_critical_list = [(cd.value, desc) for cd, desc in natal_critical]
-                    transit_critical_list = [(cd.value, desc) for cd, desc in transit_critical]
-
-                    aspects_found.append(
-                        NatalTransitAspect(
-                            natal_planet=natal_name,
-                            natal_sign=natal_planet["sign"],
-                            natal_degree=natal_deg,
-                            natal_house=natal_planet["house"],
-                            transit_planet=transit_name,
-                            transit_sign=transit_planet["sign"],
-                            transit_degree=transit_deg,
-                            transit_speed=speed_enum,
-                            transit_speed_description=speed_desc,
-                            aspect_type=aspect_type,
-                            exact_degree=exact_deg,
-                            orb=round(angle_diff, 2),
-                            applying=applying,
-                            meaning=meaning,
-                            priority_score=priority,
-                            natal_critical_degrees=natal_critical_list,
-                            transit_critical_degrees=transit_critical_list
-                        )
-                    )
-
-    # Sort by priority (highest first) or orb (tightest first)
-    if sort_by_priority:
-        return sorted(aspects_found, key=lambda x: (-x.priority_score, x.orb))
-    else:
-        return sorted(aspects_found, key=lambda x: x.orb)
+    arrays = compute_natal_transit_arrays(natal_chart, transit_chart, orb=orb)
+    return natal_transit_aspects_from_arrays(arrays, sort_by_priority=sort_by_priority)
 
 
 def synthesize_critical_degrees(transit_chart: dict) -> dict:
@@ -2256,7 +2801,8 @@ def get_speed_timing_details(planet: Planet, daily_motion: float, orb: float) ->
 def format_transit_summary_for_ui(
     natal_chart: dict,
     transit_chart: dict,
-    max_aspects: int = 5
+    max_aspects: int = 5,
+    context=None
 ) -> dict:
     """
     Create a formatted transit summary perfect for UI display with enhanced visuals.
@@ -2273,6 +2819,7 @@ def format_transit_summary_for_ui(
         natal_chart: Natal chart dict
         transit_chart: Transit chart dict
         max_aspects: Maximum number of aspects to return (default 5)
+        context: Optional DailyContext for this natal chart/date (reuses its aspects)
 
     Returns:
         Dict with formatted transit data ready for JSON serialization
@@ -2285,7 +2832,10 @@ def format_transit_summary_for_ui(
         "⚡⚡⚡ Saturn square natal Sun (0.5° orb) - PEAK INFLUENCE"
     """
     # Find all natal-transit aspects
-    aspects = find_natal_transit_aspects(natal_chart, transit_chart, orb=3.0, sort_by_priority=True)
+    if context is not None:
+        aspects = context.aspects(orb=3.0, sort_by_priority=True)
+    else:
+        aspects = find_natal_transit_aspects(natal_chart, transit_chart, orb=3.0, sort_by_priority=True)
 
     # Top priority transits with enhanced visuals and timing
     priority_transits = []
@@ -2560,7 +3110,8 @@ class UpcomingTransit(BaseModel):
 def get_upcoming_transits(
     natal_chart: dict,
     start_date: str,
-    days_ahead: int = 7
+    days_ahead: int = 7,
+    context=None
 ) -> list[UpcomingTransit]:
     """
     Calculate significant transits over the next N days, showing active and upcoming.
@@ -2575,6 +3126,7 @@ def get_upcoming_transits(
         natal_chart: Natal chart dict from compute_birth_chart()
         start_date: Starting date (YYYY-MM-DD) - typically today
         days_ahead: Number of days to look ahead (default 7)
+        context: Optional DailyContext for this natal chart (reuses its per-date aspects)
 
     Returns:
         List of all UpcomingTransit objects found in the period
@@ -2587,15 +3139,16 @@ def get_upcoming_transits(
     """
     from datetime import datetime, timedelta
 
+    def aspects_on(date_str: str) -> list[NatalTransitAspect]:
+        if context is not None:
+            return context.aspects(orb=2.0, date=date_str)
+        return find_natal_transit_aspects(natal_chart, get_transit_chart(date_str), orb=2.0)
+
     base_date = datetime.strptime(start_date, "%Y-%m-%d")
 
     # Get yesterday's aspects to determine what's new vs ongoing
     yesterday_date = base_date - timedelta(days=1)
-    yesterday_chart, _ = compute_birth_chart(
-        yesterday_date.strftime("%Y-%m-%d"),
-        birth_time="12:00"
-    )
-    yesterday_aspects = find_natal_transit_aspects(natal_chart, yesterday_chart, orb=2.0)
+    yesterday_aspects = aspects_on(yesterday_date.strftime("%Y-%m-%d"))
     yesterday_keys = {
         (a.transit_planet, a.aspect_type, a.natal_planet)
         for a in yesterday_aspects
@@ -2609,8 +3162,7 @@ def get_upcoming_transits(
         check_date = base_date + timedelta(days=day_offset)
         check_date_str = check_date.strftime("%Y-%m-%d")
 
-        check_chart, _ = compute_birth_chart(check_date_str, birth_time="12:00")
-        aspects = find_natal_transit_aspects(natal_chart, check_chart, orb=2.0)
+        aspects = aspects_on(check_date_str)
 
         for aspect in aspects:
             transit_key = (aspect.transit_planet, aspect.aspect_type, aspect.natal_planet, day_offset)
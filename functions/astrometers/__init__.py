@@ -5,50 +5,71 @@ Implements the dual-metric scoring system (DTI and HQS) for measuring
 the intensity and quality of astrological transits.
 """
 
-# Import only what exists (will expand as we implement more modules)
-from .dignity import calculate_dignity_score
-from .weightage import calculate_weightage, calculate_chart_ruler, get_weightage_breakdown
-from .transit_power import (
-    calculate_angular_separation,
-    detect_aspect,
-    calculate_orb_factor,
-    calculate_transit_power_basic,
-    get_aspect_strength_label,
-    get_direction_modifier,
-    calculate_station_modifier,
-    calculate_transit_power_complete,
-    get_aspect_direction_status,
-)
-from .quality import calculate_quality_factor, get_quality_label
-from .core import (
-    TransitAspect,
-    AspectContribution,
-    AstrometerScore,
-    calculate_aspect_contribution,
-    calculate_astrometers,
-    get_score_breakdown_text,
-)
-from .normalization import (
-    MeterInterpretation,
-    normalize_with_soft_ceiling,
-    normalize_intensity,
-    normalize_harmony,
-    normalize_meters,
-    get_intensity_label,
-    get_harmony_label,
-    get_meter_interpretation,
-)
-# Import new 17-meter system
-from .meters import (
-    MeterReading,
-    AllMetersReading,
-    get_meters,
-    METER_CONFIGS,
-)
-from .summary import daily_meters_summary
+from importlib import import_module
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from .meters import AllMetersReading
 
-def get_meter_list(all_meters: AllMetersReading) -> list:
+# Public name -> submodule. Submodules load on first attribute access, so
+# `from astrometers.hierarchy import ...` (models.py) does not pull in the
+# scoring stack (astro, NumPy, rich) at cold start.
+_EXPORTS = {
+    "calculate_dignity_score": ".dignity",
+    "calculate_weightage": ".weightage",
+    "calculate_chart_ruler": ".weightage",
+    "get_weightage_breakdown": ".weightage",
+    "calculate_angular_separation": ".transit_power",
+    "detect_aspect": ".transit_power",
+    "calculate_orb_factor": ".transit_power",
+    "calculate_transit_power_basic": ".transit_power",
+    "get_aspect_strength_label": ".transit_power",
+    "get_direction_modifier": ".transit_power",
+    "calculate_station_modifier": ".transit_power",
+    "calculate_transit_power_complete": ".transit_power",
+    "get_aspect_direction_status": ".transit_power",
+    "calculate_quality_factor": ".quality",
+    "get_quality_label": ".quality",
+    "TransitAspect": ".core",
+    "AspectContribution": ".core",
+    "AstrometerScore": ".core",
+    "calculate_aspect_contribution": ".core",
+    "calculate_astrometers": ".core",
+    "get_score_breakdown_text": ".core",
+    "MeterInterpretation": ".normalization",
+    "normalize_with_soft_ceiling": ".normalization",
+    "normalize_intensity": ".normalization",
+    "normalize_harmony": ".normalization",
+    "normalize_meters": ".normalization",
+    "get_intensity_label": ".normalization",
+    "get_harmony_label": ".normalization",
+    "get_meter_interpretation": ".normalization",
+    "MeterReading": ".meters",
+    "AllMetersReading": ".meters",
+    "get_meters": ".meters",
+    "get_meters_range": ".meters",
+    "METER_CONFIGS": ".meters",
+    "build_scoring_profile": ".profile",
+    "usable_scoring_profile": ".profile",
+    "shared_day_cache": ".shared_cache",
+    "clear_shared_day_caches": ".shared_cache",
+    "daily_meters_summary": ".summary",
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+def get_meter_list(all_meters: "AllMetersReading") -> list:
     """
     Extract all 17 meters from AllMetersReading as a list.
 
@@ -127,7 +148,14 @@ __all__ = [
     "MeterReading",
     "AllMetersReading",
     "get_meters",
+    "get_meters_range",
     "METER_CONFIGS",
+    # Natal scoring profile
+    "build_scoring_profile",
+    "usable_scoring_profile",
+    # Cross-user cache for approximate charts
+    "shared_day_cache",
+    "clear_shared_day_caches",
     # Summary and helpers
     "daily_meters_summary",
     "get_meter_list",
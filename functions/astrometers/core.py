@@ -21,10 +21,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
+import numpy as np
 from astro import Planet, AspectType, ZodiacSign
 from .weightage import calculate_weightage
 from .transit_power import calculate_transit_power_complete, calculate_gaussian_score
 from .quality import calculate_quality_factor
+from .noise import cosmic_background, cosmic_dither
 
 
 @dataclass
@@ -59,6 +61,9 @@ class TransitAspect:
     # V2: Transit speed for Gaussian scoring (degrees/day)
     transit_speed: Optional[float] = None
 
+    # Precomputed W_i from the user's natal scoring profile (skips calculate_weightage)
+    weightage: Optional[float] = None
+
     # Optional metadata
     label: Optional[str] = None  # e.g., "Transit Saturn square Natal Sun"
 
@@ -138,14 +143,16 @@ def calculate_aspect_contribution(aspect: TransitAspect) -> AspectContribution:
         AspectContribution with detailed breakdown (both V1 and V2 fields)
     """
     # Calculate W_i (Weightage Factor) - used by both V1 and V2
-    weightage = calculate_weightage(
-        planet=aspect.natal_planet,
-        sign=aspect.natal_sign,
-        house_number=aspect.natal_house,
-        degree_in_sign=aspect.natal_degree_in_sign or 0.0,
-        ascendant_sign=aspect.ascendant_sign,
-        sensitivity=aspect.sensitivity
-    )
+    weightage = aspect.weightage
+    if weightage is None:
+        weightage = calculate_weightage(
+            planet=aspect.natal_planet,
+            sign=aspect.natal_sign,
+            house_number=aspect.natal_house,
+            degree_in_sign=aspect.natal_degree_in_sign or 0.0,
+            ascendant_sign=aspect.ascendant_sign,
+            sensitivity=aspect.sensitivity
+        )
 
     # V1: Calculate P_i (Transit Power) - static orb-based
     transit_power, _ = calculate_transit_power_complete(
@@ -273,24 +280,13 @@ def get_cosmic_background(natal_chart_hash: int, date_ordinal: int, meter_name:
         - intensity: 1.0-3.0 (small, won't overpower sensitive meters like 'flow' P50=4.2)
         - polarity: -0.4 to +0.4 (mild bias, never radical)
     """
-    import random
-
-    # Create LOCAL deterministic generator (don't pollute global random state)
-    # Combining chart hash + date + meter ensures:
-    # - Same person + same day + same meter = Same background (Deterministic)
+    # Counter-based hash of chart + date + meter (see noise.py) ensures:
+    # - Same person + same day + same meter = Same background, on every instance
     # - Different person or day or meter = Different background
-    seed_value = natal_chart_hash + date_ordinal + hash(meter_name) % 10000
-    rng = random.Random(seed_value)
-
-    # Intensity: The "Hum" (1.0-3.0 range)
-    # Kept low to not overpower sensitive meters
-    intensity = 1.0 + (rng.random() * 2.0)
-
-    # Polarity: The "Drift" (-0.4 to +0.4)
-    # Avoid +/- 1.0 to ensure background is never "radical"
-    polarity = rng.uniform(-0.4, 0.4)
-
-    return intensity, polarity
+    # Intensity: The "Hum" (1.0-3.0 range), kept low to not overpower sensitive meters
+    # Polarity: The "Drift" (-0.4 to +0.4), never "radical"
+    intensity, polarity = cosmic_background(natal_chart_hash, date_ordinal, meter_name)
+    return float(intensity[0]), float(polarity[0])
 
 
 def get_cosmic_dither(natal_chart_hash: int, date_ordinal: int, meter_name: str = "") -> float:
@@ -305,17 +301,11 @@ def get_cosmic_dither(natal_chart_hash: int, date_ordinal: int, meter_name: str
         meter_name: Name of meter (for per-meter variation)
 
     Returns:
-        Dither value in range -5 to +5 (applied to unified score before post-sigmoid)
+        Dither value in range -8 to +8 (applied to unified score before post-sigmoid)
     """
-    import random
-
-    # Create LOCAL deterministic generator
-    seed_value = natal_chart_hash + date_ordinal + hash(meter_name) % 10000
-    rng = random.Random(seed_value)
-
     # Dither: -8 to +8 range (will be scaled by proximity to neutral)
     # Applied to raw_unified before post-sigmoid stretch
-    return rng.uniform(-8.0, 8.0)
+    return float(cosmic_dither(natal_chart_hash, date_ordinal, meter_name)[0])
 
 
 def calculate_astrometers(
@@ -394,6 +384,86 @@ def calculate_astrometers(
     )
 
 
+def calculate_astrometers_batch(
+    aspects: List[TransitAspect],
+    membership: np.ndarray,
+    meter_names: List[str],
+    natal_chart_hash: Optional[int] = None,
+    date_ordinal: Optional[int] = None,
+) -> List[AstrometerScore]:
+    """
+    Score many meters over one shared aspect list.
+
+    Equivalent to calling calculate_astrometers(filtered_aspects_j, meter_name=meter_names[j], ...)
+    for each meter j, where filtered_aspects_j are the aspects with membership[:, j] set.
+    Each aspect's contribution is computed once; each meter then sums its
+    members' values in aspect order with the same built-in sum(), so totals
+    are bit-identical to the per-meter sums.
+
+    Args:
+        aspects: All transit aspects (shared by every meter)
+        membership: Boolean array [len(aspects) x len(meter_names)]
+        meter_names: Meter name per membership column (selects ballast)
+        natal_chart_hash: Hash of the natal chart (for cosmic background)
+        date_ordinal: Date ordinal (for cosmic background)
+
+    Returns:
+        One AstrometerScore per meter, in meter_names order
+    """
+    empty = [
+        AstrometerScore(dti=0.0, hqs=0.0, intensity=0.0, harmony_coefficient=0.0,
+                        aspect_count=0, contributions=[])
+        for _ in meter_names
+    ]
+    if not aspects:
+        return empty
+
+    # Contribution of each aspect, computed once for all meters
+    contributions = [calculate_aspect_contribution(aspect) for aspect in aspects]
+    dti = [c.dti_contribution for c in contributions]
+    hqs = [c.hqs_contribution for c in contributions]
+    power = [c.gaussian_power for c in contributions]
+    net_quality = [c.gaussian_power * c.polarity for c in contributions]
+
+    background = None
+    if natal_chart_hash is not None and date_ordinal is not None:
+        background = get_cosmic_background(natal_chart_hash, date_ordinal)
+
+    scores = []
+    for j, meter_name in enumerate(meter_names):
+        members = np.flatnonzero(membership[:, j]).tolist()
+        if not members:
+            scores.append(empty[j])
+            continue
+
+        # Built-in sum() (compensated since Python 3.12), as calculate_astrometers() sums
+        total_dti = sum(dti[i] for i in members)
+        total_hqs = sum(hqs[i] for i in members)
+        total_intensity = sum(power[i] for i in members)
+        net_quality_sum = sum(net_quality[i] for i in members)
+        if background is not None:
+            bg_intensity, bg_polarity = background
+            total_intensity += bg_intensity
+            net_quality_sum += bg_intensity * bg_polarity
+
+        effective_ballast = get_ballast_for_meter(meter_name) if meter_name else DEFAULT_BALLAST
+        if total_intensity > 0:
+            harmony_coefficient = net_quality_sum / (total_intensity + effective_ballast)
+        else:
+            harmony_coefficient = 0.0
+
+        scores.append(AstrometerScore(
+            dti=total_dti,
+            hqs=total_hqs,
+            intensity=total_intensity,
+            harmony_coefficient=harmony_coefficient,
+            aspect_count=len(members),
+            contributions=[contributions[i] for i in members]
+        ))
+
+    return scores
+
+
 def _get_planet_speed(chart: dict, planet_name: str) -> float:
     """
     Extract planet speed from chart data.
@@ -411,55 +481,99 @@ def _get_planet_speed(chart: dict, planet_name: str) -> float:
     return 1.0  # Default fallback
 
 
-def calculate_all_aspects(natal_chart: dict, transit_chart: dict, orb: float = 8.0) -> List[TransitAspect]:
+def calculate_all_aspects(
+    natal_chart: dict,
+    transit_chart: dict,
+    orb: float = 8.0,
+    scoring_profile: Optional[dict] = None
+) -> List[TransitAspect]:
     """
     Calculate all natal-transit aspects.
 
-    Wraps astro.find_natal_transit_aspects() and converts to TransitAspect format.
+    Uses the raw hit arrays behind astro.find_natal_transit_aspects() (same hits,
+    same priority order) and converts them to TransitAspect format.
 
     Args:
         natal_chart: Natal chart dict
         transit_chart: Transit chart dict
         orb: Maximum orb in degrees (default 8.0 for astrometers)
+        scoring_profile: Natal scoring profile for natal_chart (optional, see profile.py)
 
     Returns:
         List of TransitAspect objects for DTI/HQS calculation
     """
-    from astro import find_natal_transit_aspects, Planet, ZodiacSign
+    from astro import compute_natal_transit_arrays
+
+    arrays = compute_natal_transit_arrays(natal_chart, transit_chart, orb=orb)
+    return transit_aspects_from_arrays(arrays, natal_chart, transit_chart, scoring_profile=scoring_profile)
+
+
+def transit_aspects_from_arrays(
+    arrays,
+    natal_chart: dict,
+    transit_chart: dict,
+    scoring_profile: Optional[dict] = None
+) -> List[TransitAspect]:
+    """
+    Convert precomputed natal-transit hit arrays to TransitAspect format.
+
+    Args:
+        arrays: astro.NatalTransitArrays (its orb becomes each aspect's max_orb)
+        natal_chart: Natal chart dict the arrays were computed from
+        transit_chart: Transit chart dict the arrays were computed from
+        scoring_profile: Natal scoring profile for natal_chart (optional); supplies
+            the ascendant sign and each natal planet's precomputed weightage
 
-    # Get aspects from astro.py
-    natal_transit_aspects = find_natal_transit_aspects(natal_chart, transit_chart, orb=orb)
+    Returns:
+        List of TransitAspect objects for DTI/HQS calculation
+    """
+    orb = arrays.orb
 
     # Convert to TransitAspect format
     transit_aspects = []
+    weightages = {}
     ascendant_sign = None
-    if "angles" in natal_chart and "asc" in natal_chart["angles"]:
+    if scoring_profile is not None:
+        weightages = scoring_profile["weightage"]
+        if scoring_profile["ascendant_sign"] is not None:
+            ascendant_sign = ZodiacSign(scoring_profile["ascendant_sign"])
+    elif "angles" in natal_chart and "asc" in natal_chart["angles"]:
         ascendant_sign = ZodiacSign(natal_chart["angles"]["asc"]["sign"])
 
-    for nta in natal_transit_aspects:
+    for hit in arrays.ranked(sort_by_priority=True):
+        natal_planet = arrays.natal_planets[arrays.natal_idx[hit]]
+        natal_name = natal_planet["name"]
+
         # Get natal planet info from chart
-        natal_planet_info = next((p for p in natal_chart["planets"] if p["name"] == nta.natal_planet), None)
+        natal_planet_info = next((p for p in natal_chart["planets"] if p["name"] == natal_name), None)
         if not natal_planet_info:
             continue
 
         # V2: Get transit planet speed for Gaussian scoring
-        transit_speed = _get_planet_speed(transit_chart, nta.transit_planet)
+        transit_name = arrays.transit_planets[arrays.transit_idx[hit]]["name"]
+        transit_speed = _get_planet_speed(transit_chart, transit_name)
+
+        natal_planet_enum = Planet(natal_name)
+        transit_planet_enum = Planet(transit_name)
+        aspect_type = arrays.aspect_type(hit)
+        orb_deviation = round(float(arrays.angle_diff[hit]), 2)
 
         transit_aspect = TransitAspect(
-            natal_planet=Planet(nta.natal_planet),
-            natal_sign=ZodiacSign(nta.natal_sign),
-            natal_house=nta.natal_house,
-            transit_planet=Planet(nta.transit_planet),
-            aspect_type=nta.aspect_type,
-            orb_deviation=nta.orb,
+            natal_planet=natal_planet_enum,
+            natal_sign=ZodiacSign(natal_planet["sign"]),
+            natal_house=natal_planet["house"],
+            transit_planet=transit_planet_enum,
+            aspect_type=aspect_type,
+            orb_deviation=orb_deviation,
             max_orb=orb,
             natal_degree_in_sign=natal_planet_info.get("signed_deg", 0),
             ascendant_sign=ascendant_sign,
-            today_deviation=nta.orb,  # Simplified - no tomorrow data yet
+            today_deviation=orb_deviation,  # Simplified - no tomorrow data yet
             tomorrow_deviation=None,
             days_from_station=None,
             transit_speed=transit_speed,  # V2: for Gaussian scoring
-            label=f"Transit {nta.transit_planet} {nta.aspect_type.value} Natal {nta.natal_planet}"
+            weightage=weightages.get(natal_name),
+            label=f"Transit {transit_planet_enum} {aspect_type.value} Natal {natal_planet_enum}"
         )
         transit_aspects.append(transit_aspect)
 
@@ -8,10 +8,10 @@ NOTE: Experience labels have been removed from JSON files. iOS handles bucket
 labels based on unified_score. The backend provides scores only.
 """
 
-import json
-import os
 from datetime import datetime
 from typing import Dict, List, Optional
+
+from assets import load_json
 from .hierarchy import MeterGroupV2, get_meters_in_group_v2, get_group_v2_display_name
 from .meters import (
     MeterReading,
@@ -27,22 +27,9 @@ from .meters import (
 # Group Label Loading
 # =============================================================================
 
-_GROUP_LABEL_CACHE: Dict[str, Dict] = {}
-
-
 def load_group_labels(group_name: str) -> Dict:
-    """Load labels from JSON file for a specific meter group."""
-    if group_name in _GROUP_LABEL_CACHE:
-        return _GROUP_LABEL_CACHE[group_name]
-
-    labels_dir = os.path.join(os.path.dirname(__file__), "labels", "groups")
-    label_file = os.path.join(labels_dir, f"{group_name}.json")
-
-    with open(label_file, "r") as f:
-        labels = json.load(f)
-
-    _GROUP_LABEL_CACHE[group_name] = labels
-    return labels
+    """Load labels from JSON file for a specific meter group (read-only, shared)."""
+    return load_json(f"astrometers/labels/groups/{group_name}.json")
 
 
 def get_group_bucket_labels(group_name: str) -> tuple:
@@ -65,7 +52,7 @@ def get_group_bucket_labels(group_name: str) -> tuple:
                     bucket_labels.get("75-100", {}).get("label", "Peak"),
                 )
             # Legacy list format: ["label0", "label1", "label2", "label3"]
-            elif isinstance(bucket_labels, list) and len(bucket_labels) == 4:
+            elif isinstance(bucket_labels, (list, tuple)) and len(bucket_labels) == 4:
                 return tuple(bucket_labels)
     except (KeyError, FileNotFoundError):
         pass
@@ -15,18 +15,25 @@ Usage:
     print(all_readings.love.unified_score)  # 85.3
 """
 
-import os
-import json
-from pathlib import Path
-from typing import List, Dict, Optional, Any
+from collections.abc import Mapping
+from functools import cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
+import numpy as np
 from pydantic import BaseModel, Field
 
 # Core dependencies
+from assets import load_json
 from astro import Planet, AspectType, ZodiacSign, House
-from .core import TransitAspect, AspectContribution, calculate_astrometers, AstrometerScore, get_cosmic_dither
-from .normalization import normalize_intensity, normalize_intensity_v2, normalize_harmony
+from .core import (
+    TransitAspect, AspectContribution, calculate_astrometers, calculate_astrometers_batch,
+    AstrometerScore, get_cosmic_dither
+)
+from .noise import cosmic_dither, key_uniforms
+from .normalization import (
+    normalize_intensity, normalize_intensity_v2, normalize_intensity_v2_batch, normalize_harmony
+)
 from .quality import harmonic_boost
 from .hierarchy import Meter, MeterGroupV2, get_group_v2
 from .constants import (
@@ -149,38 +156,34 @@ class MeterConfig(BaseModel):
 # METER CONFIGURATIONS (Loaded from JSON)
 # =============================================================================
 
+# Meter names and their groups
+_METER_GROUPS: Dict[str, MeterGroupV2] = {
+    "clarity": MeterGroupV2.MIND,
+    "focus": MeterGroupV2.MIND,
+    "communication": MeterGroupV2.MIND,
+    "resilience": MeterGroupV2.HEART,
+    "connections": MeterGroupV2.HEART,
+    "vulnerability": MeterGroupV2.HEART,
+    "energy": MeterGroupV2.BODY,
+    "drive": MeterGroupV2.BODY,
+    "strength": MeterGroupV2.BODY,
+    "vision": MeterGroupV2.INSTINCTS,
+    "flow": MeterGroupV2.INSTINCTS,
+    "intuition": MeterGroupV2.INSTINCTS,
+    "creativity": MeterGroupV2.INSTINCTS,
+    "momentum": MeterGroupV2.GROWTH,
+    "ambition": MeterGroupV2.GROWTH,
+    "evolution": MeterGroupV2.GROWTH,
+    "circle": MeterGroupV2.GROWTH,
+}
+
+
 def _load_meter_configs() -> Dict[str, MeterConfig]:
     """Load meter configurations from JSON label files."""
-    labels_dir = os.path.join(os.path.dirname(__file__), "labels")
     configs = {}
 
-    # Meter names and their groups
-    meter_groups = {
-        "clarity": MeterGroupV2.MIND,
-        "focus": MeterGroupV2.MIND,
-        "communication": MeterGroupV2.MIND,
-        "resilience": MeterGroupV2.HEART,
-        "connections": MeterGroupV2.HEART,
-        "vulnerability": MeterGroupV2.HEART,
-        "energy": MeterGroupV2.BODY,
-        "drive": MeterGroupV2.BODY,
-        "strength": MeterGroupV2.BODY,
-        "vision": MeterGroupV2.INSTINCTS,
-        "flow": MeterGroupV2.INSTINCTS,
-        "intuition": MeterGroupV2.INSTINCTS,
-        "creativity": MeterGroupV2.INSTINCTS,
-        "momentum": MeterGroupV2.GROWTH,
-        "ambition": MeterGroupV2.GROWTH,
-        "evolution": MeterGroupV2.GROWTH,
-        "circle": MeterGroupV2.GROWTH,
-    }
-
-    for meter_name, group in meter_groups.items():
-        label_file = os.path.join(labels_dir, f"{meter_name}.json")
-
-        with open(label_file, "r") as f:
-            data = json.load(f)
-
+    for meter_name, group in _METER_GROUPS.items():
+        data = load_json(f"astrometers/labels/{meter_name}.json")
         config_data = data.get("configuration", {})
 
         # Convert planet strings to Planet enums
@@ -203,8 +206,32 @@ def _load_meter_configs() -> Dict[str, MeterConfig]:
 
     return configs
 
-# Load configs from JSON on module import
-METER_CONFIGS: Dict[str, MeterConfig] = _load_meter_configs()
+class _LazyMeterConfigs(Mapping):
+    """Read-only meter_name -> MeterConfig; reads the label files on first access."""
+
+    def __init__(self):
+        self._configs: Optional[Dict[str, MeterConfig]] = None
+
+    def _load(self) -> Dict[str, MeterConfig]:
+        if self._configs is None:
+            self._configs = _load_meter_configs()
+        return self._configs
+
+    def __getitem__(self, meter_name: str) -> MeterConfig:
+        return self._load()[meter_name]
+
+    def __iter__(self):
+        return iter(_METER_GROUPS)
+
+    def __len__(self) -> int:
+        return len(_METER_GROUPS)
+
+    def __contains__(self, meter_name: object) -> bool:
+        return meter_name in _METER_GROUPS
+
+
+# Loaded from JSON on first use, not on module import (cold start)
+METER_CONFIGS: Mapping[str, MeterConfig] = _LazyMeterConfigs()
 
 
 # =============================================================================
@@ -281,25 +308,142 @@ def filter_aspects(
     return filtered
 
 
-# =============================================================================
-# LABEL LOADING
-# =============================================================================
+def _config_masks(configs: Dict[str, MeterConfig]) -> Dict[str, np.ndarray]:
+    """
+    Lookup tables for filter_aspects() logic over all meters at once.
 
-_LABEL_CACHE: Dict[str, Dict] = {}
+    Rows are indexed by Planet / house number / AspectType position, columns
+    by meter (METER_CONFIGS order). Empty filters match everything.
+    """
+    planets = list(Planet)
+    aspect_types = list(AspectType)
+    names = list(configs)
+
+    natal_planet = np.zeros((len(planets), len(names)), dtype=bool)
+    natal_house = np.zeros((13, len(names)), dtype=bool)  # row 0: no house
+    transit_planet = np.ones((len(planets), len(names)), dtype=bool)
+    aspect_type = np.ones((len(aspect_types), len(names)), dtype=bool)
+    unfiltered = np.zeros(len(names), dtype=bool)
+
+    for j, name in enumerate(names):
+        config = configs[name]
+        for planet in config.natal_planets:
+            natal_planet[planets.index(planet), j] = True
+        for house in config.natal_houses:
+            if 1 <= house <= 12:
+                natal_house[house, j] = True
+        if config.transit_planets:
+            transit_planet[:, j] = [p in config.transit_planets for p in planets]
+        if config.aspect_types:
+            aspect_type[:, j] = [a in config.aspect_types for a in aspect_types]
+        unfiltered[j] = not config.natal_planets and not config.natal_houses
+
+    return {
+        "natal_planet": natal_planet,
+        "natal_house": natal_house,
+        "transit_planet": transit_planet,
+        "aspect_type": aspect_type,
+        "unfiltered": unfiltered,
+    }
 
-def load_meter_labels(meter_name: str) -> Dict:
-    """Load labels from JSON file."""
-    if meter_name in _LABEL_CACHE:
-        return _LABEL_CACHE[meter_name]
 
-    labels_dir = os.path.join(os.path.dirname(__file__), "labels")
-    label_file = os.path.join(labels_dir, f"{meter_name}.json")
+_PLANET_INDEX: Dict[Planet, int] = {planet: i for i, planet in enumerate(Planet)}
+_ASPECT_TYPE_INDEX: Dict[AspectType, int] = {aspect: i for i, aspect in enumerate(AspectType)}
+METER_NAMES: List[str] = list(_METER_GROUPS)
 
-    with open(label_file, "r") as f:
-        labels = json.load(f)
 
-    _LABEL_CACHE[meter_name] = labels
-    return labels
+@cache
+def _meter_masks() -> Dict[str, np.ndarray]:
+    return _config_masks(METER_CONFIGS)
+
+
+def natal_house_map(natal_chart: dict) -> Dict[str, int]:
+    """Natal house per planet name (first match, as filter_aspects)."""
+    houses: Dict[str, int] = {}
+    for planet in natal_chart.get("planets", []):
+        houses.setdefault(planet["name"], planet["house"])
+    return houses
+
+
+def natal_meter_masks(natal_chart: dict) -> Dict[str, List[str]]:
+    """
+    Natal side of filter_aspects() for one chart.
+
+    Returns:
+        Dict of meter_name -> natal planet names whose aspects the meter counts
+        (natal_planets OR natal_houses match)
+    """
+    houses = natal_house_map(natal_chart)
+    natal_match = _natal_match(list(houses), houses)
+    return {
+        meter_name: [name for name, keep in zip(houses, natal_match[:, j]) if keep]
+        for j, meter_name in enumerate(METER_NAMES)
+    }
+
+
+def _natal_match(planet_names: List[str], houses: Dict[str, int]) -> np.ndarray:
+    """Boolean [planet x meter]: natal_planets OR natal_houses filter per meter."""
+    planet_idx = [_PLANET_INDEX[Planet(name)] for name in planet_names]
+    house_idx = []
+    for name in planet_names:
+        house = houses.get(name)
+        house_idx.append(house if isinstance(house, int) and 1 <= house <= 12 else 0)
+
+    masks = _meter_masks()
+    return (
+        masks["natal_planet"][planet_idx]
+        | masks["natal_house"][house_idx]
+        | masks["unfiltered"]
+    ).reshape(len(planet_names), len(METER_NAMES))
+
+
+def meter_membership_matrix(
+    all_aspects: List[TransitAspect],
+    natal_chart: dict,
+    scoring_profile: Optional[dict] = None
+) -> np.ndarray:
+    """
+    filter_aspects() for all 17 meters in one pass.
+
+    Args:
+        all_aspects: All natal-transit aspects
+        natal_chart: Natal chart data (for house lookups)
+        scoring_profile: Natal scoring profile (optional); its meter_masks
+            replace the natal house lookups
+
+    Returns:
+        Boolean array [len(all_aspects) x len(METER_NAMES)]; column j is True
+        exactly for the aspects filter_aspects() keeps for METER_NAMES[j]
+    """
+    if scoring_profile is not None:
+        masks = scoring_profile["meter_masks"]
+        by_planet = np.zeros((len(_PLANET_INDEX), len(METER_NAMES)), dtype=bool)
+        for j, meter_name in enumerate(METER_NAMES):
+            for name in masks.get(meter_name, []):
+                by_planet[_PLANET_INDEX[Planet(name)], j] = True
+        natal_match = by_planet[[_PLANET_INDEX[a.natal_planet] for a in all_aspects]]
+    else:
+        natal_match = _natal_match(
+            [a.natal_planet.value for a in all_aspects], natal_house_map(natal_chart)
+        )
+
+    transit_idx = [_PLANET_INDEX[a.transit_planet] for a in all_aspects]
+    aspect_idx = [_ASPECT_TYPE_INDEX[a.aspect_type] for a in all_aspects]
+    masks = _meter_masks()
+    return (
+        natal_match
+        & masks["transit_planet"][transit_idx]
+        & masks["aspect_type"][aspect_idx]
+    ).reshape(len(all_aspects), len(METER_NAMES))
+
+
+# =============================================================================
+# LABEL LOADING
+# =============================================================================
+
+def load_meter_labels(meter_name: str) -> Dict:
+    """Load labels from JSON file (read-only, shared)."""
+    return load_json(f"astrometers/labels/{meter_name}.json")
 
 
 def get_intensity_level(intensity: float) -> str:
@@ -508,8 +652,6 @@ def calculate_cosmic_background(
         - intensity_noise: -5 to +10 (slight positive bias)
         - harmony_nudge: 0 to +3 (always positive - empowering)
     """
-    import hashlib
-    import random
     from astrometers.constants import (
         COSMIC_NOISE_INTENSITY_MIN,
         COSMIC_NOISE_INTENSITY_MAX,
@@ -521,19 +663,15 @@ def calculate_cosmic_background(
     if aspect_count == 0:
         return 0.0, 0.0
 
-    # Create deterministic seed from user + date + meter
+    # Deterministic draws from user + date + meter
     # This ensures same user gets same noise on same day for same meter
-    seed_string = f"{user_id}:{date}:{meter_name}"
-    seed_hash = int(hashlib.sha256(seed_string.encode()).hexdigest()[:8], 16)
-
-    # Use seed for reproducible randomness
-    rng = random.Random(seed_hash)
+    u_intensity, u_harmony = key_uniforms(f"{user_id}:{date}:{meter_name}")
 
     # Intensity noise: slight positive bias
-    intensity_noise = rng.uniform(COSMIC_NOISE_INTENSITY_MIN, COSMIC_NOISE_INTENSITY_MAX)
+    intensity_noise = COSMIC_NOISE_INTENSITY_MIN + u_intensity * (COSMIC_NOISE_INTENSITY_MAX - COSMIC_NOISE_INTENSITY_MIN)
 
     # Harmony nudge: always positive (empowering)
-    harmony_nudge = rng.uniform(COSMIC_NOISE_HARMONY_MIN, COSMIC_NOISE_HARMONY_MAX)
+    harmony_nudge = COSMIC_NOISE_HARMONY_MIN + u_harmony * (COSMIC_NOISE_HARMONY_MAX - COSMIC_NOISE_HARMONY_MIN)
 
     return intensity_noise, harmony_nudge
 
@@ -576,10 +714,133 @@ def calculate_meter(
     Returns:
         Complete MeterReading
     """
+    scored = _score_meter(
+        meter_name,
+        config,
+        all_aspects,
+        natal_chart,
+        date,
+        apply_harmonic_boost=apply_harmonic_boost,
+        benefic_multiplier=benefic_multiplier,
+        malefic_multiplier=malefic_multiplier,
+        use_v2_scoring=use_v2_scoring
+    )
+    return _finish_meter(meter_name, config, scored, transit_chart, date, user_id=user_id)
+
+
+def _score_meter(
+    meter_name: str,
+    config: MeterConfig,
+    all_aspects: List[TransitAspect],
+    natal_chart: dict,
+    date: datetime,
+    apply_harmonic_boost: bool = True,
+    benefic_multiplier: float = 2.0,
+    malefic_multiplier: float = 0.5,
+    use_v2_scoring: bool = True
+) -> tuple:
+    """
+    Steps 1-3 of calculate_meter(): filter, raw scores and normalization.
+
+    Independent of user_id, so one result can back both the personalized
+    reading and the trend baseline for the same day.
+
+    Returns:
+        Tuple of (raw_score, intensity, harmony, dither)
+    """
     # Step 1: Filter aspects
     filtered_aspects = filter_aspects(all_aspects, config, natal_chart)
 
     # Step 2: Calculate raw scores
+    natal_chart_hash, date_ordinal = _chart_hash_and_ordinal(natal_chart, date)
+
+    # Pass meter_name and cosmic background params
+    raw_score = calculate_astrometers(
+        filtered_aspects,
+        meter_name=meter_name,
+        natal_chart_hash=natal_chart_hash,
+        date_ordinal=date_ordinal
+    )
+
+    intensity, harmony = _normalize_raw_score(
+        meter_name,
+        raw_score,
+        apply_harmonic_boost=apply_harmonic_boost,
+        benefic_multiplier=benefic_multiplier,
+        malefic_multiplier=malefic_multiplier,
+        use_v2_scoring=use_v2_scoring
+    )
+    dither = get_cosmic_dither(natal_chart_hash, date_ordinal, meter_name)
+    return raw_score, intensity, harmony, dither
+
+
+def _score_all_meters(
+    all_aspects: List[TransitAspect],
+    natal_chart: dict,
+    date: datetime,
+    apply_harmonic_boost: bool = True,
+    benefic_multiplier: float = 2.0,
+    malefic_multiplier: float = 0.5,
+    use_v2_scoring: bool = True,
+    scoring_profile: Optional[dict] = None
+) -> Dict[str, tuple]:
+    """
+    _score_meter() for all 17 meters from one aspect x meter membership matrix.
+
+    Each aspect's contribution is computed once instead of once per meter
+    that includes it; results are identical to the per-meter path.
+
+    Returns:
+        Dict of meter_name -> _score_meter() tuple
+    """
+    if scoring_profile is not None:
+        natal_chart_hash = scoring_profile["chart_hash"]
+        date_ordinal = _date_ordinal(date)
+    else:
+        natal_chart_hash, date_ordinal = _chart_hash_and_ordinal(natal_chart, date)
+    membership = meter_membership_matrix(all_aspects, natal_chart, scoring_profile=scoring_profile)
+    raw_scores = calculate_astrometers_batch(
+        all_aspects,
+        membership,
+        METER_NAMES,
+        natal_chart_hash=natal_chart_hash,
+        date_ordinal=date_ordinal
+    )
+
+    if use_v2_scoring:
+        # All 17 intensities against the compiled calibration in one pass
+        intensities = normalize_intensity_v2_batch([r.intensity for r in raw_scores], METER_NAMES).tolist()
+    dithers = cosmic_dither(natal_chart_hash, date_ordinal, METER_NAMES).tolist()
+
+    scores = {}
+    for j, (meter_name, raw_score) in enumerate(zip(METER_NAMES, raw_scores)):
+        if use_v2_scoring:
+            intensity, harmony = intensities[j], _harmony_v2(raw_score)
+        else:
+            intensity, harmony = _normalize_raw_score(
+                meter_name,
+                raw_score,
+                apply_harmonic_boost=apply_harmonic_boost,
+                benefic_multiplier=benefic_multiplier,
+                malefic_multiplier=malefic_multiplier,
+                use_v2_scoring=False
+            )
+        scores[meter_name] = (raw_score, intensity, harmony, dithers[j])
+    return scores
+
+
+def _chart_hash_and_ordinal(natal_chart: dict, date: datetime) -> Tuple[int, int]:
+    """Cosmic background seed: (natal chart hash, date ordinal)."""
+    return get_natal_chart_hash(natal_chart), _date_ordinal(date)
+
+
+def _date_ordinal(date: datetime) -> int:
+    """Date ordinal for the cosmic background seed."""
+    return date.toordinal() if hasattr(date, 'toordinal') else date.date().toordinal()
+
+
+def get_natal_chart_hash(natal_chart: dict) -> int:
+    """Stable per-chart seed for the cosmic background (from Sun and Moon positions)."""
     # Generate chart hash for cosmic background (deterministic per-chart noise)
     # Use natal chart's sun and moon positions as a stable identifier
     natal_sun_deg = 0.0
@@ -594,35 +855,31 @@ def calculate_meter(
     elif isinstance(planets, dict):
         natal_sun_deg = planets.get("sun", {}).get("abs_pos", 0)
         natal_moon_deg = planets.get("moon", {}).get("abs_pos", 0)
-    natal_chart_hash = int((natal_sun_deg * 1000 + natal_moon_deg * 100) % 1000000)
-    date_ordinal = date.toordinal() if hasattr(date, 'toordinal') else date.date().toordinal()
+    return int((natal_sun_deg * 1000 + natal_moon_deg * 100) % 1000000)
+
+
+def _harmony_v2(raw_score: AstrometerScore) -> float:
+    """V2 harmony: coefficient -1 to +1 mapped directly to 0-100."""
+    # Direct mapping: -1 to +1 → 0 to 100
+    harmony = (raw_score.harmony_coefficient + 1) * 50
+    return max(0.0, min(100.0, harmony))  # Clamp to 0-100
 
-    if not filtered_aspects:
-        # No activity - but still apply cosmic background
-        raw_score = calculate_astrometers(
-            [],
-            meter_name=meter_name,
-            natal_chart_hash=natal_chart_hash,
-            date_ordinal=date_ordinal
-        )
-    else:
-        # Pass meter_name and cosmic background params
-        raw_score = calculate_astrometers(
-            filtered_aspects,
-            meter_name=meter_name,
-            natal_chart_hash=natal_chart_hash,
-            date_ordinal=date_ordinal
-        )
 
+def _normalize_raw_score(
+    meter_name: str,
+    raw_score: AstrometerScore,
+    apply_harmonic_boost: bool = True,
+    benefic_multiplier: float = 2.0,
+    malefic_multiplier: float = 0.5,
+    use_v2_scoring: bool = True
+) -> Tuple[float, float]:
+    """Step 3 of calculate_meter(): raw score -> (intensity, harmony) on 0-100."""
     if use_v2_scoring:
         # V2: Decoupled scoring (Gaussian power + ballast)
         # Intensity: Gaussian power sum, normalized via percentiles
         # Harmony: coefficient -1 to +1, mapped to 0-100
         intensity = normalize_intensity_v2(raw_score.intensity, meter_name)
-
-        # Direct mapping: -1 to +1 → 0 to 100
-        harmony = (raw_score.harmony_coefficient + 1) * 50
-        harmony = max(0.0, min(100.0, harmony))  # Clamp to 0-100
+        harmony = _harmony_v2(raw_score)
     else:
         # V1: Legacy coupled scoring (DTI/HQS)
         # Step 2.5: Apply planetary nature adjustments (harmonic boost) - OPTIONAL
@@ -640,6 +897,20 @@ def calculate_meter(
         intensity = normalize_intensity(raw_score.dti, meter_name)
         harmony = normalize_harmony(boosted_hqs, meter_name)
 
+    return intensity, harmony
+
+
+def _finish_meter(
+    meter_name: str,
+    config: MeterConfig,
+    scored: tuple,
+    transit_chart: dict,
+    date: datetime,
+    user_id: Optional[str] = None
+) -> MeterReading:
+    """Steps 3.5-8 of calculate_meter(): noise, modifiers, unified score, labels."""
+    raw_score, intensity, harmony, dither = scored
+
     # Step 3.5: Apply cosmic background noise (if user_id provided)
     if user_id:
         date_str = date.strftime("%Y-%m-%d")
@@ -663,7 +934,6 @@ def calculate_meter(
 
     # Step 5: Calculate unified score (polar-style with sigmoid stretch)
     # Add cosmic background dither to prevent exact-50 clustering
-    dither = get_cosmic_dither(natal_chart_hash, date_ordinal, meter_name)
     unified_score, _ = calculate_unified_score(intensity, harmony, dither=dither)
 
     # Step 6: Get labels
@@ -724,7 +994,11 @@ def get_meters(
     benefic_multiplier: float = 2.0,
     malefic_multiplier: float = 0.5,
     user_id: Optional[str] = None,
-    use_v2_scoring: bool = True
+    use_v2_scoring: bool = True,
+    all_aspects: Optional[List[TransitAspect]] = None,
+    yesterday_transit_chart: Optional[dict] = None,
+    yesterday_aspects: Optional[List[TransitAspect]] = None,
+    scoring_profile: Optional[dict] = None
 ) -> AllMetersReading:
     """
     Calculate all 17 meters.
@@ -739,6 +1013,11 @@ def get_meters(
         malefic_multiplier: Multiplier for malefic+challenging aspects (default: 0.5)
         user_id: User ID for cosmic background noise (optional)
         use_v2_scoring: Use decoupled V2 scoring (Gaussian + ballast) (default: True)
+        all_aspects: Precomputed calculate_all_aspects() for transit_chart (optional)
+        yesterday_transit_chart: Precomputed transit chart for the day before (optional)
+        yesterday_aspects: Precomputed calculate_all_aspects() for yesterday (optional)
+        scoring_profile: Precomputed natal scoring profile for natal_chart (optional,
+            see astrometers.profile); readings are identical with or without it
 
     Returns:
         AllMetersReading with all 17 meters
@@ -748,80 +1027,96 @@ def get_meters(
 
     # Calculate all aspects once
     from .core import calculate_all_aspects
-    all_aspects = calculate_all_aspects(natal_chart, transit_chart)
+    if all_aspects is None:
+        all_aspects = calculate_all_aspects(natal_chart, transit_chart, scoring_profile=scoring_profile)
 
     # Calculate all 17 meters
-    readings = {}
-    for meter_name, config in METER_CONFIGS.items():
-        readings[meter_name] = calculate_meter(
-            meter_name,
-            config,
-            all_aspects,
-            natal_chart,
-            transit_chart,
-            date,
-            apply_harmonic_boost=apply_harmonic_boost,
-            benefic_multiplier=benefic_multiplier,
-            malefic_multiplier=malefic_multiplier,
-            user_id=user_id,
-            use_v2_scoring=use_v2_scoring
-        )
+    scores = _score_all_meters(
+        all_aspects,
+        natal_chart,
+        date,
+        apply_harmonic_boost=apply_harmonic_boost,
+        benefic_multiplier=benefic_multiplier,
+        malefic_multiplier=malefic_multiplier,
+        use_v2_scoring=use_v2_scoring,
+        scoring_profile=scoring_profile
+    )
+    readings = {
+        meter_name: _finish_meter(meter_name, config, scores[meter_name], transit_chart, date, user_id=user_id)
+        for meter_name, config in METER_CONFIGS.items()
+    }
 
     # Calculate trends if requested
     if calculate_trends:
-        from astro import compute_birth_chart
+        from astro import get_transit_chart, get_transit_positions
         yesterday = date - timedelta(days=1)
-        yesterday_transit, _ = compute_birth_chart(
-            yesterday.strftime("%Y-%m-%d"),
-            "12:00"
+        yesterday_str = yesterday.strftime("%Y-%m-%d")
+        yesterday_transit = yesterday_transit_chart
+        if yesterday_transit is None:
+            yesterday_transit = get_transit_positions(yesterday_str) or get_transit_chart(yesterday_str)
+        if yesterday_aspects is None:
+            yesterday_aspects = calculate_all_aspects(
+                natal_chart, yesterday_transit, scoring_profile=scoring_profile
+            )
+
+        # Trend baseline: yesterday without user noise
+        yesterday_scores = _score_all_meters(
+            yesterday_aspects,
+            natal_chart,
+            yesterday,
+            use_v2_scoring=use_v2_scoring,
+            scoring_profile=scoring_profile
         )
-        yesterday_aspects = calculate_all_aspects(natal_chart, yesterday_transit)
+        yesterday_readings = {
+            meter_name: _finish_meter(meter_name, config, yesterday_scores[meter_name], yesterday_transit, yesterday)
+            for meter_name, config in METER_CONFIGS.items()
+        }
+        _apply_trends(readings, yesterday_readings)
 
-        for meter_name, config in METER_CONFIGS.items():
-            yesterday_reading = calculate_meter(
-                meter_name,
-                config,
-                yesterday_aspects,
-                natal_chart,
-                yesterday_transit,
-                yesterday,
-                use_v2_scoring=use_v2_scoring
-            )
+    return _build_all_meters_reading(readings, date)
 
-            # Helper function to calculate single trend
-            def calc_trend(today_val: float, yesterday_val: float, metric_name: str) -> TrendData:
-                delta = today_val - yesterday_val
-
-                if abs(delta) < 2.0:
-                    change_rate = "stable"
-                elif abs(delta) < 5.5:
-                    change_rate = "slow"
-                elif abs(delta) < 10.5:
-                    change_rate = "moderate"
-                else:
-                    change_rate = "rapid"
-
-                # Direction depends on metric type
-                if metric_name == "harmony":
-                    direction = "improving" if delta > 0 else "worsening" if delta < 0 else "stable"
-                else:  # intensity or unified_score
-                    direction = "increasing" if delta > 0 else "decreasing" if delta < 0 else "stable"
-
-                return TrendData(
-                    previous=yesterday_val,
-                    delta=delta,
-                    direction=direction,
-                    change_rate=change_rate
-                )
 
-            # Calculate trends for all three metrics
-            today_reading = readings[meter_name]
-            readings[meter_name].trend = MeterTrends(
-                intensity=calc_trend(today_reading.intensity, yesterday_reading.intensity, "intensity"),
-                harmony=calc_trend(today_reading.harmony, yesterday_reading.harmony, "harmony"),
-                unified_score=calc_trend(today_reading.unified_score, yesterday_reading.unified_score, "unified_score")
-            )
+def _calc_trend(today_val: float, yesterday_val: float, metric_name: str) -> TrendData:
+    """Trend for one metric from today's and yesterday's values."""
+    delta = today_val - yesterday_val
+
+    if abs(delta) < 2.0:
+        change_rate = "stable"
+    elif abs(delta) < 5.5:
+        change_rate = "slow"
+    elif abs(delta) < 10.5:
+        change_rate = "moderate"
+    else:
+        change_rate = "rapid"
+
+    # Direction depends on metric type
+    if metric_name == "harmony":
+        direction = "improving" if delta > 0 else "worsening" if delta < 0 else "stable"
+    else:  # intensity or unified_score
+        direction = "increasing" if delta > 0 else "decreasing" if delta < 0 else "stable"
+
+    return TrendData(
+        previous=yesterday_val,
+        delta=delta,
+        direction=direction,
+        change_rate=change_rate
+    )
+
+
+def _apply_trends(readings: Dict[str, MeterReading], yesterday_readings: Dict[str, MeterReading]) -> None:
+    """Set each meter's trend (intensity, harmony, unified_score) against yesterday."""
+    for meter_name in METER_CONFIGS:
+        today_reading = readings[meter_name]
+        yesterday_reading = yesterday_readings[meter_name]
+        today_reading.trend = MeterTrends(
+            intensity=_calc_trend(today_reading.intensity, yesterday_reading.intensity, "intensity"),
+            harmony=_calc_trend(today_reading.harmony, yesterday_reading.harmony, "harmony"),
+            unified_score=_calc_trend(today_reading.unified_score, yesterday_reading.unified_score, "unified_score")
+        )
 
+
+def _build_all_meters_reading(readings: Dict[str, MeterReading], date: datetime) -> AllMetersReading:
+    """Add the overall aggregates and key aspects to 17 meter readings."""
     # Calculate overall aggregates using DYNAMIC WEIGHTED AVERAGE
     # Weight = intensity * (1 + |delta|/100) to favor active, changing meters
     all_17_meters = [
@@ -969,6 +1264,133 @@ def get_meters(
     )
 
 
+def _as_datetime(value) -> datetime:
+    """Accept a "YYYY-MM-DD" string or datetime; return midnight of that day."""
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d")
+    return datetime(value.year, value.month, value.day)
+
+
+def get_meters_range(
+    natal_chart: dict,
+    start_date,
+    end_date,
+    user_id: Optional[str] = None,
+    calculate_trends: bool = True,
+    apply_harmonic_boost: bool = True,
+    benefic_multiplier: float = 2.0,
+    malefic_multiplier: float = 0.5,
+    use_v2_scoring: bool = True,
+    aspects_for_date: Optional[Callable[[str], Tuple[dict, List[TransitAspect]]]] = None,
+    day_cache: Optional[Dict] = None,
+    scoring_profile: Optional[dict] = None
+) -> List[AllMetersReading]:
+    """
+    Calculate all 17 meters for every day from start_date to end_date (inclusive).
+
+    Equivalent to calling get_meters() once per day, but each day's transit
+    chart, aspects and meter scores are computed once: a day's trend is derived
+    from the neighbouring day already scored instead of recomputing it.
+
+    Args:
+        natal_chart: User's natal chart
+        start_date: First day ("YYYY-MM-DD" or datetime)
+        end_date: Last day, inclusive ("YYYY-MM-DD" or datetime)
+        user_id: User ID for cosmic background noise (optional)
+        calculate_trends: Whether to calculate trends vs the previous day
+        apply_harmonic_boost: Apply planetary nature multipliers (default: True)
+        benefic_multiplier: Multiplier for benefic+harmonious aspects (default: 2.0)
+        malefic_multiplier: Multiplier for malefic+challenging aspects (default: 0.5)
+        use_v2_scoring: Use decoupled V2 scoring (Gaussian + ballast) (default: True)
+        aspects_for_date: Optional callable returning (transit_chart, calculate_all_aspects())
+            for a "YYYY-MM-DD" date, to reuse aspects computed elsewhere
+        day_cache: Optional dict (or dict-like SharedDayCache) to share per-day work across
+            calls for the same natal chart
+            (see shared_cache.shared_day_cache for sharing across users)
+        scoring_profile: Precomputed natal scoring profile for natal_chart (optional)
+
+    Returns:
+        List of AllMetersReading, one per day in order
+
+    Raises:
+        ValueError: If a date is invalid or end_date is before start_date
+
+    Example:
+        >>> week = get_meters_range(natal, "2025-10-13", "2025-10-19", user_id="abc")
+        >>> [round(day.overall_intensity.unified_score) for day in week]
+    """
+    from .core import calculate_all_aspects
+    from astro import get_transit_chart, get_transit_positions
+
+    start = _as_datetime(start_date)
+    end = _as_datetime(end_date)
+    if end < start:
+        raise ValueError(f"end_date {end_date} is before start_date {start_date}")
+
+    cache = day_cache if day_cache is not None else {}
+
+    def transit_and_aspects(day: datetime) -> Tuple[dict, List[TransitAspect]]:
+        day_str = day.strftime("%Y-%m-%d")
+        key = ("aspects", day_str)
+        value = cache.get(key)
+        if value is None:
+            if aspects_for_date is not None:
+                value = aspects_for_date(day_str)
+            else:
+                transit = get_transit_positions(day_str) or get_transit_chart(day_str)
+                value = (transit, calculate_all_aspects(natal_chart, transit, scoring_profile=scoring_profile))
+            cache[key] = value
+        return value
+
+    def scores(day: datetime, boost: bool, benefic: float, malefic: float) -> Dict[str, tuple]:
+        key = ("scores", day.strftime("%Y-%m-%d"), use_v2_scoring, boost, benefic, malefic)
+        value = cache.get(key)
+        if value is None:
+            _, aspects = transit_and_aspects(day)
+            value = _score_all_meters(
+                aspects,
+                natal_chart,
+                day,
+                apply_harmonic_boost=boost,
+                benefic_multiplier=benefic,
+                malefic_multiplier=malefic,
+                use_v2_scoring=use_v2_scoring,
+                scoring_profile=scoring_profile
+            )
+            cache[key] = value
+        return value
+
+    def baseline(day: datetime) -> Dict[str, MeterReading]:
+        # Trend reference: default multipliers and no user noise (as get_meters)
+        key = ("baseline", day.strftime("%Y-%m-%d"), use_v2_scoring)
+        value = cache.get(key)
+        if value is None:
+            transit, _ = transit_and_aspects(day)
+            day_scores = scores(day, True, 2.0, 0.5)
+            value = {
+                meter_name: _finish_meter(meter_name, config, day_scores[meter_name], transit, day)
+                for meter_name, config in METER_CONFIGS.items()
+            }
+            cache[key] = value
+        return value
+
+    results = []
+    day = start
+    while day <= end:
+        transit, _ = transit_and_aspects(day)
+        day_scores = scores(day, apply_harmonic_boost, benefic_multiplier, malefic_multiplier)
+        readings = {
+            meter_name: _finish_meter(meter_name, config, day_scores[meter_name], transit, day, user_id=user_id)
+            for meter_name, config in METER_CONFIGS.items()
+        }
+        if calculate_trends:
+            _apply_trends(readings, baseline(day - timedelta(days=1)))
+        results.append(_build_all_meters_reading(readings, day))
+        day += timedelta(days=1)
+
+    return results
+
+
 def get_meter(
     meter_name: str,
     natal_chart: dict,
@@ -1011,21 +1433,9 @@ def get_meter(
 # WORD BANKS & FEATURED SELECTION (for LLM curation)
 # =============================================================================
 
-_WORD_BANKS_CACHE = None
-
 def load_word_banks() -> dict:
-    """Load word banks from JSON config file."""
-    global _WORD_BANKS_CACHE
-    if _WORD_BANKS_CACHE is not None:
-        return _WORD_BANKS_CACHE
-
-    word_banks_file = os.path.join(
-        os.path.dirname(__file__), "labels", "word_banks.json"
-    )
-    with open(word_banks_file, "r") as f:
-        _WORD_BANKS_CACHE = json.load(f)
-
-    return _WORD_BANKS_CACHE
+    """Load word banks from JSON config file (read-only, shared)."""
+    return load_json("astrometers/labels/word_banks.json")
 
 
 def get_quadrant_from_unified_score(unified_score: float) -> str:
@@ -1396,9 +1806,7 @@ HEADLINE_MATRIX = {
 
 def _load_headline_examples() -> dict:
     """Load headline examples from JSON file."""
-    labels_dir = Path(__file__).parent / "labels"
-    with open(labels_dir / "headline_examples.json") as f:
-        return json.load(f)
+    return load_json("astrometers/labels/headline_examples.json")
 
 
 def _get_headline_mode(user_id: str, date_str: str) -> str:
@@ -1671,7 +2079,6 @@ def _get_meters_in_group(group_name: str) -> list[str]:
 def _load_meter_overviews() -> dict[str, str]:
     """Load the overview description for each meter from JSON labels."""
     descriptions = {}
-    labels_dir = os.path.join(os.path.dirname(__file__), "labels")
 
     meter_names = [
         "clarity", "focus", "communication",
@@ -1682,12 +2089,10 @@ def _load_meter_overviews() -> dict[str, str]:
     ]
 
     for meter_name in meter_names:
-        label_file = os.path.join(labels_dir, f"{meter_name}.json")
         try:
-            with open(label_file, "r") as f:
-                data = json.load(f)
-                # Get the overview from description
-                descriptions[meter_name] = data.get("description", {}).get("overview", "")
+            data = load_json(f"astrometers/labels/{meter_name}.json")
+            # Get the overview from description
+            descriptions[meter_name] = data.get("description", {}).get("overview", "")
         except Exception:
             descriptions[meter_name] = ""
 
@@ -1697,7 +2102,6 @@ def _load_meter_overviews() -> dict[str, str]:
 def _load_meter_planets() -> dict[str, str]:
     """Load the natal planets tracked for each meter from JSON labels."""
     planets = {}
-    labels_dir = os.path.join(os.path.dirname(__file__), "labels")
 
     meter_names = [
         "clarity", "focus", "communication",
@@ -1708,16 +2112,14 @@ def _load_meter_planets() -> dict[str, str]:
     ]
 
     for meter_name in meter_names:
-        label_file = os.path.join(labels_dir, f"{meter_name}.json")
         try:
-            with open(label_file, "r") as f:
-                data = json.load(f)
-                # Get natal_planets_tracked from astrological_foundation
-                natal_planets = data.get("astrological_foundation", {}).get("natal_planets_tracked", [])
-                if natal_planets:
-                    planets[meter_name] = ", ".join([p.capitalize() for p in natal_planets])
-                else:
-                    planets[meter_name] = "all planets"
+            data = load_json(f"astrometers/labels/{meter_name}.json")
+            # Get natal_planets_tracked from astrological_foundation
+            natal_planets = data.get("astrological_foundation", {}).get("natal_planets_tracked", [])
+            if natal_planets:
+                planets[meter_name] = ", ".join([p.capitalize() for p in natal_planets])
+            else:
+                planets[meter_name] = "all planets"
         except Exception:
             planets[meter_name] = ""
 
@@ -1738,14 +2140,10 @@ def _get_score_bucket(score: float) -> str:
 
 def _get_group_label(group_name: str, score: float) -> str:
     """Get the state label for a group at a given score."""
-    labels_dir = os.path.join(os.path.dirname(__file__), "labels", "groups")
-    label_file = os.path.join(labels_dir, f"{group_name}.json")
-
     try:
-        with open(label_file, "r") as f:
-            data = json.load(f)
-            bucket = _get_score_bucket(score)
-            return data.get("bucket_labels", {}).get(bucket, {}).get("label", "")
+        data = load_json(f"astrometers/labels/groups/{group_name}.json")
+        bucket = _get_score_bucket(score)
+        return data.get("bucket_labels", {}).get(bucket, {}).get("label", "")
     except Exception:
         return ""
 
@@ -0,0 +1,135 @@
+"""
+Deterministic counter-based noise for the cosmic background.
+
+The cosmic background ("dithering") must be the same for a given chart, day
+and meter on every Cloud Functions instance. Seeding random.Random with
+hash(meter_name) is not: str hashes are salted per process unless
+PYTHONHASHSEED is pinned. This module derives each value from a splitmix64
+hash of (stream, chart hash, date ordinal, meter key) instead, so
+
+- values are reproducible across processes, machines and Python versions
+- no generator object is constructed per meter per call
+- any mix of charts, dates and meters is evaluated as one NumPy broadcast
+
+Per-user meter noise is keyed by strings (user ID, date, meter), so
+key_uniforms() takes its values straight from one SHA-256 digest instead.
+
+Usage:
+    intensity, polarity = cosmic_background(chart_hash, date_ordinals[:, None], METER_NAMES)
+    dither = cosmic_dither(chart_hash, date_ordinal, METER_NAMES)  # shape (17,)
+    u1, u2 = key_uniforms(f"{user_id}:{date}:{meter_name}")
+"""
+
+import hashlib
+from functools import lru_cache
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+
+# Independent streams, so background and dither never share a value
+STREAM_BACKGROUND_INTENSITY = 1
+STREAM_BACKGROUND_POLARITY = 2
+STREAM_DITHER = 3
+
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+IntArray = Union[int, Sequence[int], np.ndarray]
+MeterNames = Union[str, Sequence[str], np.ndarray]
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer on uint64 arrays (wrapping arithmetic)."""
+    x = (x ^ (x >> np.uint64(30))) * _MIX_1
+    x = (x ^ (x >> np.uint64(27))) * _MIX_2
+    return x ^ (x >> np.uint64(31))
+
+
+def _as_uint64(values: IntArray) -> np.ndarray:
+    """Integers (possibly negative) as wrapped uint64, at least 1-D."""
+    return np.atleast_1d(np.asarray(values, dtype=np.int64)).astype(np.uint64)
+
+
+@lru_cache(maxsize=256)
+def meter_key(meter_name: str) -> int:
+    """Stable 63-bit key for a meter name (unlike the salted built-in hash())."""
+    digest = hashlib.blake2b(meter_name.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") >> 1
+
+
+def _meter_keys(meter_names: MeterNames) -> np.ndarray:
+    if isinstance(meter_names, str):
+        return _as_uint64(meter_key(meter_names))
+    names = np.asarray(meter_names)
+    keys = [meter_key(str(name)) for name in names.ravel()]
+    return np.array(keys, dtype=np.int64).astype(np.uint64).reshape(names.shape)
+
+
+def uniform_noise(
+    stream: int,
+    natal_chart_hash: IntArray,
+    date_ordinal: IntArray,
+    meter_names: MeterNames = ""
+) -> np.ndarray:
+    """
+    Uniform [0, 1) values for broadcast (chart hash, date ordinal, meter) keys.
+
+    Args:
+        stream: Stream id (STREAM_*)
+        natal_chart_hash: Chart hash(es)
+        date_ordinal: Date ordinal(s)
+        meter_names: Meter name(s)
+
+    Returns:
+        float64 array with the broadcast shape of the inputs (at least 1-D)
+    """
+    with np.errstate(over="ignore"):
+        h = _splitmix64(_as_uint64(stream) * _GOLDEN_GAMMA)
+        for key in (_as_uint64(natal_chart_hash), _as_uint64(date_ordinal), _meter_keys(meter_names)):
+            h = _splitmix64(h + _GOLDEN_GAMMA + key)
+    # Top 53 bits -> double in [0, 1)
+    return (h >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def cosmic_background(
+    natal_chart_hash: IntArray,
+    date_ordinal: IntArray,
+    meter_names: MeterNames = ""
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cosmic background (intensity 1.0-3.0, polarity -0.4 to +0.4) as arrays.
+
+    See core.get_cosmic_background for the meaning of the values.
+    """
+    intensity = 1.0 + uniform_noise(STREAM_BACKGROUND_INTENSITY, natal_chart_hash, date_ordinal, meter_names) * 2.0
+    polarity = -0.4 + uniform_noise(STREAM_BACKGROUND_POLARITY, natal_chart_hash, date_ordinal, meter_names) * 0.8
+    return intensity, polarity
+
+
+def cosmic_dither(
+    natal_chart_hash: IntArray,
+    date_ordinal: IntArray,
+    meter_names: MeterNames = ""
+) -> np.ndarray:
+    """
+    Unified-score dither (-8 to +8) as an array.
+
+    See core.get_cosmic_dither for the meaning of the values.
+    """
+    return -8.0 + uniform_noise(STREAM_DITHER, natal_chart_hash, date_ordinal, meter_names) * 16.0
+
+
+def key_uniforms(key: str) -> Tuple[float, float]:
+    """
+    Two independent uniform [0, 1) values derived from a string key.
+
+    Each value is the top 53 bits of one 64-bit word of the key's SHA-256
+    digest, so no generator is seeded per call.
+    """
+    digest = hashlib.sha256(key.encode()).digest()
+    return (
+        (int.from_bytes(digest[:8], "little") >> 11) * (1.0 / (1 << 53)),
+        (int.from_bytes(digest[8:16], "little") >> 11) * (1.0 / (1 << 53)),
+    )
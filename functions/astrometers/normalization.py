@@ -22,9 +22,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import math
 import json
+import hashlib
 import numpy as np
-from typing import Tuple, Dict, Optional
-from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple, Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
 from .constants import (
     DTI_MAX_ESTIMATE,
     HQS_MAX_POSITIVE_ESTIMATE,
@@ -45,6 +47,18 @@ _CALIBRATION_CONSTANTS: Optional[Dict] = None
 _HISTORICAL_DTI_SCORES: Optional[np.ndarray] = None
 _HISTORICAL_HQS_SCORES: Optional[np.ndarray] = None
 
+CALIBRATION_DIR = Path(__file__).parent / "calibration"
+CALIBRATION_JSON_PATH = CALIBRATION_DIR / "calibration_constants.json"
+# Compiled per-meter arrays (build_calibration_tables.py); rebuilt from the JSON
+# in memory when missing or out of date
+CALIBRATION_TABLES_PATH = CALIBRATION_DIR / "calibration_tables.npz"
+
+# Per-meter percentile tables compiled from calibration_constants.json
+CALIBRATION_METRICS = ("dti", "hqs", "intensity_v2")
+
+_CALIBRATION_TABLES: Optional["CalibrationTables"] = None
+_CALIBRATION_TABLES_LOADED = False
+
 
 def load_calibration_constants() -> Optional[Dict]:
     """
@@ -98,6 +112,175 @@ def load_historical_scores() -> Tuple[Optional[np.ndarray], Optional[np.ndarray]
         return None, None
 
 
+@dataclass(frozen=True)
+class CalibrationTables:
+    """
+    Per-meter percentile tables as NumPy arrays.
+
+    For each metric in CALIBRATION_METRICS, values[metric] is a
+    [meter x percentile] array sorted by percentile rank (NaN where a meter has
+    no calibration), and lo/hi are its first and last columns: the p01/p99
+    endpoints interpolate_percentile() maps to 0 and 100.
+    """
+    meter_names: Tuple[str, ...]
+    ranks: Dict[str, np.ndarray]
+    values: Dict[str, np.ndarray]
+    source_sha256: str
+    meter_index: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "meter_index", {name: i for i, name in enumerate(self.meter_names)})
+
+    def lo(self, metric: str) -> np.ndarray:
+        """p_min_value per meter (NaN if not calibrated)."""
+        return self.values[metric][:, 0]
+
+    def hi(self, metric: str) -> np.ndarray:
+        """p_max_value per meter (NaN if not calibrated)."""
+        return self.values[metric][:, -1]
+
+    def endpoints(self, metric: str, meter_name: Optional[str]) -> Optional[Tuple[float, float]]:
+        """(p_min_value, p_max_value) for a meter, or None if not calibrated."""
+        row = self.meter_index.get(meter_name)
+        if row is None:
+            return None
+        lo = float(self.values[metric][row, 0])
+        if math.isnan(lo):
+            return None
+        return lo, float(self.values[metric][row, -1])
+
+
+def compile_calibration_tables(calibration: Dict, source_sha256: str = "") -> CalibrationTables:
+    """
+    Compile the "meters" section of calibration_constants.json into arrays.
+
+    Args:
+        calibration: Parsed calibration_constants.json
+        source_sha256: Hash of the JSON bytes (to detect stale compiled tables)
+
+    Returns:
+        CalibrationTables
+    """
+    meters = calibration.get("meters", {})
+    meter_names = tuple(sorted(meters))
+
+    ranks = {}
+    values = {}
+    for metric in CALIBRATION_METRICS:
+        key = f"{metric}_percentiles"
+        metric_ranks = sorted({
+            int(k[1:])
+            for meter in meters.values()
+            for k in (meter.get(key) or {})
+            if k.startswith('p')
+        })
+        table = np.full((len(meter_names), len(metric_ranks)), np.nan)
+        for row, name in enumerate(meter_names):
+            percentiles = meters[name].get(key) or {}
+            if not percentiles:
+                continue
+            points = sorted((int(k[1:]), v) for k, v in percentiles.items() if k.startswith('p'))
+            if [rank for rank, _ in points] == metric_ranks:
+                table[row] = [v for _, v in points]
+            else:
+                # Ranks differ from the other meters: interpolate onto the shared
+                # ranks. np.interp holds the end values beyond the meter's own
+                # range, so the p_min/p_max endpoints stay the meter's own.
+                table[row] = np.interp(metric_ranks, *zip(*points))
+        ranks[metric] = np.array(metric_ranks, dtype=np.int16)
+        values[metric] = table
+
+    return CalibrationTables(
+        meter_names=meter_names,
+        ranks=ranks,
+        values=values,
+        source_sha256=source_sha256
+    )
+
+
+def _calibration_json_sha256() -> Optional[str]:
+    try:
+        return hashlib.sha256(CALIBRATION_JSON_PATH.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def build_calibration_tables(path: Path = CALIBRATION_TABLES_PATH) -> Path:
+    """
+    Compile calibration_constants.json and write it as a compact .npz.
+
+    Args:
+        path: Output .npz path
+
+    Returns:
+        Path written
+    """
+    calibration = load_calibration_constants()
+    if calibration is None:
+        raise ValueError(f"No calibration data at {CALIBRATION_JSON_PATH}. Re-run calibration scripts!")
+
+    tables = compile_calibration_tables(calibration, _calibration_json_sha256() or "")
+    arrays = {
+        "meter_names": np.array(tables.meter_names),
+        "source_sha256": np.array(tables.source_sha256),
+    }
+    for metric in CALIBRATION_METRICS:
+        arrays[f"{metric}_ranks"] = tables.ranks[metric]
+        arrays[f"{metric}_values"] = tables.values[metric]
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp.npz")
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _read_calibration_tables(path: Path) -> CalibrationTables:
+    with np.load(path) as data:
+        return CalibrationTables(
+            meter_names=tuple(str(name) for name in data["meter_names"]),
+            ranks={metric: data[f"{metric}_ranks"] for metric in CALIBRATION_METRICS},
+            values={metric: data[f"{metric}_values"] for metric in CALIBRATION_METRICS},
+            source_sha256=str(data["source_sha256"])
+        )
+
+
+def load_calibration_tables() -> Optional[CalibrationTables]:
+    """
+    Load per-meter calibration arrays once per process.
+
+    Reads the compiled .npz when it matches calibration_constants.json,
+    otherwise compiles the JSON in memory.
+
+    Returns:
+        CalibrationTables, or None if no calibration data is available
+    """
+    global _CALIBRATION_TABLES, _CALIBRATION_TABLES_LOADED
+
+    if _CALIBRATION_TABLES_LOADED:
+        return _CALIBRATION_TABLES
+
+    source_sha256 = _calibration_json_sha256()
+    tables = None
+    if source_sha256 is not None and CALIBRATION_TABLES_PATH.exists():
+        try:
+            tables = _read_calibration_tables(CALIBRATION_TABLES_PATH)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Warning: could not read {CALIBRATION_TABLES_PATH}: {e}")
+        if tables is not None and tables.source_sha256 != source_sha256:
+            print(f"Warning: {CALIBRATION_TABLES_PATH.name} is out of date, compiling calibration JSON")
+            tables = None
+
+    if tables is None:
+        calibration = load_calibration_constants()
+        if calibration is not None and "meters" in calibration:
+            tables = compile_calibration_tables(calibration, source_sha256 or "")
+
+    _CALIBRATION_TABLES = tables
+    _CALIBRATION_TABLES_LOADED = True
+    return tables
+
+
 def percentile_rank(score: float, historical_scores: np.ndarray) -> float:
     """
     Calculate percentile rank of a score within historical distribution.
@@ -204,20 +387,23 @@ def interpolate_percentile(
         >>> interpolate_percentile(0, percentiles)     # Below p01 → -10 → clamped to 0
         0.0
     """
-    # Create sorted list of (percentile_rank, raw_value) pairs
-    points = []
-    for key, raw_value in percentiles.items():
-        if key.startswith('p'):
-            percentile_rank = int(key[1:])  # "p50" → 50
-            points.append((percentile_rank, raw_value))
+    # Lowest and highest percentile ranks present ("p50" → 50)
+    ranked = [(int(key[1:]), raw_value) for key, raw_value in percentiles.items() if key.startswith('p')]
+    p_min_value = min(ranked)[1]  # Usually p01
+    p_max_value = max(ranked)[1]  # Usually p99
 
-    points.sort()  # Sort by percentile rank
+    return _interpolate_endpoints(value, p_min_value, p_max_value, use_sigmoid=use_sigmoid)
 
+
+def _interpolate_endpoints(
+    value: float,
+    p_min_value: float,
+    p_max_value: float,
+    use_sigmoid: bool = False
+) -> float:
+    """interpolate_percentile() given its p_min/p_max endpoint values."""
     # FULL RANGE LINEAR MAPPING (p01-p99 or available range)
     # Map percentile range to 0-100 with simple clamping
-    p_min_rank, p_min_value = points[0]   # Usually p01
-    p_max_rank, p_max_value = points[-1]  # Usually p99
-
     # Linear interpolation across full range
     if p_max_value == p_min_value:
         linear_score = 50.0  # Degenerate case
@@ -294,14 +480,13 @@ def normalize_intensity(dti: float, meter_name: str = None, use_empirical: bool
 
     if use_empirical:
         # Use meter-specific calibration if available
-        calibration = load_calibration_constants()
-        if calibration and meter_name:
-            # Version 4.0+ has per-meter calibration with full percentiles
-            if "meters" in calibration and meter_name in calibration["meters"]:
-                percentiles = calibration["meters"][meter_name]["dti_percentiles"]
-                return interpolate_percentile(dti, percentiles)
+        # Version 4.0+ has per-meter calibration with full percentiles
+        endpoints = _meter_endpoints("dti", meter_name)
+        if endpoints is not None:
+            return _interpolate_endpoints(dti, *endpoints)
 
         # Fallback to global calibration (version 2.0)
+        calibration = load_calibration_constants()
         if calibration and "dti_percentiles" in calibration:
             percentiles = calibration["dti_percentiles"]
             return interpolate_percentile(dti, percentiles)
@@ -327,19 +512,60 @@ def normalize_intensity_v2(intensity_v2: float, meter_name: str = None) -> float
     if intensity_v2 <= 0:
         return 0.0
 
-    calibration = load_calibration_constants()
-    if calibration and meter_name:
-        if "meters" in calibration and meter_name in calibration["meters"]:
-            meter_cal = calibration["meters"][meter_name]
-            if "intensity_v2_percentiles" in meter_cal and meter_cal["intensity_v2_percentiles"]:
-                percentiles = meter_cal["intensity_v2_percentiles"]
-                return interpolate_percentile(intensity_v2, percentiles)
+    endpoints = _meter_endpoints("intensity_v2", meter_name)
+    if endpoints is not None:
+        return _interpolate_endpoints(intensity_v2, *endpoints)
 
     # Fallback: linear scaling with estimated p99 of 150
     # (This should rarely be hit once calibration is run)
     return min(100.0, (intensity_v2 / 150.0) * 100.0)
 
 
+def normalize_intensity_v2_batch(intensities: Sequence[float], meter_names: Sequence[str]) -> np.ndarray:
+    """
+    normalize_intensity_v2() for many meters in one vectorized pass.
+
+    Element i equals normalize_intensity_v2(intensities[i], meter_names[i]):
+    the same percentile-endpoint mapping, evaluated with array arithmetic.
+
+    Args:
+        intensities: Raw V2 intensities
+        meter_names: Meter name per intensity
+
+    Returns:
+        Array of intensity meter values (0-100)
+    """
+    values = np.asarray(intensities, dtype=np.float64)
+    fallback = np.minimum(100.0, (values / 150.0) * 100.0)
+
+    tables = load_calibration_tables()
+    if tables is None or not tables.meter_names:
+        return np.where(values <= 0, 0.0, fallback)
+
+    rows = np.array([tables.meter_index.get(name, -1) for name in meter_names], dtype=np.intp)
+    calibrated = rows >= 0
+    lo = np.where(calibrated, tables.lo("intensity_v2")[rows], np.nan)
+    hi = np.where(calibrated, tables.hi("intensity_v2")[rows], np.nan)
+    calibrated &= ~np.isnan(lo)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        linear = ((values - lo) / (hi - lo)) * 100.0
+    linear = np.where(hi == lo, 50.0, linear)  # Degenerate case
+    scaled = np.where(calibrated, np.clip(linear, 0.0, 100.0), fallback)
+
+    return np.where(values <= 0, 0.0, scaled)
+
+
+def _meter_endpoints(metric: str, meter_name: Optional[str]) -> Optional[Tuple[float, float]]:
+    """(p_min_value, p_max_value) of a meter's compiled calibration, if any."""
+    if not meter_name:
+        return None
+    tables = load_calibration_tables()
+    if tables is None:
+        return None
+    return tables.endpoints(metric, meter_name)
+
+
 def normalize_harmony(hqs: float, meter_name: str = None, use_empirical: bool = True) -> float:
     """
     Normalize HQS (Harmonic Quality Score) to 0-100 Harmony Meter.
@@ -376,14 +602,13 @@ def normalize_harmony(hqs: float, meter_name: str = None, use_empirical: bool =
 
     if use_empirical:
         # Use meter-specific calibration if available
-        calibration = load_calibration_constants()
-        if calibration and meter_name:
-            # Version 4.0+ has per-meter calibration with full percentiles
-            if "meters" in calibration and meter_name in calibration["meters"]:
-                percentiles = calibration["meters"][meter_name]["hqs_percentiles"]
-                return interpolate_percentile(hqs, percentiles)
+        # Version 4.0+ has per-meter calibration with full percentiles
+        endpoints = _meter_endpoints("hqs", meter_name)
+        if endpoints is not None:
+            return _interpolate_endpoints(hqs, *endpoints)
 
         # Fallback to global calibration (version 2.0)
+        calibration = load_calibration_constants()
         if calibration and "hqs_percentiles" in calibration:
             percentiles = calibration["hqs_percentiles"]
             return interpolate_percentile(hqs, percentiles)
@@ -0,0 +1,90 @@
+"""
+Natal scoring profile: the natal-only half of astrometer scoring.
+
+Weightage (dignity, house multiplier, chart ruler, sensitivity), the natal
+house map, the ascendant sign, the cosmic background chart hash and each
+meter's natal filter depend only on the natal chart. The profile is computed
+once when the chart is created or regenerated and stored next to natal_chart
+in the user document (users/{userId}.scoring_profile), so daily meter
+calculation only has to evaluate the transit side.
+
+Everything is stored as plain JSON/Firestore types (str, int, float, list, dict).
+
+Usage:
+    profile = build_scoring_profile(natal_chart)
+    user_ref.set({..., "natal_chart": natal_chart, "scoring_profile": profile})
+
+    profile = usable_scoring_profile(user_data.get("scoring_profile"), natal_chart)
+    meters = get_meters(natal_chart, transit_chart, scoring_profile=profile)
+"""
+
+from typing import Optional
+
+from astro import Planet, ZodiacSign
+from .weightage import calculate_weightage
+from .meters import get_natal_chart_hash, natal_house_map, natal_meter_masks
+
+
+# Bump when the profile layout or any natal-side scoring rule changes;
+# stored profiles with another version are ignored and recomputed
+SCORING_PROFILE_VERSION = 1
+
+
+def build_scoring_profile(natal_chart: dict) -> dict:
+    """
+    Compute the natal scoring profile for a chart.
+
+    Args:
+        natal_chart: Natal chart dict from compute_birth_chart()
+
+    Returns:
+        {
+            "version": int,
+            "chart_hash": int,                       # cosmic background seed
+            "ascendant_sign": str | None,
+            "house_map": {planet: house},
+            "weightage": {planet: W_i},
+            "meter_masks": {meter_name: [planet, ...]},  # natal planets each meter counts
+        }
+    """
+    # Same ascendant lookup as astrometers.core.transit_aspects_from_arrays
+    ascendant_sign = None
+    if "angles" in natal_chart and "asc" in natal_chart["angles"]:
+        ascendant_sign = ZodiacSign(natal_chart["angles"]["asc"]["sign"])
+
+    weightage = {}
+    for planet in natal_chart.get("planets", []):
+        if planet["name"] in weightage:
+            continue
+        weightage[planet["name"]] = calculate_weightage(
+            planet=Planet(planet["name"]),
+            sign=ZodiacSign(planet["sign"]),
+            house_number=planet["house"],
+            degree_in_sign=planet.get("signed_deg", 0) or 0.0,
+            ascendant_sign=ascendant_sign
+        )
+
+    return {
+        "version": SCORING_PROFILE_VERSION,
+        "chart_hash": get_natal_chart_hash(natal_chart),
+        "ascendant_sign": ascendant_sign.value if ascendant_sign is not None else None,
+        "house_map": natal_house_map(natal_chart),
+        "weightage": weightage,
+        "meter_masks": natal_meter_masks(natal_chart),
+    }
+
+
+def usable_scoring_profile(profile: Optional[dict], natal_chart: dict) -> Optional[dict]:
+    """
+    Return a stored profile if it is current for natal_chart, else None.
+
+    A profile is current when it has this module's version, the chart's hash
+    and the chart's house map. Callers fall back to computing from the chart.
+    """
+    if not profile or profile.get("version") != SCORING_PROFILE_VERSION:
+        return None
+    if profile.get("chart_hash") != get_natal_chart_hash(natal_chart):
+        return None
+    if profile.get("house_map") != natal_house_map(natal_chart):
+        return None
+    return profile
@@ -0,0 +1,209 @@
+"""
+Cross-user cache of meter work for approximate natal charts.
+
+Users without a birth time get compute_birth_chart(birth_date): noon UTC at
+(0, 0). Everyone born on the same day therefore has the same natal chart,
+the same aspects and the same pre-noise meter scores; only the user_id
+cosmic background noise (applied in _finish_meter) differs.
+
+This module keeps one get_meters_range() day_cache per approximate chart,
+shared by every user with that birth date, so a day's aspects, raw scores
+and trend baseline are computed once per birth date instead of once per
+user. Exact charts are never shared.
+
+Usage:
+    cache = shared_day_cache(natal_chart, birth_date, exact_chart, date="2025-10-17")
+    readings = get_meters_range(natal_chart, date, date, user_id=user_id, day_cache=cache)
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from .meters import get_natal_chart_hash
+
+
+# Memory budget for all shared day caches on one instance (functions run
+# with 512 MB; this keeps the cache to an eighth of it)
+SHARED_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Memory held per cached day of one chart: its aspects, scores and trend
+# baseline. Measured with tracemalloc at ~75 KB (see
+# tests/test_shared_cache.py::test_bytes_per_day_covers_measured), with
+# headroom for charts with more aspects.
+SHARED_CACHE_BYTES_PER_DAY = 128 * 1024
+
+# Days kept per birth date, counting back from the newest date requested
+SHARED_CACHE_MAX_DAYS = 8
+
+
+class SharedDayCache:
+    """
+    get_meters_range() day cache for one approximate chart.
+
+    Supports the dict operations get_meters_range() uses (get, item
+    assignment, iteration), each under the owning SharedDayCaches lock, so
+    requests for users born on the same day can read and fill it
+    concurrently. Two requests filling the same day may both compute it;
+    the results are identical.
+    """
+
+    def __init__(self, owner: "SharedDayCaches"):
+        self._owner = owner
+        self._data: Dict[Hashable, Any] = {}
+        self.days = 0  # Days held ("aspects" entries), for the memory budget
+        self.evicted = False
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._owner._lock:
+            return self._data.get(key, default)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._owner._lock:
+            is_new_day = key[0] == "aspects" and key not in self._data
+            self._data[key] = value
+            if is_new_day:
+                self._owner._charge(self, 1)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._owner._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        with self._owner._lock:
+            return len(self._data)
+
+
+class SharedDayCaches:
+    """
+    LRU of get_meters_range() day caches keyed by approximate chart.
+
+    Bounded by a memory budget rather than a chart count: each chart is
+    charged bytes_per_day for every day it holds, and the least recently
+    used charts are dropped once the total exceeds max_bytes. All reads,
+    writes, pruning and eviction take one lock.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = SHARED_CACHE_MAX_BYTES,
+        max_days: int = SHARED_CACHE_MAX_DAYS,
+        bytes_per_day: int = SHARED_CACHE_BYTES_PER_DAY
+    ):
+        self.max_bytes = max_bytes
+        self.max_days = max_days
+        self.bytes_per_day = bytes_per_day
+        self._lock = threading.Lock()
+        self._caches: OrderedDict[Tuple[str, int], SharedDayCache] = OrderedDict()
+        self._days = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by all caches."""
+        return self._days * self.bytes_per_day
+
+    def get(self, key: Tuple[str, int], date: Optional[str] = None) -> SharedDayCache:
+        """
+        Day cache for a chart key, created if missing.
+
+        Args:
+            key: approximate_chart_key()
+            date: Newest date about to be requested (prunes days older than max_days)
+        """
+        with self._lock:
+            cache = self._caches.get(key)
+            if cache is None:
+                self.misses += 1
+                cache = SharedDayCache(self)
+                self._caches[key] = cache
+            else:
+                self.hits += 1
+                self._caches.move_to_end(key)
+
+            if date is not None:
+                self._prune(cache, date)
+            return cache
+
+    def _prune(self, cache: SharedDayCache, date: str) -> None:
+        # Day cache keys are (kind, "YYYY-MM-DD", ...); caller holds the lock
+        oldest = (datetime.strptime(date, "%Y-%m-%d") - timedelta(days=self.max_days)).strftime("%Y-%m-%d")
+        stale: List[Hashable] = [k for k in cache._data if k[1] < oldest]
+        for cache_key in stale:
+            del cache._data[cache_key]
+        self._charge(cache, -sum(1 for k in stale if k[0] == "aspects"))
+
+    def _charge(self, cache: SharedDayCache, days: int) -> None:
+        """Account days added to (or removed from) a cache, then evict; caller holds the lock."""
+        if cache.evicted or not days:
+            return
+        cache.days += days
+        self._days += days
+        # Evict least recently used charts, never the one being filled
+        while self.nbytes > self.max_bytes and len(self._caches) > 1:
+            oldest_key = next(iter(self._caches))
+            if self._caches[oldest_key] is cache:
+                self._caches.move_to_end(oldest_key)
+                continue
+            evicted = self._caches.pop(oldest_key)
+            evicted.evicted = True
+            self._days -= evicted.days
+
+    def clear(self) -> None:
+        with self._lock:
+            for cache in self._caches.values():
+                cache.evicted = True
+            self._caches.clear()
+            self._days = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._caches)
+
+
+_SHARED_DAY_CACHES = SharedDayCaches()
+
+
+def approximate_chart_key(natal_chart: dict, birth_date: str, exact_chart: bool) -> Optional[Tuple[str, int]]:
+    """
+    Sharing key for an approximate natal chart, or None for exact charts.
+
+    The chart hash guards against stored charts that were not generated by
+    the current compute_birth_chart(birth_date).
+    """
+    if exact_chart or not birth_date:
+        return None
+    return birth_date, get_natal_chart_hash(natal_chart)
+
+
+def shared_day_cache(
+    natal_chart: dict,
+    birth_date: str,
+    exact_chart: bool,
+    date: Optional[str] = None
+) -> Optional[SharedDayCache]:
+    """
+    Shared get_meters_range() day_cache for an approximate chart.
+
+    Args:
+        natal_chart: User's natal chart
+        birth_date: User's birth date "YYYY-MM-DD"
+        exact_chart: Whether the chart used birth time and location
+        date: Newest reading date about to be requested (optional)
+
+    Returns:
+        Day cache shared with every user born that day, or None for exact charts
+    """
+    key = approximate_chart_key(natal_chart, birth_date, exact_chart)
+    if key is None:
+        return None
+    return _SHARED_DAY_CACHES.get(key, date)
+
+
+def clear_shared_day_caches() -> None:
+    """Drop all shared day caches (tests, or after a scoring change)."""
+    _SHARED_DAY_CACHES.clear()
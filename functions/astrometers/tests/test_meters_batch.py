@@ -0,0 +1,72 @@
+"""
+Unit tests for batched 17-meter scoring (aspect x meter membership matrix).
+
+The batched path must reproduce the per-meter filter_aspects() +
+calculate_astrometers() path exactly. Its speed is tracked by the get_meters
+kernel in tests/benchmarks/kernel_benchmark.py.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+from datetime import datetime
+from astro import compute_birth_chart, get_transit_chart
+from astrometers.core import calculate_all_aspects
+from astrometers.meters import (
+    METER_CONFIGS,
+    METER_NAMES,
+    _score_all_meters,
+    _score_meter,
+    filter_aspects,
+    meter_membership_matrix,
+)
+
+
+CASES = [
+    ("1985-05-15", "2025-10-17"),
+    ("1990-06-15", "2025-01-01"),
+    ("2000-02-29", "2024-12-21"),
+    ("1970-11-03", "2026-03-20"),
+]
+
+
+def _setup(birth_date, transit_date):
+    natal, _ = compute_birth_chart(birth_date)
+    aspects = calculate_all_aspects(natal, get_transit_chart(transit_date))
+    return natal, aspects, datetime.strptime(transit_date, "%Y-%m-%d")
+
+
+@pytest.mark.parametrize("birth_date,transit_date", CASES)
+def test_membership_matches_filter_aspects(birth_date, transit_date):
+    natal, aspects, _ = _setup(birth_date, transit_date)
+    membership = meter_membership_matrix(aspects, natal)
+
+    assert membership.shape == (len(aspects), len(METER_NAMES))
+    for j, meter_name in enumerate(METER_NAMES):
+        expected = filter_aspects(aspects, METER_CONFIGS[meter_name], natal)
+        assert [a for a, keep in zip(aspects, membership[:, j]) if keep] == expected
+
+
+@pytest.mark.parametrize("birth_date,transit_date", CASES)
+@pytest.mark.parametrize("use_v2_scoring", [True, False])
+def test_batch_matches_per_meter(birth_date, transit_date, use_v2_scoring):
+    natal, aspects, date = _setup(birth_date, transit_date)
+    batched = _score_all_meters(aspects, natal, date, use_v2_scoring=use_v2_scoring)
+
+    for meter_name, config in METER_CONFIGS.items():
+        expected = _score_meter(meter_name, config, aspects, natal, date, use_v2_scoring=use_v2_scoring)
+        raw, intensity, harmony, dither = batched[meter_name]
+        assert raw == expected[0]
+        assert (intensity, harmony, dither) == expected[1:]
+
+
+def test_no_aspects():
+    natal, _ = compute_birth_chart("1985-05-15")
+    date = datetime(2025, 10, 17)
+    batched = _score_all_meters([], natal, date)
+
+    for meter_name, config in METER_CONFIGS.items():
+        assert batched[meter_name] == _score_meter(meter_name, config, [], natal, date)
+
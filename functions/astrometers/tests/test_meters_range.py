@@ -0,0 +1,96 @@
+"""
+Unit tests for get_meters_range (multi-day astrometer timeline).
+
+Every day in a range must equal an independent get_meters() call.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+from datetime import datetime, timedelta
+from astro import compute_birth_chart, get_transit_chart
+from astrometers.meters import get_meters, get_meters_range
+from astrometers.core import calculate_all_aspects
+
+
+@pytest.fixture(scope="module")
+def natal_chart():
+    chart, _ = compute_birth_chart("1990-06-15")
+    return chart
+
+
+def _direct(natal_chart, day: datetime, **kwargs):
+    return get_meters(
+        natal_chart=natal_chart,
+        transit_chart=get_transit_chart(day.strftime("%Y-%m-%d")),
+        date=day,
+        **kwargs
+    )
+
+
+class TestRangeMatchesDaily:
+    """Range results are identical to per-day get_meters()."""
+
+    def test_week_without_user(self, natal_chart):
+        week = get_meters_range(natal_chart, "2025-10-13", "2025-10-19")
+
+        assert len(week) == 7
+        for offset, reading in enumerate(week):
+            day = datetime(2025, 10, 13) + timedelta(days=offset)
+            assert reading.model_dump() == _direct(natal_chart, day).model_dump()
+
+    def test_user_noise_matches(self, natal_chart):
+        days = get_meters_range(natal_chart, "2025-10-13", "2025-10-15", user_id="user_abc")
+
+        for offset, reading in enumerate(days):
+            day = datetime(2025, 10, 13) + timedelta(days=offset)
+            expected = _direct(natal_chart, day, user_id="user_abc")
+            assert reading.model_dump() == expected.model_dump()
+
+    def test_without_trends(self, natal_chart):
+        (reading,) = get_meters_range(natal_chart, "2025-10-13", "2025-10-13", calculate_trends=False)
+
+        assert reading.clarity.trend is None
+        expected = _direct(natal_chart, datetime(2025, 10, 13), calculate_trends=False)
+        assert reading.model_dump() == expected.model_dump()
+
+
+class TestRangeSharing:
+    """Per-day work is shared, not repeated."""
+
+    def test_each_day_aspects_computed_once(self, natal_chart):
+        calls = []
+
+        def aspects_for_date(day_str):
+            calls.append(day_str)
+            transit = get_transit_chart(day_str)
+            return transit, calculate_all_aspects(natal_chart, transit)
+
+        get_meters_range(natal_chart, "2025-10-13", "2025-10-19", aspects_for_date=aspects_for_date)
+
+        # The 7 days plus the day before (trend baseline for the first day)
+        assert sorted(calls) == sorted(set(calls))
+        assert len(calls) == 8
+
+    def test_day_cache_shared_across_calls(self, natal_chart):
+        calls = []
+
+        def aspects_for_date(day_str):
+            calls.append(day_str)
+            transit = get_transit_chart(day_str)
+            return transit, calculate_all_aspects(natal_chart, transit)
+
+        cache = {}
+        get_meters_range(natal_chart, "2025-10-14", "2025-10-14",
+                         aspects_for_date=aspects_for_date, day_cache=cache)
+        get_meters_range(natal_chart, "2025-10-13", "2025-10-13",
+                         aspects_for_date=aspects_for_date, day_cache=cache)
+
+        assert sorted(calls) == ["2025-10-12", "2025-10-13", "2025-10-14"]
+
+
+def test_end_before_start_raises(natal_chart):
+    with pytest.raises(ValueError):
+        get_meters_range(natal_chart, "2025-10-19", "2025-10-13")
@@ -0,0 +1,110 @@
+"""
+Unit tests for the counter-based cosmic background noise.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import subprocess
+import numpy as np
+import pytest
+
+from astrometers.core import get_cosmic_background, get_cosmic_dither
+from astrometers.meters import METER_NAMES, calculate_cosmic_background
+from astrometers.noise import (
+    STREAM_DITHER,
+    cosmic_background,
+    cosmic_dither,
+    key_uniforms,
+    meter_key,
+    uniform_noise,
+)
+
+
+MASK = (1 << 64) - 1
+
+
+def _reference_uniform(stream: int, chart_hash: int, date_ordinal: int, meter_name: str) -> float:
+    """Pure-Python splitmix64 chain, independent of the NumPy implementation."""
+    def mix(x):
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK
+        return x ^ (x >> 31)
+
+    gamma = 0x9E3779B97F4A7C15
+    h = mix((stream * gamma) & MASK)
+    for key in (chart_hash, date_ordinal, meter_key(meter_name)):
+        h = mix((h + gamma + (key & MASK)) & MASK)
+    return (h >> 11) * (1.0 / (1 << 53))
+
+
+@pytest.mark.parametrize("meter_name", ["", "clarity", "vision"])
+@pytest.mark.parametrize("chart_hash,date_ordinal", [(0, 739000), (123456, 739541), (999999, 1)])
+def test_matches_reference(meter_name, chart_hash, date_ordinal):
+    actual = uniform_noise(STREAM_DITHER, chart_hash, date_ordinal, meter_name)
+    assert actual.tolist() == [_reference_uniform(STREAM_DITHER, chart_hash, date_ordinal, meter_name)]
+
+
+def test_broadcast_matches_scalar():
+    ordinals = np.arange(739000, 739010)
+    dither = cosmic_dither(4242, ordinals[:, None], METER_NAMES)
+    intensity, polarity = cosmic_background(4242, ordinals[:, None], METER_NAMES)
+
+    assert dither.shape == (len(ordinals), len(METER_NAMES))
+    for i, ordinal in enumerate(ordinals.tolist()):
+        for j, name in enumerate(METER_NAMES):
+            assert dither[i, j] == get_cosmic_dither(4242, ordinal, name)
+            assert (intensity[i, j], polarity[i, j]) == get_cosmic_background(4242, ordinal, name)
+
+
+def test_ranges():
+    ordinals = np.arange(730000, 740000)
+    intensity, polarity = cosmic_background(777, ordinals, "")
+    dither = cosmic_dither(777, ordinals, "clarity")
+
+    assert intensity.min() >= 1.0 and intensity.max() < 3.0
+    assert polarity.min() >= -0.4 and polarity.max() < 0.4
+    assert dither.min() >= -8.0 and dither.max() < 8.0
+    # Streams and keys are independent
+    assert len(np.unique(dither)) == len(ordinals)
+
+
+def test_stable_across_processes():
+    """Same values regardless of per-process str hash salting."""
+    code = (
+        "from astrometers.core import get_cosmic_dither; "
+        "print(repr(get_cosmic_dither(123456, 739541, 'clarity')))"
+    )
+    functions_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    outputs = set()
+    for seed in ["0", "1", "random"]:
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=functions_dir,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        outputs.add(result.stdout.strip())
+
+    assert outputs == {repr(get_cosmic_dither(123456, 739541, "clarity"))}
+
+
+def test_key_uniforms():
+    u1, u2 = key_uniforms("user_1:2025-10-17:clarity")
+
+    assert (u1, u2) == key_uniforms("user_1:2025-10-17:clarity")
+    assert 0.0 <= u1 < 1.0 and 0.0 <= u2 < 1.0
+    assert u1 != u2
+    assert key_uniforms("user_1:2025-10-18:clarity") != (u1, u2)
+
+
+def test_user_meter_noise_ranges():
+    for i in range(200):
+        intensity_noise, harmony_nudge = calculate_cosmic_background(f"user_{i}", "2025-10-17", "clarity", 3)
+        assert -5.0 <= intensity_noise < 10.0
+        assert 0.0 <= harmony_nudge < 3.0
+
+    assert calculate_cosmic_background("user_1", "2025-10-17", "clarity", 0) == (0.0, 0.0)
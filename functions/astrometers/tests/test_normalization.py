@@ -5,11 +5,15 @@ Tests the conversion of raw DTI/HQS scores to 0-100 meter scales
 using empirical calibration data.
 """
 
+import json
 import sys
 import os
+from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 import pytest
+import numpy as np
+from astrometers import normalization
 from astrometers.normalization import (
     normalize_with_soft_ceiling,
     normalize_intensity,
@@ -20,6 +24,12 @@ from astrometers.normalization import (
     get_meter_interpretation,
     MeterInterpretation,
     load_calibration_constants,
+    load_calibration_tables,
+    build_calibration_tables,
+    compile_calibration_tables,
+    interpolate_percentile,
+    normalize_intensity_v2,
+    normalize_intensity_v2_batch,
 )
 
 
@@ -319,5 +329,86 @@ def test_calibration_file_has_meter_specific_data():
         assert "p01" in meter_data["hqs_percentiles"]
 
 
+# =============================================================================
+# Compiled Calibration Table Tests
+# =============================================================================
+
+METRICS = [
+    ("dti", normalize_intensity),
+    ("hqs", normalize_harmony),
+    ("intensity_v2", normalize_intensity_v2),
+]
+
+
+@pytest.mark.parametrize("metric,normalize", METRICS)
+def test_compiled_tables_match_percentile_dicts(metric, normalize):
+    """Table-backed normalization equals interpolate_percentile() on the JSON."""
+    calibration = load_calibration_constants()
+
+    for meter_name, meter_cal in calibration["meters"].items():
+        percentiles = meter_cal[f"{metric}_percentiles"]
+        for raw in [1.0, percentiles["p01"], percentiles["p50"], percentiles["p99"], 1e6]:
+            assert normalize(raw, meter_name) == interpolate_percentile(raw, percentiles)
+
+
+def test_intensity_v2_batch_matches_scalar():
+    meter_names = sorted(load_calibration_constants()["meters"]) + ["unknown_meter"]
+    rng = np.random.default_rng(7)
+    raw = rng.uniform(-10.0, 250.0, size=(20, len(meter_names)))
+    raw[0] = 0.0
+
+    for row in raw:
+        batched = normalize_intensity_v2_batch(row, meter_names).tolist()
+        assert batched == [normalize_intensity_v2(v, m) for v, m in zip(row.tolist(), meter_names)]
+
+
+def test_npz_round_trip(tmp_path, monkeypatch):
+    compiled = load_calibration_tables()
+    path = build_calibration_tables(tmp_path / "tables.npz")
+
+    monkeypatch.setattr(normalization, "CALIBRATION_TABLES_PATH", path)
+    monkeypatch.setattr(normalization, "_CALIBRATION_TABLES", None)
+    monkeypatch.setattr(normalization, "_CALIBRATION_TABLES_LOADED", False)
+    loaded = load_calibration_tables()
+
+    assert loaded.meter_names == compiled.meter_names
+    assert loaded.source_sha256 == compiled.source_sha256
+    for metric in normalization.CALIBRATION_METRICS:
+        np.testing.assert_array_equal(loaded.values[metric], compiled.values[metric])
+
+
+def test_stale_npz_is_ignored(tmp_path, monkeypatch):
+    path = build_calibration_tables(tmp_path / "tables.npz")
+    monkeypatch.setattr(normalization, "CALIBRATION_TABLES_PATH", path)
+    monkeypatch.setattr(normalization, "_calibration_json_sha256", lambda: "different")
+    monkeypatch.setattr(normalization, "_CALIBRATION_TABLES", None)
+    monkeypatch.setattr(normalization, "_CALIBRATION_TABLES_LOADED", False)
+
+    assert load_calibration_tables().source_sha256 == "different"
+
+
+def test_non_standard_ranks_fall_back_to_interpolation():
+    """A meter calibrated at other ranks compiles instead of raising."""
+    standard = {"p01": 1.0, "p50": 5.0, "p99": 9.0}
+    sparse = {"p05": 2.0, "p95": 8.0}
+    calibration = {"meters": {
+        "a": {f"{m}_percentiles": standard for m in normalization.CALIBRATION_METRICS},
+        "b": {f"{m}_percentiles": sparse for m in normalization.CALIBRATION_METRICS},
+    }}
+
+    tables = compile_calibration_tables(calibration)
+
+    assert tables.endpoints("dti", "a") == (1.0, 9.0)
+    assert tables.endpoints("dti", "b") == (2.0, 8.0)
+    for raw in [0.0, 3.0, 5.0, 10.0]:
+        assert normalization._interpolate_endpoints(raw, *tables.endpoints("dti", "b")) == \
+            interpolate_percentile(raw, sparse)
+
+
+def test_tables_are_built_on_deploy():
+    firebase = json.loads((Path(normalization.__file__).parents[2] / "firebase.json").read_text())
+    assert "build_calibration_tables.py" in " ".join(firebase["functions"][0]["predeploy"])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,94 @@
+"""
+Unit tests for the persisted natal scoring profile.
+
+Meters computed with a stored profile must equal meters computed from the
+natal chart alone.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import json
+import pytest
+from datetime import datetime
+from astro import compute_birth_chart, get_transit_chart
+from astrometers.core import calculate_all_aspects, calculate_aspect_contribution
+from astrometers.meters import get_meters, get_meters_range, meter_membership_matrix
+from astrometers.profile import (
+    SCORING_PROFILE_VERSION,
+    build_scoring_profile,
+    usable_scoring_profile,
+)
+
+
+@pytest.fixture(scope="module", params=["v1", "v2"])
+def natal_chart(request):
+    if request.param == "v1":
+        chart, _ = compute_birth_chart("1990-06-15")
+    else:
+        chart, _ = compute_birth_chart(
+            birth_date="1985-05-15",
+            birth_time="14:30",
+            birth_timezone="America/New_York",
+            birth_lat=40.7128,
+            birth_lon=-74.0060
+        )
+    return chart
+
+
+@pytest.fixture(scope="module")
+def profile(natal_chart):
+    # Round-trip through JSON, as stored in Firestore
+    return json.loads(json.dumps(build_scoring_profile(natal_chart)))
+
+
+def test_profile_fields(profile, natal_chart):
+    assert profile["version"] == SCORING_PROFILE_VERSION
+    assert set(profile["weightage"]) == {p["name"] for p in natal_chart["planets"]}
+    assert len(profile["meter_masks"]) == 17
+
+
+def test_aspects_match(profile, natal_chart):
+    transit = get_transit_chart("2025-10-17")
+    plain = calculate_all_aspects(natal_chart, transit)
+    profiled = calculate_all_aspects(natal_chart, transit, scoring_profile=profile)
+
+    assert [calculate_aspect_contribution(a) for a in profiled] == \
+        [calculate_aspect_contribution(a) for a in plain]
+    assert (meter_membership_matrix(profiled, natal_chart, scoring_profile=profile)
+            == meter_membership_matrix(plain, natal_chart)).all()
+
+
+def test_meters_match(profile, natal_chart):
+    transit = get_transit_chart("2025-10-17")
+    date = datetime(2025, 10, 17)
+
+    expected = get_meters(natal_chart, transit, date=date, user_id="user_abc")
+    actual = get_meters(natal_chart, transit, date=date, user_id="user_abc", scoring_profile=profile)
+
+    assert actual.model_dump() == expected.model_dump()
+
+
+def test_meters_range_match(profile, natal_chart):
+    expected = get_meters_range(natal_chart, "2025-10-13", "2025-10-15")
+    actual = get_meters_range(natal_chart, "2025-10-13", "2025-10-15", scoring_profile=profile)
+
+    assert [r.model_dump() for r in actual] == [r.model_dump() for r in expected]
+
+
+class TestUsableScoringProfile:
+    """Stale or missing profiles are rejected so callers fall back to the chart."""
+
+    def test_current_profile(self, profile, natal_chart):
+        assert usable_scoring_profile(profile, natal_chart) is profile
+
+    def test_missing_profile(self, natal_chart):
+        assert usable_scoring_profile(None, natal_chart) is None
+
+    def test_other_version(self, profile, natal_chart):
+        assert usable_scoring_profile({**profile, "version": 0}, natal_chart) is None
+
+    def test_other_chart(self, profile):
+        other, _ = compute_birth_chart("2000-02-29")
+        assert usable_scoring_profile(profile, other) is None
@@ -0,0 +1,164 @@
+"""
+Unit tests for the cross-user day cache of approximate natal charts.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import gc
+import threading
+import tracemalloc
+
+import pytest
+from astro import compute_birth_chart, get_transit_chart
+from astrometers.core import calculate_all_aspects
+from astrometers.meters import get_meters_range
+from astrometers.shared_cache import (
+    SHARED_CACHE_BYTES_PER_DAY,
+    SharedDayCaches,
+    clear_shared_day_caches,
+    shared_day_cache,
+)
+
+
+BIRTH_DATE = "1990-06-15"
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    clear_shared_day_caches()
+    yield
+    clear_shared_day_caches()
+
+
+@pytest.fixture(scope="module")
+def natal_chart():
+    chart, exact = compute_birth_chart(BIRTH_DATE)
+    assert exact is False
+    return chart
+
+
+def test_users_share_work_but_keep_their_noise(natal_chart):
+    calls = []
+
+    def aspects_for_date(day_str):
+        calls.append(day_str)
+        transit = get_transit_chart(day_str)
+        return transit, calculate_all_aspects(natal_chart, transit)
+
+    readings = {}
+    for user_id in ["user_a", "user_b", "user_c"]:
+        cache = shared_day_cache(natal_chart, BIRTH_DATE, False, date="2025-10-17")
+        (readings[user_id],) = get_meters_range(
+            natal_chart, "2025-10-17", "2025-10-17", user_id=user_id,
+            aspects_for_date=aspects_for_date, day_cache=cache
+        )
+
+    # Today and yesterday (trend baseline), once for all three users
+    assert sorted(calls) == ["2025-10-16", "2025-10-17"]
+
+    for user_id, reading in readings.items():
+        (expected,) = get_meters_range(natal_chart, "2025-10-17", "2025-10-17", user_id=user_id)
+        assert reading.model_dump() == expected.model_dump()
+    assert readings["user_a"].model_dump() != readings["user_b"].model_dump()
+
+
+def test_exact_charts_are_not_shared(natal_chart):
+    assert shared_day_cache(natal_chart, BIRTH_DATE, True) is None
+
+
+def test_same_birth_date_same_cache(natal_chart):
+    other, _ = compute_birth_chart(BIRTH_DATE)
+    assert shared_day_cache(natal_chart, BIRTH_DATE, False) is shared_day_cache(other, BIRTH_DATE, False)
+
+
+def test_different_chart_gets_own_cache(natal_chart):
+    other, _ = compute_birth_chart("1990-06-16")
+    assert shared_day_cache(natal_chart, BIRTH_DATE, False) is not shared_day_cache(other, BIRTH_DATE, False)
+
+
+def test_old_days_pruned():
+    caches = SharedDayCaches(max_days=3)
+    cache = caches.get(("2000-01-01", 1))
+    cache[("aspects", "2025-10-01")] = "old"
+    cache[("scores", "2025-10-09", True, True, 2.0, 0.5)] = "recent"
+    assert caches.nbytes == caches.bytes_per_day
+
+    caches.get(("2000-01-01", 1), date="2025-10-10")
+
+    assert list(cache) == [("scores", "2025-10-09", True, True, 2.0, 0.5)]
+    assert caches.nbytes == 0
+
+
+def _fill(cache, days):
+    for day in range(1, days + 1):
+        cache[("aspects", f"2025-10-{day:02d}")] = day
+
+
+def test_evicts_to_byte_budget():
+    caches = SharedDayCaches(max_bytes=5, bytes_per_day=1)
+    first = caches.get(("2000-01-01", 1))
+    _fill(first, 2)
+    second = caches.get(("2000-01-02", 2))
+    _fill(second, 2)
+    third = caches.get(("2000-01-03", 3))
+    _fill(third, 2)
+
+    assert len(caches) == 2
+    assert caches.nbytes == 4
+    assert caches.get(("2000-01-01", 1)) is not first
+    assert caches.get(("2000-01-03", 3)) is third
+
+
+def test_filling_cache_is_never_evicted():
+    caches = SharedDayCaches(max_bytes=2, bytes_per_day=1)
+    other = caches.get(("2000-01-01", 1))
+    _fill(other, 1)
+    cache = caches.get(("2000-01-02", 2))
+    _fill(cache, 4)
+
+    assert len(caches) == 1
+    assert caches.get(("2000-01-02", 2)) is cache
+
+
+def test_concurrent_fill_and_prune():
+    caches = SharedDayCaches(max_days=2)
+    key = ("2000-01-01", 1)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(300):
+                day = f"2025-{1 + (i + offset) % 12:02d}-15"
+                cache = caches.get(key, date=day)
+                cache[("aspects", day)] = i
+                cache.get(("aspects", day))
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_bytes_per_day_covers_measured(natal_chart):
+    """SHARED_CACHE_BYTES_PER_DAY stays an upper bound on a cached day."""
+    days = 4
+    get_meters_range(natal_chart, "2025-10-01", "2025-10-01", day_cache={})  # Warm label caches
+    gc.collect()
+    tracemalloc.start()
+    try:
+        cache = {}
+        get_meters_range(natal_chart, "2025-10-10", "2025-10-13", user_id="user_a", day_cache=cache)
+        gc.collect()
+        held, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # days readings plus the trend baseline day before them
+    assert held / (days + 1) <= SHARED_CACHE_BYTES_PER_DAY
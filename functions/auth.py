@@ -2,6 +2,9 @@
 Authentication helpers for Firebase callable functions.
 """
 
+from typing import Optional
+
+from firebase_admin import auth as firebase_auth
 from firebase_functions import https_fn
 
 # =============================================================================
@@ -60,3 +63,51 @@ def get_authenticated_user_id(req: https_fn.CallableRequest, allow_override: boo
         )
 
     return req.auth.uid
+
+
+def get_request_user_id(req: https_fn.Request, data: Optional[dict] = None, allow_override: bool = True) -> str:
+    """
+    Get user ID for an HTTPS (on_request) endpoint, e.g. an SSE stream.
+
+    Same rules as get_authenticated_user_id: DEV_ACCOUNT_UIDS may pass
+    user_id in the request body, everyone else sends
+    "Authorization: Bearer <firebase_id_token>".
+
+    Args:
+        req: The HTTPS request
+        data: Parsed JSON body
+        allow_override: If True, allow test account bypass
+
+    Returns:
+        The user ID (from the ID token or test account override)
+
+    Raises:
+        HttpsError: If the token is missing or invalid and not a valid test account
+    """
+    if allow_override and data:
+        user_id_param = data.get("user_id")
+        if user_id_param and user_id_param in DEV_ACCOUNT_UIDS:
+            return user_id_param
+
+    auth_header = req.headers.get("Authorization") or ""
+    if not auth_header.startswith("Bearer "):
+        raise https_fn.HttpsError(
+            code=https_fn.FunctionsErrorCode.UNAUTHENTICATED,
+            message="Authentication required"
+        )
+
+    try:
+        decoded_token = firebase_auth.verify_id_token(auth_header[len("Bearer "):])
+    except Exception as e:
+        raise https_fn.HttpsError(
+            code=https_fn.FunctionsErrorCode.UNAUTHENTICATED,
+            message=f"Invalid authentication token: {e}"
+        )
+
+    if not decoded_token.get("uid"):
+        raise https_fn.HttpsError(
+            code=https_fn.FunctionsErrorCode.UNAUTHENTICATED,
+            message="Invalid authentication token: missing uid"
+        )
+
+    return decoded_token["uid"]
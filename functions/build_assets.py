@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Asset Bundle Builder for Arca Backend
+
+Compiles the meter/group labels, sun sign profiles, compatibility and
+relationship labels and Jinja templates into one prevalidated bundle read
+by assets.load_json(). Runs on deploy (firebase.json predeploy); run it
+locally after editing any of them to use a bundle there too. Without a
+bundle the source files are read instead.
+
+Usage:
+    uv run python build_assets.py
+    uv run python build_assets.py --check    # exit 1 if the bundle is missing or stale
+
+Output:
+    assets_v{ASSET_BUNDLE_VERSION}.bundle
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from assets import ASSET_BUNDLE_PATH, build_asset_bundle, read_asset_bundle, source_paths, sources_sha256
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the static assets into one bundle")
+    parser.add_argument("--output", default=str(ASSET_BUNDLE_PATH), help="Output bundle path")
+    parser.add_argument("--check", action="store_true", help="Only check that the bundle matches the sources")
+    args = parser.parse_args()
+
+    if args.check:
+        bundle = read_asset_bundle(args.output)
+        if bundle is None or bundle["source_sha256"] != sources_sha256():
+            print(f"{args.output} is missing or stale (run build_assets.py)")
+            sys.exit(1)
+        print(f"{args.output} is up to date")
+        return
+
+    path = build_asset_bundle(Path(args.output))
+    print(f"Wrote {path} ({len(source_paths())} files, {path.stat().st_size / 1e3:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
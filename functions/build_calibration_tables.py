@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Calibration Table Builder for Arca Backend
+
+Compiles astrometers/calibration/calibration_constants.json into per-meter
+NumPy arrays (.npz) read by astrometers.normalization. Runs as a
+firebase.json predeploy hook; a table that no longer matches the JSON is
+ignored and the JSON is compiled at startup instead.
+
+Usage:
+    uv run python build_calibration_tables.py
+    uv run python build_calibration_tables.py --output /tmp/calibration_tables.npz
+
+Output:
+    astrometers/calibration/calibration_tables.npz
+"""
+
+import argparse
+from pathlib import Path
+
+from astrometers.normalization import CALIBRATION_TABLES_PATH, build_calibration_tables
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile astrometer calibration tables")
+    parser.add_argument("--output", default=str(CALIBRATION_TABLES_PATH), help="Output .npz path")
+    args = parser.parse_args()
+
+    path = build_calibration_tables(Path(args.output))
+    print(f"Wrote {path} ({path.stat().st_size / 1e3:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
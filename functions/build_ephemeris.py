@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Ephemeris Table Builder for Arca Backend
+
+Precomputes noon UTC transit positions for every day from 1900 to 2100 into
+a memory-mappable float32 table read by astro.get_transit_positions().
+Runs as a firebase.json predeploy hook (with --skip-existing), so deployed
+instances serve transit lookups without calling the ephemeris.
+
+Usage:
+    uv run python build_ephemeris.py
+    uv run python build_ephemeris.py --skip-existing    # keep a complete table already built
+    uv run python build_ephemeris.py --start 2020-01-01 --end 2030-12-31 --output /tmp/sky.npy
+
+Output:
+    ephemeris/sky_noon_v{EPHEMERIS_VERSION}.npy
+"""
+
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from astro import (
+    EPHEMERIS_BODIES,
+    EPHEMERIS_END,
+    EPHEMERIS_FIELDS,
+    EPHEMERIS_START,
+    EPHEMERIS_TABLE_PATH,
+    build_ephemeris_table,
+)
+
+
+def _table_shape(path: Path):
+    """Shape of an existing table, or None if it is missing or unreadable."""
+    try:
+        return np.load(path, mmap_mode="r").shape
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the precomputed ephemeris table")
+    parser.add_argument("--start", default=EPHEMERIS_START.isoformat(), help="First date (YYYY-MM-DD)")
+    parser.add_argument("--end", default=EPHEMERIS_END.isoformat(), help="Last date, inclusive (YYYY-MM-DD)")
+    parser.add_argument("--output", default=str(EPHEMERIS_TABLE_PATH), help="Output .npy path")
+    parser.add_argument("--skip-existing", action="store_true", help="Do nothing if the output already covers the range")
+    args = parser.parse_args()
+
+    start = datetime.strptime(args.start, "%Y-%m-%d").date()
+    end = datetime.strptime(args.end, "%Y-%m-%d").date()
+    shape = ((end - start).days + 1, len(EPHEMERIS_BODIES), len(EPHEMERIS_FIELDS))
+    if args.skip_existing and _table_shape(Path(args.output)) == shape:
+        print(f"{args.output} is up to date")
+        return
+
+    if start != EPHEMERIS_START:
+        print(f"Note: tables not starting at {EPHEMERIS_START} are not served by get_transit_positions()")
+
+    print(f"Building ephemeris table {start} -> {end}")
+    path = build_ephemeris_table(Path(args.output), start, end)
+    print(f"Wrote {path} ({path.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
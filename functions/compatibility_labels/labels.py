@@ -5,11 +5,12 @@ Loads and looks up labels, guidance, and descriptions for compatibility categori
 Uses JSON configuration files for each category/mode combination.
 """
 
-import json
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, TypedDict, cast
 
+from assets import asset_exists, load_json
+
 
 # Type definitions
 class BandDef(TypedDict):
@@ -96,7 +97,7 @@ def load_category_labels(mode: str, category_id: str) -> Optional[CategoryLabelC
     Returns:
         CategoryLabelConfig dict or None if not found
     """
-    labels_dir = get_labels_dir()
+    labels_dir = "compatibility_labels/labels"
 
     # Map mode to file directory
     mode_dir = MODE_FILE_MAP.get(mode, mode)
@@ -105,30 +106,27 @@ def load_category_labels(mode: str, category_id: str) -> Optional[CategoryLabelC
     file_category_id = CATEGORY_FILE_MAP.get(category_id, category_id)
 
     # Build file path with mode prefix (e.g., romantic_emotional.json)
-    file_path = labels_dir / mode_dir / f"{mode_dir}_{file_category_id}.json"
+    file_path = f"{labels_dir}/{mode_dir}/{mode_dir}_{file_category_id}.json"
 
-    if not file_path.exists():
+    if not asset_exists(file_path):
         # Try without mode prefix for backwards compatibility
-        file_path = labels_dir / mode_dir / f"{file_category_id}.json"
+        file_path = f"{labels_dir}/{mode_dir}/{file_category_id}.json"
 
-    if not file_path.exists():
+    if not asset_exists(file_path):
         return None
 
-    with open(file_path, "r") as f:
-        return json.load(f)
+    return load_json(file_path)
 
 
 @lru_cache(maxsize=1)
 def load_overall_labels() -> Optional[CategoryLabelConfig]:
     """Load the overall compatibility labels."""
-    labels_dir = get_labels_dir()
-    file_path = labels_dir / "overall.json"
+    file_path = "compatibility_labels/labels/overall.json"
 
-    if not file_path.exists():
+    if not asset_exists(file_path):
         return None
 
-    with open(file_path, "r") as f:
-        return json.load(f)
+    return load_json(file_path)
 
 
 def get_band_for_score(score: float, bands: Optional[list[BandDef]] = None) -> str:
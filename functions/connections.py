@@ -11,6 +11,9 @@ Firestore Collections:
 - users/{userId}/connections/{connectionId} - User's connections
 - share_links/{share_secret} - Reverse lookup for share URLs
 - users/{userId}/connection_requests/{requestId} - Pending requests
+
+Adding, changing or removing a connection invalidates the user's cached
+daily horoscopes (the featured connection may change).
 """
 
 import secrets
@@ -24,6 +27,7 @@ from models import VALID_SUN_SIGNS
 from relationships import RelationshipCategory, RelationshipLabel
 
 from compatibility import calculate_synastry_points, calculate_synastry_aspects
+from horoscope_cache import invalidate_cached_horoscopes
 
 
 # Constants
@@ -528,6 +532,7 @@ def import_connection(
     db.collection("users").document(user_id).collection(
         "connections"
     ).document(connection_id).set(connection.model_dump())
+    invalidate_cached_horoscopes(db, user_id)
 
     # Calculate and cache synastry points (async in background)
     current_user_data = current_user_doc.to_dict() if current_user_doc.exists else {}
@@ -632,6 +637,7 @@ def create_connection(
     db.collection("users").document(user_id).collection(
         "connections"
     ).document(connection_id).set(connection.model_dump())
+    invalidate_cached_horoscopes(db, user_id)
 
     # Calculate and cache synastry points
     user_doc = db.collection("users").document(user_id).get()
@@ -699,6 +705,7 @@ def update_connection(
     filtered_updates["updated_at"] = datetime.now().isoformat()
 
     conn_ref.update(filtered_updates)
+    invalidate_cached_horoscopes(db, user_id)
 
     # Return updated connection
     updated_doc = conn_ref.get()
@@ -730,6 +737,7 @@ def delete_connection(
         raise ValueError("Connection not found")
 
     conn_ref.delete()
+    invalidate_cached_horoscopes(db, user_id)
     return True
 
 
@@ -886,6 +894,7 @@ def respond_to_request(
     db.collection("users").document(from_user_id).collection(
         "connections"
     ).document(connection_id).set(connection.model_dump())
+    invalidate_cached_horoscopes(db, from_user_id)
 
     # Update request status
     request_ref.update({
@@ -936,6 +945,30 @@ def get_connections_for_horoscope(
     return [doc.to_dict() for doc in docs]
 
 
+def format_synastry_aspects(aspects: list, limit: int = 6) -> list[dict]:
+    """
+    Tightest synastry aspects in the form cached on a connection.
+
+    Args:
+        aspects: calculate_synastry_aspects() result
+        limit: Aspects to keep
+
+    Returns:
+        Up to `limit` dicts (user_planet, their_planet, aspect_type,
+        is_harmonious, orb), tightest orb first
+    """
+    return [
+        {
+            "user_planet": asp.user_planet,
+            "their_planet": asp.their_planet,
+            "aspect_type": asp.aspect_type,
+            "is_harmonious": asp.is_harmonious,
+            "orb": round(asp.orb, 1)
+        }
+        for asp in sorted(aspects, key=lambda a: a.orb)[:limit]
+    ]
+
+
 def calculate_and_cache_synastry(
     db: firestore.Client,
     user_id: str,
@@ -990,19 +1023,7 @@ def calculate_and_cache_synastry(
 
         # Calculate synastry aspects for display (raw aspects, no relationship_type needed)
         aspects = calculate_synastry_aspects(user_chart, conn_chart)
-
-        # Get top 6 tightest aspects for display
-        sorted_aspects = sorted(aspects, key=lambda a: a.orb)[:6]
-        synastry_aspects = [
-            {
-                "user_planet": asp.user_planet,
-                "their_planet": asp.their_planet,
-                "aspect_type": asp.aspect_type,
-                "is_harmonious": asp.is_harmonious,
-                "orb": round(asp.orb, 1)
-            }
-            for asp in sorted_aspects
-        ]
+        synastry_aspects = format_synastry_aspects(aspects)
 
         # Cache on connection record
         conn_ref = db.collection("users").document(user_id).collection(
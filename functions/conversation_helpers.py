@@ -10,26 +10,28 @@ Helper callable functions for Ask the Stars feature.
 from firebase_functions import https_fn
 from firebase_admin import firestore
 
-from models import (
-    Conversation,
-    UserEntities,
-    Entity,
-    EntityStatus
-)
 from auth import get_authenticated_user_id
 
 
 @https_fn.on_call()
 def get_conversation_history(req: https_fn.CallableRequest) -> dict:
     """
-    Get full conversation with all messages.
+    Get a conversation with one page of its messages (newest page first).
 
     Args:
         conversation_id (str): Conversation ID to fetch
+        limit (int, optional): Messages per page (default 50, max 200)
+        before (int, optional): Cursor from a previous page's next_cursor
 
     Returns:
-        { "conversation": Conversation }
+        { "conversation": Conversation, "next_cursor": int | null }
+
+    conversation.messages holds the page, oldest first; pass next_cursor as
+    `before` to get older messages (null once the first message is reached).
     """
+    from models import Conversation
+    from conversation_store import HISTORY_PAGE_SIZE, MAX_HISTORY_PAGE_SIZE, conversation_ref, load_messages
+
     user_id = get_authenticated_user_id(req)
     conversation_id = req.data.get('conversation_id')
 
@@ -39,9 +41,22 @@ def get_conversation_history(req: https_fn.CallableRequest) -> dict:
             message="Missing conversation_id"
         )
 
+    limit = req.data.get('limit', HISTORY_PAGE_SIZE)
+    before = req.data.get('before')
+    if not isinstance(limit, int) or not 1 <= limit <= MAX_HISTORY_PAGE_SIZE:
+        raise https_fn.HttpsError(
+            code=https_fn.FunctionsErrorCode.INVALID_ARGUMENT,
+            message=f"limit must be between 1 and {MAX_HISTORY_PAGE_SIZE}"
+        )
+    if before is not None and (not isinstance(before, int) or before < 0):
+        raise https_fn.HttpsError(
+            code=https_fn.FunctionsErrorCode.INVALID_ARGUMENT,
+            message="Invalid before cursor"
+        )
+
     # Fetch conversation
     db = firestore.client()
-    conv_doc = db.collection('conversations').document(conversation_id).get()
+    conv_doc = conversation_ref(db, conversation_id).get()
 
     if not conv_doc.exists:
         raise https_fn.HttpsError(
@@ -58,7 +73,10 @@ def get_conversation_history(req: https_fn.CallableRequest) -> dict:
             message="Not authorized to access this conversation"
         )
 
-    return {"conversation": conversation.model_dump()}
+    messages, next_cursor = load_messages(db, conversation, limit=limit, before_seq=before)
+    page = conversation.model_copy(update={"messages": messages})
+
+    return {"conversation": page.model_dump(), "next_cursor": next_cursor}
 
 
 @https_fn.on_call()
@@ -73,19 +91,17 @@ def get_user_entities(req: https_fn.CallableRequest) -> dict:
     Returns:
         { "entities": Entity[], "total_count": int }
     """
+    from models import EntityStatus
+    from entity_store import load_entities
+
     user_id = get_authenticated_user_id(req)
     status_filter = req.data.get('status')
     limit = req.data.get('limit', 50)
 
     # Fetch entities
     db = firestore.client()
-    entities_doc = db.collection('users').document(user_id).collection('entities').document('all').get()
-
-    if not entities_doc.exists:
-        return {"entities": [], "total_count": 0}
-
-    user_entities = UserEntities(**entities_doc.to_dict())
-    entities = user_entities.entities
+    all_entities = load_entities(db, user_id)
+    entities = all_entities
 
     # Filter by status if provided
     if status_filter:
@@ -106,7 +122,7 @@ def get_user_entities(req: https_fn.CallableRequest) -> dict:
 
     return {
         "entities": [e.model_dump() for e in entities],
-        "total_count": len(user_entities.entities)
+        "total_count": len(all_entities)
     }
 
 
@@ -124,6 +140,9 @@ def update_entity(req: https_fn.CallableRequest) -> dict:
     Returns:
         { "success": true, "entity": Entity }
     """
+    from models import EntityStatus
+    from entity_store import load_entities, save_entity_changes
+
     user_id = get_authenticated_user_id(req)
     entity_id = req.data.get('entity_id')
 
@@ -135,20 +154,17 @@ def update_entity(req: https_fn.CallableRequest) -> dict:
 
     # Fetch entities
     db = firestore.client()
-    entities_ref = db.collection('users').document(user_id).collection('entities').document('all')
-    entities_doc = entities_ref.get()
+    entities = load_entities(db, user_id)
 
-    if not entities_doc.exists:
+    if not entities:
         raise https_fn.HttpsError(
             code=https_fn.FunctionsErrorCode.NOT_FOUND,
             message="No entities found"
         )
 
-    user_entities = UserEntities(**entities_doc.to_dict())
-
     # Find entity
     target_entity = None
-    for entity in user_entities.entities:
+    for entity in entities:
         if entity.entity_id == entity_id:
             target_entity = entity
             break
@@ -182,12 +198,8 @@ def update_entity(req: https_fn.CallableRequest) -> dict:
     from datetime import datetime
     target_entity.updated_at = datetime.now().isoformat()
 
-    # Save updates
-    entities_ref.set({
-        'user_id': user_id,
-        'entities': [e.model_dump() for e in user_entities.entities],
-        'updated_at': datetime.now().isoformat()
-    })
+    # Save updates (this entity only)
+    save_entity_changes(db, user_id, changed=[target_entity])
 
     return {
         "success": True,
@@ -206,6 +218,8 @@ def delete_entity(req: https_fn.CallableRequest) -> dict:
     Returns:
         { "success": true }
     """
+    from entity_store import load_entities, save_entity_changes
+
     user_id = get_authenticated_user_id(req)
     entity_id = req.data.get('entity_id')
 
@@ -217,32 +231,24 @@ def delete_entity(req: https_fn.CallableRequest) -> dict:
 
     # Fetch entities
     db = firestore.client()
-    entities_ref = db.collection('users').document(user_id).collection('entities').document('all')
-    entities_doc = entities_ref.get()
+    entities = load_entities(db, user_id)
 
-    if not entities_doc.exists:
+    if not entities:
         raise https_fn.HttpsError(
             code=https_fn.FunctionsErrorCode.NOT_FOUND,
             message="No entities found"
         )
 
-    user_entities = UserEntities(**entities_doc.to_dict())
-
     # Remove entity
-    updated_entities = [e for e in user_entities.entities if e.entity_id != entity_id]
+    updated_entities = [e for e in entities if e.entity_id != entity_id]
 
-    if len(updated_entities) == len(user_entities.entities):
+    if len(updated_entities) == len(entities):
         raise https_fn.HttpsError(
             code=https_fn.FunctionsErrorCode.NOT_FOUND,
             message="Entity not found"
         )
 
-    # Save updates
-    from datetime import datetime
-    entities_ref.set({
-        'user_id': user_id,
-        'entities': [e.model_dump() for e in updated_entities],
-        'updated_at': datetime.now().isoformat()
-    })
+    # Save updates (this entity only)
+    save_entity_changes(db, user_id, removed=[entity_id])
 
     return {"success": True}
@@ -0,0 +1,201 @@
+"""
+Append-only storage for Ask the Stars conversation messages.
+
+Messages live at conversations/{conversation_id}/messages/{message_id},
+one document each with a `seq` (0, 1, 2, ... in conversation order). A turn
+creates its two message documents and updates `message_count` and
+`updated_at` on the conversation document in one transaction, so the cost
+of a turn no longer grows with the conversation and the conversation
+document stays far below the 1 MiB document limit. The transaction reads
+`message_count` first, so concurrent turns on one conversation (two
+devices) get distinct sequence numbers.
+
+Conversations written before this layout keep their messages inline in the
+`messages` array. That array is never written again: new messages are
+appended to the subcollection with `seq` continuing after the inline ones,
+and the readers below return both in order.
+
+Usage:
+    recent = load_recent_messages(db, conversation_id, PROMPT_MESSAGE_WINDOW)
+    window = message_window(conversation, recent, PROMPT_MESSAGE_WINDOW)
+    ...
+    append_messages(db, conversation, [user_message, assistant_message])
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from firebase_admin import firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
+
+from models import Conversation, Message
+
+
+CONVERSATIONS_COLLECTION = "conversations"
+MESSAGES_COLLECTION = "messages"
+
+# Messages the Ask the Stars prompt includes (templates/conversation/ask_the_stars.j2)
+PROMPT_MESSAGE_WINDOW = 4
+
+# Default and maximum page size for get_conversation_history
+HISTORY_PAGE_SIZE = 50
+MAX_HISTORY_PAGE_SIZE = 200
+
+# Firestore limit on writes per batch or transaction
+_MAX_BATCH_WRITES = 500
+
+
+def conversation_ref(db, conversation_id: str):
+    """Document reference for a conversation."""
+    return db.collection(CONVERSATIONS_COLLECTION).document(conversation_id)
+
+
+def _messages_collection(db, conversation_id: str):
+    return conversation_ref(db, conversation_id).collection(MESSAGES_COLLECTION)
+
+
+def message_total(conversation: Conversation) -> int:
+    """Messages in a conversation, inline (legacy) and appended."""
+    return max(conversation.message_count, len(conversation.messages))
+
+
+def _stored_message_total(data: dict) -> int:
+    """message_total() of a conversation document's data."""
+    return max(data.get("message_count") or 0, len(data.get("messages") or ()))
+
+
+def append_messages(
+    db,
+    conversation: Conversation,
+    messages: list[Message],
+    create: bool = False
+) -> None:
+    """
+    Append messages to a conversation.
+
+    Writes one document per message plus the conversation's message_count
+    and updated_at in a single transaction. Sequence numbers continue from
+    the stored message_count (read in the transaction), not the loaded
+    conversation, so concurrent turns never reuse a seq.
+
+    Args:
+        db: Firestore client
+        conversation: Conversation the messages belong to (message_count is
+            advanced in place)
+        messages: New messages, oldest first
+        create: Also create the conversation document
+    """
+    if len(messages) >= _MAX_BATCH_WRITES:
+        raise ValueError(f"Cannot append {len(messages)} messages in one batch")
+
+    conv_ref = conversation_ref(db, conversation.conversation_id)
+    messages_ref = conv_ref.collection(MESSAGES_COLLECTION)
+    updated_at = datetime.now().isoformat()
+
+    @firestore.transactional
+    def append(transaction) -> int:
+        snapshot = conv_ref.get(transaction=transaction)
+        seq = message_total(conversation)
+        if snapshot.exists:
+            seq = max(seq, _stored_message_total(snapshot.to_dict() or {}))
+        start = seq
+        for message in messages:
+            transaction.set(messages_ref.document(message.message_id), {**message.model_dump(), "seq": seq})
+            seq += 1
+
+        if create:
+            transaction.set(conv_ref, {
+                **conversation.model_dump(),
+                "message_count": seq,
+                "updated_at": updated_at,
+            })
+        else:
+            transaction.update(conv_ref, {"message_count": seq, "updated_at": updated_at})
+        return start
+
+    start = append(db.transaction())
+    conversation.message_count = start + len(messages)
+    conversation.updated_at = updated_at
+
+
+def load_recent_messages(db, conversation_id: str, limit: int) -> list[Message]:
+    """
+    Last `limit` appended messages, oldest first.
+
+    Needs only the conversation ID, so it can run alongside the read of the
+    conversation document; combine the two with message_window().
+    """
+    docs = (
+        _messages_collection(db, conversation_id)
+        .order_by("seq", direction=firestore.Query.DESCENDING)
+        .limit(limit)
+        .get()
+    )
+    return [Message(**doc.to_dict()) for doc in reversed(list(docs))]
+
+
+def message_window(conversation: Optional[Conversation], recent: list[Message], limit: int) -> list[Message]:
+    """Last `limit` messages of a conversation given load_recent_messages() output."""
+    if conversation is None:
+        return recent[-limit:]
+    # Inline (legacy) messages always precede appended ones
+    return (list(conversation.messages) + recent)[-limit:]
+
+
+def load_messages(
+    db,
+    conversation: Conversation,
+    limit: int = HISTORY_PAGE_SIZE,
+    before_seq: Optional[int] = None
+) -> tuple[list[Message], Optional[int]]:
+    """
+    One page of a conversation's messages, oldest first.
+
+    Pages run backwards from the newest message: pass the returned cursor
+    as before_seq to get the page before this one.
+
+    Args:
+        db: Firestore client
+        conversation: Conversation document
+        limit: Messages per page
+        before_seq: Return messages with seq below this (None: newest page)
+
+    Returns:
+        (messages, cursor) where cursor is the before_seq of the previous
+        page, or None if this page starts at the first message
+    """
+    inline = conversation.messages
+    end = message_total(conversation)
+    if before_seq is not None:
+        end = max(0, min(before_seq, end))
+    start = max(0, end - limit)
+
+    appended = []
+    if end > len(inline):
+        docs = (
+            _messages_collection(db, conversation.conversation_id)
+            .where(filter=FieldFilter("seq", ">=", max(start, len(inline))))
+            .where(filter=FieldFilter("seq", "<", end))
+            .order_by("seq")
+            .get()
+        )
+        appended = [Message(**doc.to_dict()) for doc in docs]
+
+    page = list(inline[start:min(end, len(inline))]) + appended
+    return page, start if start > 0 else None
+
+
+def delete_conversation(db, conversation_id: str) -> None:
+    """Delete a conversation document and its messages."""
+    conv_ref = conversation_ref(db, conversation_id)
+    batch = db.batch()
+    pending = 0
+    for doc in conv_ref.collection(MESSAGES_COLLECTION).stream():
+        batch.delete(doc.reference)
+        pending += 1
+        if pending == _MAX_BATCH_WRITES:
+            batch.commit()
+            batch = db.batch()
+            pending = 0
+    batch.delete(conv_ref)
+    batch.commit()
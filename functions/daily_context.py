@@ -0,0 +1,183 @@
+"""
+Per-user, per-day astrological context shared across the daily horoscope pipeline.
+
+Aspects for one user/day are needed at several orbs: 8° for astrometers, 3° for
+the transit summary and Moon detail, 2° for upcoming transits and 1° for the
+void-of-course check. DailyContext computes the natal-transit hits once per date
+at the widest orb and serves every tighter orb as a filtered view, along with
+the shared transit charts and today's/yesterday's meters.
+
+Usage:
+    context = DailyContext(user_profile.natal_chart, "2025-10-17", user_id=user_profile.user_id)
+    summary = format_transit_summary_for_ui(natal_chart, context.transit_chart, context=context)
+    moon = get_moon_transit_detail(natal_chart, context.transit_chart, "2025-10-17T12:00:00", context=context)
+    meters = context.meters
+"""
+
+from datetime import datetime, timedelta
+from functools import cached_property
+from typing import Optional
+
+from astro import (
+    NatalTransitArrays,
+    NatalTransitAspect,
+    compute_natal_transit_arrays,
+    find_natal_transit_aspects,
+    get_transit_chart,
+    natal_transit_aspects_from_arrays,
+)
+
+
+class DailyContext:
+    """
+    Everything derived from (natal chart, date) for one daily reading.
+
+    Values are computed lazily and memoized, so consumers only pay for what
+    they use. Returned charts and aspect lists are shared: do not mutate them.
+    """
+
+    # Widest orb used by any consumer (astrometers)
+    WIDEST_ORB = 8.0
+
+    def __init__(
+        self,
+        natal_chart: dict,
+        date: str,
+        user_id: Optional[str] = None,
+        scoring_profile: Optional[dict] = None,
+        day_cache: Optional[dict] = None
+    ):
+        """
+        Args:
+            natal_chart: User's natal chart dict
+            date: Reading date "YYYY-MM-DD"
+            user_id: User ID for meter cosmic background noise (optional)
+            scoring_profile: Stored natal scoring profile (optional; ignored if stale)
+            day_cache: Meter day cache to use instead of a private one, e.g. the
+                cross-user astrometers.shared_cache.shared_day_cache() (optional)
+
+        Raises:
+            ValueError: If date is not a valid YYYY-MM-DD string
+        """
+        self.natal_chart = natal_chart
+        self.date_obj = datetime.strptime(date, "%Y-%m-%d")
+        self.date = self.date_obj.strftime("%Y-%m-%d")
+        self.user_id = user_id
+
+        from astrometers.profile import usable_scoring_profile
+        self.scoring_profile = usable_scoring_profile(scoring_profile, natal_chart)
+
+        self.yesterday_obj = self.date_obj - timedelta(days=1)
+        self.yesterday = self.yesterday_obj.strftime("%Y-%m-%d")
+
+        self._arrays: dict[str, NatalTransitArrays] = {}
+        self._aspects: dict[tuple[str, float, bool], list[NatalTransitAspect]] = {}
+        self._transit_aspects: dict[str, list] = {}
+        self._meter_days: dict = day_cache if day_cache is not None else {}
+
+    # -------------------------------------------------------------------------
+    # Charts
+    # -------------------------------------------------------------------------
+
+    @property
+    def transit_chart(self) -> dict:
+        """Today's transit chart (from the shared sky cache)."""
+        return get_transit_chart(self.date)
+
+    @property
+    def yesterday_transit_chart(self) -> dict:
+        """Yesterday's transit chart (from the shared sky cache)."""
+        return get_transit_chart(self.yesterday)
+
+    # -------------------------------------------------------------------------
+    # Aspects
+    # -------------------------------------------------------------------------
+
+    def arrays(self, date: Optional[str] = None) -> NatalTransitArrays:
+        """Natal-transit hits at WIDEST_ORB for a date (default: today)."""
+        date = date or self.date
+        arrays = self._arrays.get(date)
+        if arrays is None:
+            arrays = compute_natal_transit_arrays(
+                self.natal_chart, get_transit_chart(date), orb=self.WIDEST_ORB
+            )
+            self._arrays[date] = arrays
+        return arrays
+
+    def aspects(
+        self,
+        orb: float,
+        sort_by_priority: bool = True,
+        date: Optional[str] = None
+    ) -> list[NatalTransitAspect]:
+        """
+        Same result as find_natal_transit_aspects(natal, transit_for(date), orb, sort_by_priority).
+
+        Args:
+            orb: Maximum orb in degrees
+            sort_by_priority: Sort by priority (default) or by orb
+            date: Date "YYYY-MM-DD" (default: today)
+        """
+        date = date or self.date
+        key = (date, orb, sort_by_priority)
+        aspects = self._aspects.get(key)
+        if aspects is None:
+            if orb > self.WIDEST_ORB:
+                aspects = find_natal_transit_aspects(
+                    self.natal_chart, get_transit_chart(date), orb=orb, sort_by_priority=sort_by_priority
+                )
+            else:
+                aspects = natal_transit_aspects_from_arrays(
+                    self.arrays(date).within(orb), sort_by_priority=sort_by_priority
+                )
+            self._aspects[key] = aspects
+        return aspects
+
+    def transit_aspects(self, date: Optional[str] = None) -> list:
+        """Astrometer TransitAspects (calculate_all_aspects() at 8°) for a date."""
+        from astrometers.core import transit_aspects_from_arrays
+
+        date = date or self.date
+        aspects = self._transit_aspects.get(date)
+        if aspects is None:
+            aspects = transit_aspects_from_arrays(
+                self.arrays(date), self.natal_chart, get_transit_chart(date),
+                scoring_profile=self.scoring_profile
+            )
+            self._transit_aspects[date] = aspects
+        return aspects
+
+    # -------------------------------------------------------------------------
+    # Meters
+    # -------------------------------------------------------------------------
+
+    def meters_range(self, start_date: str, end_date: str, user_id: Optional[str] = None) -> list:
+        """
+        get_meters_range() reusing this context's aspects and per-day meter scores.
+
+        Args:
+            start_date: First day "YYYY-MM-DD"
+            end_date: Last day "YYYY-MM-DD" (inclusive)
+            user_id: User ID for cosmic background noise (optional)
+        """
+        from astrometers import get_meters_range
+
+        return get_meters_range(
+            self.natal_chart,
+            start_date,
+            end_date,
+            user_id=user_id,
+            aspects_for_date=lambda d: (get_transit_chart(d), self.transit_aspects(d)),
+            day_cache=self._meter_days,
+            scoring_profile=self.scoring_profile
+        )
+
+    @cached_property
+    def meters(self):
+        """Today's AllMetersReading (with user_id noise and trends vs yesterday)."""
+        return self.meters_range(self.date, self.date, user_id=self.user_id)[0]
+
+    @cached_property
+    def yesterday_meters(self):
+        """Yesterday's AllMetersReading (no user_id noise), used for trend context."""
+        return self.meters_range(self.yesterday, self.yesterday)[0]
@@ -8,13 +8,14 @@ This module handles:
 """
 
 import os
+import heapq
 import json
 import uuid
 from datetime import datetime
 from typing import Optional
 
 from dotenv import load_dotenv
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment
 from google import genai
 from google.genai import types
 
@@ -28,12 +29,12 @@ from models import (
     AttributeKV,
     calculate_entity_importance_score
 )
+from assets import template_loader
 from posthog_utils import capture_llm_generation
+from gemini_client import get_gemini_client
 
 # Initialize Jinja2 environment
-import os
-template_dir = os.path.join(os.path.dirname(__file__), 'templates', 'conversation')
-template_env = Environment(loader=FileSystemLoader(template_dir))
+template_env = Environment(loader=template_loader("templates/conversation"))
 
 
 def merge_attributes(existing: list[AttributeKV], updates: list[AttributeKV]) -> list[AttributeKV]:
@@ -86,8 +87,8 @@ def extract_entities_from_message(
     if not api_key:
         raise ValueError("GOOGLE_API_KEY or GEMINI_API_KEY not provided")
 
-    # Create client (same pattern as llm.py)
-    client = genai.Client(api_key=api_key)
+    # Shared client (same pattern as llm.py)
+    client = get_gemini_client(api_key)
 
     # Load and render template
     template = template_env.get_template('extract_entities.j2')
@@ -252,7 +253,10 @@ def execute_merge_actions(
     Execute merge actions to update entity list.
 
     IMPORTANT: This function does NOT mutate the input entities.
-    It creates deep copies before any modifications.
+    An entity is deep-copied the first time an action changes it; entities
+    no action touches are returned as the same objects, so callers can
+    find the changed ones by identity (entity_store.diff_entities) and the
+    cost follows the entities touched, not the entities held.
 
     Args:
         actions: MergedEntities with list of actions
@@ -260,19 +264,27 @@ def execute_merge_actions(
         current_time: Current datetime (defaults to now)
 
     Returns:
-        Updated list of entities (new copies, inputs unchanged)
+        Updated list of entities (copies of changed ones, inputs unchanged)
     """
     if current_time is None:
         current_time = datetime.now()
 
     now_iso = current_time.isoformat()
 
-    # Create deep copies to avoid mutating inputs
-    # Use model_copy(deep=True) for Pydantic v2
-    entities_dict = {e.entity_id: e.model_copy(deep=True) for e in existing_entities}
+    entities_dict = {e.entity_id: e for e in existing_entities}
+
+    # IDs whose entry in entities_dict is already a private copy
+    copied = set()
+
+    def writable(entity_id: str) -> Entity:
+        # Copy-on-write (model_copy(deep=True) for Pydantic v2)
+        if entity_id not in copied:
+            entities_dict[entity_id] = entities_dict[entity_id].model_copy(deep=True)
+            copied.add(entity_id)
+        return entities_dict[entity_id]
 
     # Also create lookup by name (lowercase) for finding entities
-    entities_by_name = {e.name.lower(): entities_dict[e.entity_id] for e in existing_entities}
+    entity_ids_by_name = {e.name.lower(): e.entity_id for e in existing_entities}
 
     for action in actions.actions:
         if action.action == "create":
@@ -299,11 +311,12 @@ def execute_merge_actions(
                 new_entity.related_entities.append(action.link_to_entity_id)
 
             entities_dict[new_entity.entity_id] = new_entity
+            copied.add(new_entity.entity_id)
 
         elif action.action == "merge":
             # Merge with existing entity
             if action.merge_with_id in entities_dict:
-                existing = entities_dict[action.merge_with_id]
+                existing = writable(action.merge_with_id)
 
                 # Add new alias if provided
                 if action.new_alias and action.new_alias.lower() not in [a.lower() for a in existing.aliases]:
@@ -340,10 +353,10 @@ def execute_merge_actions(
 
             # Try to find by merge_with_id first
             if action.merge_with_id and action.merge_with_id in entities_dict:
-                target_entity = entities_dict[action.merge_with_id]
+                target_entity = writable(action.merge_with_id)
             # Otherwise find by name
-            elif action.entity_name.lower() in entities_by_name:
-                target_entity = entities_by_name[action.entity_name.lower()]
+            elif action.entity_name.lower() in entity_ids_by_name:
+                target_entity = writable(entity_ids_by_name[action.entity_name.lower()])
 
             if target_entity:
                 # Update attributes
@@ -373,14 +386,15 @@ def execute_merge_actions(
         elif action.action == "link":
             # Create relationship link between entities
             # Find source entity
-            source_entity = None
+            source_id = None
             if action.merge_with_id and action.merge_with_id in entities_dict:
-                source_entity = entities_dict[action.merge_with_id]
-            elif action.entity_name.lower() in entities_by_name:
-                source_entity = entities_by_name[action.entity_name.lower()]
+                source_id = action.merge_with_id
+            elif action.entity_name.lower() in entity_ids_by_name:
+                source_id = entity_ids_by_name[action.entity_name.lower()]
 
-            if source_entity and action.link_to_entity_id:
-                if action.link_to_entity_id not in source_entity.related_entities:
+            if source_id and action.link_to_entity_id:
+                if action.link_to_entity_id not in entities_dict[source_id].related_entities:
+                    source_entity = writable(source_id)
                     source_entity.related_entities.append(action.link_to_entity_id)
                     source_entity.updated_at = now_iso
 
@@ -413,14 +427,8 @@ def get_top_entities_by_importance(
     # Filter active entities only
     active_entities = [e for e in entities if e.status == EntityStatus.ACTIVE]
 
-    # Sort by importance score (descending)
-    sorted_entities = sorted(
-        active_entities,
-        key=lambda e: e.importance_score,
-        reverse=True
-    )
-
-    return sorted_entities[:limit]
+    # Top N by importance score (descending), without sorting all of them
+    return heapq.nlargest(limit, active_entities, key=lambda e: e.importance_score)
 
 
 def route_people_to_connections(
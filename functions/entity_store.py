@@ -0,0 +1,240 @@
+"""
+Sharded storage for the entities tracked from Ask the Stars conversations.
+
+Entities used to live in one users/{user_id}/entities/all document that
+every trigger run read and rewrote whole. They are now spread over
+ENTITY_SHARDS documents in the same collection (shard_0 ... shard_7, each a
+map of entity_id -> Entity), and a change writes only the changed entities
+as map entries of their shard. An index document (entities/index) holds the
+ENTITY_INDEX_SIZE most important active entities, so building the Ask the
+Stars prompt reads one small document instead of every entity.
+
+save_entity_changes() runs in a transaction that reads the stored entities,
+applies the change and rebuilds the index from the result, so concurrent
+writers (the entity trigger and the entity endpoints) never drop each
+other's entities from the index.
+
+Readers never write. Users who have not been migrated yet are read from
+their `all` document, which the first save_entity_changes() splits into
+shards.
+
+Usage:
+    entities = load_entities(db, user_id)
+    updated = execute_merge_actions(actions, entities)
+    changed, removed = diff_entities(entities, updated)
+    save_entity_changes(db, user_id, changed, removed)
+
+    top = top_entities_from_index(index_doc.to_dict(), limit=15)
+"""
+
+import heapq
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Optional
+
+from firebase_admin import firestore
+
+from models import Entity, EntityStatus, UserEntities, calculate_entity_importance_score
+
+
+ENTITIES_COLLECTION = "entities"
+ENTITY_INDEX_ID = "index"
+LEGACY_ENTITIES_ID = "all"
+
+# Entity shard documents; an entity's shard is fixed by its ID. Eight
+# shards keep each document far below the 1 MiB limit for thousands of
+# entities.
+ENTITY_SHARDS = 8
+_SHARD_PREFIX = "shard_"
+
+# Active entities kept in the index, ranked when they were last written.
+# Scores decay with time, so readers re-rank these and keep fewer.
+ENTITY_INDEX_SIZE = 30
+
+# Bump when the index layout changes; older indexes are ignored
+ENTITY_INDEX_VERSION = 1
+
+
+def _entities_collection(db, user_id: str):
+    return db.collection("users").document(user_id).collection(ENTITIES_COLLECTION)
+
+
+def shard_id(entity_id: str) -> str:
+    """ID of the shard document that holds an entity."""
+    return f"{_SHARD_PREFIX}{zlib.crc32(entity_id.encode()) % ENTITY_SHARDS}"
+
+
+def entity_index_ref(db, user_id: str):
+    """Document reference for a user's entity index."""
+    return _entities_collection(db, user_id).document(ENTITY_INDEX_ID)
+
+
+def legacy_entities_ref(db, user_id: str):
+    """Document reference for the pre-sharding entities/all document."""
+    return _entities_collection(db, user_id).document(LEGACY_ENTITIES_ID)
+
+
+def _top_active(entities: list[Entity], limit: int, current_time: Optional[datetime] = None) -> list[Entity]:
+    """
+    Top active entities by importance (same ranking as
+    entity_extraction.get_top_entities_by_importance), as scored copies.
+    """
+    scored = [
+        e.model_copy(update={"importance_score": calculate_entity_importance_score(e, current_time)})
+        for e in entities if e.status == EntityStatus.ACTIVE
+    ]
+    return heapq.nlargest(limit, scored, key=lambda e: e.importance_score)
+
+
+def build_entity_index(user_id: str, entities: list[Entity]) -> dict:
+    """Index document for a user's complete entity list."""
+    top = _top_active(entities, ENTITY_INDEX_SIZE)
+    return {
+        "version": ENTITY_INDEX_VERSION,
+        "user_id": user_id,
+        "entity_count": len(entities),
+        "top": [e.model_dump() for e in top],
+        "updated_at": datetime.now().isoformat(),
+    }
+
+
+def top_entities_from_index(
+    index: Optional[dict],
+    limit: int,
+    current_time: Optional[datetime] = None
+) -> Optional[list[Entity]]:
+    """
+    Most important active entities from an index document.
+
+    Returns:
+        Up to `limit` entities re-ranked at current_time, or None if there
+        is no index (or it has another ENTITY_INDEX_VERSION)
+    """
+    if not index or index.get("version") != ENTITY_INDEX_VERSION:
+        return None
+    entities = [Entity(**data) for data in index.get("top", [])]
+    return _top_active(entities, limit, current_time)
+
+
+def _stored_entities(docs: Iterable) -> tuple[list[Entity], bool]:
+    """
+    Entities in the entities collection's documents, oldest first, and
+    whether they are still in the pre-sharding `all` document.
+    """
+    shards = []
+    legacy = None
+    has_index = False
+    for doc in docs:
+        if doc.id == ENTITY_INDEX_ID:
+            has_index = True
+        elif doc.id == LEGACY_ENTITIES_ID:
+            legacy = doc.to_dict()
+        elif doc.id.startswith(_SHARD_PREFIX):
+            shards.append(doc.to_dict())
+
+    if legacy is not None and not has_index:
+        return UserEntities(**legacy).entities, True
+
+    entities = [
+        Entity(**data)
+        for shard in shards
+        for data in (shard.get("entities") or {}).values()
+    ]
+    return sorted(entities, key=lambda e: e.created_at), False
+
+
+def load_entities(db, user_id: str) -> list[Entity]:
+    """
+    All of a user's entities, oldest first.
+
+    One collection query returns the shards (and the index), or the
+    entities/all document of a user not migrated yet. Never writes.
+    """
+    entities, _ = _stored_entities(_entities_collection(db, user_id).stream())
+    return entities
+
+
+def diff_entities(before: list[Entity], after: list[Entity]) -> tuple[list[Entity], list[str]]:
+    """
+    Entities execute_merge_actions() changed, by identity.
+
+    Returns:
+        (changed or created entities, IDs no longer in `after`)
+    """
+    before_by_id = {e.entity_id: e for e in before}
+    after_ids = {e.entity_id for e in after}
+    changed = [e for e in after if before_by_id.get(e.entity_id) is not e]
+    removed = [entity_id for entity_id in before_by_id if entity_id not in after_ids]
+    return changed, removed
+
+
+def save_entity_changes(
+    db,
+    user_id: str,
+    changed: Iterable[Entity] = (),
+    removed: Iterable[str] = ()
+) -> int:
+    """
+    Write changed and removed entities and refresh the index.
+
+    In one transaction: the stored entities are read, the change applied and
+    the index rebuilt from the result. Only the shards holding a changed or
+    removed entity are written, and only those entities' map entries within
+    them; a user still on entities/all is migrated to shards instead.
+
+    Args:
+        db: Firestore client
+        user_id: User ID
+        changed: Created or modified entities
+        removed: IDs of deleted entities
+
+    Returns:
+        Number of entities written or deleted
+    """
+    changes = {}
+    for entity in changed:
+        changes[entity.entity_id] = entity
+    for entity_id in removed:
+        changes[entity_id] = None
+
+    if not changes:
+        return 0
+
+    now = datetime.now().isoformat()
+    collection = _entities_collection(db, user_id)
+
+    @firestore.transactional
+    def save(transaction) -> None:
+        stored, legacy = _stored_entities(collection.stream(transaction=transaction))
+        entities = {e.entity_id: e for e in stored}
+        for entity_id, entity in changes.items():
+            if entity is None:
+                entities.pop(entity_id, None)
+            else:
+                entities[entity_id] = entity
+
+        shards = defaultdict(dict)
+        if legacy:
+            # First write since sharding: every entity moves out of entities/all
+            for entity_id, entity in entities.items():
+                shards[shard_id(entity_id)][entity_id] = entity.model_dump()
+            for shard, entries in shards.items():
+                transaction.set(collection.document(shard), {"user_id": user_id, "entities": entries, "updated_at": now})
+            transaction.delete(legacy_entities_ref(db, user_id))
+        else:
+            for entity_id, entity in changes.items():
+                shards[shard_id(entity_id)][entity_id] = (
+                    firestore.DELETE_FIELD if entity is None else entity.model_dump()
+                )
+            for shard, entries in shards.items():
+                # merge=True replaces just these map entries
+                transaction.set(
+                    collection.document(shard),
+                    {"user_id": user_id, "entities": entries, "updated_at": now},
+                    merge=True
+                )
+        transaction.set(entity_index_ref(db, user_id), build_entity_index(user_id, list(entities.values())))
+
+    save(db.transaction())
+    return len(changes)
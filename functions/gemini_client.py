@@ -0,0 +1,112 @@
+"""
+Shared Gemini client provider.
+
+genai.Client owns an httpx connection pool. Building one per request pays
+TLS and connection setup on every LLM call; this module keeps one client
+per API key for the life of the instance, with keep-alive pooling sized for
+gen2 request concurrency. Clients are safe to share across threads.
+
+Tests and load benchmarks can swap the factory for a fake:
+
+    set_gemini_client_factory(lambda api_key: FakeClient())
+    ...
+    set_gemini_client_factory(None)  # back to the LLM_BACKEND default
+
+Without an injected factory, LLM_BACKEND picks the backend, so emulator
+runs can go offline through environment variables alone:
+    gemini (default)  genai.Client
+    stub              llm_stub.StubGeminiClient (LLM_STUB_LATENCY_MS)
+    record / replay   llm_replay (LLM_RECORDINGS_PATH, LLM_REPLAY_LATENCY_MS)
+
+Usage:
+    client = get_gemini_client(api_key)
+"""
+
+import os
+import threading
+from typing import Callable, Dict, Optional
+
+import httpx
+from google import genai
+from google.genai import types
+
+
+# Connection pool per client (one client per API key)
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY_SECONDS = 120.0
+
+_clients: Dict[str, object] = {}
+_factory: Optional[Callable[[str], object]] = None
+_lock = threading.Lock()
+
+
+def _create_client(api_key: str) -> genai.Client:
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+    )
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(
+            client_args={"limits": limits},
+            async_client_args={"limits": limits}
+        )
+    )
+
+
+def _backend_factory() -> Callable[[str], object]:
+    """Client factory for LLM_BACKEND (default: genai.Client)."""
+    backend = os.environ.get("LLM_BACKEND", "gemini").strip().lower()
+    if backend == "gemini":
+        return _create_client
+    if backend == "stub":
+        from llm_stub import StubGeminiClient
+        client = StubGeminiClient(latency_seconds=float(os.environ.get("LLM_STUB_LATENCY_MS", "0")) / 1000)
+        return lambda api_key: client
+    if backend in ("record", "replay"):
+        from llm_replay import replay_backend_factory
+        return replay_backend_factory(backend, _create_client)
+    raise ValueError(f"Unknown LLM_BACKEND: {backend}")
+
+
+def get_gemini_client(api_key: str):
+    """
+    Shared client for an API key, created on first use.
+
+    Args:
+        api_key: Gemini API key
+
+    Returns:
+        genai.Client (or whatever the injected factory returns)
+    """
+    client = _clients.get(api_key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = (_factory or _backend_factory())(api_key)
+            _clients[api_key] = client
+        return client
+
+
+def set_gemini_client_factory(factory: Optional[Callable[[str], object]]) -> None:
+    """
+    Replace the client factory (tests, load benchmarks) and drop pooled clients.
+
+    Args:
+        factory: Callable taking an API key and returning a client, or None for the LLM_BACKEND default
+    """
+    global _factory
+    with _lock:
+        _factory = factory
+        _clients.clear()
+
+
+def reset_gemini_clients() -> None:
+    """Drop pooled clients so the next call builds fresh ones."""
+    with _lock:
+        _clients.clear()
@@ -252,8 +252,9 @@ def parse_main_py() -> list[dict]:
     """Parse all Python files to extract Cloud Function definitions."""
     functions = []
 
-    # Parse main.py
+    # Parse main.py (callables and HTTP streaming endpoints)
     functions.extend(parse_python_file(MAIN_PY))
+    functions.extend(parse_python_file(MAIN_PY, "https_fn.on_request"))
 
     # Parse conversation_helpers.py
     functions.extend(parse_python_file(CONVERSATION_HELPERS_PY))
@@ -501,7 +502,7 @@ def generate_markdown(functions: list[dict], models: dict, enums: dict, astromet
     categories = {
         "Charts": ["natal_chart", "daily_transit", "user_transit", "get_synastry_chart", "get_natal_chart_for_connection"],
         "User Management": ["create_user_profile", "get_user_profile", "update_user_profile", "delete_user", "get_memory", "get_sun_sign_from_date", "register_device_token"],
-        "Horoscope": ["get_daily_horoscope", "get_astrometers"],
+        "Horoscope": ["get_daily_horoscope", "get_daily_horoscope_stream", "get_astrometers", "get_astrometers_timeline"],
         "Conversations": ["ask_the_stars", "get_conversation_history", "get_user_entities", "update_entity", "delete_entity"],
         "Connections": ["create_connection", "update_connection", "delete_connection", "list_connections"],
         "Sharing": ["get_share_link", "get_public_profile", "import_connection", "update_share_mode", "list_connection_requests", "respond_to_request"],
@@ -0,0 +1,195 @@
+"""
+Per-(user, date) cache of full DailyHoroscope readings.
+
+get_daily_horoscope stores the complete reading at
+users/{user_id}/daily_horoscopes/{date} and looks it up first, so app
+re-opens and retries for the same day cost one document read instead of a
+Gemini generation plus ~10 Firestore operations.
+
+Cached readings depend on the natal chart, profile and connections (the
+featured connection rotation), so anything that changes those calls
+invalidate_cached_horoscopes(). Readings for older dates are removed by a
+Firestore TTL policy on `expires_at`.
+
+Each entry is stamped with the user's cache epoch (the `epoch` document in
+the same collection) as read before generating; invalidation bumps the
+epoch, so a generation that was already in flight when the chart or
+connections changed stores an entry that is never served.
+
+Pre-generated readings (for a date that has not started yet) also carry a
+`deferred` map: the horoscopes/latest, memory and connection vibe writes
+that a live generation makes right away, applied by main when the reading
+is first served.
+
+Usage:
+    cached = get_cached_horoscope(db, user_id, date)
+    if cached is not None:
+        return cached
+    epoch = cache_epoch(horoscope_cache_epoch_ref(db, user_id).get())
+    ...  # generate
+    batch.set(horoscope_cache_ref(db, user_id, date), horoscope_cache_entry(date, daily_horoscope, epoch))
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from firebase_admin import firestore
+
+from models import DailyHoroscope
+
+
+DAILY_HOROSCOPES_COLLECTION = "daily_horoscopes"
+
+# Bump when DailyHoroscope changes shape; older entries are ignored
+HOROSCOPE_CACHE_VERSION = 2
+
+# Days a cached reading is kept (Firestore TTL policy on expires_at)
+HOROSCOPE_CACHE_RETENTION_DAYS = 14
+
+# Firestore limit on writes per batch
+_MAX_BATCH_WRITES = 500
+
+# ID of the document holding a user's cache epoch (never a reading date)
+CACHE_EPOCH_ID = "epoch"
+
+
+def _cache_collection(db, user_id: str):
+    return db.collection("users").document(user_id).collection(DAILY_HOROSCOPES_COLLECTION)
+
+
+def horoscope_cache_ref(db, user_id: str, date: str):
+    """Document reference for a user's cached reading on a date."""
+    return _cache_collection(db, user_id).document(date)
+
+
+def horoscope_cache_epoch_ref(db, user_id: str):
+    """Document reference for a user's cache epoch."""
+    return _cache_collection(db, user_id).document(CACHE_EPOCH_ID)
+
+
+def cache_epoch(snapshot) -> int:
+    """Cache epoch from a snapshot of horoscope_cache_epoch_ref (0 if never invalidated)."""
+    if snapshot is None or not snapshot.exists:
+        return 0
+    return (snapshot.to_dict() or {}).get("epoch", 0)
+
+
+def get_cached_horoscope(db, user_id: str, date: str) -> Optional[dict]:
+    """
+    Stored DailyHoroscope for a user and date.
+
+    Args:
+        db: Firestore client
+        user_id: User ID
+        date: Reading date "YYYY-MM-DD"
+
+    Returns:
+        DailyHoroscope as a JSON-mode dict, or None on a miss or read error
+    """
+    entry = get_cached_entry(db, user_id, date)
+    return entry["horoscope"] if entry is not None else None
+
+
+def get_cached_entry(db, user_id: str, date: str) -> Optional[dict]:
+    """
+    Stored cache entry (see horoscope_cache_entry) for a user and date.
+
+    The entry and the user's cache epoch come from one batched read; an
+    entry stamped with another epoch (generated before an invalidation) is
+    a miss.
+
+    Args:
+        db: Firestore client
+        user_id: User ID
+        date: Reading date "YYYY-MM-DD"
+
+    Returns:
+        The entry, or None on a miss or read error
+    """
+    try:
+        entry_ref = horoscope_cache_ref(db, user_id, date)
+        epoch_ref = horoscope_cache_epoch_ref(db, user_id)
+        snapshots = {snapshot.reference.path: snapshot for snapshot in db.get_all([entry_ref, epoch_ref])}
+        doc = snapshots.get(entry_ref.path)
+        if doc is None or not doc.exists:
+            return None
+        data = doc.to_dict()
+        epoch = cache_epoch(snapshots.get(epoch_ref.path))
+    except Exception as e:
+        print(f"Warning: Could not read cached horoscope {user_id}/{date}: {e}")
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != HOROSCOPE_CACHE_VERSION:
+        return None
+    if data.get("epoch", 0) != epoch:
+        return None
+    return data if isinstance(data.get("horoscope"), dict) else None
+
+
+def horoscope_cache_entry(
+    date: str,
+    horoscope: DailyHoroscope,
+    epoch: int = 0,
+    deferred: Optional[dict] = None
+) -> dict:
+    """
+    Document stored at users/{user_id}/daily_horoscopes/{date}.
+
+    Args:
+        date: Reading date "YYYY-MM-DD"
+        horoscope: Generated reading
+        epoch: The user's cache epoch read before generating
+        deferred: Writes to apply when the reading is first served
+            (pre-generated readings only)
+    """
+    now = datetime.now()
+    entry = {
+        "date": date,
+        "version": HOROSCOPE_CACHE_VERSION,
+        "epoch": epoch,
+        "horoscope": horoscope.model_dump(mode="json"),
+        "created_at": now.isoformat(),
+        "expires_at": now + timedelta(days=HOROSCOPE_CACHE_RETENTION_DAYS),
+    }
+    if deferred is not None:
+        entry["deferred"] = deferred
+    return entry
+
+
+def invalidate_cached_horoscopes(db, user_id: str) -> int:
+    """
+    Delete every cached reading for a user and bump their cache epoch.
+
+    Call after the natal chart, profile or connections change. The epoch
+    is bumped first, so readings still being generated from the old data
+    are rejected by get_cached_horoscope once stored.
+
+    Args:
+        db: Firestore client
+        user_id: User ID
+
+    Returns:
+        Number of cached readings deleted
+    """
+    try:
+        horoscope_cache_epoch_ref(db, user_id).set({
+            "epoch": firestore.Increment(1),
+            "updated_at": datetime.now().isoformat(),
+        }, merge=True)
+
+        deleted = 0
+        batch = db.batch()
+        for doc in _cache_collection(db, user_id).stream():
+            if doc.id == CACHE_EPOCH_ID:
+                continue
+            batch.delete(doc.reference)
+            deleted += 1
+            if deleted % _MAX_BATCH_WRITES == 0:
+                batch.commit()
+                batch = db.batch()
+        if deleted % _MAX_BATCH_WRITES:
+            batch.commit()
+        return deleted
+    except Exception as e:
+        print(f"Warning: Could not invalidate cached horoscopes for {user_id}: {e}")
+        return 0
@@ -0,0 +1,93 @@
+"""
+Incremental parsing of a streamed JSON object.
+
+Gemini streams a response_schema answer as JSON text split at arbitrary
+points. JsonFieldStream reports each top-level member of the object as soon
+as its value is complete, so callers can forward finished fields before the
+whole response has arrived.
+
+Usage:
+    fields = JsonFieldStream()
+    for chunk in stream:
+        for name, value in fields.feed(chunk.text or ""):
+            ...
+    data = json.loads(fields.text)  # the full object, once the stream ends
+"""
+
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class JsonFieldStream:
+    """Yields (name, value) for each completed top-level member of a JSON object."""
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key_start: Optional[int] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return self._buffer
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """
+        Add streamed text and return members completed by it.
+
+        Args:
+            text: Next piece of the JSON text
+
+        Returns:
+            (name, value) pairs in document order
+        """
+        self._buffer += text
+        completed = []
+        buffer = self._buffer
+
+        for i in range(self._pos, len(buffer)):
+            char = buffer[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        self._key = json.loads(buffer[self._key_start:i + 1])
+                        self._key_start = None
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._value_start is None:
+                    self._key_start = i
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._complete(buffer[self._value_start:i] if self._value_start is not None else "", completed)
+            elif self._depth == 1 and char == ":":
+                self._value_start = i + 1
+            elif self._depth == 1 and char == ",":
+                self._complete(buffer[self._value_start:i] if self._value_start is not None else "", completed)
+
+        self._pos = len(buffer)
+        return completed
+
+    def _complete(self, raw: str, completed: List[Tuple[str, Any]]) -> None:
+        if self._key is not None and raw.strip():
+            try:
+                completed.append((self._key, json.loads(raw)))
+            except json.JSONDecodeError as e:
+                print(f"Warning: Could not parse streamed field {self._key}: {e}")
+        self._key = None
+        self._value_start = None
@@ -8,13 +8,16 @@ Generates personalized daily horoscopes using:
 - Astrometers quantitative analysis
 """
 
+import itertools
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment
 from google.genai import types
 from pydantic import BaseModel, Field
+from pydantic_core import to_jsonable_python
 from dotenv import load_dotenv
 import httpx
 import uuid
@@ -25,12 +28,16 @@ load_dotenv()
 
 TEMPERATURE = 0.7
 
+# Daily horoscope generation limits
+DAILY_HOROSCOPE_MAX_TOKENS = 4096
+DAILY_HOROSCOPE_THINKING_BUDGET = 0
+
 from astro import (
     ZodiacSign,
     SunSignProfile,
     describe_chart_emphasis,
     get_upcoming_transits,
-    compute_birth_chart
+    UpcomingTransit,
 )
 from models import (
     DailyHoroscope,
@@ -53,13 +60,18 @@ from astrometers.meter_groups import build_all_meter_groups, get_group_state_lab
 from astrometers.summary import meter_groups_summary
 from astrometers.core import AspectContribution
 from moon import get_moon_transit_detail, format_moon_summary_for_llm
+from daily_context import DailyContext
+from assets import asset_exists, load_json, load_text, template_loader
 from posthog_utils import capture_llm_generation
+from gemini_client import get_gemini_client
+from llm_cache import get_static_prompt_cache, invalidate_static_prompt_cache, is_cached_content_error
+from json_stream import JsonFieldStream
 import json
 
 
 # Initialize Jinja2 environment (point to templates root to allow includes across subdirs)
 TEMPLATE_DIR = Path(__file__).parent / "templates"
-jinja_env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
+jinja_env = Environment(loader=template_loader("templates"))
 
 
 # =============================================================================
@@ -98,8 +110,7 @@ def generate_natal_chart_summary(
         posthog_api_key = os.environ.get("POSTHOG_API_KEY")
 
     # Load voice guidelines
-    voice_path = Path(__file__).parent / "templates" / "voice.md"
-    voice_content = voice_path.read_text() if voice_path.exists() else ""
+    voice_content = load_text("templates/voice.md") if asset_exists("templates/voice.md") else ""
 
     # Extract key chart elements
     sun_sign = sun_sign_profile.sign
@@ -172,7 +183,7 @@ No jargon. No "energy" or "vibe". Be specific and grounded.
 Return ONLY the summary text, no JSON wrapping."""
 
     # Initialize Gemini client
-    client = genai.Client(api_key=api_key)
+    client = get_gemini_client(api_key)
 
     response = client.models.generate_content(
         model=model_name,
@@ -248,18 +259,15 @@ METER_GROUP_MAPPING = {
 def load_meter_descriptions() -> dict[str, dict]:
     """Load overview, detailed, and astrological_foundation from meter JSON files."""
     descriptions = {}
-    base_path = Path(__file__).parent / "astrometers" / "labels"
 
     for meter_name in METER_NAMES:
-        json_path = base_path / f"{meter_name}.json"
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-                descriptions[meter_name] = {
-                    "overview": data["description"]["overview"],
-                    "detailed": data["description"]["detailed"],
-                    "astrological_foundation": data["astrological_foundation"]
-                }
+            data = load_json(f"astrometers/labels/{meter_name}.json")
+            descriptions[meter_name] = {
+                "overview": data["description"]["overview"],
+                "detailed": data["description"]["detailed"],
+                "astrological_foundation": data["astrological_foundation"]
+            }
         except Exception as e:
             print(f"Warning: Could not load {meter_name}.json: {e}")
             descriptions[meter_name] = {
@@ -274,17 +282,14 @@ def load_meter_descriptions() -> dict[str, dict]:
 def load_group_descriptions() -> dict[str, dict]:
     """Load overview and detailed descriptions from group JSON files."""
     descriptions = {}
-    base_path = Path(__file__).parent / "astrometers" / "labels" / "groups"
 
     for group_name in ["mind", "heart", "body", "instincts", "growth"]:
-        json_path = base_path / f"{group_name}.json"
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-                descriptions[group_name] = {
-                    "overview": data["description"]["overview"],
-                    "detailed": data["description"]["detailed"]
-                }
+            data = load_json(f"astrometers/labels/groups/{group_name}.json")
+            descriptions[group_name] = {
+                "overview": data["description"]["overview"],
+                "detailed": data["description"]["detailed"]
+            }
         except Exception as e:
             print(f"Warning: Could not load {group_name}.json: {e}")
             descriptions[group_name] = {
@@ -841,20 +846,115 @@ def _build_relationship_weather(
     )
 
 
-def generate_daily_horoscope(
+# Response schema for the daily horoscope (Prompt 1)
+class RelationshipWeatherResponse(BaseModel):
+    """LLM response for relationship weather - overview + optional connection vibe."""
+    overview: str  # General relationship energy for ALL relationships (no names)
+    connection_vibe: Optional[str] = None  # Personalized vibe for featured connection (with name)
+
+
+class DailyHoroscopeResponse(BaseModel):
+    technical_analysis: str
+    lunar_cycle_update: str
+    daily_theme_headline: str
+    daily_overview: str
+    actionable_advice: ActionableAdvice
+
+    # Meter group interpretations (2-3 sentences each, 150-300 chars)
+    mind_interpretation: str
+    heart_interpretation: str
+    body_interpretation: str
+    instincts_interpretation: str
+    growth_interpretation: str
+
+    # Look ahead (merged from detailed horoscope)
+    look_ahead_preview: str
+
+    # Phase 1 Extensions
+    energy_rhythm: str
+    relationship_weather: RelationshipWeatherResponse  # Now a nested object
+    collective_energy: str
+
+    # Engagement
+    follow_up_questions: list[str]
+
+
+@dataclass
+class DailyHoroscopeDraft:
+    """
+    The parts of a DailyHoroscope that do not come from the LLM, plus its prompt.
+
+    Built by prepare_daily_horoscope() before generation; computed() is what
+    the streaming endpoint sends while the LLM is still writing.
+    """
+    date: str
+    user_profile: UserProfile
+    transit_summary: dict
+    featured_connection: Optional[dict]
+    astrometers: Any  # AllMetersReading
+    moon_detail: Any  # MoonTransitDetail (interpretation filled from the LLM)
+    upcoming_transits: list[UpcomingTransit]
+    featured_meter_names: list[str]
+    static_prompt: str
+    prompt: str
+    uncached_prompt: str
+
+    def computed(self) -> dict:
+        """JSON-ready deterministic fields (interpretations empty)."""
+        astrometers_for_ios = build_astrometers_for_ios(
+            self.astrometers,
+            meter_interpretations={},
+            group_interpretations={},
+        )
+        return {
+            "date": self.date,
+            "sun_sign": self.user_profile.sun_sign,
+            "astrometers": astrometers_for_ios.model_dump(mode="json"),
+            "transit_summary": to_jsonable_python(self.transit_summary),
+            "moon_detail": self.moon_detail.model_dump(mode="json"),
+            "upcoming_transits": [t.model_dump(mode="json") for t in self.upcoming_transits],
+            "featured_meters": self.featured_meter_names,
+        }
+
+
+def _daily_horoscope_api_keys(api_key: Optional[str], posthog_api_key: Optional[str]) -> tuple[str, str]:
+    if not api_key:
+        api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        raise ValueError("GEMINI_API_KEY not provided")
+
+    if not posthog_api_key:
+        posthog_api_key = os.environ.get("POSTHOG_API_KEY")
+    if not posthog_api_key:
+        print("WARNING: POSTHOG_API_KEY not provided in generate_daily_horoscope")
+        raise ValueError("POSTHOG_API_KEY not provided")
+
+    return api_key, posthog_api_key
+
+
+def _daily_horoscope_config(cached_content: Optional[str]) -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        temperature=TEMPERATURE,
+        max_output_tokens=DAILY_HOROSCOPE_MAX_TOKENS,
+        thinking_config=types.ThinkingConfig(thinking_budget=DAILY_HOROSCOPE_THINKING_BUDGET),
+        response_mime_type="application/json",
+        response_schema=DailyHoroscopeResponse,
+        cached_content=cached_content
+    )
+
+
+def prepare_daily_horoscope(
     date: str,
     user_profile: UserProfile,
     sun_sign_profile: SunSignProfile,
     transit_summary: dict,
     memory: MemoryCollection,
     featured_connection: Optional[dict] = None,
-    api_key: Optional[str] = None,
-    posthog_api_key: Optional[str] = None,
-    model_name: str = "gemini-2.5-flash-lite",
     yesterday_meters: Optional[list[str]] = None,
-) -> DailyHoroscope:
+    context: Optional[DailyContext] = None,
+) -> DailyHoroscopeDraft:
     """
-    Generate daily horoscope (Prompt 1) - core transit analysis (async internal).
+    Compute everything a daily horoscope needs before the LLM call.
 
     Args:
         date: ISO date string (YYYY-MM-DD)
@@ -863,61 +963,22 @@ def generate_daily_horoscope(
         transit_summary: Enhanced transit summary dict from format_transit_summary_for_ui()
         memory: User's memory collection
         featured_connection: Optional connection dict for relationship_weather spotlight
-        api_key: Gemini API key (defaults to GEMINI_API_KEY env var)
-        posthog_api_key: PostHog API key for observability
-        model_name: Model to use (default: gemini-2.5-flash-lite)
         yesterday_meters: Optional list of meter names featured in yesterday's headline (to avoid repetition)
+        context: DailyContext for this user/date (built here if not provided)
 
     Returns:
-        DailyHoroscope with all fields populated
+        DailyHoroscopeDraft with meters, moon detail, upcoming transits and prompts
     """
+    # One shared computation of charts, aspects and meters for this user/day
+    if context is None:
+        context = DailyContext(user_profile.natal_chart, date, user_id=user_profile.user_id)
+    transit_chart = context.transit_chart
 
-    MAX_TOKENS = 4096
-    THINKING_BUDGET = 0
-
-    if not api_key:
-        api_key = os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not provided")
-
-    if not posthog_api_key:
-        posthog_api_key = os.environ.get("POSTHOG_API_KEY")
-    if not posthog_api_key:
-        print("WARNING: POSTHOG_API_KEY not provided in generate_daily_horoscope")
-        raise ValueError("POSTHOG_API_KEY not provided")
-
-    # Initialize Gemini client (direct, no SDK wrapper)
-    client = genai.Client(api_key=api_key)
+    # TODAY'S astrometers (user_id adds cosmic background noise)
+    astrometers = context.meters
 
-
-    # Compute transit chart for astrometers
-    transit_chart, _ = compute_birth_chart(
-        birth_date=date,
-        birth_time="12:00"  # Use noon for transits
-    )
-
-    # Calculate TODAY'S astrometers
-    from datetime import datetime as dt, timedelta
-    date_obj = dt.fromisoformat(date) if isinstance(date, str) else date
-    astrometers = get_meters(
-        natal_chart=user_profile.natal_chart,
-        transit_chart=transit_chart,
-        date=date_obj,
-        user_id=user_profile.user_id  # Pass user_id for cosmic background noise
-    )
-
-    # Calculate YESTERDAY'S astrometers for trend data
-    yesterday_date = date_obj - timedelta(days=1)
-    yesterday_date_str = yesterday_date.strftime('%Y-%m-%d')
-    yesterday_transit_chart, _ = compute_birth_chart(
-        birth_date=yesterday_date_str,
-        birth_time="12:00"
-    )
-    astrometers_yesterday = get_meters(
-        natal_chart=user_profile.natal_chart,
-        transit_chart=yesterday_transit_chart,
-        date=yesterday_date
-    )
+    # YESTERDAY'S astrometers for trend data
+    astrometers_yesterday = context.yesterday_meters
 
     # Generate smart summary (replaces verbose dump in template)
     meters_summary = daily_meters_summary(astrometers, astrometers_yesterday)
@@ -944,7 +1005,8 @@ def generate_daily_horoscope(
     moon_detail = get_moon_transit_detail(
         natal_chart=user_profile.natal_chart,
         transit_chart=transit_chart,
-        current_datetime=f"{date}T12:00:00"
+        current_datetime=f"{date}T12:00:00",
+        context=context
     )
     moon_summary_for_llm = format_moon_summary_for_llm(moon_detail)
 
@@ -963,7 +1025,7 @@ def generate_daily_horoscope(
     chart_emphasis = describe_chart_emphasis(user_profile.natal_chart['distributions'])
 
     # Get upcoming transits for look_ahead_preview
-    upcoming_transits_raw = get_upcoming_transits(user_profile.natal_chart, date, days_ahead=7)
+    upcoming_transits_raw = get_upcoming_transits(user_profile.natal_chart, date, days_ahead=7, context=context)
 
     # Group transits by day and add day names
     from datetime import datetime as dt, timedelta
@@ -992,9 +1054,6 @@ def generate_daily_horoscope(
         })
 
     # Render static template with meter metadata for reference
-    # fixme cache static
-    cache_content = None
-
     static_template = jinja_env.get_template("horoscope/daily_static.j2")
     static_prompt = static_template.render()  # Static template has no variables now
 
@@ -1203,8 +1262,10 @@ def generate_daily_horoscope(
         generation=generation
     )
 
-    # Compose final
+    # Compose final: static -> personalization -> dynamic, so the shared
+    # static prefix can be served from a Gemini cached content
     prompt = f"{static_prompt}\n\n{personalization_prompt}\n\n{dynamic_prompt}"
+    uncached_prompt = f"{personalization_prompt}\n\n{dynamic_prompt}"
 
     # Debug output (only when running locally, not in Cloud Functions)
     if os.environ.get("DEBUG_PROMPT"):
@@ -1214,160 +1275,321 @@ def generate_daily_horoscope(
         print(prompt)
         print("\n[yellow]End of Prompt[/yellow]\n")
 
-    # Define response schema
-    class RelationshipWeatherResponse(BaseModel):
-        """LLM response for relationship weather - overview + optional connection vibe."""
-        overview: str  # General relationship energy for ALL relationships (no names)
-        connection_vibe: Optional[str] = None  # Personalized vibe for featured connection (with name)
-
-    class DailyHoroscopeResponse(BaseModel):
-        technical_analysis: str
-        lunar_cycle_update: str
-        daily_theme_headline: str
-        daily_overview: str
-        actionable_advice: ActionableAdvice
-
-        # Meter group interpretations (2-3 sentences each, 150-300 chars)
-        mind_interpretation: str
-        heart_interpretation: str
-        body_interpretation: str
-        instincts_interpretation: str
-        growth_interpretation: str
-
-        # Look ahead (merged from detailed horoscope)
-        look_ahead_preview: str
-
-        # Phase 1 Extensions
-        energy_rhythm: str
-        relationship_weather: RelationshipWeatherResponse  # Now a nested object
-        collective_energy: str
-
-        # Engagement
-        follow_up_questions: list[str]
+    # Extract featured meter names for storage (to avoid repeating tomorrow)
+    featured_meter_names = [
+        item["meter"].meter_name for item in featured.get("featured_list", [])
+    ]
+
+    return DailyHoroscopeDraft(
+        date=date,
+        user_profile=user_profile,
+        transit_summary=transit_summary,
+        featured_connection=featured_connection,
+        astrometers=astrometers,
+        moon_detail=moon_detail,
+        upcoming_transits=upcoming_transits_raw,
+        featured_meter_names=featured_meter_names,
+        static_prompt=static_prompt,
+        prompt=prompt,
+        uncached_prompt=uncached_prompt,
+    )
+
+
+def _finish_daily_horoscope(
+    draft: DailyHoroscopeDraft,
+    parsed: DailyHoroscopeResponse,
+    model_name: str,
+    generation_time_ms: int,
+    usage_metadata,
+    posthog_api_key: str,
+) -> DailyHoroscope:
+    """Log the generation and merge the LLM fields into the draft."""
+    user_profile = draft.user_profile
+    astrometers = draft.astrometers
+    moon_detail = draft.moon_detail
+    usage = usage_metadata.model_dump() if usage_metadata else {}
+
+    print(f"[generate_daily_horoscope]Model:{model_name} Time:{generation_time_ms}ms Usage:{usage}")
+
+    # Manually capture to PostHog using HTTP API
+    output = f"Headline: {parsed.daily_theme_headline}\nOverview: {parsed.daily_overview}"
+    capture_llm_generation(
+        posthog_api_key=posthog_api_key,
+        distinct_id=user_profile.user_id,
+        model=model_name,
+        provider="gemini",
+        prompt=draft.prompt,
+        response=output,
+        usage=usage_metadata,
+        latency=generation_time_ms / 1000.0,
+        generation_type="daily_horoscope",
+        temperature=TEMPERATURE,
+        max_tokens=DAILY_HOROSCOPE_MAX_TOKENS,
+        thinking_budget=DAILY_HOROSCOPE_THINKING_BUDGET
+    )
+
+    # Extract group interpretations (5 fields)
+    group_interpretations = {
+        "mind": parsed.mind_interpretation,
+        "heart": parsed.heart_interpretation,
+        "body": parsed.body_interpretation,
+        "instincts": parsed.instincts_interpretation,
+        "growth": parsed.growth_interpretation,
+    }
+
+    # Extract individual meter interpretations (17 fields)
+    meter_interpretations = {
+        "clarity": "",
+        "focus": "",
+        "communication": "",
+        "resilience": "",
+        "connections": "",
+        "vulnerability": "",
+        "energy": "",
+        "drive": "",
+        "strength": "",
+        "vision": "",
+        "flow": "",
+        "intuition": "",
+        "creativity": "",
+        "momentum": "",
+        "ambition": "",
+        "evolution": "",
+        "circle": "",
+    }
+
+    # Build iOS-optimized astrometers structure
+    # State labels are computed from unified_score, not generated by LLM
+    astrometers_for_ios = build_astrometers_for_ios(
+        astrometers,
+        meter_interpretations=meter_interpretations,
+        group_interpretations=group_interpretations,
+    )
+
+    # Populate moon_detail.interpretation with LLM output
+    moon_detail.interpretation = parsed.lunar_cycle_update
+
+    horoscope = DailyHoroscope(
+        date=draft.date,
+        sun_sign=user_profile.sun_sign,
+        technical_analysis=parsed.technical_analysis,
+        daily_theme_headline=parsed.daily_theme_headline,
+        daily_overview=parsed.daily_overview,
+        actionable_advice=parsed.actionable_advice,
+        astrometers=astrometers_for_ios,  # iOS-optimized with full explainability
+        transit_summary=draft.transit_summary,
+        moon_detail=moon_detail,
+        look_ahead_preview=parsed.look_ahead_preview,
+        energy_rhythm=parsed.energy_rhythm,
+        # Use LLM-generated relationship weather
+        # overview: general relationship energy (no names)
+        # connection_vibes: populated here with LLM-generated vibe text for featured connection
+        relationship_weather=_build_relationship_weather(
+            parsed.relationship_weather,
+            draft.featured_connection
+        ) if parsed.relationship_weather else None,
+        collective_energy=parsed.collective_energy,
+        follow_up_questions=parsed.follow_up_questions,
+        model_used=model_name,
+        generation_time_ms=generation_time_ms,
+        usage=usage,
+        featured_meters=draft.featured_meter_names,
+    )
+
+    return horoscope
+
+
+def generate_daily_horoscope(
+    date: str,
+    user_profile: UserProfile,
+    sun_sign_profile: SunSignProfile,
+    transit_summary: dict,
+    memory: MemoryCollection,
+    featured_connection: Optional[dict] = None,
+    api_key: Optional[str] = None,
+    posthog_api_key: Optional[str] = None,
+    model_name: str = "gemini-2.5-flash-lite",
+    yesterday_meters: Optional[list[str]] = None,
+    context: Optional[DailyContext] = None,
+) -> DailyHoroscope:
+    """
+    Generate daily horoscope (Prompt 1) - core transit analysis (async internal).
+
+    Args:
+        date: ISO date string (YYYY-MM-DD)
+        user_profile: Complete user profile
+        sun_sign_profile: Complete sun sign profile
+        transit_summary: Enhanced transit summary dict from format_transit_summary_for_ui()
+        memory: User's memory collection
+        featured_connection: Optional connection dict for relationship_weather spotlight
+        api_key: Gemini API key (defaults to GEMINI_API_KEY env var)
+        posthog_api_key: PostHog API key for observability
+        model_name: Model to use (default: gemini-2.5-flash-lite)
+        yesterday_meters: Optional list of meter names featured in yesterday's headline (to avoid repetition)
+        context: DailyContext for this user/date (built here if not provided)
+
+    Returns:
+        DailyHoroscope with all fields populated
+    """
+    api_key, posthog_api_key = _daily_horoscope_api_keys(api_key, posthog_api_key)
+
+    # Initialize Gemini client (direct, no SDK wrapper)
+    client = get_gemini_client(api_key)
+
+    draft = prepare_daily_horoscope(
+        date=date,
+        user_profile=user_profile,
+        sun_sign_profile=sun_sign_profile,
+        transit_summary=transit_summary,
+        memory=memory,
+        featured_connection=featured_connection,
+        yesterday_meters=yesterday_meters,
+        context=context,
+    )
+
+    # The shared static prefix is served from a Gemini cached content
+    cache_content = get_static_prompt_cache(client, api_key, model_name, draft.static_prompt)
 
     # Generate
     try:
         start_time = datetime.now()
 
-        config = types.GenerateContentConfig(
-            temperature=TEMPERATURE,
-            max_output_tokens=MAX_TOKENS,
-            thinking_config=types.ThinkingConfig(thinking_budget=THINKING_BUDGET),
-            response_mime_type="application/json",
-            response_schema=DailyHoroscopeResponse,
-            cached_content=cache_content if cache_content else None
-        )
+        def _generate(cached_content: Optional[str]) -> GenerateContentResponse:
+            # Direct Gemini call (no SDK wrapper)
+            return client.models.generate_content(
+                model=model_name,
+                contents=draft.uncached_prompt if cached_content else draft.prompt,
+                config=_daily_horoscope_config(cached_content)
+            )
 
-        # Direct Gemini call (no SDK wrapper)
-        response: GenerateContentResponse = client.models.generate_content(
-            model=model_name,
-            contents=prompt,
-            config=config
-        )
+        if cache_content:
+            try:
+                response = _generate(cache_content)
+            except Exception as e:
+                if not is_cached_content_error(e):
+                    raise
+                # Cached content deleted or expired early: send the full prompt
+                print(f"Warning: Cached content {cache_content} failed, retrying without cache: {e}")
+                invalidate_static_prompt_cache(cache_content)
+                response = _generate(None)
+        else:
+            response = _generate(None)
 
         generation_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-        usage = response.usage_metadata.model_dump() if response.usage_metadata else {}
         parsed: DailyHoroscopeResponse = response.parsed
 
         open('last_daily_horoscope_response.json', 'w').write(parsed.model_dump_json(indent=2))
 
-
-        print(f"[generate_daily_horoscope]Model:{model_name} Time:{generation_time_ms}ms Usage:{usage}")
-
-        # Manually capture to PostHog using HTTP API
-        output = f"Headline: {parsed.daily_theme_headline}\nOverview: {parsed.daily_overview}"
-        capture_llm_generation(
-            posthog_api_key=posthog_api_key,
-            distinct_id=user_profile.user_id,
-            model=model_name,
-            provider="gemini",
-            prompt=prompt,
-            response=output,
-            usage=response.usage_metadata,
-            latency=generation_time_ms / 1000.0,
-            generation_type="daily_horoscope",
-            temperature=TEMPERATURE,
-            max_tokens=MAX_TOKENS,
-            thinking_budget=THINKING_BUDGET
+        return _finish_daily_horoscope(
+            draft, parsed, model_name, generation_time_ms, response.usage_metadata, posthog_api_key
         )
 
-        # Extract group interpretations (5 fields)
-        group_interpretations = {
-            "mind": parsed.mind_interpretation,
-            "heart": parsed.heart_interpretation,
-            "body": parsed.body_interpretation,
-            "instincts": parsed.instincts_interpretation,
-            "growth": parsed.growth_interpretation,
-        }
+    except Exception as e:
+        raise RuntimeError(f"Error generating daily horoscope: {e}")
 
-        # Extract individual meter interpretations (17 fields)
-        meter_interpretations = {
-            "clarity": "",
-            "focus": "",
-            "communication": "",
-            "resilience": "",
-            "connections": "",
-            "vulnerability": "",
-            "energy": "",
-            "drive": "",
-            "strength": "",
-            "vision": "",
-            "flow": "",
-            "intuition": "",
-            "creativity": "",
-            "momentum": "",
-            "ambition": "",
-            "evolution": "",
-            "circle": "",
-        }
 
-        # Build iOS-optimized astrometers structure
-        # State labels are computed from unified_score, not generated by LLM
-        astrometers_for_ios = build_astrometers_for_ios(
-            astrometers,
-            meter_interpretations=meter_interpretations,
-            group_interpretations=group_interpretations,
-        )
+def stream_daily_horoscope_response(
+    date: str,
+    user_profile: UserProfile,
+    sun_sign_profile: SunSignProfile,
+    transit_summary: dict,
+    memory: MemoryCollection,
+    featured_connection: Optional[dict] = None,
+    api_key: Optional[str] = None,
+    posthog_api_key: Optional[str] = None,
+    model_name: str = "gemini-2.5-flash-lite",
+    yesterday_meters: Optional[list[str]] = None,
+    context: Optional[DailyContext] = None,
+):
+    """
+    Generate daily horoscope (Prompt 1) as a stream of events (synchronous generator).
 
-        # Populate moon_detail.interpretation with LLM output
-        moon_detail.interpretation = parsed.lunar_cycle_update
-
-        # Extract featured meter names for storage (to avoid repeating tomorrow)
-        featured_meter_names = [
-            item["meter"].meter_name for item in featured.get("featured_list", [])
-        ]
-
-        horoscope = DailyHoroscope(
-            date=date,
-            sun_sign=user_profile.sun_sign,
-            technical_analysis=parsed.technical_analysis,
-            daily_theme_headline=parsed.daily_theme_headline,
-            daily_overview=parsed.daily_overview,
-            actionable_advice=parsed.actionable_advice,
-            astrometers=astrometers_for_ios,  # iOS-optimized with full explainability
-            transit_summary=transit_summary,
-            moon_detail=moon_detail,
-            look_ahead_preview=parsed.look_ahead_preview,
-            energy_rhythm=parsed.energy_rhythm,
-            # Use LLM-generated relationship weather
-            # overview: general relationship energy (no names)
-            # connection_vibes: populated here with LLM-generated vibe text for featured connection
-            relationship_weather=_build_relationship_weather(
-                parsed.relationship_weather,
-                featured_connection
-            ) if parsed.relationship_weather else None,
-            collective_energy=parsed.collective_energy,
-            follow_up_questions=parsed.follow_up_questions,
-            model_used=model_name,
-            generation_time_ms=generation_time_ms,
-            usage=usage,
-            featured_meters=featured_meter_names,
-        )
+    The deterministic parts are sent before the LLM call starts, then each
+    DailyHoroscopeResponse field as soon as its JSON value is complete.
 
-        return horoscope
+    Args:
+        date: ISO date string (YYYY-MM-DD)
+        user_profile: Complete user profile
+        sun_sign_profile: Complete sun sign profile
+        transit_summary: Enhanced transit summary dict from format_transit_summary_for_ui()
+        memory: User's memory collection
+        featured_connection: Optional connection dict for relationship_weather spotlight
+        api_key: Gemini API key (defaults to GEMINI_API_KEY env var)
+        posthog_api_key: PostHog API key for observability
+        model_name: Model to use (default: gemini-2.5-flash-lite)
+        yesterday_meters: Optional list of meter names featured in yesterday's headline (to avoid repetition)
+        context: DailyContext for this user/date (built here if not provided)
+
+    Yields:
+        {"type": "computed", ...}: DailyHoroscopeDraft.computed() (before the LLM call)
+        {"type": "field", "field": name, "value": value}: one per completed
+            DailyHoroscopeResponse field, in generation order
+        {"type": "complete", "horoscope": DailyHoroscope}: last event
+    """
+    api_key, posthog_api_key = _daily_horoscope_api_keys(api_key, posthog_api_key)
+    client = get_gemini_client(api_key)
+
+    draft = prepare_daily_horoscope(
+        date=date,
+        user_profile=user_profile,
+        sun_sign_profile=sun_sign_profile,
+        transit_summary=transit_summary,
+        memory=memory,
+        featured_connection=featured_connection,
+        yesterday_meters=yesterday_meters,
+        context=context,
+    )
+
+    yield {"type": "computed", **draft.computed()}
+
+    cache_content = get_static_prompt_cache(client, api_key, model_name, draft.static_prompt)
+
+    try:
+        start_time = datetime.now()
+
+        def _open_stream(cached_content: Optional[str]):
+            stream = client.models.generate_content_stream(
+                model=model_name,
+                contents=draft.uncached_prompt if cached_content else draft.prompt,
+                config=_daily_horoscope_config(cached_content)
+            )
+            # Pull the first chunk here so a rejected cached content can be retried
+            first = next(stream, None)
+            return stream if first is None else itertools.chain([first], stream)
+
+        if cache_content:
+            try:
+                chunks = _open_stream(cache_content)
+            except Exception as e:
+                if not is_cached_content_error(e):
+                    raise
+                print(f"Warning: Cached content {cache_content} failed, retrying without cache: {e}")
+                invalidate_static_prompt_cache(cache_content)
+                chunks = _open_stream(None)
+        else:
+            chunks = _open_stream(None)
+
+        fields = JsonFieldStream()
+        usage_metadata = None
+        for chunk in chunks:
+            if chunk.text:
+                for name, value in fields.feed(chunk.text):
+                    yield {"type": "field", "field": name, "value": value}
+            # Usage arrives with the last chunk
+            if chunk.usage_metadata:
+                usage_metadata = chunk.usage_metadata
+
+        generation_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        parsed = DailyHoroscopeResponse.model_validate_json(fields.text)
+
+        horoscope = _finish_daily_horoscope(
+            draft, parsed, model_name, generation_time_ms, usage_metadata, posthog_api_key
+        )
 
     except Exception as e:
-        raise RuntimeError(f"Error generating daily horoscope: {e}")
+        raise RuntimeError(f"Error streaming daily horoscope: {e}")
+
+    yield {"type": "complete", "horoscope": horoscope}
 
 
 # =============================================================================
@@ -1456,8 +1678,7 @@ def generate_compatibility_result(
         posthog_api_key = os.environ.get("POSTHOG_API_KEY")
 
     # Load voice guidelines
-    voice_path = Path(__file__).parent / "templates" / "voice.md"
-    voice_content = voice_path.read_text() if voice_path.exists() else ""
+    voice_content = load_text("templates/voice.md") if asset_exists("templates/voice.md") else ""
 
     # Extract data for prompt
     mode = compatibility_data.mode
@@ -1749,7 +1970,7 @@ For "Difficult" or "Challenging" categories, the path forward should be about re
 9. {"Feel free to mention the karmic/fated connection naturally in the summary or strengths" if karmic.is_karmic else "Do NOT mention karmic, fated, destiny, or past-life themes - this relationship does not have those aspects"}"""
 
     # Initialize Gemini client
-    client = genai.Client(api_key=gemini_api_key)
+    client = get_gemini_client(gemini_api_key)
 
     # Generate with Pydantic schema
     response = client.models.generate_content(
@@ -0,0 +1,206 @@
+"""
+Gemini explicit context caching for static prompt prefixes.
+
+The daily horoscope prompt is composed static -> personalization -> dynamic.
+The static part (daily_static.j2) is identical for every user, so it is
+uploaded once per (API key, model, prompt version) as a Gemini cached
+content and referenced by name from each generate_content call. Only the
+personalization and dynamic parts are sent per request.
+
+Handles are refreshed (TTL extended) shortly before they expire. A cache
+create/refresh error falls back to sending the full prompt, and so does a
+generate call that rejects the handle itself (is_cached_content_error());
+other generate errors such as 429s and timeouts are not retried uncached.
+
+After a failed create the manager waits FAILURE_BACKOFF_SECONDS before
+trying again, so a prompt that is below the model's minimum cacheable size
+does not cost a create call per request.
+
+Usage:
+    cached_name = get_static_prompt_cache(client, api_key, model_name, static_prompt)
+    if cached_name:
+        contents = f"{personalization_prompt}\\n\\n{dynamic_prompt}"
+    else:
+        contents = f"{static_prompt}\\n\\n{personalization_prompt}\\n\\n{dynamic_prompt}"
+"""
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from google.genai import errors, types
+
+
+# Lifetime of a cached content handle
+CACHE_TTL_SECONDS = 3600
+
+# Extend the TTL once a handle is this close to expiring
+CACHE_REFRESH_MARGIN_SECONDS = 300
+
+# Wait this long after a failed create before trying again
+FAILURE_BACKOFF_SECONDS = 600
+
+
+@dataclass
+class _CacheEntry:
+    name: Optional[str]
+    expires_at: float
+
+
+def prompt_version(text: str) -> str:
+    """Short content hash identifying a version of a static prompt."""
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def _expires_at(cached_content, now: float, ttl_seconds: int) -> float:
+    # Prefer the server's expiry; fall back to our own clock
+    expire_time = getattr(cached_content, "expire_time", None)
+    if isinstance(expire_time, datetime):
+        return min(expire_time.timestamp(), now + ttl_seconds)
+    return now + ttl_seconds
+
+
+class PromptCacheManager:
+    """
+    Cached content handles keyed by (API key, model, prompt version).
+
+    Thread-safe. Each key has its own lock so concurrent requests for the
+    same prompt create one handle, while other keys are not blocked.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = CACHE_TTL_SECONDS,
+        refresh_margin_seconds: int = CACHE_REFRESH_MARGIN_SECONDS,
+        failure_backoff_seconds: int = FAILURE_BACKOFF_SECONDS,
+        clock: Callable[[], float] = time.time
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.failure_backoff_seconds = failure_backoff_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._entries: Dict[Tuple[str, str, str], _CacheEntry] = {}
+
+    def _key_lock(self, key: Tuple[str, str, str]) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get(self, client, api_key: str, model: str, text: str, display_name: str = "static-prompt") -> Optional[str]:
+        """
+        Name of a live cached content holding `text`, or None to send it inline.
+
+        Args:
+            client: genai.Client (or a fake with .caches.create/.update)
+            api_key: API key the client was built with (cached contents are per project)
+            model: Model name the handle is created for
+            text: Static prompt prefix
+            display_name: Label shown in the Gemini console
+
+        Returns:
+            Cached content name, or None if caching is unavailable
+        """
+        key = (hashlib.sha256(api_key.encode()).hexdigest()[:16], model, prompt_version(text))
+
+        entry = self._entries.get(key)
+        if entry and self._fresh(entry):
+            return entry.name
+
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry and self._fresh(entry):
+                return entry.name
+
+            now = self.clock()
+            if entry and entry.name and entry.expires_at > now:
+                refreshed = self._refresh(client, entry, now)
+                if refreshed:
+                    return refreshed.name
+            if entry and entry.name is None and entry.expires_at > now:
+                return None  # Backing off after a failed create
+
+            created = self._create(client, model, text, f"{display_name}-{key[2]}", now)
+            self._entries[key] = created
+            return created.name
+
+    def _fresh(self, entry: _CacheEntry) -> bool:
+        return entry.name is not None and entry.expires_at - self.refresh_margin_seconds > self.clock()
+
+    def _create(self, client, model: str, text: str, display_name: str, now: float) -> _CacheEntry:
+        try:
+            cached = client.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    contents=[types.Content(role="user", parts=[types.Part(text=text)])],
+                    display_name=display_name,
+                    ttl=f"{self.ttl_seconds}s"
+                )
+            )
+            name = getattr(cached, "name", None)
+            if not isinstance(name, str) or not name:
+                raise ValueError("cached content has no name")
+            return _CacheEntry(name=name, expires_at=_expires_at(cached, now, self.ttl_seconds))
+        except Exception as e:
+            print(f"Warning: Could not create cached content for {model}: {e}")
+            return _CacheEntry(name=None, expires_at=now + self.failure_backoff_seconds)
+
+    def _refresh(self, client, entry: _CacheEntry, now: float) -> Optional[_CacheEntry]:
+        try:
+            updated = client.caches.update(
+                name=entry.name,
+                config=types.UpdateCachedContentConfig(ttl=f"{self.ttl_seconds}s")
+            )
+            entry.expires_at = _expires_at(updated, now, self.ttl_seconds)
+            return entry
+        except Exception as e:
+            print(f"Warning: Could not refresh cached content {entry.name}: {e}")
+            return None
+
+    def invalidate(self, name: str) -> None:
+        """Forget a handle the API rejected (e.g. deleted or expired early)."""
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e.name == name]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+
+_PROMPT_CACHE = PromptCacheManager()
+
+
+def get_static_prompt_cache(client, api_key: str, model: str, static_prompt: str) -> Optional[str]:
+    """Cached content name for a static prompt prefix, or None to send it inline."""
+    return _PROMPT_CACHE.get(client, api_key, model, static_prompt, display_name="daily-static")
+
+
+def invalidate_static_prompt_cache(name: str) -> None:
+    """Drop a cached content name after the API rejected it."""
+    _PROMPT_CACHE.invalidate(name)
+
+
+def clear_static_prompt_cache() -> None:
+    """Forget all handles (tests)."""
+    _PROMPT_CACHE.clear()
+
+
+def is_cached_content_error(error: Exception) -> bool:
+    """
+    True if a generate call failed because its cached content is gone or unusable.
+
+    Deleted or expired handles come back as 404 NOT_FOUND, or as 400/403 with a
+    message naming the cached content. Rate limits, server errors and timeouts
+    are not cache errors: retrying them uncached would only double the load.
+    """
+    if not isinstance(error, errors.ClientError):
+        return False
+    if error.code == 404:
+        return True
+    message = (error.message or "").lower()
+    return error.code in (400, 403) and ("cachedcontent" in message or "cached content" in message)
@@ -0,0 +1,253 @@
+"""
+Record/replay Gemini backend for offline load tests.
+
+RecordingGeminiClient wraps a real client and appends every
+generate_content / generate_content_stream exchange (response chunks with
+usage metadata, and when each chunk arrived) to a JSONL file.
+ReplayGeminiClient serves those recordings back with the recorded or a
+synthetic latency, so full request paths can run against the Firestore
+emulator without network calls or API cost.
+
+A request is answered by the recording of the same model and prompt if
+there is one, otherwise by the next recording (round robin) of the same
+call shape: method plus response_schema, e.g.
+"generate_content:DailyHoroscopeResponse" or "generate_content_stream:text".
+
+Select a backend with LLM_BACKEND (read by gemini_client):
+    LLM_BACKEND=record LLM_RECORDINGS_PATH=llm_recordings.jsonl   # Gemini, saved
+    LLM_BACKEND=replay LLM_RECORDINGS_PATH=llm_recordings.jsonl   # offline
+    LLM_REPLAY_LATENCY_MS=800       # fixed latency per call (default: as recorded)
+    LLM_REPLAY_LATENCY_SCALE=0.5    # or scale the recorded latency
+
+Usage (in-process):
+    from llm_replay import use_replay_llm
+    use_replay_llm("llm_recordings.jsonl", latency_seconds=0.8)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, List, Optional
+
+from google.genai import types
+from pydantic import BaseModel
+
+from gemini_client import set_gemini_client_factory
+from llm_stub import StubCaches
+
+
+DEFAULT_RECORDINGS_PATH = "llm_recordings.jsonl"
+
+# Response fields not worth recording (parsed is rebuilt from the text)
+_EXCLUDED_FIELDS = {"parsed", "sdk_http_response"}
+
+
+def call_shape(method: str, config) -> str:
+    """Replay fallback key: method plus response_schema name."""
+    schema = getattr(config, "response_schema", None)
+    return f"{method}:{getattr(schema, '__name__', None) or 'text'}"
+
+
+def prompt_key(model: str, contents) -> str:
+    """Exact-match key for a model and prompt."""
+    text = contents if isinstance(contents, str) else json.dumps(contents, default=str, sort_keys=True)
+    return hashlib.sha256(f"{model}\n{text}".encode()).hexdigest()[:24]
+
+
+def _dump_response(response) -> dict:
+    return response.model_dump(mode="json", exclude_none=True, exclude=_EXCLUDED_FIELDS)
+
+
+class _RecordingModels:
+    def __init__(self, client: "RecordingGeminiClient"):
+        self._client = client
+
+    def generate_content(self, model: str, contents, config=None):
+        start = time.perf_counter()
+        response = self._client.inner.models.generate_content(model=model, contents=contents, config=config)
+        elapsed_ms = round((time.perf_counter() - start) * 1000)
+        self._client.record("generate_content", model, contents, config, [(elapsed_ms, response)])
+        return response
+
+    def generate_content_stream(self, model: str, contents, config=None):
+        start = time.perf_counter()
+        chunks = []
+        for chunk in self._client.inner.models.generate_content_stream(model=model, contents=contents, config=config):
+            chunks.append((round((time.perf_counter() - start) * 1000), chunk))
+            yield chunk
+        self._client.record("generate_content_stream", model, contents, config, chunks)
+
+
+class RecordingGeminiClient:
+    """
+    genai.Client wrapper that saves every generation to a JSONL file.
+
+    Args:
+        inner: Real client (e.g. genai.Client)
+        path: Recordings file (appended to)
+    """
+
+    def __init__(self, inner, path: str = DEFAULT_RECORDINGS_PATH):
+        self.inner = inner
+        self.path = path
+        self.models = _RecordingModels(self)
+        self.caches = inner.caches
+        self._lock = threading.Lock()
+
+    def record(self, method: str, model: str, contents, config, chunks: list) -> None:
+        entry = {
+            "shape": call_shape(method, config),
+            "key": prompt_key(model, contents),
+            "model": model,
+            "chunks": [{"at_ms": at_ms, "response": _dump_response(r)} for at_ms, r in chunks],
+        }
+        try:
+            with self._lock, open(self.path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        except Exception as e:
+            print(f"Warning: Could not record Gemini response to {self.path}: {e}")
+
+
+class _ReplayModels:
+    def __init__(self, client: "ReplayGeminiClient"):
+        self._client = client
+
+    def generate_content(self, model: str, contents, config=None) -> types.GenerateContentResponse:
+        recording = self._client.match("generate_content", model, contents, config)
+        offsets = self._client.offsets(recording)
+        self._client.sleep(offsets[-1])
+        return self._client.response(recording["chunks"][-1], config)
+
+    def generate_content_stream(self, model: str, contents, config=None) -> Iterator[types.GenerateContentResponse]:
+        recording = self._client.match("generate_content_stream", model, contents, config)
+        elapsed = 0.0
+        for chunk, offset in zip(recording["chunks"], self._client.offsets(recording)):
+            self._client.sleep(max(0.0, offset - elapsed))
+            elapsed = offset
+            yield self._client.response(chunk, None)
+
+
+class ReplayGeminiClient:
+    """
+    genai.Client look-alike that answers from recordings.
+
+    Args:
+        recordings: Entries written by RecordingGeminiClient
+        latency_seconds: Fixed latency per call; chunks keep their recorded
+            spacing, stretched to end at this latency (default: as recorded)
+        latency_scale: Multiplier on the recorded latency when
+            latency_seconds is not set
+        sleep: Sleep function (tests)
+    """
+
+    def __init__(
+        self,
+        recordings: List[dict],
+        latency_seconds: Optional[float] = None,
+        latency_scale: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.latency_seconds = latency_seconds
+        self.latency_scale = latency_scale
+        self.sleep = sleep
+        self.calls: list[dict] = []
+        self.models = _ReplayModels(self)
+        self.caches = StubCaches()
+        self._by_key: Dict[tuple, dict] = {}
+        self._by_shape: Dict[str, List[dict]] = defaultdict(list)
+        self._next: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        for recording in recordings:
+            if not recording.get("chunks"):
+                continue
+            self._by_key[(recording["shape"], recording["key"])] = recording
+            self._by_shape[recording["shape"]].append(recording)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_RECORDINGS_PATH, **kwargs) -> "ReplayGeminiClient":
+        """Replay client for a JSONL recordings file."""
+        with open(path) as f:
+            recordings = [json.loads(line) for line in f if line.strip()]
+        return cls(recordings, **kwargs)
+
+    def match(self, method: str, model: str, contents, config) -> dict:
+        """Recording for this call: same prompt, else round robin over the same shape."""
+        shape = call_shape(method, config)
+        self.calls.append({"method": method, "model": model, "shape": shape})
+        recording = self._by_key.get((shape, prompt_key(model, contents)))
+        if recording is not None:
+            return recording
+        candidates = self._by_shape.get(shape)
+        if not candidates:
+            raise LookupError(f"No recorded Gemini response for {shape}")
+        with self._lock:
+            index = self._next[shape]
+            self._next[shape] = index + 1
+        return candidates[index % len(candidates)]
+
+    def offsets(self, recording: dict) -> List[float]:
+        """Seconds from the start of the call at which each chunk is returned."""
+        recorded = [chunk.get("at_ms", 0) / 1000 for chunk in recording["chunks"]]
+        if self.latency_seconds is None:
+            return [t * self.latency_scale for t in recorded]
+        if recorded[-1] <= 0:
+            count = len(recorded)
+            return [self.latency_seconds * (i + 1) / count for i in range(count)]
+        return [self.latency_seconds * t / recorded[-1] for t in recorded]
+
+    def response(self, chunk: dict, config) -> types.GenerateContentResponse:
+        """Rebuild a recorded response (with parsed for a response_schema)."""
+        data = chunk["response"]
+        response = types.GenerateContentResponse.model_validate(data)
+        schema = getattr(config, "response_schema", None)
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            response = types.GenerateContentResponse(
+                **data, parsed=schema.model_validate_json(response.text or "{}")
+            )
+        return response
+
+
+def replay_backend_factory(backend: str, create_client: Callable[[str], object]) -> Callable[[str], object]:
+    """
+    Client factory for LLM_BACKEND=record or replay, configured from the environment.
+
+    Args:
+        backend: "record" or "replay"
+        create_client: Factory for real clients (wrapped when recording)
+
+    Returns:
+        Callable taking an API key and returning a client
+    """
+    path = os.environ.get("LLM_RECORDINGS_PATH", DEFAULT_RECORDINGS_PATH)
+    if backend == "record":
+        return lambda api_key: RecordingGeminiClient(create_client(api_key), path)
+
+    latency_ms = os.environ.get("LLM_REPLAY_LATENCY_MS")
+    client = ReplayGeminiClient.load(
+        path,
+        latency_seconds=float(latency_ms) / 1000 if latency_ms else None,
+        latency_scale=float(os.environ.get("LLM_REPLAY_LATENCY_SCALE", "1.0")),
+    )
+    return lambda api_key: client
+
+
+def use_replay_llm(
+    path: Optional[str] = DEFAULT_RECORDINGS_PATH,
+    latency_seconds: Optional[float] = None,
+    latency_scale: float = 1.0
+) -> Optional[ReplayGeminiClient]:
+    """
+    Route get_gemini_client() to one shared ReplayGeminiClient (or back to Gemini with None).
+
+    Returns:
+        The replay client, or None when disabled
+    """
+    if path is None:
+        set_gemini_client_factory(None)
+        return None
+    client = ReplayGeminiClient.load(path, latency_seconds=latency_seconds, latency_scale=latency_scale)
+    set_gemini_client_factory(lambda api_key: client)
+    return client
@@ -0,0 +1,150 @@
+"""
+Offline stand-in for the Gemini client.
+
+StubGeminiClient answers generate_content / generate_content_stream with
+placeholder text, or with a placeholder instance of the requested
+response_schema, so the whole generation pipeline (prompt rendering,
+parsing, Firestore writes) runs locally without an API key or network.
+
+Usage:
+    from llm_stub import use_stub_llm
+    use_stub_llm()               # every get_gemini_client() returns a stub
+    ...
+    use_stub_llm(False)          # back to genai.Client
+"""
+
+import enum
+import itertools
+import time
+import types as pytypes
+import typing
+from collections import deque
+from typing import Any, Optional
+
+from google.genai import types
+from pydantic import BaseModel
+
+from gemini_client import set_gemini_client_factory
+
+
+STUB_TEXT = "Stub response."
+
+# Recent calls a StubGeminiClient keeps for inspection; one stub serves a
+# whole benchmark run, so older calls are dropped rather than kept forever
+RECENT_CALLS = 32
+
+
+def _stub_value(annotation: Any, name: str) -> Any:
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin in (typing.Union, pytypes.UnionType):
+        non_none = [a for a in args if a is not type(None)]
+        return _stub_value(non_none[0], name) if non_none else None
+    if origin is typing.Literal:
+        return args[0]
+    if origin in (list, typing.List):
+        return [_stub_value(args[0], name)] if args else []
+    if origin in (dict, typing.Dict):
+        return {}
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return stub_instance(annotation)
+        if issubclass(annotation, enum.Enum):
+            return next(iter(annotation))
+        if issubclass(annotation, bool):
+            return False
+        if issubclass(annotation, int):
+            return 0
+        if issubclass(annotation, float):
+            return 0.0
+        if issubclass(annotation, str):
+            return f"Stub {name.replace('_', ' ')}."
+    return None
+
+
+def stub_instance(schema: type[BaseModel]) -> BaseModel:
+    """Placeholder instance of a response schema (every field filled)."""
+    values = {
+        name: _stub_value(field.annotation, name)
+        for name, field in schema.model_fields.items()
+    }
+    return schema.model_validate(values)
+
+
+class _StubModels:
+    def __init__(self, client: "StubGeminiClient"):
+        self._client = client
+
+    def _respond(self, model: str, contents, config) -> types.GenerateContentResponse:
+        self._client.call_count = next(self._client._call_ids)
+        self._client.calls.append({"model": model, "contents": contents, "config": config})
+        if self._client.latency_seconds:
+            time.sleep(self._client.latency_seconds)
+
+        schema = getattr(config, "response_schema", None)
+        parsed = stub_instance(schema) if isinstance(schema, type) and issubclass(schema, BaseModel) else None
+        text = parsed.model_dump_json() if parsed is not None else STUB_TEXT
+
+        response = types.GenerateContentResponse(
+            candidates=[types.Candidate(content=types.Content(role="model", parts=[types.Part(text=text)]))],
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=0, candidates_token_count=0, total_token_count=0
+            ),
+            parsed=parsed,
+        )
+        return response
+
+    def generate_content(self, model: str, contents, config=None) -> types.GenerateContentResponse:
+        return self._respond(model, contents, config)
+
+    def generate_content_stream(self, model: str, contents, config=None):
+        yield self._respond(model, contents, config)
+
+
+class StubCaches:
+    """caches look-alike: cached contents that exist only by name."""
+
+    def __init__(self):
+        self._ids = itertools.count()
+
+    def create(self, model: str, config=None):
+        return pytypes.SimpleNamespace(name=f"cachedContents/stub-{next(self._ids)}", expire_time=None)
+
+    def update(self, name: str, config=None):
+        return pytypes.SimpleNamespace(name=name, expire_time=None)
+
+
+class StubGeminiClient:
+    """
+    genai.Client look-alike with placeholder responses.
+
+    call_count counts every generate call; calls holds only the last
+    RECENT_CALLS of them (model, contents, config), oldest first.
+
+    Args:
+        latency_seconds: Simulated generation latency per call
+    """
+
+    def __init__(self, latency_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds
+        self.call_count = 0
+        self._call_ids = itertools.count(1)
+        self.calls: deque[dict] = deque(maxlen=RECENT_CALLS)
+        self.models = _StubModels(self)
+        self.caches = StubCaches()
+
+
+def use_stub_llm(enabled: bool = True, latency_seconds: float = 0.0) -> Optional[StubGeminiClient]:
+    """
+    Route get_gemini_client() to one shared StubGeminiClient (or back to Gemini).
+
+    Returns:
+        The stub client, or None when disabled
+    """
+    if not enabled:
+        set_gemini_client_factory(None)
+        return None
+    client = StubGeminiClient(latency_seconds=latency_seconds)
+    set_gemini_client_factory(lambda api_key: client)
+    return client
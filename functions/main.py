@@ -2,28 +2,15 @@
 # To get started, simply uncomment the below code or create your own.
 # Deploy with `firebase deploy`
 
-from firebase_functions import https_fn, options, firestore_fn, params
-from firebase_admin import initialize_app, firestore, auth
+from firebase_functions import https_fn, options, firestore_fn, params, scheduler_fn, tasks_fn
+from firebase_admin import initialize_app, get_app, firestore, auth
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import functools
 from typing import Optional
 
-from astro import (
-    get_astro_chart,
-    compute_birth_chart,
-    get_sun_sign,
-    get_sun_sign_profile,
-    format_transit_summary_for_ui,
-    synthesize_critical_degrees,
-    synthesize_transit_themes,
-    get_house_context,
-    ChartType,
-)
-from models import (
-    UserProfile,
-    MemoryCollection,
-    create_empty_memory,
-)
-from llm import generate_daily_horoscope
+from single_flight import FUNCTION_TIMEOUT_SECONDS
+from stage_timer import StageTimer
 
 # Import shared secrets (centralized to avoid duplicate declarations)
 from firebase_secrets import GEMINI_API_KEY, POSTHOG_API_KEY
@@ -46,7 +33,23 @@ from auth import get_authenticated_user_id, DEV_ACCOUNT_UIDS
 
 
 # Initialize Firebase app (but only if not already initialized)
-initialize_app()
+try:
+    get_app()
+except ValueError:
+    initialize_app()
+
+# Heavy modules (astro, models, llm, connections, compatibility and their
+# NumPy / natal / google-genai / Jinja dependencies) are imported inside the
+# handlers that use them, so a cold start only loads what the invoked
+# function needs. tests/unit/test_import_budget.py keeps it that way.
+
+
+@functools.cache
+def _use_shared_sky_cache() -> None:
+    """Share transit charts across instances via sky/{date} (one compute per day)."""
+    from astro import configure_sky_cache, FirestoreSkyStore
+    configure_sky_cache(store=FirestoreSkyStore(lambda: firestore.client(database_id=DATABASE_ID)))
+
 
 @https_fn.on_call()
 def natal_chart(req: https_fn.CallableRequest) -> dict:
@@ -65,6 +68,7 @@ def natal_chart(req: https_fn.CallableRequest) -> dict:
     Returns:
         Complete natal chart data as a dictionary
     """
+    from astro import ChartType, get_astro_chart
     try:
         # Extract parameters from request
         data = req.data
@@ -120,6 +124,7 @@ def daily_transit(req: https_fn.CallableRequest) -> dict:
     Returns:
         NatalChartData - houses/angles use (0,0) so are not meaningful
     """
+    from astro import ChartType, get_astro_chart
     try:
         # Extract parameters from request
         data = req.data
@@ -178,6 +183,7 @@ def user_transit(req: https_fn.CallableRequest) -> dict:
     Returns:
         NatalChartData - houses calculated for user's birth location
     """
+    from astro import ChartType, get_astro_chart
     try:
         # Extract parameters from request
         data = req.data
@@ -256,6 +262,8 @@ def create_user_profile(req: https_fn.CallableRequest) -> dict:
         "mode": "v1"  // "v1" or "v2"
     }
     """
+    from astro import compute_birth_chart, get_sun_sign, get_sun_sign_profile
+    from models import create_empty_memory, UserProfile
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -317,6 +325,10 @@ def create_user_profile(req: https_fn.CallableRequest) -> dict:
         )
         natal_chart["summary"] = natal_chart_summary
 
+        # Natal-only half of astrometer scoring, stored next to the chart
+        from astrometers import build_scoring_profile
+        scoring_profile = build_scoring_profile(natal_chart)
+
         # Determine mode
         has_full_info = all([birth_time, birth_timezone, birth_lat, birth_lon])
         mode = "v2" if has_full_info else "v1"
@@ -367,6 +379,7 @@ def create_user_profile(req: https_fn.CallableRequest) -> dict:
             sun_sign=sun_sign.value,
             natal_chart=natal_chart,
             exact_chart=exact_chart,
+            scoring_profile=scoring_profile,
             created_at=created_at,
             last_active=now
         )
@@ -374,6 +387,11 @@ def create_user_profile(req: https_fn.CallableRequest) -> dict:
         # Save to Firestore
         user_ref.set(user_profile.model_dump())
 
+        # Re-onboarding replaces birth data: drop readings from the old chart
+        if existing_doc.exists:
+            from horoscope_cache import invalidate_cached_horoscopes
+            invalidate_cached_horoscopes(db, user_id)
+
         # Initialize memory only if it doesn't exist (preserve existing entities)
         memory_ref = db.collection("memory").document(user_id)
         if not memory_ref.get().exists:
@@ -463,6 +481,7 @@ def update_user_profile(req: https_fn.CallableRequest) -> dict:
     Returns:
         UserProfile
     """
+    from astro import compute_birth_chart, get_sun_sign, get_sun_sign_profile
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -556,6 +575,10 @@ def update_user_profile(req: https_fn.CallableRequest) -> dict:
             updates["natal_chart"] = natal_chart
             updates["exact_chart"] = exact_chart
 
+            # Keep the natal scoring profile in sync with the regenerated chart
+            from astrometers import build_scoring_profile
+            updates["scoring_profile"] = build_scoring_profile(natal_chart)
+
         # Update last_active timestamp
         updates["last_active"] = datetime.now().isoformat()
 
@@ -563,6 +586,11 @@ def update_user_profile(req: https_fn.CallableRequest) -> dict:
         if updates:
             user_ref.update(updates)
 
+        # Readings generated from the old chart are stale
+        if has_birth_update:
+            from horoscope_cache import invalidate_cached_horoscopes
+            invalidate_cached_horoscopes(db, user_id)
+
         # Get the updated profile
         updated_doc = user_ref.get()
         updated_profile = updated_doc.to_dict()
@@ -596,6 +624,7 @@ def get_memory(req: https_fn.CallableRequest) -> dict:
     Returns:
         Memory collection dictionary
     """
+    from models import create_empty_memory
     try:
         user_id = get_authenticated_user_id(req)
 
@@ -640,6 +669,7 @@ def get_sun_sign_from_date(req: https_fn.CallableRequest) -> dict:
         "summary": "Gemini, the third sign of the zodiac..."
     }
     """
+    from astro import get_sun_sign, get_sun_sign_profile
     try:
         data = req.data
         birth_date = data.get("birth_date")
@@ -679,41 +709,93 @@ def get_sun_sign_from_date(req: https_fn.CallableRequest) -> dict:
             message=f"Error calculating sun sign: {str(e)}"
         )
 
-# The function run out of memory at 256MB, so increased to 512MB
-@https_fn.on_call(memory=512, secrets=[GEMINI_API_KEY, POSTHOG_API_KEY])
-def get_daily_horoscope(req: https_fn.CallableRequest) -> dict:
-    """
-    Generate daily horoscope - complete reading with meter groups.
-
-    Includes:
-    - Core fields: technical_analysis, daily_theme_headline, daily_overview,
-                   summary, actionable_advice, lunar_cycle_update
-    - Meter groups: 5 life areas (mind, heart, body, instincts, growth) with
-                    aggregated scores and LLM interpretations
-    - Look ahead: Upcoming transits preview (next 7 days)
-    - Astrometers: Complete 17-meter reading
 
-    Note: user_id is extracted from Firebase auth token, not passed in request.
+# Shared pool for concurrent get_daily_horoscope stages (reads, chart compute, synastry)
+_STAGE_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="horoscope-stage")
 
-    Expected request data:
-    {
-        "date": "2025-10-18"  // Optional, defaults to today
-    }
 
-    Returns:
-        DailyHoroscope
+def _daily_horoscope_events(
+    db,
+    user_id: str,
+    date: str,
+    model_name: str,
+    defer_writes: bool = False,
+    stream: bool = False
+):
     """
-    try:
-        user_id = get_authenticated_user_id(req)
-        data = req.data
-
-        # Optional parameters
-        date = data.get("date", datetime.now().strftime("%Y-%m-%d"))
-        model_name = DEFAULT_MODEL
-
-        # Get user profile from Firestore
-        db = firestore.client(database_id=DATABASE_ID)
-        user_doc = db.collection("users").document(user_id).get()
+    Generate and store a user's daily horoscope, yielding progress events.
+
+    Stages (wall times logged once the reading is stored):
+    1. reads: user, memory, horoscopes/latest and the cache epoch via one get_all, the
+       connections query in parallel, transit charts warming in the background
+    2. compute: DailyContext + transit summary alongside featured-connection synastry
+    3. llm: Gemini generation
+    4. writes: connection vibes, memory, horoscopes/latest, last_active and
+       the full-reading cache in one WriteBatch; with defer_writes (readings
+       pre-generated before their date) only the cache entry, the rest being
+       applied by _apply_deferred_writes when the reading is first served
+
+    Yields:
+        With stream=True, the "computed" and "field" events of
+        llm.stream_daily_horoscope_response during stage 3. Always ends with
+        {"type": "done", "horoscope": DailyHoroscope dict} after stage 4, in
+        JSON mode like a cached reading.
+    """
+    from astro import (
+        compute_birth_chart,
+        format_transit_summary_for_ui,
+        get_sun_sign,
+        get_sun_sign_profile,
+        get_transit_chart,
+        get_transit_chart_data,
+    )
+    from models import create_empty_memory, MemoryCollection, UserProfile
+    from connections import get_connections_for_horoscope, StoredVibe
+    from daily_context import DailyContext
+    from astrometers import shared_day_cache
+    from horoscope_cache import (
+        cache_epoch,
+        horoscope_cache_entry,
+        horoscope_cache_epoch_ref,
+        horoscope_cache_ref,
+    )
+    from llm import (
+        generate_daily_horoscope,
+        select_featured_connection,
+        stream_daily_horoscope_response,
+    )
+    from models import compress_horoscope
+    from datetime import timedelta
+    from google.api_core.exceptions import NotFound
+
+    _use_shared_sky_cache()
+    timer = StageTimer()
+    yesterday_date = (datetime.fromisoformat(date) - timedelta(days=1)).strftime('%Y-%m-%d')
+
+    user_ref = db.collection("users").document(user_id)
+    memory_ref = db.collection("memory").document(user_id)
+    horoscopes_ref = user_ref.collection("horoscopes").document("latest")
+    epoch_ref = horoscope_cache_epoch_ref(db, user_id)
+
+    # Stage 1: user, memory, horoscopes/latest and the cache epoch (stamped
+    # on the cached reading) in one batched read, the
+    # connections query alongside, and the shared transit charts (today and
+    # the trend baseline) warming in the background.
+    with timer.stage("reads"):
+        transit_futures = [
+            _STAGE_EXECUTOR.submit(get_transit_chart, d) for d in (date, yesterday_date)
+        ]
+        connections_future = _STAGE_EXECUTOR.submit(
+            timer.timed("connections", get_connections_for_horoscope), db, user_id, 20
+        )
+        snapshots = {
+            snapshot.reference.path: snapshot
+            for snapshot in db.get_all([user_ref, memory_ref, horoscopes_ref, epoch_ref])
+        }
+        user_doc = snapshots[user_ref.path]
+        memory_doc = snapshots[memory_ref.path]
+        horoscopes_doc = snapshots[horoscopes_ref.path]
+        epoch = cache_epoch(snapshots[epoch_ref.path])
 
         if not user_doc.exists:
             raise https_fn.HttpsError(
@@ -734,110 +816,114 @@ def get_daily_horoscope(req: https_fn.CallableRequest) -> dict:
                 message=f"Sun sign profile not found: {sun_sign.value}"
             )
 
-        # Load memory from Firestore (for connection rotation tracking)
-        memory_doc = db.collection("memory").document(user_id).get()
+        # Memory (for connection rotation tracking)
         if memory_doc.exists:
             memory = MemoryCollection(**memory_doc.to_dict())
         else:
             memory = create_empty_memory(user_id)
 
-        # Fetch user connections for relationship weather (replacing entities)
-        from connections import get_connections_for_horoscope
-        connections = get_connections_for_horoscope(db, user_id, limit=20)
-
-        # Select ONE featured connection for today (rotation)
-        from llm import select_featured_connection
-        featured_connection = select_featured_connection(connections, memory, date)
-
-        # Compute transit chart for today
-        transit_chart, _ = compute_birth_chart(
-            birth_date=date,
-            birth_time="12:00"  # Use noon for transits
-        )
-
-        # Get natal chart from user profile
-        natal_chart = user_profile.natal_chart
-
-        # Generate enhanced transit data with natal-transit aspects
-        transit_summary = format_transit_summary_for_ui(natal_chart, transit_chart, max_aspects=5)
-
-        # Fetch yesterday's featured meters (to avoid repeating same meters)
-        from datetime import datetime as dt, timedelta
-        yesterday_date = (dt.fromisoformat(date) - timedelta(days=1)).strftime('%Y-%m-%d')
+        # Yesterday's featured meters (to avoid repeating same meters)
         yesterday_meters = None
         try:
-            horoscopes_ref = db.collection("users").document(user_id).collection("horoscopes").document("latest")
-            horoscopes_doc = horoscopes_ref.get()
             if horoscopes_doc.exists:
                 horoscopes_data = horoscopes_doc.to_dict()
                 yesterday_horoscope = horoscopes_data.get('horoscopes', {}).get(yesterday_date)
                 if yesterday_horoscope:
                     yesterday_meters = yesterday_horoscope.get('featured_meters', [])
         except Exception as e:
-            # Non-critical: if we can't fetch yesterday's data, continue without it
+            # Non-critical: if we can't read yesterday's data, continue without it
             print(f"Warning: Could not fetch yesterday's meters: {e}")
 
+        # Connections for relationship weather; select ONE featured connection for today (rotation)
+        connections = connections_future.result()
+        featured_connection = select_featured_connection(connections, memory, date)
+
+    # Post-generation writes, committed together in stage 4
+    connection_updates = {}
+
+    # Stage 2: chart/meter context and the featured connection's synastry in parallel
+    natal_chart = user_profile.natal_chart
+
+    def build_context():
+        for future in transit_futures:
+            future.result()
+        # One shared computation of transit chart, aspects and meters for this user/day
+        context = DailyContext(
+            natal_chart,
+            date,
+            user_id=user_profile.user_id,
+            scoring_profile=user_profile.scoring_profile,
+            day_cache=shared_day_cache(natal_chart, user_profile.birth_date, user_profile.exact_chart, date=date)
+        )
+        # Generate enhanced transit data with natal-transit aspects
+        transit_summary = format_transit_summary_for_ui(
+            natal_chart, context.transit_chart, max_aspects=5, context=context
+        )
+        return context, transit_summary
+
+    def enrich_featured_connection():
         # Enrich featured_connection with synastry transit data for the LLM prompt
         # If synastry_points are missing (old connection), compute them on-the-fly
-        if featured_connection and featured_connection.get("birth_date"):
-            from compatibility import find_transits_to_synastry, calculate_vibe_score, calculate_synastry_points
-            from astro import NatalChartData
-
-            # Compute synastry_points on-the-fly if missing (for old connections)
-            if not featured_connection.get("synastry_points"):
-                try:
-                    user_chart_data = NatalChartData(**user_profile.natal_chart)
-                    conn_chart_dict, _ = compute_birth_chart(
-                        birth_date=featured_connection["birth_date"],
-                        birth_time=featured_connection.get("birth_time"),
-                        birth_timezone=featured_connection.get("birth_timezone"),
-                        birth_lat=featured_connection.get("birth_lat"),
-                        birth_lon=featured_connection.get("birth_lon")
-                    )
-                    conn_chart_data = NatalChartData(**conn_chart_dict)
-                    featured_connection["synastry_points"] = calculate_synastry_points(
-                        user_chart_data, conn_chart_data
-                    )
-
-                    # Also cache it on the connection for future calls
-                    if featured_connection.get("connection_id"):
-                        try:
-                            conn_ref = db.collection("users").document(user_id).collection(
-                                "connections"
-                            ).document(featured_connection["connection_id"])
-                            conn_ref.update({"synastry_points": featured_connection["synastry_points"]})
-                        except Exception as cache_err:
-                            print(f"Warning: Could not cache synastry_points: {cache_err}")
-                except Exception as e:
-                    print(f"Warning: Could not compute synastry on-the-fly: {e}")
-
-            # Now enrich with transit data if we have synastry_points
-            if featured_connection.get("synastry_points"):
-                transit_chart_data = NatalChartData(**transit_chart)
-                active_transits = find_transits_to_synastry(
-                    transit_chart=transit_chart_data,
-                    synastry_points=featured_connection["synastry_points"],
-                    orb=3.0
+        from compatibility import find_transits_to_synastry, calculate_vibe_score, calculate_synastry_points
+        from astro import NatalChartData
+
+        # Compute synastry_points on-the-fly if missing (for old connections)
+        if not featured_connection.get("synastry_points"):
+            try:
+                user_chart_data = NatalChartData(**user_profile.natal_chart)
+                conn_chart_dict, _ = compute_birth_chart(
+                    birth_date=featured_connection["birth_date"],
+                    birth_time=featured_connection.get("birth_time"),
+                    birth_timezone=featured_connection.get("birth_timezone"),
+                    birth_lat=featured_connection.get("birth_lat"),
+                    birth_lon=featured_connection.get("birth_lon")
+                )
+                conn_chart_data = NatalChartData(**conn_chart_dict)
+                featured_connection["synastry_points"] = calculate_synastry_points(
+                    user_chart_data, conn_chart_data
                 )
-                vibe_score = calculate_vibe_score(active_transits)
-
-                # Add computed data to featured_connection for the prompt
-                featured_connection["active_transits"] = active_transits
-                featured_connection["vibe_score"] = vibe_score
-
-            # Compute connection age
-            conn_birth_date = featured_connection.get("birth_date")
-            if conn_birth_date:
-                try:
-                    conn_birth_year = int(conn_birth_date.split("-")[0])
-                    current_year = int(date.split("-")[0])
-                    featured_connection["age"] = current_year - conn_birth_year
-                except (ValueError, IndexError):
-                    pass
-
-        # Generate daily horoscope (Prompt 1)
-        from llm import update_memory_with_connection_mention
-        daily_horoscope = generate_daily_horoscope(
+
+                # Also cache it on the connection for future calls
+                if featured_connection.get("connection_id"):
+                    connection_updates["synastry_points"] = featured_connection["synastry_points"]
+            except Exception as e:
+                print(f"Warning: Could not compute synastry on-the-fly: {e}")
+
+        # Now enrich with transit data if we have synastry_points
+        if featured_connection.get("synastry_points"):
+            transit_chart_data = get_transit_chart_data(date)
+            active_transits = find_transits_to_synastry(
+                transit_chart=transit_chart_data,
+                synastry_points=featured_connection["synastry_points"],
+                orb=3.0
+            )
+            vibe_score = calculate_vibe_score(active_transits)
+
+            # Add computed data to featured_connection for the prompt
+            featured_connection["active_transits"] = active_transits
+            featured_connection["vibe_score"] = vibe_score
+
+        # Compute connection age
+        conn_birth_date = featured_connection.get("birth_date")
+        if conn_birth_date:
+            try:
+                conn_birth_year = int(conn_birth_date.split("-")[0])
+                current_year = int(date.split("-")[0])
+                featured_connection["age"] = current_year - conn_birth_year
+            except (ValueError, IndexError):
+                pass
+
+    with timer.stage("compute"):
+        synastry_future = None
+        if featured_connection and featured_connection.get("birth_date"):
+            synastry_future = _STAGE_EXECUTOR.submit(timer.timed("synastry", enrich_featured_connection))
+        context, transit_summary = timer.timed("context", build_context)()
+        if synastry_future is not None:
+            synastry_future.result()
+
+    # Stage 3: generate daily horoscope (Prompt 1)
+    with timer.stage("llm"):
+        llm_kwargs = dict(
             date=date,
             user_profile=user_profile,
             sun_sign_profile=sun_sign_profile,
@@ -848,95 +934,340 @@ def get_daily_horoscope(req: https_fn.CallableRequest) -> dict:
             posthog_api_key=POSTHOG_API_KEY.value,
             model_name=model_name,
             yesterday_meters=yesterday_meters,
+            context=context,
         )
+        if stream:
+            for event in stream_daily_horoscope_response(**llm_kwargs):
+                if event["type"] == "complete":
+                    daily_horoscope = event["horoscope"]
+                else:
+                    yield event
+        else:
+            daily_horoscope = generate_daily_horoscope(**llm_kwargs)
 
-        # Store vibe history on connection (FIFO last 10, like Co-Star updates)
-        # The connection_vibes in relationship_weather is now populated by the LLM in llm.py
-        if (featured_connection and
-            daily_horoscope.relationship_weather and
-            daily_horoscope.relationship_weather.connection_vibes):
-
-            # Get the LLM-generated vibe from relationship_weather
-            connection_vibe = daily_horoscope.relationship_weather.connection_vibes[0]
-
-            # Store vibe history on connection record
-            from connections import StoredVibe
-            stored_vibe = StoredVibe(
-                date=date,
-                vibe=connection_vibe.vibe,  # LLM-generated text
-                vibe_score=connection_vibe.vibe_score,
-                key_transit=connection_vibe.key_transit
+    # Stage 4: every write in one WriteBatch. Deferred (pre-generated)
+    # readings store only the cache entry, carrying the other writes for
+    # _apply_deferred_writes once the reading is served on its date.
+    with timer.stage("writes"):
+        now = datetime.now().isoformat()
+        follow_up = {"compressed": compress_horoscope(daily_horoscope).model_dump(), "connection": None}
+
+        if featured_connection:
+            # What the memory mention and the connection's vibe history need
+            follow_up_connection = {
+                field: featured_connection[field]
+                for field in ("connection_id", "name", "relationship_category", "relationship_label")
+                if field in featured_connection
+            }
+            follow_up_connection.update(connection_updates)  # synastry_points computed on the fly
+
+            # The connection_vibes in relationship_weather is populated by the LLM in llm.py
+            if daily_horoscope.relationship_weather and daily_horoscope.relationship_weather.connection_vibes:
+                connection_vibe = daily_horoscope.relationship_weather.connection_vibes[0]
+                follow_up_connection["vibe"] = StoredVibe(
+                    date=date,
+                    vibe=connection_vibe.vibe,  # LLM-generated text
+                    vibe_score=connection_vibe.vibe_score,
+                    key_transit=connection_vibe.key_transit
+                ).model_dump()
+                follow_up_connection["vibe_context"] = connection_vibe.vibe
+            follow_up["connection"] = follow_up_connection
+
+        if defer_writes:
+            writes, conn_ref = [], None
+        else:
+            # Vibes as read with the connections query
+            writes, conn_ref = _follow_up_writes(
+                db, user_id, date, follow_up,
+                memory=memory,
+                horoscopes_data=horoscopes_doc.to_dict() if horoscopes_doc.exists else None,
+                connection_vibes=(featured_connection or {}).get("vibes", []),
+                now=now
             )
+            writes.append(("update", user_ref, {"last_active": now}, {}))
 
-            # Update connection with new vibe (FIFO)
-            conn_ref = db.collection("users").document(user_id).collection("connections").document(featured_connection["connection_id"])
-            conn_doc = conn_ref.get()
-            if conn_doc.exists:
-                conn_data = conn_doc.to_dict()
-                vibes = conn_data.get("vibes", [])
+        # Full reading for repeat requests
+        writes.append(("set", horoscope_cache_ref(db, user_id, date), horoscope_cache_entry(
+            date, daily_horoscope, epoch, deferred=follow_up if defer_writes else None
+        ), {}))
 
-                # Don't add duplicate for same date
-                vibes = [v for v in vibes if v.get("date") != date]
+        def commit(skip_ref=None):
+            batch = db.batch()
+            for method, ref, data, kwargs in writes:
+                if ref is not skip_ref:
+                    getattr(batch, method)(ref, data, **kwargs)
+            batch.commit()
 
-                # Add new vibe at front, keep last 10
-                vibes.insert(0, stored_vibe.model_dump())
-                vibes = vibes[:10]
+        try:
+            commit()
+        except NotFound:
+            if conn_ref is None:
+                raise
+            # Featured connection deleted during generation: commit the rest
+            print(f"Warning: Connection {featured_connection.get('connection_id')} no longer exists")
+            commit(skip_ref=conn_ref)
+
+    print(f"[get_daily_horoscope] user={user_id} date={date} stages_ms={timer.finish()}")
+
+    yield {"type": "done", "horoscope": daily_horoscope.model_dump(mode="json")}
+
+
+
+def _follow_up_writes(
+    db,
+    user_id: str,
+    date: str,
+    follow_up: dict,
+    memory,
+    horoscopes_data: Optional[dict],
+    connection_vibes: Optional[list],
+    now: str
+):
+    """
+    Writes that go with a stored reading besides its cache entry.
 
-                conn_ref.update({"vibes": vibes, "updated_at": datetime.now().isoformat()})
+    - the featured connection's vibe history (FIFO last 10, like Co-Star
+      updates) and any synastry points computed on the fly
+    - the memory's connection mention (for rotation tracking)
+    - the compressed reading in horoscopes/latest (for Ask the Stars)
 
-        # Update memory with connection mention (for rotation tracking)
-        if featured_connection:
-            vibe_context = ""
-            if daily_horoscope.relationship_weather and daily_horoscope.relationship_weather.connection_vibes:
-                vibe_context = daily_horoscope.relationship_weather.connection_vibes[0].vibe
-            memory = update_memory_with_connection_mention(
-                memory=memory,
-                featured_connection=featured_connection,
-                date=date,
-                context=vibe_context
-            )
-            # Save updated memory to Firestore
-            memory_ref = db.collection("memory").document(user_id)
-            memory_ref.set(memory.model_dump(), merge=True)
-
-        # Cache compressed horoscope (for Ask the Stars)
-        # Store in users/{user_id}/horoscopes/latest with FIFO limit of 10
-        from models import compress_horoscope, UserHoroscopes, CompressedHoroscope
-
-        compressed = compress_horoscope(daily_horoscope)
-        horoscopes_ref = db.collection("users").document(user_id).collection("horoscopes").document("latest")
-        horoscopes_doc = horoscopes_ref.get()
-
-        if horoscopes_doc.exists:
-            # Load existing and add new (FIFO enforcement)
-            horoscopes_data = UserHoroscopes(**horoscopes_doc.to_dict())
-            horoscopes_dict = horoscopes_data.horoscopes
-
-            # Add new horoscope
-            horoscopes_dict[date] = compressed.model_dump()
-
-            # FIFO: Keep only last 10 (sort by date descending, take top 10)
-            sorted_dates = sorted(horoscopes_dict.keys(), reverse=True)[:10]
-            horoscopes_dict = {d: horoscopes_dict[d] for d in sorted_dates}
-
-            horoscopes_ref.update({
-                "horoscopes": horoscopes_dict,
-                "updated_at": datetime.now().isoformat()
-            })
-        else:
-            # Create new horoscopes document
-            horoscopes_ref.set({
-                "user_id": user_id,
-                "horoscopes": {date: compressed.model_dump()},
-                "updated_at": datetime.now().isoformat()
-            })
+    Args:
+        follow_up: {"compressed": ..., "connection": ...} built in stage 4
+        memory: MemoryCollection as read before writing
+        horoscopes_data: horoscopes/latest as read before writing (None if missing)
+        connection_vibes: The connection's vibes as read, or None to skip the
+            connection write (connection deleted)
+        now: ISO timestamp for updated_at fields
 
-        # Update last_active
+    Returns:
+        ([(WriteBatch method, ref, data, kwargs)], connection ref or None)
+    """
+    from google.cloud.firestore_v1 import DELETE_FIELD
+    from google.cloud.firestore_v1.field_path import FieldPath
+    from llm import update_memory_with_connection_mention
+    from models import UserHoroscopes
+
+    user_ref = db.collection("users").document(user_id)
+    memory_ref = db.collection("memory").document(user_id)
+    horoscopes_ref = user_ref.collection("horoscopes").document("latest")
+    writes = []
+
+    connection = follow_up.get("connection")
+    conn_ref = None
+    if connection and connection.get("connection_id") and connection_vibes is not None:
+        connection_updates = {}
+        if connection.get("synastry_points"):
+            connection_updates["synastry_points"] = connection["synastry_points"]
+        if connection.get("vibe"):
+            # Don't add duplicate for same date; new vibe at front, keep last 10
+            vibes = [v for v in connection_vibes if v.get("date") != date]
+            vibes.insert(0, connection["vibe"])
+            connection_updates["vibes"] = vibes[:10]
+            connection_updates["updated_at"] = now
+        if connection_updates:
+            conn_ref = user_ref.collection("connections").document(connection["connection_id"])
+            writes.append(("update", conn_ref, connection_updates, {}))
+
+    if connection:
+        memory = update_memory_with_connection_mention(
+            memory=memory,
+            featured_connection=connection,
+            date=date,
+            context=connection.get("vibe_context", "")
+        )
+        writes.append(("set", memory_ref, memory.model_dump(), {"merge": True}))
+
+    # FIFO limit of 10. Only this date's field is written (plus deletes for
+    # dates pushed out of the last 10), so a generation for another date
+    # running at the same time keeps its entry.
+    compressed = follow_up["compressed"]
+    if horoscopes_data is not None:
+        # Dates read plus this one; FIFO keeps the 10 most recent
+        stored_dates = set(UserHoroscopes(**horoscopes_data).horoscopes) | {date}
+        kept_dates = set(sorted(stored_dates, reverse=True)[:10])
+
+        horoscope_updates = {"updated_at": now}
+        if date in kept_dates:
+            horoscope_updates[FieldPath("horoscopes", date).to_api_repr()] = compressed
+        for old_date in stored_dates - kept_dates:
+            horoscope_updates[FieldPath("horoscopes", old_date).to_api_repr()] = DELETE_FIELD
+        writes.append(("update", horoscopes_ref, horoscope_updates, {}))
+    else:
+        # merge: a concurrent first generation for another date may create it too
+        writes.append(("set", horoscopes_ref, {
+            "user_id": user_id,
+            "horoscopes": {date: compressed},
+            "updated_at": now
+        }, {"merge": True}))
+
+    return writes, conn_ref
+
+
+def _apply_deferred_writes(db, user_id: str, date: str) -> None:
+    """
+    Apply a pre-generated reading's deferred writes, plus last_active.
+
+    One transaction re-reads the entry, so concurrent first requests apply
+    them once, against the memory, horoscopes/latest and connection as they
+    are now rather than as they were when the reading was generated.
+    """
+    from google.cloud.firestore_v1 import DELETE_FIELD, transactional
+    from horoscope_cache import horoscope_cache_ref
+    from models import create_empty_memory, MemoryCollection
+
+    user_ref = db.collection("users").document(user_id)
+    memory_ref = db.collection("memory").document(user_id)
+    horoscopes_ref = user_ref.collection("horoscopes").document("latest")
+    entry_ref = horoscope_cache_ref(db, user_id, date)
+
+    @transactional
+    def apply(transaction) -> None:
+        now = datetime.now().isoformat()
+        entry_doc = entry_ref.get(transaction=transaction)
+        follow_up = (entry_doc.to_dict() or {}).get("deferred") if entry_doc.exists else None
+        if follow_up is None:
+            # Applied by a concurrent request
+            transaction.update(user_ref, {"last_active": now})
+            return
+
+        refs = [memory_ref, horoscopes_ref]
+        connection_id = (follow_up.get("connection") or {}).get("connection_id")
+        if connection_id:
+            refs.append(user_ref.collection("connections").document(connection_id))
+        snapshots = {
+            snapshot.reference.path: snapshot
+            for snapshot in db.get_all(refs, transaction=transaction)
+        }
+        memory_doc = snapshots[memory_ref.path]
+        horoscopes_doc = snapshots[horoscopes_ref.path]
+        conn_doc = snapshots.get(refs[-1].path) if connection_id else None
+
+        writes, _ = _follow_up_writes(
+            db, user_id, date, follow_up,
+            memory=MemoryCollection(**memory_doc.to_dict()) if memory_doc.exists else create_empty_memory(user_id),
+            horoscopes_data=horoscopes_doc.to_dict() if horoscopes_doc.exists else None,
+            connection_vibes=(conn_doc.to_dict() or {}).get("vibes", []) if conn_doc and conn_doc.exists else None,
+            now=now
+        )
+        for method, ref, data, kwargs in writes:
+            getattr(transaction, method)(ref, data, **kwargs)
+        transaction.update(user_ref, {"last_active": now})
+        transaction.update(entry_ref, {"deferred": DELETE_FIELD})
+
+    apply(db.transaction())
+
+
+def _generate_daily_horoscope(
+    db,
+    user_id: str,
+    date: str,
+    model_name: str,
+    defer_writes: bool = False
+) -> dict:
+    """
+    Generate, store and return a user's daily horoscope (get_daily_horoscope body).
+
+    Runs inside run_single_flight, so at most one generation per user/date
+    is in progress at a time. Pre-generation passes defer_writes=True so a
+    reading for tomorrow neither shows up in horoscopes/latest, memory and
+    connection vibes today nor counts as user activity.
+    """
+    for event in _daily_horoscope_events(db, user_id, date, model_name, defer_writes):
+        if event["type"] == "done":
+            return event["horoscope"]
+    raise RuntimeError("Daily horoscope generation ended without a result")
+
+
+def _touch_last_active(db, user_id: str) -> None:
+    try:
         db.collection("users").document(user_id).update({
             "last_active": datetime.now().isoformat()
         })
+    except Exception as e:
+        print(f"Warning: Could not update last_active: {e}")
+
+
+def _serve_stored_reading(db, user_id: str, date: str, entry: dict) -> None:
+    """
+    Bookkeeping for a stored (e.g. pre-generated) reading returned instead
+    of generated: it still counts as activity, and a pre-generated reading's
+    deferred writes are applied the first time it is served.
+    """
+    if entry.get("deferred") is None:
+        _touch_last_active(db, user_id)
+        return
+    try:
+        _apply_deferred_writes(db, user_id, date)
+    except Exception as e:
+        # Retried on the next request, which still finds the deferred writes
+        print(f"Warning: Could not apply deferred writes {user_id}/{date}: {e}")
+        _touch_last_active(db, user_id)
 
-        return daily_horoscope.model_dump()
+
+# The function run out of memory at 256MB, so increased to 512MB.
+# timeout_sec is explicit: the single-flight lease timings are derived from it.
+@https_fn.on_call(memory=512, timeout_sec=FUNCTION_TIMEOUT_SECONDS, secrets=[GEMINI_API_KEY, POSTHOG_API_KEY])
+def get_daily_horoscope(req: https_fn.CallableRequest) -> dict:
+    """
+    Generate daily horoscope - complete reading with meter groups.
+
+    Includes:
+    - Core fields: technical_analysis, daily_theme_headline, daily_overview,
+                   summary, actionable_advice, lunar_cycle_update
+    - Meter groups: 5 life areas (mind, heart, body, instincts, growth) with
+                    aggregated scores and LLM interpretations
+    - Look ahead: Upcoming transits preview (next 7 days)
+    - Astrometers: Complete 17-meter reading
+
+    Note: user_id is extracted from Firebase auth token, not passed in request.
+
+    Expected request data:
+    {
+        "date": "2025-10-18"  // Optional, defaults to today
+    }
+
+    Returns:
+        DailyHoroscope
+    """
+    try:
+        user_id = get_authenticated_user_id(req)
+        data = req.data
+
+        # Optional parameters
+        date = data.get("date", datetime.now().strftime("%Y-%m-%d"))
+        model_name = DEFAULT_MODEL
+
+        db = firestore.client(database_id=DATABASE_ID)
+
+        # Repeat request for the same day: return the stored reading (1 read).
+        # Concurrent requests for the same day share one generation.
+        from horoscope_cache import get_cached_entry
+        from single_flight import run_single_flight
+        generated = []
+        stored = []
+
+        def compute() -> dict:
+            generated.append(True)
+            return _generate_daily_horoscope(db, user_id, date, model_name)
+
+        def lookup() -> Optional[dict]:
+            entry = get_cached_entry(db, user_id, date)
+            if entry is None:
+                return None
+            stored.append(entry)
+            return entry["horoscope"]
+
+        horoscope = run_single_flight(
+            db,
+            f"daily_horoscope_{user_id}_{date}",
+            compute=compute,
+            lookup=lookup
+        )
+
+        if not generated:
+            _serve_stored_reading(db, user_id, date, stored[-1])
+
+        return horoscope
 
     except https_fn.HttpsError:
         raise
@@ -952,6 +1283,221 @@ def get_daily_horoscope(req: https_fn.CallableRequest) -> dict:
         )
 
 
+# Same resources as get_daily_horoscope
+@https_fn.on_request(
+    memory=512,
+    timeout_sec=FUNCTION_TIMEOUT_SECONDS,
+    cors=options.CorsOptions(
+        cors_origins="*",
+        cors_methods=["POST", "OPTIONS"]
+    ),
+    secrets=[GEMINI_API_KEY, POSTHOG_API_KEY]
+)
+def get_daily_horoscope_stream(req: https_fn.Request) -> https_fn.Response:
+    """
+    HTTPS endpoint: daily horoscope with SSE streaming.
+
+    Same reading as get_daily_horoscope, but the computed parts (astrometers,
+    meter groups, moon detail, upcoming transits) are sent as soon as the
+    charts are done, and each LLM field as soon as Gemini has written it.
+    A stored reading for the date is sent as a single done event.
+
+    Streams take the same single-flight lease as get_daily_horoscope: while
+    another request is generating the day's reading, the stream waits for
+    it and sends it as a single done event.
+
+    Authentication:
+        Authorization: Bearer <firebase_id_token>
+        Dev accounts: user_id in body (see auth.DEV_ACCOUNT_UIDS)
+
+    Expected request data:
+    {
+        "date": "2025-10-18",  // Optional, defaults to today
+        "user_id": "string"    // Optional - dev accounts only
+    }
+
+    SSE Response Events:
+        Content-Type: text/event-stream
+
+        Computed event (before the LLM call):
+            data: {"type": "computed", "date": ..., "sun_sign": ..., "astrometers": {...},
+                   "transit_summary": {...}, "moon_detail": {...},
+                   "upcoming_transits": [...], "featured_meters": [...]}
+
+        Field events (one per LLM response field, as it completes):
+            data: {"type": "field", "field": "daily_theme_headline", "value": "..."}
+
+        Done event (after the reading is stored):
+            data: {"type": "done", "horoscope": {...DailyHoroscope...}}
+
+        Error event (generation failed after the stream started):
+            data: {"type": "error", "message": "..."}
+    """
+    import itertools
+    import json
+    from auth import get_request_user_id
+    from horoscope_cache import get_cached_entry
+    from single_flight import stream_single_flight
+
+    if req.method == "OPTIONS":
+        return https_fn.Response(status=204)
+
+    def error_response(status: int, message: str) -> https_fn.Response:
+        return https_fn.Response(
+            json.dumps({"error": message}),
+            status=status,
+            headers={"Content-Type": "application/json"}
+        )
+
+    body = req.get_json(silent=True) or {}
+    try:
+        user_id = get_request_user_id(req, body)
+    except https_fn.HttpsError as e:
+        return error_response(401, e.message)
+
+    date = body.get("date") or datetime.now().strftime("%Y-%m-%d")
+    db = firestore.client(database_id=DATABASE_ID)
+
+    generated = []
+    stored = []
+
+    def compute():
+        generated.append(True)
+        return _daily_horoscope_events(db, user_id, date, DEFAULT_MODEL, stream=True)
+
+    def stored_events():
+        entry = get_cached_entry(db, user_id, date)
+        if entry is None:
+            return None
+        stored.append(entry)
+        return [{"type": "done", "horoscope": entry["horoscope"]}]
+
+    events = stream_single_flight(db, f"daily_horoscope_{user_id}_{date}", compute, stored_events)
+    # Wait for the lease and run reads and chart compute before responding,
+    # so a missing user or bad date is an HTTP error rather than an error event
+    try:
+        first = next(events)
+    except https_fn.HttpsError as e:
+        status = 404 if e.code == https_fn.FunctionsErrorCode.NOT_FOUND else 500
+        return error_response(status, e.message)
+    except ValueError as e:
+        return error_response(400, f"Invalid parameter values: {str(e)}")
+    except Exception as e:
+        return error_response(500, f"Error generating daily horoscope: {str(e)}")
+    events = itertools.chain([first], events)
+
+    if not generated:
+        _serve_stored_reading(db, user_id, date, stored[-1])
+
+    def generate():
+        try:
+            for event in events:
+                yield f"data: {json.dumps(event, default=str)}\n\n"
+        except Exception as e:
+            print(f"[get_daily_horoscope_stream] user={user_id} date={date} failed: {e}")
+            yield f"data: {json.dumps({'type': 'error', 'message': f'Error generating daily horoscope: {str(e)}'})}\n\n"
+
+    return https_fn.Response(
+        generate(),
+        status=200,
+        headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive"
+        }
+    )
+
+
+def run_pregeneration(db, now: Optional[datetime] = None, **kwargs):
+    """
+    Pre-generate next-day horoscopes for due, recently active users.
+
+    See pregeneration.pregenerate_for_active_users for kwargs.
+    """
+    from horoscope_cache import get_cached_horoscope
+    from pregeneration import pregenerate_for_active_users
+    from single_flight import run_single_flight
+
+    def generate(user_id: str, date: str) -> dict:
+        return run_single_flight(
+            db,
+            f"daily_horoscope_{user_id}_{date}",
+            compute=lambda: _generate_daily_horoscope(db, user_id, date, DEFAULT_MODEL, defer_writes=True),
+            lookup=lambda: get_cached_horoscope(db, user_id, date)
+        )
+
+    return pregenerate_for_active_users(db, generate, now=now, **kwargs)
+
+
+# Shards per hourly pre-generation run (one task each), and the timeout of
+# each shard's task
+PREGENERATE_SHARD_COUNT = 8
+PREGENERATE_TIMEOUT_SECONDS = 540
+
+
+@scheduler_fn.on_schedule(schedule="every 60 minutes")
+def pregenerate_daily_horoscopes(event: scheduler_fn.ScheduledEvent) -> None:
+    """
+    Hourly: store tomorrow's horoscope for users whose local time is ~23:00.
+
+    Users are picked by device_timezone, so each user is handled once per
+    night, shortly before their local date rolls over. The work is fanned
+    out as one pregenerate_horoscope_shard task per shard, all for this
+    run's time.
+    """
+    from datetime import timezone
+    from firebase_admin import functions as admin_functions
+
+    now = datetime.now(timezone.utc).isoformat()
+    queue = admin_functions.task_queue("pregenerate_horoscope_shard")
+    for shard_index in range(PREGENERATE_SHARD_COUNT):
+        queue.enqueue({"now": now, "shard_index": shard_index, "shard_count": PREGENERATE_SHARD_COUNT})
+    print(f"[pregenerate_daily_horoscopes] now={now} shards={PREGENERATE_SHARD_COUNT}")
+
+
+@tasks_fn.on_task_dispatched(
+    retry_config=options.RetryConfig(max_attempts=2, min_backoff_seconds=60),
+    rate_limits=options.RateLimits(max_concurrent_dispatches=PREGENERATE_SHARD_COUNT),
+    memory=1024,
+    timeout_sec=PREGENERATE_TIMEOUT_SECONDS,
+    secrets=[GEMINI_API_KEY, POSTHOG_API_KEY]
+)
+def pregenerate_horoscope_shard(req: tasks_fn.CallableRequest) -> None:
+    """
+    One shard of an hourly pre-generation run (enqueued by pregenerate_daily_horoscopes).
+
+    Expected task data:
+    {
+        "now": "2025-10-18T06:00:00+00:00",  // Scheduled run time (UTC)
+        "shard_index": 0,
+        "shard_count": 8
+    }
+
+    Stops starting users PREGENERATE_FINISH_SECONDS before the timeout, so
+    the started generations finish in time; users still due are
+    logged and get their reading on first app open instead. Raising the
+    shard count is the fix when shards keep running out of time.
+    """
+    from pregeneration import PREGENERATE_FINISH_SECONDS
+
+    data = req.data
+    shard = f"{data['shard_index']}/{data['shard_count']}"
+    db = firestore.client(database_id=DATABASE_ID)
+    result = run_pregeneration(
+        db,
+        now=datetime.fromisoformat(data["now"]),
+        shard_index=data["shard_index"],
+        shard_count=data["shard_count"],
+        time_budget_seconds=PREGENERATE_TIMEOUT_SECONDS - PREGENERATE_FINISH_SECONDS,
+    )
+    print(f"[pregenerate_horoscope_shard] shard={shard} considered={result.considered} "
+          f"generated={len(result.generated)} skipped={len(result.skipped)} "
+          f"failed={len(result.failed)} remaining={len(result.remaining)}")
+    if result.remaining:
+        print(f"[pregenerate_horoscope_shard] shard={shard} out of time, not started: "
+              f"{', '.join(f'{user_id}/{date}' for user_id, date in result.remaining)}")
+
+
 # =============================================================================
 # Sprint X: Astrometers - Quantitative Transit Analysis
 # =============================================================================
@@ -980,8 +1526,11 @@ def get_astrometers(req: https_fn.CallableRequest) -> dict:
     Returns:
         AstrometersForIOS
     """
+    from astro import get_transit_chart, get_transit_positions
+    from models import UserProfile
+    _use_shared_sky_cache()
     try:
-        from astrometers import get_meters
+        from astrometers import get_meters, get_meters_range, shared_day_cache, usable_scoring_profile
 
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1005,21 +1554,34 @@ def get_astrometers(req: https_fn.CallableRequest) -> dict:
         # Get natal chart from user profile
         natal_chart = user_profile.natal_chart
 
-        # Compute transit chart for the target date
-        transit_chart, _ = compute_birth_chart(
-            birth_date=date_str,
-            birth_time="12:00"  # Use noon for transits
-        )
+        # Transit positions for the target date: precomputed table when available,
+        # otherwise the shared sky cache chart
+        transit_chart = get_transit_positions(date_str) or get_transit_chart(date_str)
 
         # Parse date string to datetime
         target_date = datetime.strptime(date_str, "%Y-%m-%d")
 
-        # Calculate all meters
-        all_meters = get_meters(
-            natal_chart=natal_chart,
-            transit_chart=transit_chart,
-            date=target_date
+        # Calculate all meters (approximate charts share the work with every
+        # user born the same day)
+        scoring_profile = usable_scoring_profile(user_profile.scoring_profile, natal_chart)
+        shared_cache = shared_day_cache(
+            natal_chart, user_profile.birth_date, user_profile.exact_chart, date=date_str
         )
+        if shared_cache is not None:
+            all_meters = get_meters_range(
+                natal_chart,
+                target_date,
+                target_date,
+                scoring_profile=scoring_profile,
+                day_cache=shared_cache
+            )[0]
+        else:
+            all_meters = get_meters(
+                natal_chart=natal_chart,
+                transit_chart=transit_chart,
+                date=target_date,
+                scoring_profile=scoring_profile
+            )
 
         # Update last_active
         db.collection("users").document(user_id).update({
@@ -1043,6 +1605,121 @@ def get_astrometers(req: https_fn.CallableRequest) -> dict:
         )
 
 
+# Longest range served by get_astrometers_timeline (monthly chart)
+MAX_TIMELINE_DAYS = 31
+
+
+@https_fn.on_call()
+def get_astrometers_timeline(req: https_fn.CallableRequest) -> dict:
+    """
+    Daily meter scores over a date range, for weekly/monthly meter charts.
+
+    Scores match get_astrometers for each day; all days are computed in one
+    pass with get_meters_range().
+
+    Note: user_id is extracted from Firebase auth token, not passed in request.
+
+    Expected request data:
+    {
+        "start_date": "2025-10-20",  // Optional, defaults to today
+        "end_date": "2025-10-26"     // Optional, defaults to start_date + 6 days
+    }
+
+    Returns:
+    {
+        "start_date": "2025-10-20",
+        "end_date": "2025-10-26",
+        "days": [
+            {
+                "date": "2025-10-20",
+                "overall_unified_score": 58.2,
+                "overall_intensity": 44.0,
+                "overall_harmony": 61.5,
+                "meters": {"clarity": {"unified_score": 62.1, "intensity": 40.3, "harmony": 70.2}, ...}
+            },
+            ...
+        ]
+    }
+    """
+    from models import UserProfile
+    _use_shared_sky_cache()
+    try:
+        from datetime import timedelta
+        from astrometers import get_meters_range, shared_day_cache, usable_scoring_profile, METER_CONFIGS
+
+        user_id = get_authenticated_user_id(req)
+        data = req.data
+
+        start_str = data.get("start_date", datetime.now().strftime("%Y-%m-%d"))
+        start = datetime.strptime(start_str, "%Y-%m-%d")
+        end_str = data.get("end_date", (start + timedelta(days=6)).strftime("%Y-%m-%d"))
+        end = datetime.strptime(end_str, "%Y-%m-%d")
+
+        days = (end - start).days + 1
+        if days < 1 or days > MAX_TIMELINE_DAYS:
+            raise ValueError(f"date range must cover 1-{MAX_TIMELINE_DAYS} days")
+
+        # Get user profile from Firestore
+        db = firestore.client(database_id=DATABASE_ID)
+        user_doc = db.collection("users").document(user_id).get()
+
+        if not user_doc.exists:
+            raise https_fn.HttpsError(
+                code=https_fn.FunctionsErrorCode.NOT_FOUND,
+                message=f"User profile not found: {user_id}"
+            )
+
+        user_profile = UserProfile(**user_doc.to_dict())
+
+        readings = get_meters_range(
+            user_profile.natal_chart,
+            start,
+            end,
+            scoring_profile=usable_scoring_profile(user_profile.scoring_profile, user_profile.natal_chart),
+            day_cache=shared_day_cache(
+                user_profile.natal_chart,
+                user_profile.birth_date,
+                user_profile.exact_chart,
+                date=end.strftime("%Y-%m-%d")
+            )
+        )
+
+        return {
+            "start_date": start.strftime("%Y-%m-%d"),
+            "end_date": end.strftime("%Y-%m-%d"),
+            "days": [
+                {
+                    "date": reading.date.strftime("%Y-%m-%d"),
+                    "overall_unified_score": reading.overall_intensity.unified_score,
+                    "overall_intensity": reading.overall_intensity.intensity,
+                    "overall_harmony": reading.overall_harmony.harmony,
+                    "meters": {
+                        name: {
+                            "unified_score": getattr(reading, name).unified_score,
+                            "intensity": getattr(reading, name).intensity,
+                            "harmony": getattr(reading, name).harmony,
+                        }
+                        for name in METER_CONFIGS
+                    },
+                }
+                for reading in readings
+            ],
+        }
+
+    except https_fn.HttpsError:
+        raise
+    except ValueError as e:
+        raise https_fn.HttpsError(
+            code=https_fn.FunctionsErrorCode.INVALID_ARGUMENT,
+            message=f"Invalid parameter values: {str(e)}"
+        )
+    except Exception as e:
+        raise https_fn.HttpsError(
+            code=https_fn.FunctionsErrorCode.INTERNAL,
+            message=f"Error calculating astrometers timeline: {str(e)}"
+        )
+
+
 # =============================================================================
 # Ask the Stars - Conversational Q&A Feature
 # =============================================================================
@@ -1070,26 +1747,6 @@ from conversation_helpers import (
 # Connections & Compatibility - Charts API
 # =============================================================================
 
-from connections import (
-    get_or_create_share_link,
-    get_public_profile as get_public_profile_fn,
-    import_connection as import_connection_fn,
-    create_connection as create_connection_fn,
-    update_connection as update_connection_fn,
-    delete_connection as delete_connection_fn,
-    list_connections as list_connections_fn,
-    list_connection_requests as list_connection_requests_fn,
-    update_share_mode as update_share_mode_fn,
-    respond_to_request as respond_to_request_fn,
-    register_device_token as register_device_token_fn,
-)
-from compatibility import (
-    calculate_compatibility,
-    CompatibilityResult,
-    CATEGORY_TO_MODE,
-)
-
-
 @https_fn.on_call()
 def get_share_link(req: https_fn.CallableRequest) -> dict:
     """
@@ -1106,6 +1763,7 @@ def get_share_link(req: https_fn.CallableRequest) -> dict:
         "qr_code_data": "https://arca-app.com/u/abc123xyz"
     }
     """
+    from connections import get_or_create_share_link
     try:
         user_id = get_authenticated_user_id(req)
 
@@ -1155,6 +1813,7 @@ def get_public_profile(req: https_fn.CallableRequest) -> dict:
         "message": "John requires approval..."
     }
     """
+    from connections import get_public_profile as get_public_profile_fn
     try:
         data = req.data
         share_secret = data.get("share_secret")
@@ -1205,6 +1864,7 @@ def import_connection(req: https_fn.CallableRequest) -> dict:
         "notification_sent": true
     }
     """
+    from connections import import_connection as import_connection_fn
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1260,6 +1920,7 @@ def create_connection(req: https_fn.CallableRequest) -> dict:
     Returns:
         Created connection data
     """
+    from connections import create_connection as create_connection_fn
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1329,6 +1990,7 @@ def update_connection(req: https_fn.CallableRequest) -> dict:
     Returns:
         Updated connection data
     """
+    from connections import update_connection as update_connection_fn
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1374,6 +2036,7 @@ def delete_connection(req: https_fn.CallableRequest) -> dict:
     Returns:
         { "success": true }
     """
+    from connections import delete_connection as delete_connection_fn
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1421,6 +2084,7 @@ def list_connections(req: https_fn.CallableRequest) -> dict:
         "total_count": 5
     }
     """
+    from connections import list_connections as list_connections_fn
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1451,6 +2115,7 @@ def list_connection_requests(req: https_fn.CallableRequest) -> dict:
         "requests": [...]
     }
     """
+    from connections import list_connection_requests as list_connection_requests_fn
     try:
         user_id = get_authenticated_user_id(req)
 
@@ -1482,6 +2147,7 @@ def update_share_mode(req: https_fn.CallableRequest) -> dict:
     Returns:
         { "share_mode": "request" }
     """
+    from connections import update_share_mode as update_share_mode_fn
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1522,6 +2188,7 @@ def respond_to_request(req: https_fn.CallableRequest) -> dict:
     Returns:
         { "success": true, "action": "approved", "connection_id": "..." }
     """
+    from connections import respond_to_request as respond_to_request_fn
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1569,6 +2236,7 @@ def register_device_token(req: https_fn.CallableRequest) -> dict:
     Returns:
         { "success": true }
     """
+    from connections import register_device_token as register_device_token_fn
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1618,6 +2286,7 @@ def get_natal_chart_for_connection(req: https_fn.CallableRequest) -> dict:
         - connection_name: string - the connection's display name
         - sun_sign: string - lowercase zodiac sign e.g. "cancer"
     """
+    from astro import compute_birth_chart
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1688,6 +2357,8 @@ def get_compatibility(req: https_fn.CallableRequest) -> dict:
     Returns:
         CompatibilityResult
     """
+    from astro import compute_birth_chart
+    from compatibility import calculate_compatibility, CATEGORY_TO_MODE, CompatibilityResult
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1795,6 +2466,7 @@ def get_synastry_chart(req: https_fn.CallableRequest) -> dict:
     Returns:
         NatalChartData
     """
+    from astro import compute_birth_chart
     try:
         user_id = get_authenticated_user_id(req)
         data = req.data
@@ -1911,6 +2583,9 @@ def delete_user(req: https_fn.CallableRequest) -> dict:
         for doc in db.collection("users").document(user_id).collection("horoscopes").stream():
             doc.reference.delete()
 
+        for doc in db.collection("users").document(user_id).collection("daily_horoscopes").stream():
+            doc.reference.delete()
+
         for doc in db.collection("users").document(user_id).collection("entities").stream():
             doc.reference.delete()
 
@@ -1927,9 +2602,10 @@ def delete_user(req: https_fn.CallableRequest) -> dict:
         # Delete memory document
         db.collection("memory").document(user_id).delete()
 
-        # Delete all conversations for this user
+        # Delete all conversations (and their messages) for this user
+        from conversation_store import delete_conversation
         for doc in db.collection("conversations").where("user_id", "==", user_id).stream():
-            doc.reference.delete()
+            delete_conversation(db, doc.id)
 
         # Delete share link reverse lookup
         if share_secret:
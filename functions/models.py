@@ -138,6 +138,8 @@ class UserProfile(BaseModel):
     sun_sign: str = Field(description="Sun sign (e.g., 'taurus')")
     natal_chart: dict = Field(description="Complete NatalChartData from get_astro_chart()")
     exact_chart: bool = Field(description="True if birth_time + timezone provided")
+    scoring_profile: Optional[dict] = Field(default=None,
+        description="Natal scoring profile for natal_chart (astrometers.build_scoring_profile)")
 
     # Photo
     photo_path: Optional[str] = Field(
@@ -327,7 +329,8 @@ class Entity(BaseModel):
     """
     Tracked entity from user conversations (person, relationship, goal, challenge, etc.).
 
-    Stored in: users/{userId}/entities/all (single doc with entities array)
+    Stored in: users/{userId}/entities/shard_{n} (map of entity_id -> Entity,
+    see entity_store.py)
     """
     entity_id: str = Field(min_length=1, max_length=64, pattern=r"^[a-zA-Z0-9_-]+$", description="UUID for this entity")
     name: str = Field(min_length=1, max_length=MAX_NAME_LENGTH, description="Entity name (e.g., 'John', 'Job Search', 'Meditation Practice')")
@@ -418,7 +421,9 @@ class Message(BaseModel):
     """
     Single message in a conversation (user or assistant).
 
-    Stored in Conversation.messages array.
+    Stored in: conversations/{conversationId}/messages/{messageId}
+    (with its `seq`), or inline in Conversation.messages for conversations
+    written before messages moved to the subcollection.
     """
     message_id: str = Field(min_length=1, max_length=64, description="UUID for this message")
     role: MessageRole = Field(description="Message role")
@@ -438,14 +443,16 @@ class Conversation(BaseModel):
     Conversation session tied to a horoscope date.
 
     Stored in: conversations/{conversationId}
-    All messages stored in single document (messages array).
+    Messages are appended to the messages subcollection (conversation_store).
     """
     conversation_id: str = Field(min_length=1, max_length=64, description="UUID for this conversation")
     user_id: str = Field(min_length=1, max_length=128, description="Firebase Auth user ID")
     horoscope_date: str = Field(pattern=r"^\d{4}-\d{2}-\d{2}$", description="ISO date (e.g., '2025-01-20')")
 
-    # All messages in single array (cost optimization)
-    messages: list[Message] = Field(default_factory=list, max_length=1000, description="All messages in conversation")
+    # Inline messages of conversations written before the messages
+    # subcollection (never appended to); API responses put a page here
+    messages: list[Message] = Field(default_factory=list, max_length=1000, description="Inline (legacy) messages or a page of messages")
+    message_count: int = Field(default=0, ge=0, description="Messages in the conversation, inline and appended")
 
     # Timestamps
     created_at: str = Field(description="ISO timestamp of creation")
@@ -454,9 +461,10 @@ class Conversation(BaseModel):
 
 class UserEntities(BaseModel):
     """
-    Single document containing all entities for a user (cost optimization).
+    Single document containing all entities for a user.
 
-    Stored in: users/{userId}/entities/all
+    Stored in: users/{userId}/entities/all for users not yet migrated to
+    the sharded entity store (entity_store.save_entity_changes migrates them).
     """
     user_id: str = Field(description="Firebase Auth user ID")
     entities: list[Entity] = Field(default_factory=list, description="All entities in single array")
@@ -135,7 +135,8 @@ def detect_void_of_course(
     moon_position: dict,
     transit_chart: dict,
     natal_chart: dict,
-    current_datetime: str
+    current_datetime: str,
+    context=None
 ) -> tuple[VoidOfCourseStatus, Optional[str], Optional[str]]:
     """
     Detect if Moon is void-of-course.
@@ -148,6 +149,7 @@ def detect_void_of_course(
         transit_chart: Current transit chart
         natal_chart: User's natal chart
         current_datetime: Current UTC datetime (ISO format)
+        context: Optional DailyContext for the same natal chart and date (reuses its aspects)
 
     Returns:
         Tuple of (status, void_start_time, void_end_time)
@@ -176,7 +178,10 @@ def detect_void_of_course(
 
     # Check if Moon makes any natal aspects before sign change
     # Use tight orb (1°) since we only care about upcoming aspects
-    all_aspects = find_natal_transit_aspects(natal_chart, transit_chart, orb=1.0, sort_by_priority=False)
+    if context is not None:
+        all_aspects = context.aspects(orb=1.0, sort_by_priority=False)
+    else:
+        all_aspects = find_natal_transit_aspects(natal_chart, transit_chart, orb=1.0, sort_by_priority=False)
 
     # Filter for Moon aspects only
     moon_aspects = [asp for asp in all_aspects if asp.transit_planet == Planet.MOON]
@@ -401,7 +406,8 @@ def estimate_next_lunar_phase(
 def get_moon_transit_detail(
     natal_chart: dict,
     transit_chart: dict,
-    current_datetime: str
+    current_datetime: str,
+    context=None
 ) -> MoonTransitDetail:
     """
     Generate complete Moon transit detail for LLM context.
@@ -412,6 +418,7 @@ def get_moon_transit_detail(
         natal_chart: User's natal chart from compute_birth_chart()
         transit_chart: Current transit chart from compute_birth_chart()
         current_datetime: Current UTC datetime (ISO format)
+        context: Optional DailyContext for the same natal chart and date (reuses its aspects)
 
     Returns:
         MoonTransitDetail with all lunar analysis
@@ -438,7 +445,10 @@ def get_moon_transit_detail(
     lunar_phase = calculate_lunar_phase(sun["absolute_degree"], moon["absolute_degree"])
 
     # Get all natal-transit aspects (tight orb for Moon)
-    all_aspects = find_natal_transit_aspects(natal_chart, transit_chart, orb=3.0, sort_by_priority=False)
+    if context is not None:
+        all_aspects = context.aspects(orb=3.0, sort_by_priority=False)
+    else:
+        all_aspects = find_natal_transit_aspects(natal_chart, transit_chart, orb=3.0, sort_by_priority=False)
 
     # Filter for Moon aspects only, sort by orb
     moon_aspects = [asp for asp in all_aspects if asp.transit_planet == Planet.MOON]
@@ -446,7 +456,7 @@ def get_moon_transit_detail(
 
     # Detect void-of-course
     void_status, void_start, void_end = detect_void_of_course(
-        moon, transit_chart, natal_chart, current_datetime
+        moon, transit_chart, natal_chart, current_datetime, context=context
     )
 
     # Calculate dispositor
@@ -2,8 +2,12 @@
 PostHog integration utilities for LLM observability.
 
 Provides manual HTTP-based event capture for Gemini LLM generations.
+
+Set POSTHOG_DISABLED=1 (or true/yes/on) to skip capture (local load tests
+and benchmarks); 0/false/no/off or unset leaves capture on.
 """
 
+import os
 import uuid
 import httpx
 from datetime import datetime
@@ -12,6 +16,13 @@ from google.genai.types import GenerateContentResponseUsageMetadata
 
 POSTHOG_HOST = "https://us.i.posthog.com"
 
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+
+def posthog_disabled() -> bool:
+    """True if POSTHOG_DISABLED is set to a true value (1/true/yes/on)."""
+    return os.environ.get("POSTHOG_DISABLED", "").strip().lower() in _TRUE_VALUES
+
 
 def capture_llm_generation(
     posthog_api_key: str,
@@ -44,6 +55,9 @@ def capture_llm_generation(
         max_tokens: Max tokens parameter
         thinking_budget: Thinking budget parameter
     """
+    if posthog_disabled():
+        return
+
     # Cleanup API key
     posthog_api_key = posthog_api_key.replace("\n", '').replace('"', '').replace("'", '').strip()
 
@@ -0,0 +1,326 @@
+"""
+Nightly pre-generation of next-day daily horoscopes.
+
+Generation normally happens on the first app open of the day, so the
+morning peak waits on Gemini. The pregenerate_daily_horoscopes scheduled
+function (main.py) runs hourly and calls pregenerate_for_active_users(),
+which picks users who were active in the last PREGENERATE_ACTIVE_DAYS days
+and whose local clock (device_timezone) is in the PREGENERATE_LOCAL_HOUR
+hour, and stores their reading for the next local day. Only the reading
+itself is stored; its horoscopes/latest, memory and connection vibe writes
+wait until it is first served, so nothing about tomorrow is visible (e.g.
+to Ask the Stars) before then. The transit chart
+and approximate-chart meter work come from the shared sky and day caches,
+so each additional user mostly costs the LLM call.
+
+Only users whose device_timezone is currently in that hour are queried
+(device_timezone "in" the due zones); users without a known timezone count
+as UTC and are found by a scan of all active users in the UTC hour.
+
+Work is split by a stable hash of the user id (shard_index / shard_count):
+the scheduled function enqueues one task per shard, each with its own
+function timeout. Shards run with bounded concurrency, stop starting users
+once their time budget is spent (reporting the rest), and retry transient
+failures (timeouts, 429s, unavailable backends) with exponential backoff;
+permanent ones such as NotFound or InvalidArgument fail the user at once.
+Readings that already exist are skipped.
+
+Local run against the emulator with a stub LLM (no Gemini calls):
+    FIRESTORE_EMULATOR_HOST=localhost:8080 uv run python pregeneration.py --stub-llm --now 2025-10-17T23:30
+"""
+
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+
+from google.api_core import exceptions as api_exceptions
+from google.genai import errors as genai_errors
+
+from horoscope_cache import get_cached_horoscope
+
+
+# Users active within this many days are pre-generated
+PREGENERATE_ACTIVE_DAYS = 7
+
+# Local hour (user's device_timezone) in which the next day is pre-generated
+PREGENERATE_LOCAL_HOUR = 23
+
+# Concurrent generations per shard
+PREGENERATE_CONCURRENCY = 8
+
+# A shard stops starting users this long before its function timeout, so
+# the generations already started can finish
+PREGENERATE_FINISH_SECONDS = 90
+
+# Attempts per user (exponential backoff between attempts)
+PREGENERATE_MAX_ATTEMPTS = 3
+PREGENERATE_RETRY_BASE_SECONDS = 2.0
+
+# Users read per Firestore page
+PREGENERATE_PAGE_SIZE = 200
+
+# Firestore limit on values in an "in" filter
+_MAX_IN_VALUES = 30
+
+
+@dataclass
+class PregenerationResult:
+    """Outcome of one pre-generation run."""
+    considered: int = 0
+    generated: List[Tuple[str, str]] = field(default_factory=list)
+    skipped: List[Tuple[str, str]] = field(default_factory=list)
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    # Due but not started before the time budget ran out
+    remaining: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def user_shard(user_id: str, shard_count: int) -> int:
+    """Stable shard of a user id (same on every instance and run)."""
+    digest = hashlib.sha256(user_id.encode()).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def local_time(now_utc: datetime, tz_name: Optional[str]) -> datetime:
+    """now_utc in the user's timezone (UTC if missing or unknown)."""
+    try:
+        tz = ZoneInfo(tz_name) if tz_name else timezone.utc
+    except (ZoneInfoNotFoundError, ValueError):
+        tz = timezone.utc
+    return now_utc.astimezone(tz)
+
+
+def pregeneration_date(
+    now_utc: datetime,
+    tz_name: Optional[str],
+    local_hour: int = PREGENERATE_LOCAL_HOUR
+) -> Optional[str]:
+    """
+    Next local date to pre-generate for a user, or None outside their window.
+
+    Args:
+        now_utc: Current time (timezone-aware UTC)
+        tz_name: User's IANA device timezone
+        local_hour: Local hour in which the next day is pre-generated
+
+    Returns:
+        "YYYY-MM-DD" of the user's next local day, or None
+    """
+    local = local_time(now_utc, tz_name)
+    if local.hour != local_hour:
+        return None
+    return (local.date() + timedelta(days=1)).isoformat()
+
+
+def due_timezones(now_utc: datetime, local_hour: int = PREGENERATE_LOCAL_HOUR) -> List[str]:
+    """IANA timezones whose local time is in local_hour at now_utc."""
+    return sorted(
+        tz_name for tz_name in available_timezones()
+        if local_time(now_utc, tz_name).hour == local_hour
+    )
+
+
+def iter_active_users(
+    db,
+    since: datetime,
+    timezones: Optional[Sequence[str]] = None,
+    page_size: int = PREGENERATE_PAGE_SIZE
+) -> Iterator[Tuple[str, dict]]:
+    """
+    (user_id, data) for users with last_active on or after `since`.
+
+    last_active is stored as a naive ISO string, so the comparison is a
+    string range query; only the fields needed for scheduling are read.
+    With timezones, only users whose device_timezone is one of them
+    (composite index on device_timezone + last_active).
+    """
+    query = (
+        db.collection("users")
+        .where("last_active", ">=", since.replace(tzinfo=None).isoformat())
+        .order_by("last_active")
+        .select(["last_active", "device_timezone"])
+        .limit(page_size)
+    )
+    if timezones is None:
+        queries = [query]
+    else:
+        queries = [
+            query.where("device_timezone", "in", list(timezones[i:i + _MAX_IN_VALUES]))
+            for i in range(0, len(timezones), _MAX_IN_VALUES)
+        ]
+
+    for query in queries:
+        last = None
+        while True:
+            page = list((query.start_after(last) if last is not None else query).stream())
+            for doc in page:
+                yield doc.id, doc.to_dict() or {}
+            if len(page) < page_size:
+                break
+            last = page[-1]
+
+
+# Errors worth retrying: the same call may succeed a few seconds later
+TRANSIENT_ERRORS = (
+    api_exceptions.DeadlineExceeded,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.ResourceExhausted,
+    api_exceptions.Aborted,
+    api_exceptions.InternalServerError,
+    genai_errors.ServerError,
+    TimeoutError,
+    ConnectionError,
+)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    True if an error (or one it was raised from) is worth retrying.
+
+    Generation wraps Gemini errors in RuntimeError, so the cause and context
+    chain is checked as well.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, TRANSIENT_ERRORS):
+            return True
+        if isinstance(error, genai_errors.ClientError) and error.code == 429:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _with_retry(
+    fn: Callable[[], object],
+    max_attempts: int,
+    base_delay: float,
+    sleep: Callable[[float], None]
+) -> None:
+    for attempt in range(max_attempts):
+        try:
+            fn()
+            return
+        except Exception as e:
+            if attempt == max_attempts - 1 or not is_transient_error(e):
+                raise
+            sleep(base_delay * (2 ** attempt))
+
+
+def pregenerate_for_active_users(
+    db,
+    generate: Callable[[str, str], object],
+    now: Optional[datetime] = None,
+    shard_index: int = 0,
+    shard_count: int = 1,
+    active_days: int = PREGENERATE_ACTIVE_DAYS,
+    local_hour: int = PREGENERATE_LOCAL_HOUR,
+    concurrency: int = PREGENERATE_CONCURRENCY,
+    max_attempts: int = PREGENERATE_MAX_ATTEMPTS,
+    retry_base_seconds: float = PREGENERATE_RETRY_BASE_SECONDS,
+    time_budget_seconds: Optional[float] = None,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic
+) -> PregenerationResult:
+    """
+    Pre-generate the next local day's reading for due, recently active users.
+
+    Args:
+        db: Firestore client
+        generate: Generates and stores one reading, generate(user_id, date)
+        now: Current time (default: now, UTC)
+        shard_index: Shard handled by this run
+        shard_count: Total shards
+        active_days: Activity window in days
+        local_hour: Local hour in which the next day is pre-generated
+        concurrency: Concurrent generations
+        max_attempts: Attempts per user
+        retry_base_seconds: First retry delay (doubles per attempt)
+        time_budget_seconds: Stop starting users after this long (None: no limit)
+        sleep: Sleep function (tests)
+        clock: Monotonic clock for the time budget (tests)
+
+    Returns:
+        PregenerationResult with (user_id, date) pairs per outcome
+    """
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    deadline = clock() + time_budget_seconds if time_budget_seconds is not None else None
+    result = PregenerationResult()
+
+    since = now - timedelta(days=active_days)
+    if pregeneration_date(now, None, local_hour) is not None:
+        # UTC is due: scan everyone, so users without a known timezone are included
+        users = iter_active_users(db, since)
+    else:
+        users = iter_active_users(db, since, timezones=due_timezones(now, local_hour))
+
+    due = []
+    for user_id, data in users:
+        if user_shard(user_id, shard_count) != shard_index:
+            continue
+        result.considered += 1
+        date = pregeneration_date(now, data.get("device_timezone"), local_hour)
+        if date is None:
+            continue
+        if get_cached_horoscope(db, user_id, date) is not None:
+            result.skipped.append((user_id, date))
+            continue
+        due.append((user_id, date))
+
+    def run(item: Tuple[str, str]) -> Tuple[Tuple[str, str], Optional[Exception], bool]:
+        """(item, error, started)"""
+        if deadline is not None and clock() >= deadline:
+            return item, None, False
+        user_id, date = item
+        try:
+            _with_retry(lambda: generate(user_id, date), max_attempts, retry_base_seconds, sleep)
+            return item, None, True
+        except Exception as e:
+            return item, e, True
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        for item, error, started in executor.map(run, due):
+            if not started:
+                result.remaining.append(item)
+            elif error is None:
+                result.generated.append(item)
+            else:
+                print(f"Warning: Could not pre-generate horoscope {item[0]}/{item[1]}: {error}")
+                result.failed.append(item)
+
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Pre-generate next-day horoscopes for active users")
+    parser.add_argument("--now", help="Pretend current UTC time, e.g. 2025-10-17T23:30 (default: now)")
+    parser.add_argument("--shard-index", type=int, default=0)
+    parser.add_argument("--shard-count", type=int, default=1)
+    parser.add_argument("--stub-llm", action="store_true", help="Use the offline stub instead of Gemini")
+    args = parser.parse_args()
+
+    if args.stub_llm:
+        from llm_stub import use_stub_llm
+        use_stub_llm()
+        os.environ.setdefault("GEMINI_API_KEY", "stub")
+        os.environ.setdefault("POSTHOG_API_KEY", "stub")
+
+    import main
+
+    now_arg = datetime.fromisoformat(args.now).replace(tzinfo=timezone.utc) if args.now else None
+    outcome = main.run_pregeneration(
+        main.firestore.client(database_id=main.DATABASE_ID),
+        now=now_arg,
+        shard_index=args.shard_index,
+        shard_count=args.shard_count,
+    )
+    print(f"considered={outcome.considered} generated={len(outcome.generated)} "
+          f"skipped={len(outcome.skipped)} failed={len(outcome.failed)} remaining={len(outcome.remaining)}")
@@ -7,11 +7,11 @@ Provides:
 - Helper functions to load label guidance for LLM prompts
 """
 
-import json
 from enum import Enum
-from pathlib import Path
 from typing import Optional
 
+from assets import load_json
+
 
 # =============================================================================
 # Enums
@@ -147,12 +147,10 @@ _labels_cache: Optional[dict] = None
 
 
 def _load_labels() -> dict:
-    """Load labels.json (cached)."""
+    """Load labels.json (cached, read-only)."""
     global _labels_cache
     if _labels_cache is None:
-        labels_path = Path(__file__).parent / "labels.json"
-        with open(labels_path) as f:
-            _labels_cache = json.load(f)
+        _labels_cache = load_json("relationships/labels.json")
     return _labels_cache
 
 
@@ -0,0 +1,309 @@
+"""
+Single-flight coalescing of expensive per-key work across requests.
+
+When the app retries, or two devices open at once, concurrent requests for
+the same user and date would each run a full LLM generation and race on the
+same writes. SingleFlight lets exactly one of them compute:
+
+1. An in-instance lock per key serializes callers on the same instance
+   (gen2 functions serve concurrent requests per instance).
+2. A Firestore lease at leases/{key} (owner token + expiry) elects one
+   caller across instances.
+3. Everyone else polls `lookup()` (e.g. the stored result) until the owner
+   finishes, and only computes themselves if the lease expires or the wait
+   times out.
+
+The owner extends its lease every LEASE_HEARTBEAT_SECONDS while it computes
+or streams, for up to FUNCTION_TIMEOUT_SECONDS, so slow generations keep
+followers waiting rather than starting a duplicate. A crashed owner stops
+renewing and blocks others for at most LEASE_TTL_SECONDS. If Firestore is
+unavailable the caller computes without a lease.
+
+Streaming work (a generator of events) goes through stream_single_flight:
+the owner's events are yielded as they are produced, and followers yield the
+stored result once the owner has written it.
+
+Usage:
+    result = run_single_flight(
+        db, f"daily_horoscope_{user_id}_{date}",
+        compute=lambda: generate(...),
+        lookup=lambda: get_cached_horoscope(db, user_id, date),
+    )
+"""
+
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from firebase_admin import firestore
+
+
+T = TypeVar("T")
+
+LEASES_COLLECTION = "leases"
+
+# timeout_sec of the functions that take leases (get_daily_horoscope and
+# get_daily_horoscope_stream); the lease timings below are derived from it
+FUNCTION_TIMEOUT_SECONDS = 60
+
+# Lifetime of a lease since its last renewal. The owner renews it while
+# working, so it only expires for an owner that crashed or hung; retries
+# after a crash wait at most this long.
+LEASE_TTL_SECONDS = FUNCTION_TIMEOUT_SECONDS // 3
+
+# Interval between lease renewals, a few per TTL so one slow write does not
+# let the lease lapse
+LEASE_HEARTBEAT_SECONDS = LEASE_TTL_SECONDS / 4
+
+# Longest a follower waits for the owner's result before computing itself,
+# leaving it half of its own timeout to do so
+WAIT_TIMEOUT_SECONDS = FUNCTION_TIMEOUT_SECONDS // 2
+
+# Interval between result lookups while waiting
+POLL_INTERVAL_SECONDS = 0.5
+
+
+class SingleFlight:
+    """
+    Per-key in-instance locks plus Firestore leases.
+
+    One instance per process (see run_single_flight); tests create their own
+    to simulate separate Cloud Functions instances.
+    """
+
+    def __init__(
+        self,
+        collection: str = LEASES_COLLECTION,
+        lease_ttl_seconds: float = LEASE_TTL_SECONDS,
+        heartbeat_seconds: float = LEASE_HEARTBEAT_SECONDS,
+        max_hold_seconds: float = FUNCTION_TIMEOUT_SECONDS,
+        wait_timeout_seconds: float = WAIT_TIMEOUT_SECONDS,
+        poll_interval_seconds: float = POLL_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.collection = collection
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.max_hold_seconds = max_hold_seconds
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self.instance_id = uuid.uuid4().hex[:12]
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, list] = {}  # key -> [lock, users]
+
+    @contextmanager
+    def _local_lock(self, key: str):
+        with self._lock:
+            entry = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._key_locks[key]
+
+    def run(
+        self,
+        db,
+        key: str,
+        compute: Callable[[], T],
+        lookup: Callable[[], Optional[T]]
+    ) -> T:
+        """
+        Return lookup() if it has a result, otherwise compute once per key.
+
+        Args:
+            db: Firestore client for leases (None: in-instance coalescing only)
+            key: Work key, a valid Firestore document ID
+            compute: Produces the result and stores it where lookup() finds it
+            lookup: Returns the stored result, or None
+
+        Returns:
+            The stored or computed result
+        """
+        with self._turn(db, key, lookup) as result:
+            return result if result is not None else compute()
+
+    def stream(
+        self,
+        db,
+        key: str,
+        compute: Callable[[], Iterator[T]],
+        lookup: Callable[[], Optional[Iterable[T]]]
+    ) -> Iterator[T]:
+        """
+        run() for work that yields events.
+
+        The key (and its lease) is held until the generator is exhausted or
+        closed, so a follower waits for the owner's stored result.
+
+        Args:
+            db: Firestore client for leases (None: in-instance coalescing only)
+            key: Work key, a valid Firestore document ID
+            compute: Returns the events; stores the result where lookup() finds it
+            lookup: Returns the stored result as events, or None
+
+        Yields:
+            The stored events, or compute()'s events as they are produced
+        """
+        with self._turn(db, key, lookup) as events:
+            yield from events if events is not None else compute()
+
+    @contextmanager
+    def _turn(self, db, key: str, lookup: Callable[[], Optional[T]]):
+        """
+        Yields the stored result, or None when this caller should compute; the
+        key stays held (lease included, if one was taken) until exit.
+        """
+        with self._local_lock(key):
+            result = lookup()
+            if result is not None or db is None:
+                yield result
+                return
+
+            deadline = self.clock() + self.wait_timeout_seconds
+            while True:
+                acquired, token = self._acquire(db, key)
+                if acquired:
+                    heartbeat = self._heartbeat(db, key, token) if token else None
+                    try:
+                        yield None
+                    finally:
+                        if heartbeat is not None:
+                            heartbeat.set()
+                        if token:
+                            self._release(db, key, token)
+                    return
+
+                result = self._wait(db, key, lookup, deadline)
+                if result is not None:
+                    yield result
+                    return
+                if self.clock() >= deadline:
+                    print(f"Warning: Timed out waiting for {key}, computing without lease")
+                    yield None
+                    return
+
+    def _acquire(self, db, key: str) -> Tuple[bool, Optional[str]]:
+        """(acquired, owner token); (True, None) if leases are unavailable."""
+        token = f"{self.instance_id}-{uuid.uuid4().hex[:12]}"
+        now = self.clock()
+
+        @firestore.transactional
+        def take(transaction, ref) -> bool:
+            snapshot = ref.get(transaction=transaction)
+            data = snapshot.to_dict() if snapshot.exists else None
+            if data and data.get("lease_until", 0) > now:
+                return False
+            lease_until = now + self.lease_ttl_seconds
+            transaction.set(ref, {
+                "owner": token,
+                "lease_until": lease_until,
+                # Firestore TTL policy field (stale leases are cleaned up)
+                "expires_at": datetime.fromtimestamp(lease_until, tz=timezone.utc),
+            })
+            return True
+
+        try:
+            ref = db.collection(self.collection).document(key)
+            return take(db.transaction(), ref), token
+        except Exception as e:
+            print(f"Warning: Could not take lease {key}: {e}")
+            return True, None
+
+    def _heartbeat(self, db, key: str, token: str) -> threading.Event:
+        """
+        Renew the lease in the background until the returned event is set,
+        the lease is lost, or max_hold_seconds have passed.
+        """
+        stop = threading.Event()
+        hold_until = self.clock() + self.max_hold_seconds
+
+        def beat():
+            while not stop.wait(self.heartbeat_seconds):
+                if self.clock() >= hold_until or not self._renew(db, key, token):
+                    return
+
+        threading.Thread(target=beat, name=f"lease-heartbeat-{key}", daemon=True).start()
+        return stop
+
+    def _renew(self, db, key: str, token: str) -> bool:
+        """Extend the lease if token still owns it; False once it does not."""
+        now = self.clock()
+
+        @firestore.transactional
+        def extend(transaction, ref) -> bool:
+            snapshot = ref.get(transaction=transaction)
+            if not snapshot.exists or (snapshot.to_dict() or {}).get("owner") != token:
+                return False
+            lease_until = now + self.lease_ttl_seconds
+            transaction.update(ref, {
+                "lease_until": lease_until,
+                "expires_at": datetime.fromtimestamp(lease_until, tz=timezone.utc),
+            })
+            return True
+
+        try:
+            return extend(db.transaction(), db.collection(self.collection).document(key))
+        except Exception as e:
+            # Keep trying; the lease only lapses after lease_ttl_seconds
+            print(f"Warning: Could not renew lease {key}: {e}")
+            return True
+
+    def _release(self, db, key: str, token: str) -> None:
+        ref = db.collection(self.collection).document(key)
+        try:
+            snapshot = ref.get()
+            if snapshot.exists and (snapshot.to_dict() or {}).get("owner") == token:
+                ref.delete(option=db.write_option(last_update_time=snapshot.update_time))
+        except Exception as e:
+            # The lease expires on its own
+            print(f"Warning: Could not release lease {key}: {e}")
+
+    def _lease_active(self, db, key: str) -> bool:
+        try:
+            snapshot = db.collection(self.collection).document(key).get()
+        except Exception:
+            return False
+        if not snapshot.exists:
+            return False
+        return (snapshot.to_dict() or {}).get("lease_until", 0) > self.clock()
+
+    def _wait(self, db, key: str, lookup: Callable[[], Optional[T]], deadline: float) -> Optional[T]:
+        """Poll for the owner's result; None once the lease is gone or the deadline passes."""
+        while self.clock() < deadline:
+            self.sleep(self.poll_interval_seconds)
+            result = lookup()
+            if result is not None:
+                return result
+            if not self._lease_active(db, key):
+                # Owner finished without a result, failed, or expired: retry the lease
+                return lookup()
+        return None
+
+
+_SINGLE_FLIGHT = SingleFlight()
+
+
+def run_single_flight(db, key: str, compute: Callable[[], T], lookup: Callable[[], Optional[T]]) -> T:
+    """Compute once per key across concurrent requests (see SingleFlight.run)."""
+    return _SINGLE_FLIGHT.run(db, key, compute, lookup)
+
+
+def stream_single_flight(
+    db,
+    key: str,
+    compute: Callable[[], Iterator[T]],
+    lookup: Callable[[], Optional[Iterable[T]]]
+) -> Iterator[T]:
+    """Stream once per key across concurrent requests (see SingleFlight.stream)."""
+    return _SINGLE_FLIGHT.stream(db, key, compute, lookup)
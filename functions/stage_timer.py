@@ -0,0 +1,55 @@
+"""
+Wall-clock timings for the stages of a request.
+
+Stages may run concurrently (e.g. on a thread pool); each records its own
+duration, so comparing overlapping stages shows the critical path.
+
+Usage:
+    timer = StageTimer()
+    with timer.stage("reads"):
+        ...
+    future = executor.submit(timer.timed("synastry", enrich), connection)
+    timer.mark("first_chunk")  # time since the timer started
+    timings = timer.finish()  # {"reads": 42, "synastry": 15, ..., "total": 3120}
+"""
+
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, TypeVar
+
+
+T = TypeVar("T")
+
+
+class StageTimer:
+    """Collects per-stage durations in milliseconds."""
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self.timings_ms: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings_ms[name] = round((time.perf_counter() - start) * 1000)
+
+    def timed(self, name: str, fn: Callable[..., T]) -> Callable[..., T]:
+        """Wrap fn so each call records its duration under `name`."""
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    def mark(self, name: str) -> None:
+        """Record the time since construction under `name` (e.g. time to first byte)."""
+        self.timings_ms[name] = round((time.perf_counter() - self._start) * 1000)
+
+    def finish(self) -> Dict[str, int]:
+        """Record the total since construction and return all timings."""
+        self.timings_ms["total"] = round((time.perf_counter() - self._start) * 1000)
+        return dict(self.timings_ms)
@@ -0,0 +1,772 @@
+"""
+Local benchmark of every callable in main.py against the Firestore emulator.
+
+Seeds N synthetic users (profiles with natal charts, connections, memory,
+entities, a conversation and a share link) with the e2e factories, then
+calls each callable in-process, `iterations` times with `concurrency`
+threads, through the stub LLM (or recorded responses with --llm-recordings).
+No Gemini, PostHog or network calls are made.
+
+Per endpoint it reports p50/p95/p99 latency, Firestore RPCs, documents read
+and writes per call (counted on the Firestore client), and peak process RSS
+during the run, and writes everything as JSON so runs can be compared
+across commits:
+
+    firebase emulators:start --only firestore
+    cd functions
+    uv run python -m tests.benchmarks.emulator_benchmark --users 20 --concurrency 8 --output bench.json
+    uv run python -m tests.benchmarks.emulator_benchmark --baseline bench.json --max-regression 0.25
+
+With --baseline the run exits 1 if any endpoint's p95 latency grew by more
+than --max-regression, or it reads or writes more documents per call.
+
+delete_user also deletes the Firebase Auth account, so it only succeeds when
+the Auth emulator runs too (FIREBASE_AUTH_EMULATOR_HOST).
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+from math import floor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+SCHEMA_VERSION = 1
+
+# Error messages kept per endpoint in the report
+MAX_ERROR_SAMPLES = 3
+
+
+# =============================================================================
+# Statistics
+# =============================================================================
+
+def percentile(values: List[float], q: float) -> float:
+    """q-th percentile (0-100) with linear interpolation; 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def latency_summary(latencies_ms: List[float]) -> Dict[str, float]:
+    """p50/p95/p99, mean and max of per-call latencies in milliseconds."""
+    return {
+        "p50": round(percentile(latencies_ms, 50), 2),
+        "p95": round(percentile(latencies_ms, 95), 2),
+        "p99": round(percentile(latencies_ms, 99), 2),
+        "mean": round(sum(latencies_ms) / len(latencies_ms), 2) if latencies_ms else 0.0,
+        "max": round(max(latencies_ms), 2) if latencies_ms else 0.0,
+    }
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RssSampler:
+    """Samples RSS on a background thread and keeps the peak."""
+
+    def __init__(self, interval_seconds: float = 0.01):
+        self.interval_seconds = interval_seconds
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        self.peak_bytes = max(self.peak_bytes, current_rss_bytes())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self._sample()
+
+    def __enter__(self) -> "RssSampler":
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+# =============================================================================
+# Firestore operation counting
+# =============================================================================
+
+def _field(obj, name: str):
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _has_document(response, name: str) -> bool:
+    return bool(_field(_field(response, name), "name"))
+
+
+class _CountingIterator:
+    """Proxies a streaming response, calling on_item for each item consumed."""
+
+    def __init__(self, inner, on_item: Callable[[object], None]):
+        self._inner = inner
+        self._iter = iter(inner)
+        self._on_item = on_item
+
+    def __iter__(self) -> Iterator:
+        return self
+
+    def __next__(self):
+        item = next(self._iter)
+        self._on_item(item)
+        return item
+
+    def __getattr__(self, name: str):
+        return getattr(self._inner, name)
+
+
+class FirestoreOpCounter:
+    """
+    Counts Firestore RPCs, documents read and documents written.
+
+    Patches the generated Firestore API client that every
+    google.cloud.firestore Client (and so firebase_admin.firestore) calls
+    into. Reads follow Firestore billing: one per document returned by a
+    lookup or query, one per aggregation query.
+
+    Args:
+        api_class: Firestore API class to patch (default: FirestoreClient)
+    """
+
+    READ_METHODS = ("get_document", "batch_get_documents", "run_query", "run_aggregation_query", "list_documents")
+    WRITE_METHODS = ("commit", "batch_write")
+
+    def __init__(self, api_class=None):
+        if api_class is None:
+            from google.cloud.firestore_v1.services.firestore.client import FirestoreClient
+            api_class = FirestoreClient
+        self.api_class = api_class
+        self._originals: Dict[str, Callable] = {}
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts = {"rpcs": 0, "reads": 0, "writes": 0, "queries": 0}
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+    def add(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                self.counts[name] += delta
+
+    def install(self) -> "FirestoreOpCounter":
+        for name in self.READ_METHODS + self.WRITE_METHODS:
+            original = getattr(self.api_class, name, None)
+            if original is None or name in self._originals:
+                continue
+            self._originals[name] = original
+            setattr(self.api_class, name, self._wrap(name, original))
+        return self
+
+    def uninstall(self) -> None:
+        for name, original in self._originals.items():
+            setattr(self.api_class, name, original)
+        self._originals.clear()
+
+    def __enter__(self) -> "FirestoreOpCounter":
+        return self.install()
+
+    def __exit__(self, *exc) -> None:
+        self.uninstall()
+
+    def _wrap(self, name: str, original: Callable) -> Callable:
+        counter = self
+
+        @wraps(original)
+        def wrapper(api, *args, **kwargs):
+            counter.add(rpcs=1)
+            result = original(api, *args, **kwargs)
+            if name in counter.WRITE_METHODS:
+                request = kwargs.get("request", args[0] if args else None)
+                counter.add(writes=len(_field(request, "writes") or []))
+                return result
+            if name == "get_document":
+                counter.add(reads=1)
+                return result
+            if name == "run_aggregation_query":
+                counter.add(queries=1, reads=1)
+                return result
+            if name == "run_query":
+                counter.add(queries=1)
+                return _CountingIterator(
+                    result, lambda r: counter.add(reads=1) if _has_document(r, "document") else None
+                )
+            if name == "batch_get_documents":
+                return _CountingIterator(
+                    result,
+                    lambda r: counter.add(reads=1) if _has_document(r, "found") or _field(r, "missing") else None
+                )
+            return _CountingIterator(result, lambda doc: counter.add(reads=1))
+
+        return wrapper
+
+
+# =============================================================================
+# Seeding
+# =============================================================================
+
+@dataclass
+class BenchUser:
+    """A seeded user and the documents scenarios refer to."""
+    user_id: str
+    birth_date: str
+    share_secret: str
+    connection_ids: List[str]
+    entity_ids: List[str]
+    conversation_id: str
+
+
+@dataclass
+class BenchContext:
+    """State shared by scenario setup functions."""
+    db: object
+    run_id: str
+    today: str
+    users: List[BenchUser]
+    created_user_ids: List[str] = field(default_factory=list)
+    share_secrets: List[str] = field(default_factory=list)
+
+    def other(self, user: BenchUser, i: int) -> BenchUser:
+        """A different seeded user (the same one when only one is seeded)."""
+        index = self.users.index(user)
+        return self.users[(index + 1 + i // len(self.users)) % len(self.users)]
+
+    def date(self, offset_days: int) -> str:
+        return (datetime.strptime(self.today, "%Y-%m-%d") + timedelta(days=offset_days)).strftime("%Y-%m-%d")
+
+
+def seed_users(db, count: int, connections_per_user: int, run_id: str) -> List[BenchUser]:
+    """
+    Seed synthetic users for a benchmark run.
+
+    Args:
+        db: Firestore client (emulator)
+        count: Number of users
+        connections_per_user: Connections seeded per user
+        run_id: Prefix for every seeded id
+
+    Returns:
+        Seeded users
+    """
+    from models import create_empty_memory
+    from tests.e2e.emulator_helpers import (
+        seed_connections, seed_conversation, seed_entity, seed_memory, seed_share_link, seed_user_profile,
+    )
+    from tests.e2e.factories import (
+        BirthDataFactory, ConnectionFactory, EntityFactory, MessageFactory, UserProfileFactory,
+    )
+
+    signs = list(BirthDataFactory.ALL_SIGNS.values())
+    today = datetime.now().strftime("%Y-%m-%d")
+    users = []
+    for k in range(count):
+        user_id = f"{run_id}_user_{k}"
+        birth_date = signs[k % len(signs)]
+        seed_user_profile(db, UserProfileFactory.create(
+            user_id=user_id, name=f"Bench User {k}", email=f"{user_id}@bench.test", birth_date=birth_date
+        ))
+        seed_memory(db, user_id, create_empty_memory(user_id).model_dump())
+
+        connections = [
+            ConnectionFactory.create(
+                name=f"Bench Friend {k}.{j}",
+                birth_date=signs[(k + j + 1) % len(signs)],
+                relationship_category=("love", "friend", "family", "coworker")[j % 4],
+                relationship_label=("partner", "friend", "sibling", "colleague")[j % 4],
+                compute_chart=True,
+            )
+            for j in range(connections_per_user)
+        ]
+        seed_connections(db, user_id, connections)
+
+        entities = [EntityFactory.create_person(f"Bench Person {k}.{j}") for j in range(2)]
+        for entity in entities:
+            seed_entity(db, user_id, entity)
+
+        conversation = MessageFactory.create_conversation_with_messages(
+            user_id, today, [("What should I focus on today?", "Your chart favors steady work.")]
+        )
+        seed_conversation(db, conversation)
+
+        share_secret = f"{run_id}_share_{k}"
+        seed_share_link(db, user_id, share_secret, "public")
+
+        users.append(BenchUser(
+            user_id=user_id,
+            birth_date=birth_date,
+            share_secret=share_secret,
+            connection_ids=[c["connection_id"] for c in connections],
+            entity_ids=[e["entity_id"] for e in entities],
+            conversation_id=conversation["conversation_id"],
+        ))
+    return users
+
+
+def cleanup(ctx: BenchContext) -> None:
+    """Delete everything a run seeded or created."""
+    from tests.e2e.emulator_helpers import clear_subcollection, clear_test_data
+
+    user_ids = [u.user_id for u in ctx.users] + ctx.created_user_ids
+    for user_id in user_ids:
+        clear_subcollection(ctx.db, f"users/{user_id}", "connection_requests")
+        clear_test_data(ctx.db, user_id)
+    for share_secret in [u.share_secret for u in ctx.users] + ctx.share_secrets:
+        ctx.db.collection("share_links").document(share_secret).delete()
+
+
+# =============================================================================
+# Scenarios
+# =============================================================================
+
+Prepare = Callable[[BenchContext, BenchUser, int], Tuple[str, dict]]
+
+
+@dataclass
+class Scenario:
+    """
+    One benchmarked endpoint.
+
+    prepare(ctx, user, i) runs before timing starts and returns the caller's
+    user id and the request data for call i.
+    """
+    name: str
+    function: str
+    prepare: Prepare
+
+
+def _seed_request(ctx: BenchContext, user: BenchUser, i: int) -> Tuple[str, dict]:
+    request_id = f"{ctx.run_id}_req_{i}"
+    sender = ctx.other(user, i)
+    ctx.db.collection("users").document(user.user_id).collection("connection_requests").document(request_id).set({
+        "request_id": request_id,
+        "from_user_id": sender.user_id,
+        "from_name": "Bench Sender",
+        "status": "pending",
+        "created_at": datetime.now().isoformat(),
+    })
+    return user.user_id, {"request_id": request_id, "action": "approve"}
+
+
+def _seed_connection(ctx: BenchContext, user: BenchUser, i: int) -> Tuple[str, dict]:
+    from tests.e2e.emulator_helpers import seed_connection
+    from tests.e2e.factories import ConnectionFactory
+
+    connection = ConnectionFactory.create(name=f"Bench Temp {i}")
+    seed_connection(ctx.db, user.user_id, connection)
+    return user.user_id, {"connection_id": connection["connection_id"]}
+
+
+def _seed_entity(ctx: BenchContext, user: BenchUser, i: int) -> Tuple[str, dict]:
+    from tests.e2e.emulator_helpers import seed_entity
+    from tests.e2e.factories import EntityFactory
+
+    entity = EntityFactory.create_person(f"Bench Temp {i}")
+    seed_entity(ctx.db, user.user_id, entity)
+    return user.user_id, {"entity_id": entity["entity_id"]}
+
+
+def _seed_deletable_user(ctx: BenchContext, user: BenchUser, i: int) -> Tuple[str, dict]:
+    from tests.e2e.emulator_helpers import seed_user_profile
+    from tests.e2e.factories import UserProfileFactory
+
+    user_id = f"{ctx.run_id}_delete_{i}"
+    ctx.created_user_ids.append(user_id)
+    seed_user_profile(ctx.db, UserProfileFactory.create(user_id=user_id, birth_date=user.birth_date))
+    return user_id, {}
+
+
+def _new_user(ctx: BenchContext, user: BenchUser, i: int) -> Tuple[str, dict]:
+    user_id = f"{ctx.run_id}_new_{i}"
+    ctx.created_user_ids.append(user_id)
+    return user_id, {"name": f"Bench New {i}", "email": f"{user_id}@bench.test", "birth_date": user.birth_date}
+
+
+def _seed_shared_user(ctx: BenchContext, user: BenchUser, i: int) -> Tuple[str, dict]:
+    # A new source per call: importing the same person twice is rejected
+    from tests.e2e.emulator_helpers import seed_share_link, seed_user_profile
+    from tests.e2e.factories import UserProfileFactory
+
+    source_id = f"{ctx.run_id}_shared_{i}"
+    share_secret = f"{source_id}_share"
+    ctx.created_user_ids.append(source_id)
+    ctx.share_secrets.append(share_secret)
+    seed_user_profile(ctx.db, UserProfileFactory.create(user_id=source_id, birth_date=ctx.other(user, i).birth_date))
+    seed_share_link(ctx.db, source_id, share_secret, "public")
+    return user.user_id, {"share_secret": share_secret, "relationship_category": "friend", "relationship_label": "friend"}
+
+
+SCENARIOS: List[Scenario] = [
+    # Pure computation
+    Scenario("get_sun_sign_from_date", "get_sun_sign_from_date",
+             lambda ctx, u, i: (u.user_id, {"birth_date": u.birth_date})),
+    Scenario("natal_chart", "natal_chart",
+             lambda ctx, u, i: (u.user_id, {"utc_dt": "1990-06-15 12:00", "lat": 40.7128, "lon": -74.0060})),
+    Scenario("daily_transit", "daily_transit",
+             lambda ctx, u, i: (u.user_id, {"utc_dt": f"{ctx.today} 12:00"})),
+    Scenario("user_transit", "user_transit",
+             lambda ctx, u, i: (u.user_id, {"utc_dt": f"{ctx.today} 12:00", "birth_lat": 40.7128, "birth_lon": -74.0060})),
+
+    # Profile and memory
+    Scenario("get_user_profile", "get_user_profile", lambda ctx, u, i: (u.user_id, {})),
+    Scenario("get_memory", "get_memory", lambda ctx, u, i: (u.user_id, {})),
+
+    # Horoscope: every call generates a new date, then the same dates again from the cache
+    Scenario("get_daily_horoscope", "get_daily_horoscope",
+             lambda ctx, u, i: (u.user_id, {"date": ctx.date(i // len(ctx.users))})),
+    Scenario("get_daily_horoscope:cached", "get_daily_horoscope",
+             lambda ctx, u, i: (u.user_id, {"date": ctx.date(i // len(ctx.users))})),
+    Scenario("get_astrometers", "get_astrometers",
+             lambda ctx, u, i: (u.user_id, {"date": ctx.date(i % 7)})),
+    Scenario("get_astrometers_timeline", "get_astrometers_timeline",
+             lambda ctx, u, i: (u.user_id, {"start_date": ctx.today})),
+
+    # Connections and compatibility
+    Scenario("list_connections", "list_connections", lambda ctx, u, i: (u.user_id, {})),
+    Scenario("get_natal_chart_for_connection", "get_natal_chart_for_connection",
+             lambda ctx, u, i: (u.user_id, {"connection_id": u.connection_ids[i % len(u.connection_ids)]})),
+    Scenario("get_compatibility", "get_compatibility",
+             lambda ctx, u, i: (u.user_id, {"connection_id": u.connection_ids[i % len(u.connection_ids)]})),
+    Scenario("get_synastry_chart", "get_synastry_chart",
+             lambda ctx, u, i: (u.user_id, {"connection_id": u.connection_ids[i % len(u.connection_ids)]})),
+    Scenario("get_share_link", "get_share_link", lambda ctx, u, i: (u.user_id, {})),
+    Scenario("get_public_profile", "get_public_profile",
+             lambda ctx, u, i: (u.user_id, {"share_secret": ctx.other(u, i).share_secret})),
+    Scenario("update_share_mode", "update_share_mode",
+             lambda ctx, u, i: (u.user_id, {"share_mode": "public"})),
+    Scenario("register_device_token", "register_device_token",
+             lambda ctx, u, i: (u.user_id, {"device_token": f"bench_token_{i}"})),
+    Scenario("list_connection_requests", "list_connection_requests", lambda ctx, u, i: (u.user_id, {})),
+
+    # Conversations and entities
+    Scenario("get_conversation_history", "get_conversation_history",
+             lambda ctx, u, i: (u.user_id, {"conversation_id": u.conversation_id})),
+    Scenario("get_user_entities", "get_user_entities", lambda ctx, u, i: (u.user_id, {})),
+    Scenario("update_entity", "update_entity",
+             lambda ctx, u, i: (u.user_id, {"entity_id": u.entity_ids[0], "add_context": f"Benchmark note {i}"})),
+
+    # Writes
+    Scenario("update_user_profile", "update_user_profile",
+             lambda ctx, u, i: (u.user_id, {"photo_path": f"users/{u.user_id}/photo_{i}.jpg"})),
+    Scenario("update_user_profile:birth", "update_user_profile",
+             lambda ctx, u, i: (u.user_id, {"birth_time": "08:30", "birth_timezone": "America/New_York",
+                                            "birth_lat": 40.7128, "birth_lon": -74.0060})),
+    Scenario("create_connection", "create_connection",
+             lambda ctx, u, i: (u.user_id, {"connection": {
+                 "name": f"Bench Created {i}", "birth_date": "1992-03-22",
+                 "relationship_category": "friend", "relationship_label": "friend",
+             }})),
+    Scenario("update_connection", "update_connection",
+             lambda ctx, u, i: (u.user_id, {"connection_id": u.connection_ids[0], "updates": {"name": f"Renamed {i}"}})),
+    Scenario("import_connection", "import_connection", _seed_shared_user),
+    Scenario("respond_to_request", "respond_to_request", _seed_request),
+    Scenario("delete_connection", "delete_connection", _seed_connection),
+    Scenario("delete_entity", "delete_entity", _seed_entity),
+    Scenario("create_user_profile", "create_user_profile", _new_user),
+    Scenario("delete_user", "delete_user", _seed_deletable_user),
+]
+
+
+def callable_names(module) -> List[str]:
+    """Names of the callable (on_call) functions a module exports."""
+    names = []
+    for name in dir(module):
+        endpoint = getattr(getattr(module, name), "__firebase_endpoint__", None)
+        if endpoint is not None and getattr(endpoint, "callableTrigger", None) is not None:
+            names.append(name)
+    return sorted(names)
+
+
+# =============================================================================
+# Running
+# =============================================================================
+
+def _call(target: Callable, user_id: str, data: dict) -> Tuple[float, Optional[str]]:
+    from firebase_functions import https_fn
+
+    request = https_fn.CallableRequest(
+        raw_request=None, data=data, auth=https_fn.AuthData(uid=user_id, token={})
+    )
+    start = time.perf_counter()
+    try:
+        target(request)
+        error = None
+    except https_fn.HttpsError as e:
+        error = f"{e.code}: {e.message}"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return (time.perf_counter() - start) * 1000, error
+
+
+def run_scenario(
+    ctx: BenchContext,
+    scenario: Scenario,
+    target: Callable,
+    counter: FirestoreOpCounter,
+    iterations: int,
+    concurrency: int
+) -> dict:
+    """
+    Time `iterations` calls of one endpoint (setup runs before timing).
+
+    Returns:
+        Endpoint entry for the JSON report
+    """
+    requests = [scenario.prepare(ctx, ctx.users[i % len(ctx.users)], i) for i in range(iterations)]
+
+    counter.reset()
+    with RssSampler() as rss:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            results = list(executor.map(lambda r: _call(target, *r), requests))
+        wall_seconds = time.perf_counter() - start
+    ops = counter.snapshot()
+
+    latencies = [latency for latency, _ in results]
+    errors = [error for _, error in results if error is not None]
+    calls = len(results)
+    return {
+        "function": scenario.function,
+        "calls": calls,
+        "errors": len(errors),
+        "error_samples": sorted(set(errors))[:MAX_ERROR_SAMPLES],
+        "latency_ms": latency_summary(latencies),
+        "throughput_per_s": round(calls / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+        "firestore": {
+            "rpcs_per_call": round(ops["rpcs"] / calls, 2) if calls else 0.0,
+            "reads_per_call": round(ops["reads"] / calls, 2) if calls else 0.0,
+            "writes_per_call": round(ops["writes"] / calls, 2) if calls else 0.0,
+            "queries_per_call": round(ops["queries"] / calls, 2) if calls else 0.0,
+        },
+        "peak_rss_mb": round(rss.peak_bytes / (1024 * 1024), 1),
+    }
+
+
+def compare_to_baseline(baseline: dict, current: dict, max_regression: float) -> List[str]:
+    """
+    Regressions of a run against a baseline report.
+
+    An endpoint regresses when its p95 latency grew by more than
+    max_regression (a fraction), or it reads or writes more documents per
+    call. Endpoints missing from either report are ignored.
+
+    Returns:
+        One message per regression
+    """
+    regressions = []
+    for name, now in current.get("endpoints", {}).items():
+        before = baseline.get("endpoints", {}).get(name)
+        if before is None:
+            continue
+        old_p95 = before["latency_ms"]["p95"]
+        new_p95 = now["latency_ms"]["p95"]
+        if old_p95 > 0 and new_p95 > old_p95 * (1 + max_regression):
+            regressions.append(f"{name}: p95 {old_p95:.1f}ms -> {new_p95:.1f}ms")
+        for metric in ("reads_per_call", "writes_per_call"):
+            old_value = before["firestore"][metric]
+            new_value = now["firestore"][metric]
+            if new_value > old_value:
+                regressions.append(f"{name}: {metric} {old_value} -> {new_value}")
+    return regressions
+
+
+def git_commit() -> Optional[str]:
+    """Short hash of the checked-out commit, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(
+    users: int = 10,
+    connections_per_user: int = 3,
+    iterations: int = 20,
+    concurrency: int = 4,
+    llm_latency_ms: float = 0,
+    llm_recordings: Optional[str] = None,
+    endpoints: Optional[List[str]] = None,
+    keep_data: bool = False
+) -> dict:
+    """
+    Seed the emulator, benchmark each scenario, clean up.
+
+    Args:
+        users: Synthetic users to seed
+        connections_per_user: Connections per user
+        iterations: Calls per endpoint
+        concurrency: Concurrent calls
+        llm_latency_ms: Stub LLM latency per call
+        llm_recordings: Replay recorded Gemini responses (JSONL) instead of the stub
+        endpoints: Scenario names to run (default: all)
+        keep_data: Leave seeded data in the emulator
+
+    Returns:
+        JSON report
+    """
+    os.environ.setdefault("GEMINI_API_KEY", "stub")
+    os.environ.setdefault("POSTHOG_API_KEY", "stub")
+    os.environ["POSTHOG_DISABLED"] = "1"
+
+    from tests.e2e.emulator_helpers import get_emulator_client
+    db = get_emulator_client()
+
+    import main as app
+    from gemini_client import reset_gemini_clients
+    if llm_recordings:
+        from llm_replay import use_replay_llm
+        use_replay_llm(llm_recordings, latency_seconds=llm_latency_ms / 1000 if llm_latency_ms else None)
+    else:
+        from llm_stub import use_stub_llm
+        use_stub_llm(latency_seconds=llm_latency_ms / 1000)
+    reset_gemini_clients()
+
+    scenarios = [s for s in SCENARIOS if not endpoints or s.name in endpoints]
+    uncovered = sorted(set(callable_names(app)) - {s.function for s in SCENARIOS})
+    if uncovered:
+        print(f"Warning: No benchmark scenario for {', '.join(uncovered)}")
+
+    run_id = f"bench_{uuid.uuid4().hex[:8]}"
+    ctx = BenchContext(
+        db=db,
+        run_id=run_id,
+        today=datetime.now().strftime("%Y-%m-%d"),
+        users=seed_users(db, users, max(1, connections_per_user), run_id),
+    )
+
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "config": {
+            "users": users,
+            "connections_per_user": connections_per_user,
+            "iterations": iterations,
+            "concurrency": concurrency,
+            "llm": "replay" if llm_recordings else "stub",
+            "llm_latency_ms": llm_latency_ms,
+        },
+        "endpoints": {},
+    }
+    try:
+        with FirestoreOpCounter() as counter:
+            for scenario in scenarios:
+                target = getattr(app, scenario.function)
+                report["endpoints"][scenario.name] = run_scenario(
+                    ctx, scenario, getattr(target, "__wrapped__", target), counter, iterations, concurrency
+                )
+    finally:
+        if not keep_data:
+            cleanup(ctx)
+    return report
+
+
+def print_report(report: dict) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="Emulator benchmark")
+    for column in ("Endpoint", "Calls", "Errors", "p50 ms", "p95 ms", "p99 ms", "Reads", "Writes", "RPCs", "Peak RSS MB"):
+        table.add_column(column, justify="left" if column == "Endpoint" else "right")
+    for name, entry in report["endpoints"].items():
+        latency = entry["latency_ms"]
+        ops = entry["firestore"]
+        table.add_row(
+            name, str(entry["calls"]), str(entry["errors"]),
+            f"{latency['p50']:.1f}", f"{latency['p95']:.1f}", f"{latency['p99']:.1f}",
+            f"{ops['reads_per_call']:g}", f"{ops['writes_per_call']:g}", f"{ops['rpcs_per_call']:g}",
+            f"{entry['peak_rss_mb']:.1f}",
+        )
+    Console().print(table)
+    for name, entry in report["endpoints"].items():
+        for sample in entry["error_samples"]:
+            print(f"  {name}: {sample}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark every callable against the Firestore emulator")
+    parser.add_argument("--users", type=int, default=10, help="Synthetic users to seed")
+    parser.add_argument("--connections-per-user", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=20, help="Calls per endpoint")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--llm-latency-ms", type=float, default=0, help="Simulated LLM latency per call")
+    parser.add_argument("--llm-recordings", help="Replay recorded Gemini responses (JSONL) instead of the stub")
+    parser.add_argument("--endpoints", help="Comma-separated scenario names (default: all)")
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--baseline", help="Earlier JSON report to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed p95 growth (fraction)")
+    parser.add_argument("--keep-data", action="store_true", help="Leave seeded data in the emulator")
+    args = parser.parse_args(argv)
+
+    from tests.e2e.emulator_helpers import is_emulator_running
+    if not is_emulator_running():
+        print("Firestore emulator not running on localhost:8080 (firebase emulators:start --only firestore)")
+        return 2
+
+    report = run_benchmark(
+        users=args.users,
+        connections_per_user=args.connections_per_user,
+        iterations=args.iterations,
+        concurrency=args.concurrency,
+        llm_latency_ms=args.llm_latency_ms,
+        llm_recordings=args.llm_recordings,
+        endpoints=args.endpoints.split(",") if args.endpoints else None,
+        keep_data=args.keep_data,
+    )
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(json.load(f), report, args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""
+Import-time budget for the Cloud Functions entry points.
+
+Every function instance imports main.py on cold start, then only the
+modules its handler imports lazily. This measures that cost per entry
+point with `python -X importtime` in a fresh interpreter:
+
+- `main`: what every instance pays (must not load LAZY_MODULES)
+- one entry per handler: main plus the modules that handler imports
+
+Handler imports are read from the source (function-local imports,
+following calls to module-level helpers in the same file), so a new
+handler is budgeted without registering it here.
+
+    cd functions
+    uv run python -m tests.benchmarks.import_budget --save-baseline   # store tests/benchmarks/import_baseline.json
+    uv run python -m tests.benchmarks.import_budget                   # exits 1 on regression
+    uv run python -m tests.benchmarks.import_budget --entry-points main,get_sun_sign_from_date
+
+An entry point regresses when its import time or its module count grows by
+more than --max-growth against the baseline, or when it loads a module its
+budget forbids (FORBIDDEN). Import times depend on the machine, so store the
+baseline from the machine that runs the comparison (module counts are
+comparable anywhere).
+"""
+
+import argparse
+import ast
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from tests.benchmarks.emulator_benchmark import git_commit
+
+
+SCHEMA_VERSION = 1
+
+FUNCTIONS_DIR = Path(__file__).parent.parent.parent
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "import_baseline.json"
+
+# Files that define deployed functions (main.py re-exports the others)
+ENTRY_POINT_FILES = ("main.py", "ask_the_stars.py", "triggers.py", "conversation_helpers.py")
+
+# Decorator namespaces that mark a Cloud Function
+_TRIGGER_NAMESPACES = {"https_fn", "firestore_fn", "scheduler_fn"}
+
+# Loaded only by the handlers that need them, never by `import main`.
+# Jinja is not listed: firebase_functions imports Flask, which imports it.
+LAZY_MODULES = (
+    "numpy",
+    "natal",
+    "pandas",
+    "google.genai",
+    "astro",
+    "models",
+    "llm",
+    "astrometers",
+    "compatibility",
+    "connections",
+    "moon",
+    "entity_extraction",
+)
+
+# Entry point -> modules it must not load
+FORBIDDEN: Dict[str, tuple] = {
+    "main": LAZY_MODULES,
+    "get_sun_sign_from_date": ("llm", "models", "google.genai", "astrometers"),
+}
+
+_MARKER = "--import-budget--"
+
+
+def _is_trigger(decorator: ast.expr) -> bool:
+    target = decorator.func if isinstance(decorator, ast.Call) else decorator
+    return (
+        isinstance(target, ast.Attribute)
+        and isinstance(target.value, ast.Name)
+        and target.value.id in _TRIGGER_NAMESPACES
+    )
+
+
+def _local_imports(node: ast.AST) -> Set[str]:
+    modules = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.ImportFrom) and child.module and not child.level:
+            modules.add(child.module)
+        elif isinstance(child, ast.Import):
+            modules.update(alias.name for alias in child.names)
+    return modules
+
+
+def _called_names(node: ast.AST) -> Set[str]:
+    return {
+        child.func.id
+        for child in ast.walk(node)
+        if isinstance(child, ast.Call) and isinstance(child.func, ast.Name)
+    }
+
+
+def entry_points(functions_dir: Path = FUNCTIONS_DIR) -> Dict[str, List[str]]:
+    """
+    Modules each deployed function imports lazily.
+
+    Returns:
+        Dict of function name -> sorted module names imported inside the
+        handler or the module-level helpers it calls (same file)
+    """
+    result = {}
+    for filename in ENTRY_POINT_FILES:
+        tree = ast.parse((functions_dir / filename).read_text())
+        functions = {
+            node.name: node for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        }
+        for name, node in functions.items():
+            if not any(_is_trigger(d) for d in node.decorator_list):
+                continue
+            modules: Set[str] = set()
+            seen = set()
+            pending = [name]
+            while pending:
+                current = pending.pop()
+                if current in seen:
+                    continue
+                seen.add(current)
+                modules |= _local_imports(functions[current])
+                pending.extend(n for n in _called_names(functions[current]) if n in functions)
+            result[name] = sorted(modules)
+    return result
+
+
+def parse_importtime(stderr: str) -> Dict[str, dict]:
+    """
+    Parse `-X importtime` output after the marker line.
+
+    Returns:
+        Dict of module name -> {"self_us", "cumulative_us"} in import order
+    """
+    modules = {}
+    started = _MARKER not in stderr
+    for line in stderr.splitlines():
+        if line.strip() == _MARKER:
+            started = True
+            continue
+        if not started or not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header row
+        modules[fields[2].strip()] = {
+            "self_us": int(fields[0]),
+            "cumulative_us": int(fields[1]),
+        }
+    return modules
+
+
+def measure_imports(modules: Iterable[str], functions_dir: Path = FUNCTIONS_DIR) -> dict:
+    """
+    Import main plus `modules` in a fresh interpreter.
+
+    Returns:
+        total_ms, module_count, heaviest (top 10 by self time) and loaded
+        (sorted module names)
+    """
+    statements = ["import main"] + [f"import {name}" for name in modules]
+    code = f"import sys; sys.stderr.write({_MARKER!r} + '\\n'); " + "; ".join(statements)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=functions_dir,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Import failed: {completed.stderr.strip().splitlines()[-1:]}")
+
+    imported = parse_importtime(completed.stderr)
+    heaviest = sorted(imported.items(), key=lambda item: item[1]["self_us"], reverse=True)[:10]
+    return {
+        "total_ms": round(sum(m["self_us"] for m in imported.values()) / 1000, 1),
+        "module_count": len(imported),
+        "heaviest": [{"module": name, "self_ms": round(m["self_us"] / 1000, 1)} for name, m in heaviest],
+        "loaded": sorted(imported),
+    }
+
+
+def forbidden_imports(entry_point: str, loaded: Iterable[str]) -> List[str]:
+    """Modules (or their submodules) in `loaded` that FORBIDDEN rules out for entry_point."""
+    forbidden = FORBIDDEN.get(entry_point, ())
+    return sorted(
+        name for name in loaded
+        if any(name == f or name.startswith(f + ".") for f in forbidden)
+    )
+
+
+def compare_to_baseline(baseline: dict, current: dict, max_growth: float) -> List[str]:
+    """
+    Regressions of a run against a baseline report.
+
+    An entry point regresses when total_ms or module_count grew by more than
+    max_growth (fraction), or when it loads a forbidden module. Entry points
+    missing from the baseline are only checked for forbidden modules.
+
+    Returns:
+        One message per regression
+    """
+    regressions = []
+    for name, now in current.get("entry_points", {}).items():
+        for module in forbidden_imports(name, now.get("loaded", [])):
+            regressions.append(f"{name}: loads {module}")
+        before = baseline.get("entry_points", {}).get(name)
+        if before is None:
+            continue
+        if before["total_ms"] > 0 and now["total_ms"] > before["total_ms"] * (1 + max_growth):
+            regressions.append(f"{name}: {before['total_ms']:.1f} -> {now['total_ms']:.1f} ms import time")
+        if before["module_count"] > 0 and now["module_count"] > before["module_count"] * (1 + max_growth):
+            regressions.append(f"{name}: {before['module_count']} -> {now['module_count']} modules")
+    return regressions
+
+
+def run_budget(entry_point_names: Optional[List[str]] = None, repeat: int = 3) -> dict:
+    """
+    Measure `main` and every entry point (best of `repeat` fresh interpreters).
+
+    Returns:
+        JSON report
+    """
+    handlers = {"main": [], **entry_points()}
+    unknown = sorted(set(entry_point_names or []) - set(handlers))
+    if unknown:
+        raise ValueError(f"Unknown entry points: {', '.join(unknown)}")
+
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "generated_at": datetime.now().isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "config": {"repeat": repeat},
+        "entry_points": {},
+    }
+    measured: Dict[tuple, dict] = {}
+    for name, modules in handlers.items():
+        if entry_point_names and name not in entry_point_names:
+            continue
+        key = tuple(modules)
+        if key not in measured:
+            runs = [measure_imports(modules) for _ in range(repeat)]
+            measured[key] = min(runs, key=lambda run: run["total_ms"])
+        report["entry_points"][name] = {"lazy_imports": modules, **measured[key]}
+    return report
+
+
+def print_report(report: dict) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="Import budget (cold start)")
+    for column in ("Entry point", "import ms", "modules", "heaviest"):
+        table.add_column(column, justify="right" if column in ("import ms", "modules") else "left")
+    for name, entry in report["entry_points"].items():
+        heaviest = ", ".join(f"{h['module']} {h['self_ms']:.0f}" for h in entry["heaviest"][:3])
+        table.add_row(name, f"{entry['total_ms']:.1f}", str(entry["module_count"]), heaviest)
+    Console().print(table)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure per-entry-point import cost")
+    parser.add_argument("--entry-points", help="Comma-separated entry points (default: main and all functions)")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per entry point (best is kept)")
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH), help="Baseline report to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run to --baseline instead of comparing")
+    parser.add_argument("--max-growth", type=float, default=0.25, help="Allowed import time / module count growth (fraction)")
+    args = parser.parse_args(argv)
+
+    report = run_budget(
+        entry_point_names=args.entry_points.split(",") if args.entry_points else None,
+        repeat=args.repeat,
+    )
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = {}
+    if Path(args.baseline).exists():
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    else:
+        print(f"No baseline at {args.baseline} (run with --save-baseline to create one); checking forbidden imports only")
+
+    regressions = compare_to_baseline(baseline, report, args.max_growth)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
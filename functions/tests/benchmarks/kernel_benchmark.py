@@ -0,0 +1,307 @@
+"""
+Microbenchmarks for the astrology compute kernels.
+
+Runs each pure-compute hot path over a fixed corpus of seeded natal charts
+(default 1,000; half exact with birth time and location, half approximate)
+and reports operations per second and the peak memory allocated per call
+(tracemalloc). The corpus is generated from a fixed seed, so every run and
+every machine benchmarks the same inputs.
+
+Kernels: compute_birth_chart, find_natal_transit_aspects,
+calculate_all_aspects, get_meters, build_all_meter_groups,
+calculate_compatibility, get_upcoming_transits, get_moon_transit_detail.
+
+    cd functions
+    uv run python -m tests.benchmarks.kernel_benchmark --save-baseline   # store tests/benchmarks/kernel_baseline.json
+    uv run python -m tests.benchmarks.kernel_benchmark                   # exits 1 on regression
+    uv run python -m tests.benchmarks.kernel_benchmark --kernels get_meters --output kernels.json
+
+A kernel regresses when its ops/sec falls by more than --max-slowdown or its
+peak allocation per call grows by more than --max-alloc-growth against the
+baseline. Throughput depends on the machine, so store the baseline from the
+machine that runs the comparison (allocations are comparable anywhere).
+
+Process-wide caches (sky cache, ephemeris table) are warmed before timing,
+so results measure the per-user work of a warm instance.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date as date_type, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from tests.benchmarks.emulator_benchmark import git_commit
+
+
+SCHEMA_VERSION = 1
+
+CORPUS_SIZE = 1000
+CORPUS_SEED = 20251017
+
+# Reading date all kernels run against
+BENCHMARK_DATE = "2025-10-17"
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "kernel_baseline.json"
+
+# (timezone, lat, lon) for exact charts
+_BIRTH_PLACES = [
+    ("America/New_York", 40.7128, -74.0060),
+    ("America/Los_Angeles", 34.0522, -118.2437),
+    ("Europe/London", 51.5074, -0.1278),
+    ("Europe/Berlin", 52.5200, 13.4050),
+    ("Asia/Tokyo", 35.6762, 139.6503),
+    ("Australia/Sydney", -33.8688, 151.2093),
+    ("America/Sao_Paulo", -23.5505, -46.6333),
+    ("Asia/Kolkata", 19.0760, 72.8777),
+]
+
+_RELATIONSHIP_TYPES = ("romantic", "friendship", "coworker")
+
+Kernel = Callable[[int], object]
+
+
+def build_corpus(size: int = CORPUS_SIZE, seed: int = CORPUS_SEED) -> List[dict]:
+    """
+    Deterministic compute_birth_chart() inputs.
+
+    Args:
+        size: Number of charts
+        seed: Random seed (same seed, same corpus)
+
+    Returns:
+        Keyword arguments for compute_birth_chart(); even indexes are exact
+        charts, odd indexes approximate (birth date only)
+    """
+    rng = random.Random(seed)
+    start = date_type(1940, 1, 1)
+    span_days = (date_type(2010, 12, 31) - start).days
+    corpus = []
+    for i in range(size):
+        birth_date = (start + timedelta(days=rng.randrange(span_days))).isoformat()
+        if i % 2:
+            corpus.append({"birth_date": birth_date})
+            continue
+        timezone_name, lat, lon = rng.choice(_BIRTH_PLACES)
+        corpus.append({
+            "birth_date": birth_date,
+            "birth_time": f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            "birth_timezone": timezone_name,
+            "birth_lat": lat,
+            "birth_lon": lon,
+        })
+    return corpus
+
+
+def build_kernels(corpus: List[dict], reading_date: str = BENCHMARK_DATE) -> Dict[str, Kernel]:
+    """
+    Kernel callables taking a corpus index.
+
+    Computes the natal charts (and the meter readings build_all_meter_groups
+    needs) up front, so each kernel times only its own work.
+    """
+    from astro import (
+        NatalChartData,
+        compute_birth_chart,
+        find_natal_transit_aspects,
+        get_transit_chart,
+        get_upcoming_transits,
+    )
+    from astrometers.core import calculate_all_aspects
+    from astrometers.meter_groups import build_all_meter_groups
+    from astrometers.meters import get_meters
+    from compatibility import calculate_compatibility
+    from moon import get_moon_transit_detail
+
+    charts = [compute_birth_chart(**inputs)[0] for inputs in corpus]
+    chart_models = [NatalChartData(**chart) for chart in charts]
+    transit = get_transit_chart(reading_date)
+    reading_datetime = datetime.strptime(reading_date, "%Y-%m-%d")
+    count = len(corpus)
+
+    def meters(i: int):
+        return get_meters(charts[i % count], transit, date=reading_datetime, user_id=f"bench_{i % count}")
+
+    readings = [meters(i) for i in range(min(count, 100))]
+
+    return {
+        "compute_birth_chart": lambda i: compute_birth_chart(**corpus[i % count]),
+        "find_natal_transit_aspects": lambda i: find_natal_transit_aspects(charts[i % count], transit),
+        "calculate_all_aspects": lambda i: calculate_all_aspects(charts[i % count], transit),
+        "get_meters": meters,
+        "build_all_meter_groups": lambda i: build_all_meter_groups(readings[i % len(readings)]),
+        "calculate_compatibility": lambda i: calculate_compatibility(
+            chart_models[i % count], chart_models[(i + 1) % count], _RELATIONSHIP_TYPES[i % 3]
+        ),
+        "get_upcoming_transits": lambda i: get_upcoming_transits(charts[i % count], reading_date, days_ahead=7),
+        "get_moon_transit_detail": lambda i: get_moon_transit_detail(
+            charts[i % count], transit, f"{reading_date}T12:00:00"
+        ),
+    }
+
+
+def measure(kernel: Kernel, iterations: int, warmup: int = 20, alloc_samples: int = 50) -> dict:
+    """
+    Time `iterations` calls, then trace allocations for `alloc_samples` calls.
+
+    Returns:
+        ops_per_sec, mean_us, peak_alloc_kb (mean peak traced memory per call)
+    """
+    for i in range(warmup):
+        kernel(i)
+
+    gc.collect()
+    start = time.perf_counter()
+    for i in range(iterations):
+        kernel(i)
+    elapsed = time.perf_counter() - start
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for i in range(alloc_samples):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            kernel(i)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_us": round(elapsed / iterations * 1e6, 1) if iterations else 0.0,
+        "peak_alloc_kb": round(sum(peaks) / len(peaks) / 1024, 1) if peaks else 0.0,
+    }
+
+
+def compare_to_baseline(
+    baseline: dict,
+    current: dict,
+    max_slowdown: float,
+    max_alloc_growth: float
+) -> List[str]:
+    """
+    Regressions of a run against a baseline report.
+
+    A kernel regresses when ops/sec fell by more than max_slowdown or peak
+    allocation per call grew by more than max_alloc_growth (fractions).
+    Kernels missing from either report are ignored.
+
+    Returns:
+        One message per regression
+    """
+    regressions = []
+    for name, now in current.get("kernels", {}).items():
+        before = baseline.get("kernels", {}).get(name)
+        if before is None:
+            continue
+        if before["ops_per_sec"] > 0 and now["ops_per_sec"] < before["ops_per_sec"] * (1 - max_slowdown):
+            regressions.append(f"{name}: {before['ops_per_sec']:.1f} -> {now['ops_per_sec']:.1f} ops/sec")
+        if before["peak_alloc_kb"] > 0 and now["peak_alloc_kb"] > before["peak_alloc_kb"] * (1 + max_alloc_growth):
+            regressions.append(f"{name}: {before['peak_alloc_kb']:.1f} -> {now['peak_alloc_kb']:.1f} KB peak allocation")
+    return regressions
+
+
+def run_benchmark(
+    corpus_size: int = CORPUS_SIZE,
+    iterations: Optional[int] = None,
+    kernels: Optional[List[str]] = None
+) -> dict:
+    """
+    Benchmark the kernels over the seeded corpus.
+
+    Args:
+        corpus_size: Charts in the corpus
+        iterations: Timed calls per kernel (default: one pass over the corpus)
+        kernels: Kernel names to run (default: all)
+
+    Returns:
+        JSON report
+    """
+    corpus = build_corpus(corpus_size)
+    available = build_kernels(corpus)
+    unknown = sorted(set(kernels or []) - set(available))
+    if unknown:
+        raise ValueError(f"Unknown kernels: {', '.join(unknown)}")
+
+    iterations = iterations or corpus_size
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "generated_at": datetime.now().isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "config": {"corpus_size": corpus_size, "corpus_seed": CORPUS_SEED, "iterations": iterations,
+                   "date": BENCHMARK_DATE},
+        "kernels": {},
+    }
+    for name, kernel in available.items():
+        if kernels and name not in kernels:
+            continue
+        report["kernels"][name] = measure(kernel, iterations)
+    return report
+
+
+def print_report(report: dict) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title=f"Kernel benchmark ({report['config']['corpus_size']} charts)")
+    for column in ("Kernel", "ops/sec", "mean µs", "peak alloc KB"):
+        table.add_column(column, justify="left" if column == "Kernel" else "right")
+    for name, entry in report["kernels"].items():
+        table.add_row(name, f"{entry['ops_per_sec']:.1f}", f"{entry['mean_us']:.1f}", f"{entry['peak_alloc_kb']:.1f}")
+    Console().print(table)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the astrology compute kernels")
+    parser.add_argument("--corpus-size", type=int, default=CORPUS_SIZE)
+    parser.add_argument("--iterations", type=int, help="Timed calls per kernel (default: corpus size)")
+    parser.add_argument("--kernels", help="Comma-separated kernel names (default: all)")
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH), help="Baseline report to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run to --baseline instead of comparing")
+    parser.add_argument("--max-slowdown", type=float, default=0.25, help="Allowed ops/sec drop (fraction)")
+    parser.add_argument("--max-alloc-growth", type=float, default=0.25, help="Allowed peak allocation growth (fraction)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        corpus_size=args.corpus_size,
+        iterations=args.iterations,
+        kernels=args.kernels.split(",") if args.kernels else None,
+    )
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not Path(args.baseline).exists():
+        print(f"No baseline at {args.baseline} (run with --save-baseline to create one)")
+        return 0
+
+    with open(args.baseline) as f:
+        regressions = compare_to_baseline(json.load(f), report, args.max_slowdown, args.max_alloc_growth)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,241 @@
 """
 Pytest configuration for Arca Backend tests.
 
-Adds the functions directory to the path so tests can import modules.
+Adds the functions directory to the path so tests can import modules, and
+provides `fake_db`: an in-memory stand-in for the Firestore client covering
+the document, query, batch and transaction calls the stores use.
 """
+import copy
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add functions directory to path for imports
 functions_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(functions_dir))
+
+from firebase_admin import firestore  # noqa: E402
+from google.cloud.firestore_v1.field_path import FieldPath  # noqa: E402
+
+
+_OPS = {
+    "==": lambda a, b: a == b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "in": lambda a, b: a in b,
+}
+
+
+def _apply_value(target: dict, key: str, value) -> None:
+    if value is firestore.DELETE_FIELD:
+        target.pop(key, None)
+    elif isinstance(value, firestore.Increment):
+        target[key] = target.get(key, 0) + value.value
+    else:
+        target[key] = value
+
+
+def _merge(target: dict, updates: dict) -> None:
+    """set(..., merge=True): nested maps are merged, not replaced."""
+    for key, value in updates.items():
+        if isinstance(value, dict):
+            if not isinstance(target.get(key), dict):
+                target[key] = {}
+            _merge(target[key], value)
+        elif isinstance(value, list):
+            target[key] = list(value)
+        else:
+            _apply_value(target, key, value)
+
+
+def _update(target: dict, updates: dict) -> None:
+    """update(): keys are field paths ("a.b" or "a.`2025-10-17`")."""
+    for path, value in updates.items():
+        *parents, leaf = FieldPath.from_string(path).parts
+        node = target
+        for part in parents:
+            if not isinstance(node.get(part), dict):
+                node[part] = {}
+            node = node[part]
+        _apply_value(node, leaf, value)
+
+
+class FakeDoc:
+    def __init__(self, ref, data):
+        self.exists = data is not None
+        self._data = data
+        self.id = ref.path.rsplit("/", 1)[-1]
+        self.reference = ref
+        self.update_time = None
+
+    def to_dict(self):
+        return self._data
+
+
+class FakeQuery:
+    def __init__(self, db, path, filters=(), order=None, descending=False, limit=None):
+        self.db = db
+        self.path = path
+        self.filters = list(filters)
+        self.order = order
+        self.descending = descending
+        self._limit = limit
+
+    def _copy(self, **changes):
+        fields = dict(filters=self.filters, order=self.order, descending=self.descending, limit=self._limit)
+        fields.update(changes)
+        return FakeQuery(self.db, self.path, **fields)
+
+    def where(self, field=None, op=None, value=None, *, filter=None):
+        if filter is not None:
+            field, op, value = filter.field_path, filter.op_string, filter.value
+        return self._copy(filters=self.filters + [(field, op, value)])
+
+    def order_by(self, field, direction=None):
+        return self._copy(order=field, descending=direction == firestore.Query.DESCENDING)
+
+    def limit(self, count):
+        return self._copy(limit=count)
+
+    def select(self, field_paths):
+        return self._copy()  # Whole documents
+
+    def start_after(self, doc):
+        return self._copy(filters=self.filters + [(self.order, ">", doc.to_dict()[self.order])])
+
+    def stream(self, transaction=None):
+        self.db.queries += 1
+        prefix = self.path + "/"
+        docs = [
+            FakeDoc(FakeRef(self.db, path), data) for path, data in list(self.db.docs.items())
+            if path.startswith(prefix) and "/" not in path[len(prefix):]
+        ]
+        docs = [
+            d for d in docs
+            if all(f in d.to_dict() and _OPS[op](d.to_dict()[f], v) for f, op, v in self.filters)
+        ]
+        if self.order:
+            docs.sort(key=lambda d: d.to_dict()[self.order], reverse=self.descending)
+        return docs[:self._limit] if self._limit is not None else docs
+
+    get = stream
+
+
+class FakeRef(FakeQuery):
+    """Collection or document reference addressed by its slash path."""
+
+    def __init__(self, db, path):
+        super().__init__(db, path)
+
+    def collection(self, name):
+        return FakeRef(self.db, f"{self.path}/{name}")
+
+    def document(self, doc_id):
+        return FakeRef(self.db, f"{self.path}/{doc_id}")
+
+    def get(self, transaction=None):
+        self.db.reads += 1
+        # A snapshot: later writes don't show through documents already read
+        return FakeDoc(self, copy.deepcopy(self.db.docs.get(self.path)))
+
+    def set(self, data, merge=False):
+        self.db._set(self.path, data, merge)
+
+    def update(self, data):
+        self.db._update(self.path, data)
+
+    def delete(self, **kwargs):
+        self.db.docs.pop(self.path, None)
+
+
+class FakeBatch:
+    """WriteBatch (and transaction) writes, applied in order on commit."""
+
+    def __init__(self, db):
+        self.db = db
+        self.ops = []
+
+    def set(self, ref, data, merge=False):
+        self.ops.append(lambda: self.db._set(ref.path, data, merge))
+
+    def update(self, ref, data):
+        self.ops.append(lambda: self.db._update(ref.path, data))
+
+    def delete(self, ref):
+        self.ops.append(lambda: self.db.docs.pop(ref.path, None))
+
+    def commit(self):
+        if self.db.fail_commits:
+            raise self.db.fail_commits.pop(0)
+        for op in self.ops:
+            op()
+        self.db.commits += 1
+
+
+class FakeTransaction(FakeBatch):
+    """Enough of firestore.Transaction for @firestore.transactional."""
+
+    _read_only = False
+    _max_attempts = 1
+    _id = b"fake-transaction"
+
+    def _clean_up(self):
+        self.ops = []
+
+    def _begin(self, retry_id=None):
+        pass
+
+    def _commit(self):
+        self.commit()
+
+    def _rollback(self):
+        self.ops = []
+
+
+class FakeFirestore:
+    def __init__(self):
+        self.docs = {}
+        self.reads = 0
+        self.queries = 0
+        self.commits = 0
+        self.writes = []  # Paths written, in order
+        self.fail_commits = []  # Exceptions raised by the next commits
+
+    def collection(self, name):
+        return FakeRef(self, name)
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+    def get_all(self, refs, transaction=None):
+        return [ref.get() for ref in refs]
+
+    def write_option(self, **kwargs):
+        return None
+
+    def _set(self, path, data, merge):
+        self.writes.append(path)
+        if merge and path in self.docs:
+            _merge(self.docs[path], data)
+        else:
+            self.docs[path] = {}
+            _merge(self.docs[path], data)
+
+    def _update(self, path, data):
+        if path not in self.docs:
+            from google.api_core.exceptions import NotFound
+            raise NotFound(f"No document to update: {path}")
+        self.writes.append(path)
+        _update(self.docs[path], data)
+
+
+@pytest.fixture
+def fake_db():
+    """Empty in-memory Firestore client."""
+    return FakeFirestore()
@@ -115,7 +115,7 @@ def clear_test_data(db, test_user_id: str) -> dict:
 
     # Delete user subcollections
     user_path = f"users/{test_user_id}"
-    for subcoll in ["connections", "entities", "horoscopes"]:
+    for subcoll in ["connections", "entities", "horoscopes", "daily_horoscopes"]:
         count = clear_subcollection(db, user_path, subcoll)
         counts[subcoll] = count
 
@@ -127,6 +127,8 @@ def clear_test_data(db, test_user_id: str) -> dict:
     convs = db.collection("conversations").where("user_id", "==", test_user_id).stream()
     conv_count = 0
     for conv in convs:
+        for message in conv.reference.collection("messages").stream():
+            message.reference.delete()
         conv.reference.delete()
         conv_count += 1
     counts["conversations"] = conv_count
@@ -225,23 +227,10 @@ def seed_entity(db, user_id: str, entity_data: dict) -> None:
         user_id: User ID
         entity_data: Entity data dict
     """
-    # Entities are stored in users/{userId}/entities/all
-    entities_ref = db.collection("users").document(user_id).collection("entities").document("all")
-
-    # Get existing or create new
-    doc = entities_ref.get()
-    if doc.exists:
-        existing = doc.to_dict()
-        entities = existing.get("entities", [])
-        entities.append(entity_data)
-        entities_ref.update({"entities": entities, "updated_at": entity_data["updated_at"]})
-    else:
-        from datetime import datetime, timezone
-        entities_ref.set({
-            "user_id": user_id,
-            "entities": [entity_data],
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        })
+    from entity_store import save_entity_changes
+    from models import Entity
+
+    save_entity_changes(db, user_id, changed=[Entity(**entity_data)])
 
 
 def seed_share_link(db, user_id: str, share_secret: str, share_mode: str = "public") -> None:
@@ -360,11 +349,9 @@ def get_entities_from_emulator(db, user_id: str) -> list[dict]:
     Returns:
         List of entity dicts
     """
-    doc = db.collection("users").document(user_id).collection("entities").document("all").get()
-    if doc.exists:
-        data = doc.to_dict()
-        return data.get("entities", [])
-    return []
+    from entity_store import load_entities
+
+    return [e.model_dump() for e in load_entities(db, user_id)]
 
 
 def count_documents(db, collection_path: str) -> int:
@@ -0,0 +1,115 @@
+"""
+E2E Tests for single-flight coalescing of daily horoscope generation.
+
+Runs SingleFlight against the Firestore emulator. Separate SingleFlight
+objects stand in for separate Cloud Functions instances (no shared locks),
+so only the Firestore lease can coalesce them.
+
+NO MOCKS. Real Firestore leases.
+"""
+import threading
+import time
+import uuid
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+@pytest.fixture
+def lease_key(firestore_emulator):
+    """Unique lease key, deleted after the test."""
+    key = f"test_single_flight_{uuid.uuid4().hex[:12]}"
+    yield key
+    firestore_emulator.collection("leases").document(key).delete()
+
+
+def _run_concurrently(targets):
+    results = [None] * len(targets)
+
+    def runner(i, target):
+        results[i] = target()
+
+    threads = [threading.Thread(target=runner, args=(i, t)) for i, t in enumerate(targets)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+class TestSingleFlightEmulator:
+    """Lease-based coalescing across simulated instances."""
+
+    def test_two_instances_generate_once(self, firestore_emulator, lease_key):
+        store = {}
+        computes = []
+
+        def compute():
+            computes.append(1)
+            time.sleep(1.0)
+            store["result"] = {"headline": "Clear skies"}
+            return store["result"]
+
+        instances = [SingleFlight(poll_interval_seconds=0.1) for _ in range(3)]
+        results = _run_concurrently([
+            lambda sf=sf: sf.run(firestore_emulator, lease_key, compute, lambda: store.get("result"))
+            for sf in instances
+        ])
+
+        assert len(computes) == 1
+        assert results == [{"headline": "Clear skies"}] * 3
+        # Lease released by the owner
+        assert not firestore_emulator.collection("leases").document(lease_key).get().exists
+
+    def test_follower_takes_over_after_owner_fails(self, firestore_emulator, lease_key):
+        store = {}
+        attempts = []
+
+        def compute():
+            attempts.append(1)
+            time.sleep(0.5)
+            if len(attempts) == 1:
+                raise RuntimeError("LLM timeout")
+            store["result"] = "second try"
+            return store["result"]
+
+        owner, follower = SingleFlight(poll_interval_seconds=0.1), SingleFlight(poll_interval_seconds=0.1)
+
+        def run_owner():
+            try:
+                return owner.run(firestore_emulator, lease_key, compute, lambda: store.get("result"))
+            except RuntimeError as e:
+                return str(e)
+
+        def run_follower():
+            time.sleep(0.2)  # Let the owner take the lease first
+            return follower.run(firestore_emulator, lease_key, compute, lambda: store.get("result"))
+
+        results = _run_concurrently([run_owner, run_follower])
+
+        assert results == ["LLM timeout", "second try"]
+        assert len(attempts) == 2
+
+    def test_expired_lease_is_taken_over(self, firestore_emulator, lease_key):
+        firestore_emulator.collection("leases").document(lease_key).set({
+            "owner": "crashed-instance",
+            "lease_until": time.time() - 1,
+        })
+
+        result = SingleFlight().run(firestore_emulator, lease_key, lambda: "fresh", lambda: None)
+
+        assert result == "fresh"
+
+    def test_active_lease_waits_then_times_out(self, firestore_emulator, lease_key):
+        firestore_emulator.collection("leases").document(lease_key).set({
+            "owner": "slow-instance",
+            "lease_until": time.time() + 60,
+        })
+        sf = SingleFlight(wait_timeout_seconds=0.5, poll_interval_seconds=0.1)
+
+        start = time.time()
+        result = sf.run(firestore_emulator, lease_key, lambda: "computed anyway", lambda: None)
+
+        assert result == "computed anyway"
+        assert time.time() - start >= 0.5
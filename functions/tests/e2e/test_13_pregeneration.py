@@ -0,0 +1,85 @@
+"""
+E2E Tests for nightly pre-generation of next-day horoscopes.
+
+Runs main.run_pregeneration against the Firestore emulator with the
+offline stub LLM (llm_stub), so the whole pipeline - user selection by
+timezone, chart/meter computation, prompt rendering, parsing and storage -
+runs without Gemini.
+"""
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from .emulator_helpers import seed_user_profile
+
+
+@pytest.fixture
+def stub_llm(monkeypatch):
+    from llm_stub import use_stub_llm
+
+    monkeypatch.setenv("GEMINI_API_KEY", os.environ.get("GEMINI_API_KEY", "stub"))
+    monkeypatch.setenv("POSTHOG_API_KEY", os.environ.get("POSTHOG_API_KEY", "stub"))
+    client = use_stub_llm()
+    yield client
+    use_stub_llm(False)
+
+
+@pytest.fixture
+def main_module(firestore_emulator):
+    import main
+    return main
+
+
+def _seed_user(db, profile, device_timezone, last_active):
+    data = profile.model_dump()
+    data["device_timezone"] = device_timezone
+    data["last_active"] = last_active.replace(tzinfo=None).isoformat()
+    seed_user_profile(db, data)
+
+
+class TestPregeneration:
+    """Scheduled pre-generation end to end."""
+
+    def test_generates_next_local_day(self, clean_firestore, main_module, stub_llm, sample_user_profile_v1):
+        # 23:30 in Los Angeles (PDT, UTC-7) on 2025-10-17
+        now = datetime(2025, 10, 18, 6, 30, tzinfo=timezone.utc)
+        last_active = now - timedelta(days=1)
+        _seed_user(clean_firestore, sample_user_profile_v1, "America/Los_Angeles", last_active)
+
+        result = main_module.run_pregeneration(clean_firestore, now=now, retry_base_seconds=0)
+
+        user_id = sample_user_profile_v1.user_id
+        assert (user_id, "2025-10-18") in result.generated
+        doc = clean_firestore.collection("users").document(user_id).collection(
+            "daily_horoscopes").document("2025-10-18").get()
+        assert doc.exists
+        assert doc.to_dict()["horoscope"]["date"] == "2025-10-18"
+
+        # Scheduled runs are not user activity
+        user = clean_firestore.collection("users").document(user_id).get().to_dict()
+        assert user["last_active"] == last_active.replace(tzinfo=None).isoformat()
+
+        # Second run finds the stored reading
+        again = main_module.run_pregeneration(clean_firestore, now=now, retry_base_seconds=0)
+        assert (user_id, "2025-10-18") in again.skipped
+        assert (user_id, "2025-10-18") not in again.generated
+
+    def test_outside_local_window_is_not_generated(self, clean_firestore, main_module, stub_llm, sample_user_profile_v1):
+        # 08:30 in Tokyo
+        now = datetime(2025, 10, 17, 23, 30, tzinfo=timezone.utc)
+        _seed_user(clean_firestore, sample_user_profile_v1, "Asia/Tokyo", now - timedelta(hours=2))
+
+        result = main_module.run_pregeneration(clean_firestore, now=now, retry_base_seconds=0)
+
+        user_id = sample_user_profile_v1.user_id
+        assert all(uid != user_id for uid, _ in result.generated)
+
+    def test_inactive_user_is_not_generated(self, clean_firestore, main_module, stub_llm, sample_user_profile_v1):
+        now = datetime(2025, 10, 18, 6, 30, tzinfo=timezone.utc)
+        _seed_user(clean_firestore, sample_user_profile_v1, "America/Los_Angeles", now - timedelta(days=30))
+
+        result = main_module.run_pregeneration(clean_firestore, now=now, retry_base_seconds=0)
+
+        user_id = sample_user_profile_v1.user_id
+        assert all(uid != user_id for uid, _ in result.generated)
@@ -0,0 +1,267 @@
+"""
+Unit tests for Ask the Stars context loading (in-memory Firestore).
+"""
+
+import pytest
+
+import ask_the_stars
+import astro
+import compatibility
+import connections
+from ask_the_stars import (
+    MAX_ENTITIES,
+    ContextNotFound,
+    _backfill_synastry_aspects,
+    find_mentioned_connections,
+    load_ask_context,
+)
+from conversation_store import PROMPT_MESSAGE_WINDOW, append_messages
+from entity_store import build_entity_index
+from models import Conversation, Entity, EntityStatus, Message, MessageRole, create_empty_memory
+
+
+NOW = "2025-10-17T12:00:00"
+
+
+def _horoscope(date):
+    return {
+        "date": date,
+        "sun_sign": "gemini",
+        "technical_analysis": "Moon trine Venus",
+        "daily_theme_headline": f"Headline {date}",
+        "daily_overview": "Overview",
+        "actionable_advice": {"do": "Rest", "dont": "Rush", "reflect_on": "What matters?"},
+        "meter_groups": [],
+        "astrometers": {
+            "overall_state": "Balanced Flow",
+            "top_active_meters": [],
+            "top_flowing_meters": [],
+            "top_challenging_meters": [],
+        },
+        "transit_summary": {"priority_transits": []},
+        "created_at": NOW,
+    }
+
+
+def _entity(i, status=EntityStatus.ACTIVE):
+    return Entity(
+        entity_id=f"ent_{i:04d}",
+        name=f"Entity {i}",
+        entity_type="goal",
+        status=status,
+        first_seen=NOW,
+        last_seen=NOW,
+        mention_count=i,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def _message(i):
+    return Message(
+        message_id=f"msg_{i:04d}",
+        role=MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT,
+        content=f"message {i}",
+        timestamp=NOW,
+    )
+
+
+def _seed(db, user_id="u1", horoscope_dates=("2025-10-16", "2025-10-17")):
+    db.docs[f"users/{user_id}"] = {
+        "user_id": user_id, "name": "Ada", "email": "ada@example.com",
+        "birth_date": "1990-06-15", "sun_sign": "gemini",
+        "natal_chart": {"chart_type": "natal"}, "exact_chart": False,
+        "created_at": NOW, "last_active": NOW,
+    }
+    db.docs[f"users/{user_id}/horoscopes/latest"] = {
+        "user_id": user_id,
+        "horoscopes": {d: _horoscope(d) for d in horoscope_dates},
+        "updated_at": NOW,
+    }
+
+
+def _add_connection(db, connection_id, name, **fields):
+    db.docs[f"users/u1/connections/{connection_id}"] = {"name": name, **fields}
+
+
+class _InlineExecutor:
+    """Runs submitted writes immediately so tests can see them."""
+
+    def submit(self, fn, *args, **kwargs):
+        fn(*args, **kwargs)
+
+
+class TestFindMentionedConnections:
+    CONNECTIONS = [{"name": "John Smith"}, {"name": "Maya"}, {"name": None}, {}]
+
+    def test_matches_any_word_of_the_name(self):
+        assert find_mentioned_connections("How is john today?", self.CONNECTIONS) == [{"name": "John Smith"}]
+        assert find_mentioned_connections("And Smith?", self.CONNECTIONS) == [{"name": "John Smith"}]
+
+    def test_whole_words_only(self):
+        assert find_mentioned_connections("What about Johnny?", self.CONNECTIONS) == []
+
+    def test_several_connections(self):
+        assert find_mentioned_connections("Maya and John", self.CONNECTIONS) == [
+            {"name": "John Smith"}, {"name": "Maya"}
+        ]
+
+    def test_connections_without_name_never_match(self):
+        assert find_mentioned_connections("none", [{"name": ""}, {}]) == []
+
+
+class TestLoadAskContext:
+    def test_documents_come_from_one_batched_read(self, fake_db, monkeypatch):
+        _seed(fake_db)
+        fake_db.docs["memory/u1"] = create_empty_memory("u1").model_dump()
+        fake_db.docs["users/u1/entities/index"] = build_entity_index("u1", [_entity(1), _entity(2)])
+        batches = []
+        get_all = fake_db.get_all
+        monkeypatch.setattr(fake_db, "get_all", lambda refs: batches.append(refs) or get_all(refs))
+
+        context = load_ask_context(fake_db, "u1", "How is my day?")
+
+        assert len(batches) == 1
+        assert fake_db.reads == len(batches[0])
+        assert context.user_profile.user_id == "u1"
+        assert context.horoscope_date == "2025-10-17"
+        assert context.horoscope.daily_theme_headline == "Headline 2025-10-17"
+        assert [e.entity_id for e in context.top_entities] == ["ent_0002", "ent_0001"]
+        assert context.conversation is None
+        assert context.conversation_messages == []
+
+    def test_missing_user(self, fake_db):
+        with pytest.raises(ContextNotFound, match="User"):
+            load_ask_context(fake_db, "u1", "hi")
+
+    @pytest.mark.parametrize("dates", [None, ()])
+    def test_missing_or_empty_horoscopes(self, fake_db, dates):
+        _seed(fake_db, horoscope_dates=dates or ())
+        if dates is None:
+            del fake_db.docs["users/u1/horoscopes/latest"]
+        with pytest.raises(ContextNotFound, match="horoscopes"):
+            load_ask_context(fake_db, "u1", "hi")
+
+    def test_partial_documents_use_defaults(self, fake_db):
+        _seed(fake_db)  # No memory, entity index or legacy entities
+
+        context = load_ask_context(fake_db, "u1", "hi")
+
+        assert context.memory.user_id == "u1"
+        assert context.top_entities == []
+        assert context.mentioned_connections == []
+
+    def test_legacy_entities_when_index_missing(self, fake_db):
+        _seed(fake_db)
+        entities = [_entity(i) for i in range(1, MAX_ENTITIES + 5)]
+        entities.append(_entity(99, status=EntityStatus.ARCHIVED))
+        fake_db.docs["users/u1/entities/all"] = {
+            "user_id": "u1",
+            "entities": [e.model_dump() for e in entities],
+            "updated_at": NOW,
+        }
+
+        context = load_ask_context(fake_db, "u1", "hi")
+
+        assert len(context.top_entities) == MAX_ENTITIES
+        assert "ent_0099" not in [e.entity_id for e in context.top_entities]
+
+    def test_conversation_window(self, fake_db):
+        _seed(fake_db)
+        conversation = Conversation(
+            conversation_id="conv_1", user_id="u1", horoscope_date="2025-10-17",
+            messages=[], created_at=NOW, updated_at=NOW,
+        )
+        append_messages(fake_db, conversation, [_message(i) for i in range(6)], create=True)
+
+        context = load_ask_context(fake_db, "u1", "hi", conversation_id="conv_1")
+
+        assert context.conversation.conversation_id == "conv_1"
+        assert [m.content for m in context.conversation_messages] == [
+            f"message {i}" for i in range(6 - PROMPT_MESSAGE_WINDOW, 6)
+        ]
+
+    def test_other_users_conversation_not_found(self, fake_db):
+        _seed(fake_db)
+        fake_db.docs["conversations/conv_1"] = Conversation(
+            conversation_id="conv_1", user_id="someone_else", horoscope_date="2025-10-17",
+            messages=[], created_at=NOW, updated_at=NOW,
+        ).model_dump()
+
+        with pytest.raises(ContextNotFound, match="Conversation"):
+            load_ask_context(fake_db, "u1", "hi", conversation_id="conv_1")
+
+    def test_missing_conversation_not_found(self, fake_db):
+        _seed(fake_db)
+        with pytest.raises(ContextNotFound, match="Conversation"):
+            load_ask_context(fake_db, "u1", "hi", conversation_id="conv_1")
+
+    def test_mentioned_connections_keep_cached_synastry(self, fake_db):
+        _seed(fake_db)
+        _add_connection(fake_db, "c1", "Maya", birth_date="1992-03-01", synastry_aspects=["Sun trine Moon"])
+        _add_connection(fake_db, "c2", "John")
+
+        context = load_ask_context(fake_db, "u1", "Will Maya call?")
+
+        assert context.mentioned_connections == [{
+            "name": "Maya", "birth_date": "1992-03-01",
+            "synastry_aspects": ["Sun trine Moon"], "connection_id": "c1",
+        }]
+
+
+class TestBackfillSynastryAspects:
+    @pytest.fixture
+    def synastry(self, monkeypatch):
+        """Stub chart/synastry computation; returns the birth dates computed."""
+        computed = []
+
+        def compute_birth_chart(birth_date, **kwargs):
+            if birth_date == "bad":
+                raise ValueError("bad birth date")
+            computed.append(birth_date)
+            return {"birth_date": birth_date}, {}
+
+        monkeypatch.setattr(astro, "NatalChartData", lambda **chart: chart)
+        monkeypatch.setattr(astro, "compute_birth_chart", compute_birth_chart)
+        monkeypatch.setattr(compatibility, "calculate_synastry_aspects", lambda user, conn: [conn["birth_date"]])
+        monkeypatch.setattr(connections, "format_synastry_aspects", lambda aspects: [f"aspects {aspects[0]}"])
+        monkeypatch.setattr(ask_the_stars, "_CONTEXT_EXECUTOR", _InlineExecutor())
+        return computed
+
+    def test_missing_aspects_are_computed_and_written_back(self, fake_db, synastry):
+        _add_connection(fake_db, "c1", "Maya", birth_date="1992-03-01")
+        mentioned = [{"connection_id": "c1", "name": "Maya", "birth_date": "1992-03-01"}]
+
+        _backfill_synastry_aspects(fake_db, "u1", {"chart_type": "natal"}, mentioned)
+
+        assert mentioned[0]["synastry_aspects"] == ["aspects 1992-03-01"]
+        assert fake_db.docs["users/u1/connections/c1"]["synastry_aspects"] == ["aspects 1992-03-01"]
+
+    def test_cached_or_undated_connections_skipped(self, fake_db, synastry):
+        mentioned = [
+            {"connection_id": "c1", "name": "Maya", "birth_date": "1992-03-01", "synastry_aspects": ["cached"]},
+            {"connection_id": "c2", "name": "John"},
+        ]
+
+        _backfill_synastry_aspects(fake_db, "u1", {"chart_type": "natal"}, mentioned)
+
+        assert synastry == []
+        assert fake_db.writes == []
+
+    def test_no_natal_chart_skips(self, fake_db, synastry):
+        mentioned = [{"connection_id": "c1", "name": "Maya", "birth_date": "1992-03-01"}]
+        _backfill_synastry_aspects(fake_db, "u1", None, mentioned)
+        assert synastry == []
+        assert "synastry_aspects" not in mentioned[0]
+
+    def test_failed_connection_does_not_stop_others(self, fake_db, synastry):
+        _add_connection(fake_db, "c2", "John", birth_date="1988-07-04")
+        mentioned = [
+            {"connection_id": "c1", "name": "Maya", "birth_date": "bad"},
+            {"connection_id": "c2", "name": "John", "birth_date": "1988-07-04"},
+        ]
+
+        _backfill_synastry_aspects(fake_db, "u1", {"chart_type": "natal"}, mentioned)
+
+        assert "synastry_aspects" not in mentioned[0]
+        assert fake_db.writes == ["users/u1/connections/c2"]
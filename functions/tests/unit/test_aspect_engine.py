@@ -0,0 +1,135 @@
+"""
+Tests for the vectorized natal-transit aspect engine.
+
+The reference implementation below is the original natal x transit x aspect
+loop; the NumPy engine must reproduce it exactly (hits, values and order).
+"""
+
+import pytest
+
+from astro import (
+    AspectType,
+    NATAL_TRANSIT_ASPECTS,
+    Planet,
+    ZodiacSign,
+    analyze_planet_speed,
+    calculate_aspect_priority,
+    check_critical_degrees,
+    compute_birth_chart,
+    compute_natal_transit_arrays,
+    find_natal_transit_aspects,
+    get_transit_chart,
+)
+from astrometers.core import calculate_all_aspects
+
+
+def reference_aspects(natal_chart, transit_chart, orb):
+    """Original loop-based find_natal_transit_aspects (as dicts, priority sorted)."""
+    found = []
+    natal_planets = {p["name"]: p for p in natal_chart["planets"]}
+    transit_planets = {p["name"]: p for p in transit_chart["planets"]}
+
+    for natal_name, natal_planet in natal_planets.items():
+        for transit_name, transit_planet in transit_planets.items():
+            natal_deg = natal_planet["absolute_degree"]
+            transit_deg = transit_planet["absolute_degree"]
+            for aspect_type, (exact_deg, meaning) in NATAL_TRANSIT_ASPECTS.items():
+                diff = abs((transit_deg - natal_deg) % 360)
+                if diff > 180:
+                    diff = 360 - diff
+                angle_diff = abs(diff - exact_deg)
+                if angle_diff > orb:
+                    continue
+                applying = transit_planet["speed"] > natal_planet.get("speed", 0)
+                speed_enum, speed_desc = analyze_planet_speed(Planet(transit_name), transit_planet["speed"])
+                priority = calculate_aspect_priority(
+                    Planet(transit_name), Planet(natal_name), aspect_type, angle_diff,
+                    applying, speed_enum,
+                    natal_house=natal_planet["house"],
+                    transit_house=transit_planet["house"],
+                    transit_retrograde=transit_planet["retrograde"],
+                    transit_sign=ZodiacSign(transit_planet["sign"])
+                )
+                found.append({
+                    "natal_planet": natal_name,
+                    "transit_planet": transit_name,
+                    "aspect_type": aspect_type,
+                    "orb": round(angle_diff, 2),
+                    "applying": applying,
+                    "priority_score": priority,
+                    "transit_speed_description": speed_desc,
+                    "natal_critical_degrees": [
+                        (cd.value, d) for cd, d in
+                        check_critical_degrees(natal_planet["degree_in_sign"], ZodiacSign(natal_planet["sign"]))
+                    ],
+                })
+    return sorted(found, key=lambda x: (-x["priority_score"], x["orb"]))
+
+
+CASES = [
+    ("1985-05-15", "2025-10-17"),
+    ("1990-06-15", "2025-01-01"),
+    ("2000-02-29", "2024-12-21"),
+    ("1970-11-03", "2026-03-20"),
+]
+
+
+@pytest.mark.parametrize("birth_date,transit_date", CASES)
+@pytest.mark.parametrize("orb", [1.0, 3.0, 8.0])
+def test_matches_reference_loop(birth_date, transit_date, orb):
+    natal, _ = compute_birth_chart(birth_date)
+    transit = get_transit_chart(transit_date)
+
+    expected = reference_aspects(natal, transit, orb)
+    actual = [
+        {
+            "natal_planet": a.natal_planet.value,
+            "transit_planet": a.transit_planet.value,
+            "aspect_type": a.aspect_type,
+            "orb": a.orb,
+            "applying": a.applying,
+            "priority_score": a.priority_score,
+            "transit_speed_description": a.transit_speed_description,
+            "natal_critical_degrees": [tuple(c) for c in a.natal_critical_degrees],
+        }
+        for a in find_natal_transit_aspects(natal, transit, orb=orb)
+    ]
+
+    assert actual == expected
+
+
+def test_within_matches_direct_computation():
+    natal, _ = compute_birth_chart("1985-05-15")
+    transit = get_transit_chart("2025-10-17")
+
+    wide = compute_natal_transit_arrays(natal, transit, orb=8.0)
+    narrow = compute_natal_transit_arrays(natal, transit, orb=2.0)
+    view = wide.within(2.0)
+
+    assert len(view) == len(narrow)
+    assert view.angle_diff.tolist() == narrow.angle_diff.tolist()
+    assert view.aspect_idx.tolist() == narrow.aspect_idx.tolist()
+    assert wide.within(10.0) is wide
+
+
+def test_orb_sort_matches_reference():
+    natal, _ = compute_birth_chart("1990-06-15")
+    transit = get_transit_chart("2025-01-01")
+
+    by_orb = find_natal_transit_aspects(natal, transit, orb=8.0, sort_by_priority=False)
+    orbs = [a.orb for a in by_orb]
+
+    assert orbs == sorted(orbs)
+
+
+def test_calculate_all_aspects_uses_same_hits():
+    natal, _ = compute_birth_chart("1985-05-15")
+    transit = get_transit_chart("2025-10-17")
+
+    aspects = calculate_all_aspects(natal, transit)
+    expected = find_natal_transit_aspects(natal, transit, orb=8.0)
+
+    assert [(a.natal_planet, a.transit_planet, a.aspect_type, a.orb_deviation) for a in aspects] == [
+        (e.natal_planet, e.transit_planet, e.aspect_type, e.orb) for e in expected
+    ]
+    assert all(isinstance(a.aspect_type, AspectType) for a in aspects)
@@ -0,0 +1,141 @@
+"""
+Unit tests for the prebuilt asset bundle and registry.
+"""
+
+import copy
+import json
+
+import pytest
+
+import assets
+from assets import (
+    FrozenDict,
+    build_asset_bundle,
+    clear_asset_cache,
+    freeze,
+    load_json,
+    load_text,
+    read_asset_bundle,
+    source_paths,
+    sources_sha256,
+    template_loader,
+)
+from astro import ZodiacSign, get_sun_sign_profile
+
+
+@pytest.fixture
+def bundle_path(tmp_path, monkeypatch):
+    """Registry serving a freshly built bundle."""
+    path = build_asset_bundle(tmp_path / "assets.bundle")
+    monkeypatch.setattr(assets, "ASSET_BUNDLE_PATH", path)
+    clear_asset_cache()
+    yield path
+    clear_asset_cache()
+
+
+class TestFreeze:
+    def test_read_only(self):
+        frozen = freeze({"a": {"b": [1, 2]}})
+        assert isinstance(frozen, FrozenDict)
+        assert frozen["a"]["b"] == (1, 2)
+        with pytest.raises(TypeError):
+            frozen["c"] = 1
+        with pytest.raises(TypeError):
+            frozen["a"].update(b=3)
+
+    def test_still_json_and_dict(self):
+        frozen = freeze({"a": [1, {"b": 2}]})
+        assert isinstance(frozen, dict)
+        assert json.loads(json.dumps(frozen)) == {"a": [1, {"b": 2}]}
+
+    def test_copies_are_mutable(self):
+        frozen = freeze({"a": {"b": 1}})
+        copied = copy.deepcopy(frozen)
+        copied["a"]["b"] = 2
+        assert type(copied) is dict
+        assert frozen["a"]["b"] == 1
+
+
+class TestBundle:
+    def test_covers_every_asset_kind(self):
+        paths = source_paths()
+        for expected in (
+            "astrometers/labels/clarity.json",
+            "astrometers/labels/groups/mind.json",
+            "astrometers/labels/word_banks.json",
+            "signs/aries.json",
+            "compatibility_labels/labels/overall.json",
+            "compatibility_labels/labels/romantic/romantic_emotional.json",
+            "relationships/labels.json",
+            "templates/voice.md",
+            "templates/horoscope/daily_static.j2",
+        ):
+            assert expected in paths
+
+    def test_round_trip(self, tmp_path):
+        bundle = read_asset_bundle(build_asset_bundle(tmp_path / "assets.bundle"))
+        assert bundle["source_sha256"] == sources_sha256()
+        assert sorted(bundle["files"]) == source_paths()
+        for relative, content in bundle["files"].items():
+            source = (assets.ASSET_ROOT / relative).read_text()
+            if relative.endswith(".json"):
+                assert json.loads(json.dumps(content)) == json.loads(source)
+            else:
+                assert content == source
+
+    def test_invalid_sign_profile_fails_build(self, tmp_path):
+        (tmp_path / "signs").mkdir()
+        (tmp_path / "signs" / "aries.json").write_text('{"sign": "Aries"}')
+        with pytest.raises(ValueError, match="signs/aries.json"):
+            build_asset_bundle(tmp_path / "assets.bundle", root=tmp_path)
+
+    def test_corrupt_or_missing_bundle_ignored(self, tmp_path):
+        assert read_asset_bundle(tmp_path / "missing.bundle") is None
+        corrupt = tmp_path / "corrupt.bundle"
+        corrupt.write_bytes(b"not a bundle")
+        assert read_asset_bundle(corrupt) is None
+
+    def test_deployed_bundle_is_current(self):
+        bundle = read_asset_bundle(assets.ASSET_BUNDLE_PATH)
+        if bundle is None:
+            pytest.skip("No asset bundle built (python build_assets.py)")
+        assert bundle["source_sha256"] == sources_sha256(), "Asset bundle is stale: run build_assets.py"
+
+    def test_bundle_is_built_on_deploy(self):
+        firebase = json.loads((assets.ASSET_ROOT.parent / "firebase.json").read_text())
+        predeploy = " ".join(firebase["functions"][0]["predeploy"])
+        assert "build_assets.py" in predeploy
+
+
+class TestRegistry:
+    def test_serves_bundle(self, bundle_path):
+        labels = load_json("astrometers/labels/clarity.json")
+        assert isinstance(labels, FrozenDict)
+        assert labels is load_json("astrometers/labels/clarity.json")
+        assert load_text("templates/voice.md") == (assets.ASSET_ROOT / "templates" / "voice.md").read_text()
+
+    def test_source_fallback(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(assets, "ASSET_BUNDLE_PATH", tmp_path / "missing.bundle")
+        clear_asset_cache()
+        try:
+            labels = load_json("relationships/labels.json")
+            assert isinstance(labels, FrozenDict)
+            with pytest.raises(FileNotFoundError):
+                load_json("astrometers/labels/missing.json")
+        finally:
+            clear_asset_cache()
+
+    def test_template_loader(self, bundle_path):
+        from jinja2 import Environment
+
+        env = Environment(loader=template_loader("templates/conversation", "templates"))
+        source, filename, uptodate = env.loader.get_source(env, "voice.md")
+        assert source == load_text("templates/voice.md")
+        assert uptodate()
+        assert env.get_template("ask_the_stars.j2") is not None
+
+
+def test_sun_sign_profile_validated_once():
+    profile = get_sun_sign_profile(ZodiacSign.ARIES)
+    assert profile is not None
+    assert get_sun_sign_profile(ZodiacSign.ARIES) is profile
@@ -12,7 +12,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 from firebase_functions import https_fn
 
-from auth import get_authenticated_user_id, DEV_ACCOUNT_UIDS
+from auth import get_authenticated_user_id, get_request_user_id, DEV_ACCOUNT_UIDS
 
 
 class MockAuthInfo:
@@ -21,6 +21,12 @@ class MockAuthInfo:
         self.uid = uid
 
 
+class MockHttpRequest:
+    """Mock Flask request for on_request endpoints."""
+    def __init__(self, headers: dict = None):
+        self.headers = headers or {}
+
+
 class MockCallableRequest:
     """Mock Firebase CallableRequest."""
     def __init__(self, data: dict = None, auth: MockAuthInfo = None):
@@ -154,5 +160,36 @@ class TestPriorityOrder:
         assert result == "firebase_user_789"
 
 
+class TestRequestUserId:
+    """Test get_request_user_id for HTTPS (SSE) endpoints."""
+
+    def test_dev_account_in_body(self):
+        """Dev accounts in the body bypass the Authorization header."""
+        assert get_request_user_id(MockHttpRequest(), {"user_id": "test_user_a"}) == "test_user_a"
+
+    def test_missing_header_rejected(self):
+        """No bearer token and no dev account raises UNAUTHENTICATED."""
+        with pytest.raises(https_fn.HttpsError) as exc_info:
+            get_request_user_id(MockHttpRequest(), {"user_id": "random_user_123"})
+
+        assert exc_info.value.code == https_fn.FunctionsErrorCode.UNAUTHENTICATED
+
+    def test_valid_bearer_token(self):
+        """A verified ID token returns its uid."""
+        req = MockHttpRequest({"Authorization": "Bearer token_abc"})
+        with patch("auth.firebase_auth.verify_id_token", return_value={"uid": "firebase_user_123"}) as verify:
+            assert get_request_user_id(req, {}) == "firebase_user_123"
+        verify.assert_called_once_with("token_abc")
+
+    def test_invalid_bearer_token_rejected(self):
+        """Token verification errors raise UNAUTHENTICATED."""
+        req = MockHttpRequest({"Authorization": "Bearer expired"})
+        with patch("auth.firebase_auth.verify_id_token", side_effect=ValueError("expired")):
+            with pytest.raises(https_fn.HttpsError) as exc_info:
+                get_request_user_id(req, {})
+
+        assert exc_info.value.code == https_fn.FunctionsErrorCode.UNAUTHENTICATED
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,127 @@
+"""
+Unit tests for append-only conversation message storage.
+"""
+
+from conversation_store import (
+    append_messages,
+    delete_conversation,
+    load_messages,
+    load_recent_messages,
+    message_total,
+    message_window,
+)
+from models import Conversation, Message, MessageRole
+
+
+def _message(i):
+    return Message(
+        message_id=f"msg_{i:04d}",
+        role=MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT,
+        content=f"message {i}",
+        timestamp="2025-10-17T12:00:00",
+    )
+
+
+def _conversation(messages=()):
+    return Conversation(
+        conversation_id="conv_1",
+        user_id="u1",
+        horoscope_date="2025-10-17",
+        messages=list(messages),
+        created_at="2025-10-17T12:00:00",
+        updated_at="2025-10-17T12:00:00",
+    )
+
+
+def _stored_conversation(db, messages):
+    """Conversation written before the messages subcollection."""
+    conversation = _conversation(messages)
+    db.docs["conversations/conv_1"] = conversation.model_dump()
+    return conversation
+
+
+def _contents(messages):
+    return [m.content for m in messages]
+
+
+def test_turn_writes_two_documents_and_a_counter(fake_db):
+    conversation = _conversation()
+    append_messages(fake_db, conversation, [_message(0), _message(1)], create=True)
+    append_messages(fake_db, conversation, [_message(2), _message(3)])
+
+    stored = fake_db.docs["conversations/conv_1"]
+    assert stored["messages"] == []
+    assert stored["message_count"] == 4
+    assert fake_db.docs["conversations/conv_1/messages/msg_0003"]["seq"] == 3
+    assert fake_db.commits == 2
+
+
+def test_concurrent_turns_get_distinct_seqs(fake_db):
+    append_messages(fake_db, _conversation(), [_message(0), _message(1)], create=True)
+    # Two devices load the conversation at message_count 2, then both append
+    device_a = Conversation(**fake_db.docs["conversations/conv_1"])
+    device_b = Conversation(**fake_db.docs["conversations/conv_1"])
+
+    append_messages(fake_db, device_a, [_message(2), _message(3)])
+    append_messages(fake_db, device_b, [_message(4), _message(5)])
+
+    seqs = [fake_db.docs[f"conversations/conv_1/messages/msg_{i:04d}"]["seq"] for i in range(6)]
+    assert seqs == [0, 1, 2, 3, 4, 5]
+    assert fake_db.docs["conversations/conv_1"]["message_count"] == 6
+    assert device_b.message_count == 6
+
+
+def test_legacy_inline_messages_are_not_rewritten(fake_db):
+    conversation = _stored_conversation(fake_db, [_message(0), _message(1)])
+
+    append_messages(fake_db, conversation, [_message(2), _message(3)])
+
+    stored = fake_db.docs["conversations/conv_1"]
+    assert len(stored["messages"]) == 2
+    assert stored["message_count"] == 4
+    assert fake_db.docs["conversations/conv_1/messages/msg_0002"]["seq"] == 2
+    assert message_total(Conversation(**stored)) == 4
+
+
+def test_window_spans_inline_and_appended(fake_db):
+    conversation = _stored_conversation(fake_db, [_message(i) for i in range(3)])
+    append_messages(fake_db, conversation, [_message(3), _message(4)])
+
+    recent = load_recent_messages(fake_db, "conv_1", 4)
+    assert _contents(recent) == ["message 3", "message 4"]
+    window = message_window(conversation, recent, 4)
+    assert _contents(window) == [f"message {i}" for i in range(1, 5)]
+
+
+def test_pages_walk_back_to_the_first_message(fake_db):
+    conversation = _stored_conversation(fake_db, [_message(i) for i in range(3)])
+    for i in range(3, 11, 2):
+        append_messages(fake_db, conversation, [_message(i), _message(i + 1)])
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = load_messages(fake_db, conversation, limit=4, before_seq=cursor)
+        seen = _contents(page) + seen
+        if cursor is None:
+            break
+
+    assert seen == [f"message {i}" for i in range(11)]
+
+
+def test_first_page_of_legacy_conversation_needs_no_query(fake_db):
+    conversation = _conversation([_message(i) for i in range(3)])
+
+    page, cursor = load_messages(fake_db, conversation, limit=50)
+    assert _contents(page) == ["message 0", "message 1", "message 2"]
+    assert cursor is None
+    assert fake_db.queries == 0
+
+
+def test_delete_removes_messages(fake_db):
+    append_messages(fake_db, _conversation(), [_message(0), _message(1)], create=True)
+    fake_db.docs["conversations/conv_2"] = {"user_id": "u1"}
+
+    delete_conversation(fake_db, "conv_1")
+
+    assert list(fake_db.docs) == ["conversations/conv_2"]
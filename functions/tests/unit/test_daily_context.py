@@ -0,0 +1,95 @@
+"""
+Unit tests for DailyContext: every shared view must equal the direct computation.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from astro import (
+    compute_birth_chart,
+    find_natal_transit_aspects,
+    format_transit_summary_for_ui,
+    get_transit_chart,
+    get_upcoming_transits,
+)
+from astrometers import get_meters
+from daily_context import DailyContext
+from moon import get_moon_transit_detail
+
+
+DATE = "2025-10-17"
+
+
+@pytest.fixture(scope="module")
+def natal_chart():
+    chart, _ = compute_birth_chart(
+        birth_date="1985-05-15",
+        birth_time="14:30",
+        birth_timezone="America/New_York",
+        birth_lat=40.7128,
+        birth_lon=-74.0060
+    )
+    return chart
+
+
+@pytest.fixture
+def context(natal_chart):
+    return DailyContext(natal_chart, DATE, user_id="test_user_123")
+
+
+@pytest.mark.parametrize("orb", [1.0, 2.0, 3.0, 8.0, 10.0])
+@pytest.mark.parametrize("sort_by_priority", [True, False])
+def test_aspects_match_direct(context, natal_chart, orb, sort_by_priority):
+    expected = find_natal_transit_aspects(
+        natal_chart, get_transit_chart(DATE), orb=orb, sort_by_priority=sort_by_priority
+    )
+    assert context.aspects(orb, sort_by_priority=sort_by_priority) == expected
+
+
+def test_aspects_are_memoized(context):
+    assert context.aspects(3.0) is context.aspects(3.0)
+    assert context.arrays() is context.arrays()
+
+
+def test_transit_summary_matches_direct(context, natal_chart):
+    transit = get_transit_chart(DATE)
+    assert format_transit_summary_for_ui(natal_chart, transit, context=context) == \
+        format_transit_summary_for_ui(natal_chart, transit)
+
+
+def test_upcoming_transits_match_direct(context, natal_chart):
+    assert get_upcoming_transits(natal_chart, DATE, days_ahead=7, context=context) == \
+        get_upcoming_transits(natal_chart, DATE, days_ahead=7)
+
+
+def test_moon_detail_matches_direct(context, natal_chart):
+    transit = get_transit_chart(DATE)
+    now = f"{DATE}T12:00:00"
+    assert get_moon_transit_detail(natal_chart, transit, now, context=context) == \
+        get_moon_transit_detail(natal_chart, transit, now)
+
+
+def test_meters_match_direct(context, natal_chart):
+    date_obj = datetime.fromisoformat(DATE)
+    expected = get_meters(
+        natal_chart=natal_chart,
+        transit_chart=get_transit_chart(DATE),
+        date=date_obj,
+        user_id="test_user_123"
+    )
+    assert context.meters.model_dump() == expected.model_dump()
+
+
+def test_yesterday_meters_match_direct(context, natal_chart):
+    yesterday = datetime.fromisoformat(DATE) - timedelta(days=1)
+    expected = get_meters(
+        natal_chart=natal_chart,
+        transit_chart=get_transit_chart(yesterday.strftime("%Y-%m-%d")),
+        date=yesterday
+    )
+    assert context.yesterday_meters.model_dump() == expected.model_dump()
+
+
+def test_invalid_date_raises(natal_chart):
+    with pytest.raises(ValueError):
+        DailyContext(natal_chart, "2025-02-30")
@@ -0,0 +1,134 @@
+"""
+Unit tests for the emulator benchmark harness helpers.
+
+The benchmark itself needs the Firestore emulator; these cover the
+statistics, Firestore operation counting and baseline comparison.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from tests.benchmarks.emulator_benchmark import (
+    FirestoreOpCounter,
+    callable_names,
+    compare_to_baseline,
+    latency_summary,
+    percentile,
+)
+
+
+class FakeFirestoreApi:
+    """Stands in for the generated FirestoreClient."""
+
+    def get_document(self, request=None):
+        return {"name": "projects/p/databases/d/documents/users/u1"}
+
+    def batch_get_documents(self, request=None):
+        return iter([
+            {"found": {"name": "users/u1"}},
+            {"missing": "users/u2"},
+            {"transaction": b"t"},
+        ])
+
+    def run_query(self, request=None):
+        return iter([
+            {"document": {"name": "users/u1"}},
+            {"document": {"name": "users/u2"}},
+            {"read_time": "2025-01-01T00:00:00Z"},
+        ])
+
+    def commit(self, request=None):
+        return {"write_results": []}
+
+
+def _report(p95: float, reads: float = 1.0, writes: float = 0.0) -> dict:
+    return {"endpoints": {"get_user_profile": {
+        "latency_ms": {"p95": p95},
+        "firestore": {"reads_per_call": reads, "writes_per_call": writes},
+    }}}
+
+
+class TestPercentile:
+    def test_empty(self):
+        assert percentile([], 95) == 0.0
+
+    def test_interpolates(self):
+        values = [10.0, 20.0, 30.0, 40.0, 50.0]
+        assert percentile(values, 50) == 30.0
+        assert percentile(values, 0) == 10.0
+        assert percentile(values, 100) == 50.0
+        assert percentile(values, 75) == 40.0
+        assert percentile([1.0, 2.0], 50) == pytest.approx(1.5)
+
+    def test_unsorted_input(self):
+        assert percentile([50.0, 10.0, 30.0], 50) == 30.0
+
+    def test_latency_summary(self):
+        summary = latency_summary([float(v) for v in range(1, 101)])
+        assert summary["p50"] == pytest.approx(50.5)
+        assert summary["p95"] == pytest.approx(95.05)
+        assert summary["p99"] == pytest.approx(99.01)
+        assert summary["max"] == 100.0
+        assert summary["mean"] == 50.5
+
+
+class TestFirestoreOpCounter:
+    def test_counts_reads_and_writes(self):
+        api = FakeFirestoreApi()
+        with FirestoreOpCounter(FakeFirestoreApi) as counter:
+            api.get_document(request={"name": "users/u1"})
+            assert len(list(api.batch_get_documents(request={}))) == 3
+            assert len(list(api.run_query(request={}))) == 3
+            api.commit(request={"writes": [{"update": {}}, {"delete": "users/u2"}]})
+            api.commit(request=SimpleNamespace(writes=[{"update": {}}]))
+
+        assert counter.snapshot() == {"rpcs": 5, "reads": 5, "writes": 3, "queries": 1}
+
+    def test_reads_counted_as_consumed(self):
+        api = FakeFirestoreApi()
+        with FirestoreOpCounter(FakeFirestoreApi) as counter:
+            stream = api.run_query(request={})
+            assert counter.snapshot()["reads"] == 0
+            next(stream)
+            assert counter.snapshot()["reads"] == 1
+
+    def test_uninstall_restores_methods(self):
+        original = FakeFirestoreApi.get_document
+        counter = FirestoreOpCounter(FakeFirestoreApi).install()
+        assert FakeFirestoreApi.get_document is not original
+        counter.uninstall()
+        assert FakeFirestoreApi.get_document is original
+
+    def test_reset(self):
+        api = FakeFirestoreApi()
+        with FirestoreOpCounter(FakeFirestoreApi) as counter:
+            api.get_document(request={})
+            counter.reset()
+        assert counter.snapshot() == {"rpcs": 0, "reads": 0, "writes": 0, "queries": 0}
+
+
+class TestCompareToBaseline:
+    def test_within_threshold(self):
+        assert compare_to_baseline(_report(100.0), _report(115.0), 0.2) == []
+
+    def test_latency_regression(self):
+        regressions = compare_to_baseline(_report(100.0), _report(130.0), 0.2)
+        assert len(regressions) == 1
+        assert "p95" in regressions[0]
+
+    def test_more_reads_or_writes(self):
+        regressions = compare_to_baseline(_report(100.0, reads=1, writes=0), _report(100.0, reads=2, writes=1), 0.2)
+        assert len(regressions) == 2
+
+    def test_new_endpoint_ignored(self):
+        assert compare_to_baseline({"endpoints": {}}, _report(100.0), 0.2) == []
+
+
+def test_callable_names():
+    module = SimpleNamespace(
+        get_user_profile=SimpleNamespace(__firebase_endpoint__=SimpleNamespace(callableTrigger={})),
+        ask_the_stars=SimpleNamespace(__firebase_endpoint__=SimpleNamespace(callableTrigger=None)),
+        helper=lambda: None,
+    )
+    assert callable_names(module) == ["get_user_profile"]
@@ -309,6 +309,38 @@ class TestContextSnippetManagement:
         assert "Context 0" not in result[0].context_snippets  # Oldest removed
         assert "New context 11" in result[0].context_snippets  # Latest added
 
+    def test_untouched_entities_not_copied(self):
+        """Only entities an action changes are copied (callers diff by identity)."""
+        now = datetime.now()
+        existing = [
+            Entity(
+                entity_id=f"ent_00{i}",
+                name=name,
+                entity_type="person",
+                first_seen=now.isoformat(),
+                last_seen=now.isoformat(),
+                mention_count=1,
+                created_at=now.isoformat(),
+                updated_at=now.isoformat()
+            )
+            for i, name in enumerate(["John", "Sarah"])
+        ]
+
+        actions = MergedEntities(actions=[
+            EntityMergeAction(
+                action="update",
+                entity_name="Sarah",
+                entity_type="person",
+                context_update="Sarah got promoted"
+            )
+        ])
+
+        result = {e.entity_id: e for e in execute_merge_actions(actions, existing, now)}
+
+        assert result["ent_000"] is existing[0]
+        assert result["ent_001"] is not existing[1]
+        assert existing[1].context_snippets == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,137 @@
+"""
+Unit tests for the sharded entity store and its top-K index.
+"""
+
+from datetime import datetime, timedelta
+
+from entity_store import (
+    ENTITY_INDEX_SIZE,
+    diff_entities,
+    load_entities,
+    save_entity_changes,
+    shard_id,
+    top_entities_from_index,
+)
+from models import Entity, EntityStatus
+
+
+NOW = datetime.now().replace(microsecond=0)
+
+
+def _entity(i, mention_count=1, days_ago=0, status=EntityStatus.ACTIVE):
+    seen = (NOW - timedelta(days=days_ago)).isoformat()
+    return Entity(
+        entity_id=f"ent_{i:04d}",
+        name=f"Entity {i}",
+        entity_type="goal",
+        status=status,
+        first_seen=seen,
+        last_seen=seen,
+        mention_count=mention_count,
+        created_at=(NOW + timedelta(seconds=i)).isoformat(),
+        updated_at=seen,
+    )
+
+
+def _saved(db, entities):
+    save_entity_changes(db, "u1", changed=entities)
+    db.writes.clear()
+    db.queries = 0
+
+
+def test_round_trip(fake_db):
+    entities = [_entity(i) for i in range(20)]
+    _saved(fake_db, entities)
+
+    loaded = load_entities(fake_db, "u1")
+    assert [e.entity_id for e in loaded] == [e.entity_id for e in entities]
+    assert fake_db.queries == 1
+
+
+def test_change_writes_one_shard_and_the_index(fake_db):
+    entities = [_entity(i) for i in range(20)]
+    _saved(fake_db, entities)
+
+    changed = entities[3].model_copy(update={"mention_count": 5})
+    after = entities[:3] + [changed] + entities[4:]
+    assert save_entity_changes(fake_db, "u1", *diff_entities(entities, after)) == 1
+
+    assert sorted(fake_db.writes) == sorted([
+        f"users/u1/entities/{shard_id(changed.entity_id)}",
+        "users/u1/entities/index",
+    ])
+    loaded = {e.entity_id: e for e in load_entities(fake_db, "u1")}
+    assert loaded[changed.entity_id].mention_count == 5
+    assert len(loaded) == 20
+
+
+def test_removed_entity_deleted_from_its_shard(fake_db):
+    entities = [_entity(i) for i in range(5)]
+    _saved(fake_db, entities)
+
+    save_entity_changes(fake_db, "u1", removed=[entities[0].entity_id])
+
+    assert [e.entity_id for e in load_entities(fake_db, "u1")] == [e.entity_id for e in entities[1:]]
+
+
+def test_index_keeps_top_active_entities(fake_db):
+    entities = [_entity(i, days_ago=i) for i in range(ENTITY_INDEX_SIZE + 10)]
+    entities.append(_entity(999, mention_count=50, status=EntityStatus.ARCHIVED))
+    _saved(fake_db, entities)
+
+    index = fake_db.docs["users/u1/entities/index"]
+    assert len(index["top"]) == ENTITY_INDEX_SIZE
+    assert index["entity_count"] == len(entities)
+
+    top = top_entities_from_index(index, limit=3, current_time=NOW)
+    assert [e.entity_id for e in top] == ["ent_0000", "ent_0001", "ent_0002"]
+
+
+def test_missing_index_returns_none():
+    assert top_entities_from_index(None, limit=15) is None
+    assert top_entities_from_index({"version": 0, "top": []}, limit=15) is None
+
+
+def test_index_keeps_concurrent_writers_entities(fake_db):
+    entities = [_entity(i) for i in range(3)]
+    _saved(fake_db, entities)
+
+    # Two writers load the same entities; each adds one without seeing the other's
+    assert load_entities(fake_db, "u1") == load_entities(fake_db, "u1")
+    save_entity_changes(fake_db, "u1", changed=[_entity(10, mention_count=9)])
+    save_entity_changes(fake_db, "u1", changed=[_entity(11, mention_count=9)])
+
+    index = fake_db.docs["users/u1/entities/index"]
+    assert index["entity_count"] == 5
+    assert {"ent_0010", "ent_0011"} <= {e["entity_id"] for e in index["top"]}
+
+
+def _legacy(db, entities):
+    db.docs["users/u1/entities/all"] = {
+        "user_id": "u1",
+        "entities": [e.model_dump() for e in entities],
+        "updated_at": NOW.isoformat(),
+    }
+
+
+def test_legacy_document_read_without_writes(fake_db):
+    entities = [_entity(i) for i in range(3)]
+    _legacy(fake_db, entities)
+
+    assert [e.entity_id for e in load_entities(fake_db, "u1")] == [e.entity_id for e in entities]
+    assert fake_db.writes == []
+    assert "users/u1/entities/all" in fake_db.docs
+
+
+def test_legacy_document_migrated_on_first_save(fake_db):
+    entities = [_entity(i) for i in range(3)]
+    _legacy(fake_db, entities)
+
+    changed = entities[1].model_copy(update={"mention_count": 7})
+    assert save_entity_changes(fake_db, "u1", changed=[changed], removed=[entities[0].entity_id]) == 2
+
+    assert "users/u1/entities/all" not in fake_db.docs
+    assert fake_db.docs["users/u1/entities/index"]["entity_count"] == 2
+    loaded = load_entities(fake_db, "u1")
+    assert [e.entity_id for e in loaded] == [e.entity_id for e in entities[1:]]
+    assert loaded[0].mention_count == 7
@@ -0,0 +1,111 @@
+"""
+Unit tests for the precomputed ephemeris table and get_transit_positions().
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import astro
+from astro import (
+    EPHEMERIS_START,
+    build_ephemeris_table,
+    compute_birth_chart,
+    find_natal_transit_aspects,
+    get_transit_positions,
+)
+from datetime import timedelta
+
+
+TABLE_DAYS = 5
+
+
+def _use_table(monkeypatch, path):
+    monkeypatch.setattr(astro, "EPHEMERIS_TABLE_PATH", path)
+    monkeypatch.setattr(astro, "_EPHEMERIS_TABLE", None)
+    monkeypatch.setattr(astro, "_EPHEMERIS_LOADED", False)
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    """Small table covering the first days of the supported range."""
+    path = tmp_path_factory.mktemp("ephemeris") / "sky.npy"
+    end = EPHEMERIS_START + timedelta(days=TABLE_DAYS - 1)
+    return build_ephemeris_table(path, EPHEMERIS_START, end)
+
+
+@pytest.fixture
+def table(monkeypatch, table_path):
+    _use_table(monkeypatch, table_path)
+    return table_path
+
+
+def _date(offset: int) -> str:
+    return (EPHEMERIS_START + timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+@pytest.mark.parametrize("offset", range(TABLE_DAYS))
+def test_positions_match_full_chart(table, offset):
+    """Every field read from the table equals the full chart's value."""
+    date = _date(offset)
+    full, _ = compute_birth_chart(date, birth_time="12:00")
+    light = get_transit_positions(date)
+
+    assert light is not None
+    fields = ["name", "sign", "degree_in_sign", "absolute_degree", "house",
+              "speed", "retrograde", "element", "modality"]
+    expected = [{k: p[k] for k in fields} for p in full["planets"]]
+    assert light["planets"] == expected
+
+
+def test_aspects_match_full_chart(table):
+    natal, _ = compute_birth_chart("1985-05-15")
+    date = _date(2)
+    full, _ = compute_birth_chart(date, birth_time="12:00")
+
+    assert (
+        find_natal_transit_aspects(natal, get_transit_positions(date), orb=8.0)
+        == find_natal_transit_aspects(natal, full, orb=8.0)
+    )
+
+
+def test_out_of_range_returns_none(table):
+    assert get_transit_positions(_date(TABLE_DAYS)) is None
+    assert get_transit_positions("1899-12-31") is None
+
+
+def test_missing_table_returns_none(monkeypatch, tmp_path):
+    _use_table(monkeypatch, tmp_path / "missing.npy")
+    assert get_transit_positions("2025-10-17") is None
+
+
+def test_invalid_date_raises(table):
+    with pytest.raises(ValueError):
+        get_transit_positions("not-a-date")
+
+
+def test_missing_body_is_left_out(monkeypatch, tmp_path):
+    """A body the ephemeris skips is stored as NaN, not as 0 degrees Aries."""
+    compute = astro.compute_birth_chart
+
+    def without_pluto(*args, **kwargs):
+        chart, data = compute(*args, **kwargs)
+        chart["planets"] = [p for p in chart["planets"] if p["name"] != "pluto"]
+        return chart, data
+
+    monkeypatch.setattr(astro, "compute_birth_chart", without_pluto)
+    path = build_ephemeris_table(tmp_path / "sky.npy", EPHEMERIS_START, EPHEMERIS_START)
+    _use_table(monkeypatch, path)
+
+    assert np.isnan(np.load(path)[0, astro.EPHEMERIS_BODIES.index("pluto")]).all()
+    names = [p["name"] for p in get_transit_positions(_date(0))["planets"]]
+    assert "pluto" not in names
+    assert names == [p["name"] for p in without_pluto(_date(0), birth_time="12:00")[0]["planets"]]
+
+
+def test_table_is_built_on_deploy():
+    firebase = json.loads((Path(astro.__file__).parent.parent / "firebase.json").read_text())
+    predeploy = " ".join(firebase["functions"][0]["predeploy"])
+    assert "build_ephemeris.py" in predeploy
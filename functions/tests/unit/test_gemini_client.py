@@ -0,0 +1,62 @@
+"""
+Unit tests for the shared Gemini client provider.
+"""
+
+import threading
+import pytest
+
+from gemini_client import get_gemini_client, reset_gemini_clients, set_gemini_client_factory
+
+
+@pytest.fixture
+def created():
+    created = []
+
+    def factory(api_key):
+        created.append(api_key)
+        return object()
+
+    set_gemini_client_factory(factory)
+    yield created
+    set_gemini_client_factory(None)
+
+
+def test_one_client_per_api_key(created):
+    a = get_gemini_client("key-a")
+    assert get_gemini_client("key-a") is a
+    assert get_gemini_client("key-b") is not a
+    assert created == ["key-a", "key-b"]
+
+
+def test_reset_builds_fresh_client(created):
+    a = get_gemini_client("key-a")
+    reset_gemini_clients()
+    assert get_gemini_client("key-a") is not a
+
+
+def test_concurrent_first_use_builds_once(created):
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(get_gemini_client("key-a"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert created == ["key-a"]
+    assert all(r is results[0] for r in results)
+
+
+def test_default_factory_builds_pooled_genai_client():
+    set_gemini_client_factory(None)
+    try:
+        client = get_gemini_client("test-key")
+        assert client.__class__.__name__ == "Client"
+        assert get_gemini_client("test-key") is client
+    finally:
+        reset_gemini_clients()
@@ -0,0 +1,92 @@
+"""
+Unit tests for the per-(user, date) DailyHoroscope cache.
+"""
+
+from types import SimpleNamespace
+
+from horoscope_cache import (
+    HOROSCOPE_CACHE_VERSION,
+    cache_epoch,
+    get_cached_horoscope,
+    horoscope_cache_entry,
+    horoscope_cache_epoch_ref,
+    horoscope_cache_ref,
+    invalidate_cached_horoscopes,
+)
+
+
+def _horoscope(headline):
+    return SimpleNamespace(model_dump=lambda mode="python": {"daily_theme_headline": headline})
+
+
+def _store(db, user_id, date, horoscope, epoch=0):
+    horoscope_cache_ref(db, user_id, date).set(horoscope_cache_entry(date, horoscope, epoch))
+
+
+def test_round_trip_in_one_batched_read(fake_db):
+    _store(fake_db, "u1", "2025-10-17", _horoscope("Clear skies"))
+    batches = []
+    get_all = fake_db.get_all
+    fake_db.get_all = lambda refs: batches.append(refs) or get_all(refs)
+
+    assert fake_db.docs["users/u1/daily_horoscopes/2025-10-17"]["version"] == HOROSCOPE_CACHE_VERSION
+    assert get_cached_horoscope(fake_db, "u1", "2025-10-17") == {"daily_theme_headline": "Clear skies"}
+    assert len(batches) == 1
+
+
+def test_miss_for_other_user_or_date(fake_db):
+    _store(fake_db, "u1", "2025-10-17", _horoscope("Clear skies"))
+
+    assert get_cached_horoscope(fake_db, "u1", "2025-10-18") is None
+    assert get_cached_horoscope(fake_db, "u2", "2025-10-17") is None
+
+
+def test_stale_version_ignored(fake_db):
+    fake_db.docs["users/u1/daily_horoscopes/2025-10-17"] = {
+        "version": HOROSCOPE_CACHE_VERSION - 1,
+        "horoscope": {"daily_theme_headline": "Old"},
+    }
+    assert get_cached_horoscope(fake_db, "u1", "2025-10-17") is None
+
+
+def test_invalidate_only_touches_that_user(fake_db):
+    for date in ["2025-10-16", "2025-10-17"]:
+        _store(fake_db, "u1", date, _horoscope(date))
+    _store(fake_db, "u2", "2025-10-17", _horoscope("other"))
+
+    assert invalidate_cached_horoscopes(fake_db, "u1") == 2
+    assert get_cached_horoscope(fake_db, "u1", "2025-10-17") is None
+    assert get_cached_horoscope(fake_db, "u2", "2025-10-17") == {"daily_theme_headline": "other"}
+    assert fake_db.commits == 1
+
+
+def test_invalidate_bumps_epoch_and_keeps_it(fake_db):
+    epoch_ref = horoscope_cache_epoch_ref(fake_db, "u1")
+    assert cache_epoch(epoch_ref.get()) == 0
+
+    invalidate_cached_horoscopes(fake_db, "u1")
+    invalidate_cached_horoscopes(fake_db, "u1")
+
+    assert cache_epoch(epoch_ref.get()) == 2
+
+
+def test_entry_from_an_older_epoch_is_a_miss(fake_db):
+    # Generation read epoch 0, then the chart changed before it was stored
+    invalidate_cached_horoscopes(fake_db, "u1")
+    _store(fake_db, "u1", "2025-10-17", _horoscope("Old chart"), epoch=0)
+    assert get_cached_horoscope(fake_db, "u1", "2025-10-17") is None
+
+    _store(fake_db, "u1", "2025-10-17", _horoscope("New chart"), epoch=1)
+    assert get_cached_horoscope(fake_db, "u1", "2025-10-17") == {"daily_theme_headline": "New chart"}
+
+
+def test_errors_are_swallowed():
+    class Broken:
+        def collection(self, name):
+            raise RuntimeError("unavailable")
+
+        def batch(self):
+            raise RuntimeError("unavailable")
+
+    assert get_cached_horoscope(Broken(), "u1", "2025-10-17") is None
+    assert invalidate_cached_horoscopes(Broken(), "u1") == 0
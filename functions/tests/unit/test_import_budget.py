@@ -0,0 +1,105 @@
+"""
+Import-time budget: cold start must not load the heavy subsystems.
+
+`import main` runs on every function instance; astro, models, llm and
+their NumPy / natal / google-genai dependencies load inside the handlers
+that use them. (Jinja is loaded anyway: firebase_functions imports Flask.) Stored-baseline comparisons (import time, module
+count) run only when tests/benchmarks/import_baseline.json exists.
+"""
+
+import json
+
+import pytest
+
+from tests.benchmarks.import_budget import (
+    DEFAULT_BASELINE_PATH,
+    compare_to_baseline,
+    entry_points,
+    forbidden_imports,
+    measure_imports,
+    parse_importtime,
+    run_budget,
+)
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | encodings
+--import-budget--
+import time:       300 |        300 |   stage_timer
+import time:      4000 |       4300 | main
+"""
+
+
+def _report(total_ms: float, module_count: int, loaded=()) -> dict:
+    return {"entry_points": {"main": {
+        "total_ms": total_ms, "module_count": module_count, "loaded": list(loaded),
+    }}}
+
+
+class TestEntryPoints:
+    def test_handlers_found_in_every_file(self):
+        handlers = entry_points()
+        for name in ("get_sun_sign_from_date", "ask_the_stars", "extract_entities_on_message",
+                     "get_conversation_history", "pregenerate_daily_horoscopes"):
+            assert name in handlers
+
+    def test_helpers_followed(self):
+        handlers = entry_points()
+        # get_daily_horoscope -> _generate_daily_horoscope -> _daily_horoscope_events
+        assert "llm" in handlers["get_daily_horoscope"]
+        # extract_entities_on_message -> _extract_and_merge_entities
+        assert "gemini_client" in handlers["extract_entities_on_message"]
+
+    def test_light_handlers(self):
+        handlers = entry_points()
+        assert handlers["get_sun_sign_from_date"] == ["astro"]
+        assert "llm" not in handlers["list_connections"]
+
+
+def test_parse_importtime():
+    modules = parse_importtime(IMPORTTIME_OUTPUT)
+    assert list(modules) == ["stage_timer", "main"]
+    assert modules["main"] == {"self_us": 4000, "cumulative_us": 4300}
+
+
+def test_forbidden_imports():
+    assert forbidden_imports("main", ["json", "numpy.core", "astrometers", "astronomy"]) == ["astrometers", "numpy.core"]
+    assert forbidden_imports("list_connections", ["numpy"]) == []
+
+
+class TestCompareToBaseline:
+    def test_within_threshold(self):
+        assert compare_to_baseline(_report(100.0, 200), _report(120.0, 240), 0.25) == []
+
+    def test_import_time_growth(self):
+        regressions = compare_to_baseline(_report(100.0, 200), _report(130.0, 200), 0.25)
+        assert len(regressions) == 1
+        assert "ms" in regressions[0]
+
+    def test_module_count_growth(self):
+        regressions = compare_to_baseline(_report(100.0, 200), _report(100.0, 300), 0.25)
+        assert len(regressions) == 1
+        assert "modules" in regressions[0]
+
+    def test_forbidden_without_baseline(self):
+        assert compare_to_baseline({}, _report(100.0, 200, loaded=["numpy"]), 0.25) == ["main: loads numpy"]
+
+
+class TestColdStart:
+    def test_main_loads_no_heavy_modules(self):
+        loaded = measure_imports([])["loaded"]
+        assert "main" in loaded
+        assert forbidden_imports("main", loaded) == []
+
+    def test_sun_sign_stays_light(self):
+        loaded = measure_imports(entry_points()["get_sun_sign_from_date"])["loaded"]
+        assert "astro" in loaded
+        assert forbidden_imports("get_sun_sign_from_date", loaded) == []
+
+    def test_against_baseline(self):
+        if not DEFAULT_BASELINE_PATH.exists():
+            pytest.skip("No import baseline (python -m tests.benchmarks.import_budget --save-baseline)")
+        with open(DEFAULT_BASELINE_PATH) as f:
+            baseline = json.load(f)
+        assert compare_to_baseline(baseline, run_budget(repeat=1), 0.25) == []
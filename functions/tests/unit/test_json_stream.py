@@ -0,0 +1,52 @@
+"""
+Unit tests for json_stream.py - incremental top-level JSON member parsing.
+"""
+
+import json
+
+from json_stream import JsonFieldStream
+
+
+DOCUMENT = {
+    "headline": "Say \"yes\", {carefully}",
+    "advice": {"do": "Rest", "dont": "Rush [things]"},
+    "score": 72,
+    "questions": ["Why?", "What, then?"],
+    "vibe": None,
+}
+
+
+def feed_all(pieces):
+    stream = JsonFieldStream()
+    completed = []
+    for piece in pieces:
+        completed.extend(stream.feed(piece))
+    return stream, completed
+
+
+class TestJsonFieldStream:
+    def test_whole_document_at_once(self):
+        text = json.dumps(DOCUMENT)
+        stream, completed = feed_all([text])
+        assert completed == list(DOCUMENT.items())
+        assert stream.text == text
+
+    def test_one_character_at_a_time(self):
+        text = json.dumps(DOCUMENT, indent=2)
+        _, completed = feed_all(list(text))
+        assert completed == list(DOCUMENT.items())
+
+    def test_member_reported_as_soon_as_complete(self):
+        stream = JsonFieldStream()
+        assert stream.feed('{"headline": "Hel') == []
+        assert stream.feed('lo", "advice": {"do": ') == [("headline", "Hello")]
+        assert stream.feed('"Rest"}') == []
+        assert stream.feed("}") == [("advice", {"do": "Rest"})]
+
+    def test_escaped_quotes_and_brackets_in_strings(self):
+        _, completed = feed_all(['{"a": "x\\\\", "b": "}\\"]{"}'])
+        assert completed == [("a", "x\\"), ("b", '}"]{')]
+
+    def test_empty_object(self):
+        _, completed = feed_all(["{", "}"])
+        assert completed == []
@@ -0,0 +1,51 @@
+"""
+Unit tests for the compute kernel benchmark helpers.
+"""
+
+from tests.benchmarks.kernel_benchmark import CORPUS_SIZE, build_corpus, compare_to_baseline, measure
+
+
+def _report(ops_per_sec: float, peak_alloc_kb: float) -> dict:
+    return {"kernels": {"get_meters": {"ops_per_sec": ops_per_sec, "peak_alloc_kb": peak_alloc_kb}}}
+
+
+class TestCorpus:
+    def test_deterministic(self):
+        assert build_corpus(50) == build_corpus(50)
+        assert build_corpus(50, seed=1) != build_corpus(50)
+
+    def test_default_size(self):
+        assert len(build_corpus()) == CORPUS_SIZE
+
+    def test_exact_and_approximate(self):
+        corpus = build_corpus(10)
+        assert set(corpus[0]) == {"birth_date", "birth_time", "birth_timezone", "birth_lat", "birth_lon"}
+        assert set(corpus[1]) == {"birth_date"}
+        assert all("1940-01-01" <= c["birth_date"] <= "2010-12-31" for c in corpus)
+
+
+class TestCompareToBaseline:
+    def test_within_threshold(self):
+        assert compare_to_baseline(_report(100.0, 50.0), _report(80.0, 60.0), 0.25, 0.25) == []
+
+    def test_slowdown(self):
+        regressions = compare_to_baseline(_report(100.0, 50.0), _report(70.0, 50.0), 0.25, 0.25)
+        assert len(regressions) == 1
+        assert "ops/sec" in regressions[0]
+
+    def test_allocation_growth(self):
+        regressions = compare_to_baseline(_report(100.0, 50.0), _report(100.0, 70.0), 0.25, 0.25)
+        assert len(regressions) == 1
+        assert "KB" in regressions[0]
+
+    def test_new_kernel_ignored(self):
+        assert compare_to_baseline({"kernels": {}}, _report(1.0, 1.0), 0.25, 0.25) == []
+
+
+def test_measure():
+    calls = []
+    result = measure(lambda i: calls.append(bytearray(64 * 1024)), iterations=10, warmup=2, alloc_samples=3)
+    assert len(calls) == 15
+    assert result["iterations"] == 10
+    assert result["ops_per_sec"] > 0
+    assert result["peak_alloc_kb"] >= 64
@@ -0,0 +1,149 @@
+"""
+Unit tests for llm_cache.py against a local fake Gemini client.
+"""
+
+import pytest
+from types import SimpleNamespace
+
+from google.genai import errors
+
+from llm_cache import PromptCacheManager, is_cached_content_error, prompt_version
+
+
+class FakeCaches:
+    """In-memory stand-in for client.caches."""
+
+    def __init__(self, fail_create=False, fail_update=False):
+        self.fail_create = fail_create
+        self.fail_update = fail_update
+        self.created = []
+        self.updated = []
+
+    def create(self, model, config):
+        if self.fail_create:
+            raise RuntimeError("Cached content is too small")
+        name = f"cachedContents/{len(self.created)}"
+        self.created.append((model, config))
+        return SimpleNamespace(name=name, expire_time=None)
+
+    def update(self, name, config):
+        if self.fail_update:
+            raise RuntimeError("not found")
+        self.updated.append((name, config.ttl))
+        return SimpleNamespace(name=name, expire_time=None)
+
+
+class FakeClient:
+    def __init__(self, **kwargs):
+        self.caches = FakeCaches(**kwargs)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def manager(clock):
+    return PromptCacheManager(ttl_seconds=3600, refresh_margin_seconds=300, failure_backoff_seconds=600, clock=clock)
+
+
+def test_created_once_and_reused(manager):
+    client = FakeClient()
+    first = manager.get(client, "key", "gemini-2.5-flash-lite", "STATIC")
+    second = manager.get(FakeClient(), "key", "gemini-2.5-flash-lite", "STATIC")
+
+    assert first == second == "cachedContents/0"
+    assert len(client.caches.created) == 1
+    model, config = client.caches.created[0]
+    assert model == "gemini-2.5-flash-lite"
+    assert config.contents[0].parts[0].text == "STATIC"
+    assert config.ttl == "3600s"
+
+
+def test_keyed_by_model_version_and_api_key(manager):
+    client = FakeClient()
+    names = {
+        manager.get(client, "key", "model-a", "STATIC"),
+        manager.get(client, "key", "model-b", "STATIC"),
+        manager.get(client, "key", "model-a", "STATIC v2"),
+        manager.get(client, "other-key", "model-a", "STATIC"),
+    }
+    assert len(names) == 4
+    assert prompt_version("STATIC") != prompt_version("STATIC v2")
+
+
+def test_refreshed_before_expiry(manager, clock):
+    client = FakeClient()
+    name = manager.get(client, "key", "model", "STATIC")
+
+    clock.now += 3600 - 300 - 1
+    assert manager.get(client, "key", "model", "STATIC") == name
+    assert client.caches.updated == []
+
+    clock.now += 2
+    assert manager.get(client, "key", "model", "STATIC") == name
+    assert client.caches.updated == [(name, "3600s")]
+    assert len(client.caches.created) == 1
+
+
+def test_recreated_after_expiry_or_failed_refresh(manager, clock):
+    client = FakeClient()
+    manager.get(client, "key", "model", "STATIC")
+
+    clock.now += 3600 - 100
+    client.caches.fail_update = True
+    assert manager.get(client, "key", "model", "STATIC") == "cachedContents/1"
+
+    clock.now += 10_000
+    assert manager.get(client, "key", "model", "STATIC") == "cachedContents/2"
+
+
+def test_create_failure_falls_back_and_backs_off(manager, clock):
+    client = FakeClient(fail_create=True)
+    assert manager.get(client, "key", "model", "STATIC") is None
+    assert manager.get(client, "key", "model", "STATIC") is None
+
+    client.caches.fail_create = False
+    assert manager.get(client, "key", "model", "STATIC") is None  # Still backing off
+
+    clock.now += 601
+    assert manager.get(client, "key", "model", "STATIC") == "cachedContents/0"
+
+
+def test_unnamed_handle_is_not_used(manager):
+    client = FakeClient()
+    client.caches.create = lambda model, config: SimpleNamespace(name=None)
+    assert manager.get(client, "key", "model", "STATIC") is None
+
+
+def test_invalidate(manager):
+    client = FakeClient()
+    name = manager.get(client, "key", "model", "STATIC")
+    manager.invalidate(name)
+    assert manager.get(client, "key", "model", "STATIC") == "cachedContents/1"
+
+
+def _api_error(cls, code, message):
+    return cls(code, {"error": {"code": code, "message": message, "status": ""}})
+
+
+@pytest.mark.parametrize("error,expected", [
+    (_api_error(errors.ClientError, 404, "CachedContent not found"), True),
+    (_api_error(errors.ClientError, 403, "CachedContent not found (or permission denied)"), True),
+    (_api_error(errors.ClientError, 400, "Invalid cached content name"), True),
+    (_api_error(errors.ClientError, 400, "Request contains an invalid argument"), False),
+    (_api_error(errors.ClientError, 429, "Resource exhausted"), False),
+    (_api_error(errors.ServerError, 503, "The model is overloaded"), False),
+    (TimeoutError("timed out"), False),
+])
+def test_is_cached_content_error(error, expected):
+    assert is_cached_content_error(error) is expected
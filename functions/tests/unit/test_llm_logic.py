@@ -10,8 +10,11 @@ from unittest.mock import MagicMock, patch, ANY
 from datetime import datetime
 from google.genai import types
 
+from gemini_client import reset_gemini_clients
+
 from llm import (
     generate_daily_horoscope,
+    stream_daily_horoscope_response,
     generate_natal_chart_summary,
     select_featured_relationship,
     select_featured_connection
@@ -44,9 +47,11 @@ from astro import (
 @pytest.fixture
 def mock_genai_client():
     """Mock the Google GenAI Client."""
+    reset_gemini_clients()
     with patch("llm.genai.Client") as MockClient:
         client_instance = MockClient.return_value
         yield client_instance
+    reset_gemini_clients()
 
 
 @pytest.fixture
@@ -295,6 +300,69 @@ def test_generate_daily_horoscope_posthog_logging(
         assert mock_capture.call_args.kwargs["generation_type"] == "daily_horoscope"
 
 
+def test_stream_daily_horoscope_response_events(
+    mock_genai_client,
+    sample_user_profile,
+    sample_sun_sign_profile,
+    sample_transit_summary,
+    sample_memory,
+    mock_llm_response_json
+):
+    """Computed data comes before the LLM call, then each field as it completes."""
+    text = json.dumps(mock_llm_response_json)
+    third = len(text) // 3
+    chunks = []
+    for piece in (text[:third], text[third:2 * third], text[2 * third:]):
+        chunk = MagicMock()
+        chunk.text = piece
+        chunk.usage_metadata = None
+        chunks.append(chunk)
+    chunks[-1].usage_metadata = MagicMock()
+    chunks[-1].usage_metadata.model_dump.return_value = {"total_tokens": 100}
+
+    stream_calls = []
+
+    def fake_stream(**kwargs):
+        stream_calls.append(kwargs)
+        return iter(chunks)
+
+    mock_genai_client.models.generate_content_stream.side_effect = fake_stream
+
+    with patch("llm.capture_llm_generation"):
+        events = stream_daily_horoscope_response(
+            date="2025-01-01",
+            user_profile=sample_user_profile,
+            sun_sign_profile=sample_sun_sign_profile,
+            transit_summary=sample_transit_summary,
+            memory=sample_memory,
+            api_key="test_key",
+            posthog_api_key="test_ph_key"
+        )
+        computed = next(events)
+        assert stream_calls == []
+        rest = list(events)
+
+    # Deterministic parts, JSON-ready, interpretations still empty
+    assert computed["type"] == "computed"
+    json.dumps(computed)
+    assert computed["date"] == "2025-01-01"
+    assert computed["astrometers"]["groups"][0]["interpretation"] == ""
+    assert computed["moon_detail"]
+    assert isinstance(computed["upcoming_transits"], list)
+
+    fields = [e for e in rest if e["type"] == "field"]
+    assert [e["field"] for e in fields] == list(mock_llm_response_json)
+    assert fields[2]["value"] == "Happy Birthday"
+    assert fields[4]["value"] == mock_llm_response_json["actionable_advice"]
+
+    assert rest[-1]["type"] == "complete"
+    horoscope = rest[-1]["horoscope"]
+    assert isinstance(horoscope, DailyHoroscope)
+    assert horoscope.daily_theme_headline == "Happy Birthday"
+    assert horoscope.astrometers.groups[0].interpretation == "Mind is clear."
+    assert horoscope.usage == {"total_tokens": 100}
+
+
 # =============================================================================
 # Tests for Selection Logic
 # =============================================================================
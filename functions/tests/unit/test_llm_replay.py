@@ -0,0 +1,184 @@
+"""
+Unit tests for llm_replay.py - recording and replaying Gemini responses.
+"""
+
+import json
+import os
+
+import pytest
+from google.genai import types
+from pydantic import BaseModel
+
+from gemini_client import get_gemini_client, set_gemini_client_factory
+from llm_replay import RecordingGeminiClient, ReplayGeminiClient, call_shape, prompt_key
+from llm_stub import StubGeminiClient
+
+
+class Reading(BaseModel):
+    headline: str
+    score: int
+
+
+SCHEMA_CONFIG = types.GenerateContentConfig(response_mime_type="application/json", response_schema=Reading)
+
+
+def usage(total: int) -> types.GenerateContentResponseUsageMetadata:
+    return types.GenerateContentResponseUsageMetadata(
+        prompt_token_count=total - 1, candidates_token_count=1, total_token_count=total
+    )
+
+
+def text_response(text: str, total: int = 0) -> types.GenerateContentResponse:
+    return types.GenerateContentResponse(
+        candidates=[types.Candidate(content=types.Content(role="model", parts=[types.Part(text=text)]))],
+        usage_metadata=usage(total) if total else None,
+    )
+
+
+class ChunkedModels:
+    """Streams fixed chunks, the last one carrying usage metadata."""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+
+    def generate_content_stream(self, model, contents, config=None):
+        for i, piece in enumerate(self.pieces):
+            yield text_response(piece, total=12 if i == len(self.pieces) - 1 else 0)
+
+
+class ChunkedClient:
+    def __init__(self, pieces):
+        self.models = ChunkedModels(pieces)
+        self.caches = None
+
+
+@pytest.fixture
+def recordings_path(tmp_path):
+    return str(tmp_path / "recordings.jsonl")
+
+
+def load(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestRecording:
+    def test_generate_content_recorded(self, recordings_path):
+        client = RecordingGeminiClient(StubGeminiClient(), recordings_path)
+        response = client.models.generate_content(model="m", contents="prompt", config=SCHEMA_CONFIG)
+
+        [entry] = load(recordings_path)
+        assert entry["shape"] == "generate_content:Reading"
+        assert entry["model"] == "m"
+        assert len(entry["chunks"]) == 1
+        assert "parsed" not in entry["chunks"][0]["response"]
+        assert response.parsed is not None
+
+    def test_stream_recorded_after_last_chunk(self, recordings_path):
+        client = RecordingGeminiClient(ChunkedClient(["Hel", "lo"]), recordings_path)
+        stream = client.models.generate_content_stream(model="m", contents="prompt")
+        assert next(stream).text == "Hel"
+        assert not os.path.exists(recordings_path)
+        assert [c.text for c in stream] == ["lo"]
+
+        [entry] = load(recordings_path)
+        assert entry["shape"] == "generate_content_stream:text"
+        assert [c["at_ms"] >= 0 for c in entry["chunks"]] == [True, True]
+
+
+class TestReplay:
+    def test_replays_schema_response_with_parsed(self, recordings_path):
+        recorder = RecordingGeminiClient(StubGeminiClient(), recordings_path)
+        original = recorder.models.generate_content(model="m", contents="prompt", config=SCHEMA_CONFIG)
+
+        replay = ReplayGeminiClient.load(recordings_path, sleep=lambda s: None)
+        response = replay.models.generate_content(model="m", contents="other prompt", config=SCHEMA_CONFIG)
+
+        assert response.text == original.text
+        assert isinstance(response.parsed, Reading)
+        assert response.parsed == original.parsed
+        assert response.usage_metadata.total_token_count == 0
+
+    def test_replays_stream_chunks_and_usage(self, recordings_path):
+        recorder = RecordingGeminiClient(ChunkedClient(["Hel", "lo", "!"]), recordings_path)
+        list(recorder.models.generate_content_stream(model="m", contents="prompt"))
+
+        replay = ReplayGeminiClient.load(recordings_path, sleep=lambda s: None)
+        chunks = list(replay.models.generate_content_stream(model="m", contents="prompt"))
+
+        assert [c.text for c in chunks] == ["Hel", "lo", "!"]
+        assert chunks[-1].usage_metadata.total_token_count == 12
+
+    def test_exact_prompt_preferred_then_round_robin(self):
+        def recording(key, text):
+            return {
+                "shape": "generate_content:text",
+                "key": key,
+                "model": "m",
+                "chunks": [{"at_ms": 0, "response": text_response(text).model_dump(mode="json", exclude_none=True)}],
+            }
+
+        replay = ReplayGeminiClient(
+            [recording(prompt_key("m", "a"), "A"), recording("other", "B")],
+            sleep=lambda s: None,
+        )
+
+        assert replay.models.generate_content(model="m", contents="a").text == "A"
+        assert [replay.models.generate_content(model="m", contents="x").text for _ in range(3)] == ["A", "B", "A"]
+
+    def test_unknown_shape_raises(self):
+        replay = ReplayGeminiClient([], sleep=lambda s: None)
+        with pytest.raises(LookupError):
+            replay.models.generate_content(model="m", contents="x")
+
+    def test_latency_recorded_scaled_and_fixed(self):
+        entry = {"shape": call_shape("generate_content_stream", None), "key": "k", "chunks": [
+            {"at_ms": 200, "response": {}}, {"at_ms": 1000, "response": {}},
+        ]}
+
+        assert ReplayGeminiClient([entry]).offsets(entry) == [0.2, 1.0]
+        assert ReplayGeminiClient([entry], latency_scale=0.5).offsets(entry) == [0.1, 0.5]
+        assert ReplayGeminiClient([entry], latency_seconds=2.0).offsets(entry) == [0.4, 2.0]
+
+    def test_stream_sleeps_between_chunks(self, recordings_path):
+        with open(recordings_path, "w") as f:
+            f.write(json.dumps({"shape": "generate_content_stream:text", "key": "k", "model": "m", "chunks": [
+                {"at_ms": 300, "response": text_response("a").model_dump(mode="json", exclude_none=True)},
+                {"at_ms": 500, "response": text_response("b").model_dump(mode="json", exclude_none=True)},
+            ]}) + "\n")
+        sleeps = []
+        replay = ReplayGeminiClient.load(recordings_path, sleep=sleeps.append)
+
+        list(replay.models.generate_content_stream(model="m", contents="x"))
+
+        assert sleeps == pytest.approx([0.3, 0.2])
+
+
+class TestBackendSelection:
+    @pytest.fixture(autouse=True)
+    def no_factory(self):
+        set_gemini_client_factory(None)
+        yield
+        set_gemini_client_factory(None)
+
+    def test_stub_backend(self, monkeypatch):
+        monkeypatch.setenv("LLM_BACKEND", "stub")
+        assert isinstance(get_gemini_client("key"), StubGeminiClient)
+
+    def test_replay_backend(self, monkeypatch, recordings_path):
+        RecordingGeminiClient(StubGeminiClient(), recordings_path).models.generate_content(
+            model="m", contents="prompt", config=SCHEMA_CONFIG
+        )
+        monkeypatch.setenv("LLM_BACKEND", "replay")
+        monkeypatch.setenv("LLM_RECORDINGS_PATH", recordings_path)
+        monkeypatch.setenv("LLM_REPLAY_LATENCY_MS", "0")
+
+        client = get_gemini_client("key")
+
+        assert isinstance(client, ReplayGeminiClient)
+        assert client.latency_seconds == 0.0
+
+    def test_unknown_backend_raises(self, monkeypatch):
+        monkeypatch.setenv("LLM_BACKEND", "nope")
+        with pytest.raises(ValueError):
+            get_gemini_client("key")
@@ -285,5 +285,176 @@ def test_create_user_profile_preserves_protected_fields(mock_gen_summary):
     # Verify updatable fields were updated
     assert captured_profile["name"] == "Updated Name"
 
+    # Verify the natal scoring profile is stored next to the regenerated chart
+    from astrometers import usable_scoring_profile
+    assert usable_scoring_profile(
+        captured_profile["scoring_profile"], captured_profile["natal_chart"]
+    ) is not None
+
     # Verify memory was NOT reset (already exists)
     mock_memory_ref.set.assert_not_called()
+
+
+# =============================================================================
+# Daily horoscope pipeline: stage 4 writes
+# =============================================================================
+
+DATE = "2025-10-17"
+CONNECTION = {"connection_id": "c1", "name": "Sam", "vibes": []}
+
+
+@pytest.fixture
+def pipeline(fake_db, monkeypatch):
+    """
+    fake_db seeded with a user and a featured connection, and every stage
+    before the writes (sky, context, LLM) stubbed out.
+
+    Returns a list; set pipeline[0] to a callable to run it while the LLM
+    "generates" (e.g. to simulate a concurrent request).
+    """
+    fake_db.docs["users/u1"] = {
+        "user_id": "u1", "name": "Ada", "email": "ada@example.com",
+        "birth_date": "1990-06-15", "sun_sign": "gemini",
+        "natal_chart": {}, "exact_chart": False,
+        "created_at": "2025-01-01T00:00:00", "last_active": "2025-01-01T00:00:00",
+    }
+    fake_db.docs["users/u1/connections/c1"] = dict(CONNECTION)
+    during_llm = [None]
+
+    horoscope = MagicMock()
+    horoscope.relationship_weather.connection_vibes = [
+        MagicMock(vibe="Easy company today", vibe_score=70, key_transit="Venus trine Moon")
+    ]
+    horoscope.model_dump.return_value = {"date": DATE, "technical_analysis": "..."}
+
+    def generate(**kwargs):
+        if during_llm[0]:
+            during_llm[0]()
+        return horoscope
+
+    compressed = MagicMock()
+    compressed.model_dump.return_value = {"date": DATE}
+
+    # Imported before patching, so none of them binds a stub at import time
+    import astro, astrometers, connections, daily_context, llm, models
+
+    monkeypatch.setattr(main, "_use_shared_sky_cache", lambda: None)
+    monkeypatch.setattr(astro, "get_transit_chart", lambda date: None)
+    monkeypatch.setattr(astro, "format_transit_summary_for_ui", lambda *a, **kw: {})
+    monkeypatch.setattr(astrometers, "shared_day_cache", lambda *a, **kw: None)
+    monkeypatch.setattr(daily_context, "DailyContext", MagicMock())
+    monkeypatch.setattr(connections, "get_connections_for_horoscope", lambda db, uid, limit: [dict(CONNECTION)])
+    monkeypatch.setattr(llm, "select_featured_connection", lambda conns, memory, date: conns[0])
+    monkeypatch.setattr(llm, "update_memory_with_connection_mention", lambda memory, **kw: memory)
+    monkeypatch.setattr(llm, "generate_daily_horoscope", generate)
+    monkeypatch.setattr(models, "compress_horoscope", lambda h: compressed)
+    return during_llm
+
+
+def _run_pipeline(db, **kwargs):
+    events = list(main._daily_horoscope_events(db, "u1", DATE, "gemini-test", **kwargs))
+    assert events[-1]["type"] == "done"
+    return events[-1]["horoscope"]
+
+
+def test_daily_horoscope_writes_in_one_batch(fake_db, pipeline):
+    _run_pipeline(fake_db)
+
+    assert fake_db.commits == 1
+    assert fake_db.docs["users/u1/connections/c1"]["vibes"][0]["vibe"] == "Easy company today"
+    assert fake_db.docs["users/u1"]["last_active"] > "2025-01-01T00:00:00"
+    assert fake_db.docs["memory/u1"]["user_id"] == "u1"
+    assert fake_db.docs["users/u1/horoscopes/latest"]["horoscopes"] == {DATE: {"date": DATE}}
+
+    cached = fake_db.docs[f"users/u1/daily_horoscopes/{DATE}"]
+    assert cached["horoscope"] == {"date": DATE, "technical_analysis": "..."}
+    assert "stage_timings_ms" not in cached["horoscope"]
+
+
+def test_daily_horoscope_commits_rest_when_connection_deleted(fake_db, pipeline):
+    pipeline[0] = lambda: fake_db.docs.pop("users/u1/connections/c1")
+
+    _run_pipeline(fake_db)
+
+    assert fake_db.commits == 1
+    assert "users/u1/connections/c1" not in fake_db.docs
+    assert f"users/u1/daily_horoscopes/{DATE}" in fake_db.docs
+    assert DATE in fake_db.docs["users/u1/horoscopes/latest"]["horoscopes"]
+
+
+def test_reading_generated_across_an_invalidation_is_not_served(fake_db, pipeline):
+    from horoscope_cache import get_cached_horoscope, invalidate_cached_horoscopes
+
+    # The birth data changes while the LLM is generating from the old chart
+    pipeline[0] = lambda: invalidate_cached_horoscopes(fake_db, "u1")
+
+    _run_pipeline(fake_db)
+
+    assert f"users/u1/daily_horoscopes/{DATE}" in fake_db.docs
+    assert get_cached_horoscope(fake_db, "u1", DATE) is None
+
+    pipeline[0] = None
+    _run_pipeline(fake_db)
+
+    assert get_cached_horoscope(fake_db, "u1", DATE) == {"date": DATE, "technical_analysis": "..."}
+
+
+def test_daily_horoscope_keeps_concurrent_dates_and_trims_to_ten(fake_db, pipeline):
+    old_dates = [f"2025-10-{day:02d}" for day in range(5, 15)]
+    fake_db.docs["users/u1/horoscopes/latest"] = {
+        "user_id": "u1",
+        "horoscopes": {d: {"date": d} for d in old_dates},
+        "updated_at": "2025-10-14T08:00:00",
+    }
+
+    def concurrent_generation():
+        # Another request stores 2025-10-16 after this one read the document
+        fake_db.docs["users/u1/horoscopes/latest"]["horoscopes"]["2025-10-16"] = {"date": "2025-10-16"}
+
+    pipeline[0] = concurrent_generation
+
+    _run_pipeline(fake_db)
+
+    stored = fake_db.docs["users/u1/horoscopes/latest"]["horoscopes"]
+    assert DATE in stored
+    assert "2025-10-16" in stored
+    assert "2025-10-05" not in stored  # Oldest of the 10 read in stage 1
+    assert len(stored) == 11  # Trimmed back to 10 by the next generation
+
+
+def test_pregenerated_reading_defers_writes_until_served(fake_db, pipeline):
+    from horoscope_cache import get_cached_entry
+
+    _run_pipeline(fake_db, defer_writes=True)
+
+    # Only the cache entry: nothing about tomorrow is visible today
+    assert fake_db.writes == [f"users/u1/daily_horoscopes/{DATE}"]
+    assert fake_db.docs["users/u1/connections/c1"]["vibes"] == []
+    assert "memory/u1" not in fake_db.docs
+    assert "users/u1/horoscopes/latest" not in fake_db.docs
+    assert fake_db.docs["users/u1"]["last_active"] == "2025-01-01T00:00:00"
+
+    entry = get_cached_entry(fake_db, "u1", DATE)
+    main._serve_stored_reading(fake_db, "u1", DATE, entry)
+
+    assert fake_db.docs["users/u1/connections/c1"]["vibes"][0]["vibe"] == "Easy company today"
+    assert fake_db.docs["memory/u1"]["user_id"] == "u1"
+    assert fake_db.docs["users/u1/horoscopes/latest"]["horoscopes"] == {DATE: {"date": DATE}}
+    assert fake_db.docs["users/u1"]["last_active"] > "2025-01-01T00:00:00"
+    assert "deferred" not in fake_db.docs[f"users/u1/daily_horoscopes/{DATE}"]
+
+    # A concurrent request that read the entry before it was applied
+    main._serve_stored_reading(fake_db, "u1", DATE, entry)
+    assert fake_db.writes.count("memory/u1") == 1
+
+
+def test_deferred_writes_skip_a_deleted_connection(fake_db, pipeline):
+    from horoscope_cache import get_cached_entry
+
+    _run_pipeline(fake_db, defer_writes=True)
+    del fake_db.docs["users/u1/connections/c1"]
+
+    main._serve_stored_reading(fake_db, "u1", DATE, get_cached_entry(fake_db, "u1", DATE))
+
+    assert "users/u1/connections/c1" not in fake_db.docs
+    assert DATE in fake_db.docs["users/u1/horoscopes/latest"]["horoscopes"]
@@ -0,0 +1,24 @@
+"""
+Unit tests for the POSTHOG_DISABLED switch in posthog_utils.
+"""
+
+import pytest
+
+from posthog_utils import posthog_disabled
+
+
+@pytest.mark.parametrize("value", ["1", "true", "TRUE", " yes ", "on"])
+def test_true_values_disable_capture(monkeypatch, value):
+    monkeypatch.setenv("POSTHOG_DISABLED", value)
+    assert posthog_disabled()
+
+
+@pytest.mark.parametrize("value", ["0", "false", "False", "no", "off", ""])
+def test_false_values_keep_capture(monkeypatch, value):
+    monkeypatch.setenv("POSTHOG_DISABLED", value)
+    assert not posthog_disabled()
+
+
+def test_unset_keeps_capture(monkeypatch):
+    monkeypatch.delenv("POSTHOG_DISABLED", raising=False)
+    assert not posthog_disabled()
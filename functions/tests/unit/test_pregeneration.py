@@ -0,0 +1,193 @@
+"""
+Unit tests for pre-generation scheduling helpers.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from llm_stub import RECENT_CALLS, StubGeminiClient, stub_instance
+from models import ActionableAdvice
+from google.api_core import exceptions as api_exceptions
+from google.genai import errors as genai_errors
+
+from pregeneration import (
+    _with_retry,
+    due_timezones,
+    is_transient_error,
+    iter_active_users,
+    pregenerate_for_active_users,
+    pregeneration_date,
+    user_shard,
+)
+
+
+NOW = datetime(2025, 10, 18, 6, 30, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("tz_name,expected", [
+    ("America/Los_Angeles", "2025-10-18"),   # 23:30 local on the 17th
+    ("Asia/Tokyo", None),                    # 15:30 local
+    (None, None),                            # 06:30 UTC
+    ("Not/AZone", None),                     # Unknown -> UTC
+])
+def test_pregeneration_date(tz_name, expected):
+    assert pregeneration_date(NOW, tz_name) == expected
+
+
+def test_pregeneration_date_utc_user():
+    assert pregeneration_date(datetime(2025, 12, 31, 23, 5, tzinfo=timezone.utc), None) == "2026-01-01"
+
+
+def test_user_shard_is_stable_and_spread():
+    shards = [user_shard(f"user_{i}", 4) for i in range(400)]
+    assert shards == [user_shard(f"user_{i}", 4) for i in range(400)]
+    assert set(shards) == {0, 1, 2, 3}
+
+
+def test_due_timezones():
+    zones = due_timezones(NOW)
+    assert "America/Los_Angeles" in zones
+    assert "Asia/Tokyo" not in zones
+    assert "UTC" not in zones
+
+
+def _seed_users(db, timezones):
+    for i, tz_name in enumerate(timezones):
+        data = {"last_active": f"2025-10-17T12:00:{i:02d}"}
+        if tz_name:
+            data["device_timezone"] = tz_name
+        db.docs[f"users/u{i}"] = data
+
+
+def test_only_users_in_due_timezones_are_read(fake_db):
+    _seed_users(fake_db, ["America/Los_Angeles", "Asia/Tokyo", None, "America/Vancouver"])
+    generated = []
+
+    result = pregenerate_for_active_users(
+        fake_db, lambda user_id, date: generated.append((user_id, date)), now=NOW
+    )
+
+    assert result.considered == 2
+    assert sorted(generated) == [("u0", "2025-10-18"), ("u3", "2025-10-18")]
+
+
+def test_active_users_are_paged_per_timezone_chunk(fake_db):
+    _seed_users(fake_db, ["America/Los_Angeles", "Asia/Tokyo", "America/Vancouver", "Europe/Paris"])
+    since = datetime(2025, 10, 10, tzinfo=timezone.utc)
+    timezones = ["America/Los_Angeles", "America/Vancouver"] + [f"Etc/Zone{i}" for i in range(40)] + ["Europe/Paris"]
+
+    users = iter_active_users(fake_db, since, timezones=timezones, page_size=1)
+
+    assert sorted(user_id for user_id, _ in users) == ["u0", "u2", "u3"]
+
+
+def test_users_without_timezone_are_read_in_the_utc_hour(fake_db):
+    _seed_users(fake_db, [None, "Asia/Tokyo"])
+    generated = []
+
+    pregenerate_for_active_users(
+        fake_db, lambda user_id, date: generated.append((user_id, date)),
+        now=datetime(2025, 10, 17, 23, 10, tzinfo=timezone.utc),
+    )
+
+    assert generated == [("u0", "2025-10-18")]
+
+
+def test_time_budget_reports_users_not_started(fake_db):
+    _seed_users(fake_db, ["America/Los_Angeles"] * 4)
+    clock = [0.0]
+
+    def generate(user_id, date):
+        clock[0] += 10
+
+    result = pregenerate_for_active_users(
+        fake_db, generate, now=NOW, concurrency=1, time_budget_seconds=15, clock=lambda: clock[0]
+    )
+
+    assert [user_id for user_id, _ in result.generated] == ["u0", "u1"]
+    assert [user_id for user_id, _ in result.remaining] == ["u2", "u3"]
+    assert result.failed == []
+
+
+def test_retry_backs_off_then_succeeds():
+    calls, sleeps = [], []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise api_exceptions.ServiceUnavailable("503")
+
+    _with_retry(flaky, max_attempts=3, base_delay=2.0, sleep=sleeps.append)
+    assert len(calls) == 3
+    assert sleeps == [2.0, 4.0]
+
+
+def test_retry_gives_up():
+    with pytest.raises(api_exceptions.DeadlineExceeded):
+        _with_retry(lambda: (_ for _ in ()).throw(api_exceptions.DeadlineExceeded("timeout")), 2, 0.0, lambda s: None)
+
+
+def test_permanent_errors_are_not_retried():
+    calls = []
+
+    def missing():
+        calls.append(1)
+        raise api_exceptions.NotFound("no user")
+
+    with pytest.raises(api_exceptions.NotFound):
+        _with_retry(missing, max_attempts=3, base_delay=0.0, sleep=lambda s: None)
+    assert len(calls) == 1
+
+
+def _genai_error(cls, code):
+    return cls(code, {"error": {"code": code, "message": "", "status": ""}})
+
+
+def _wrapped(error):
+    """As generate_daily_horoscope re-raises Gemini errors."""
+    try:
+        raise error
+    except Exception as e:
+        try:
+            raise RuntimeError(f"Error generating daily horoscope: {e}")
+        except RuntimeError as wrapped:
+            return wrapped
+
+
+@pytest.mark.parametrize("error,expected", [
+    (api_exceptions.ResourceExhausted("quota"), True),
+    (api_exceptions.InvalidArgument("bad"), False),
+    (api_exceptions.NotFound("gone"), False),
+    (_wrapped(_genai_error(genai_errors.ClientError, 429)), True),
+    (_wrapped(_genai_error(genai_errors.ServerError, 503)), True),
+    (_wrapped(_genai_error(genai_errors.ClientError, 400)), False),
+    (ValueError("bad date"), False),
+])
+def test_is_transient_error(error, expected):
+    assert is_transient_error(error) is expected
+
+
+def test_stub_client_fills_response_schema():
+    from google.genai import types
+
+    client = StubGeminiClient()
+    response = client.models.generate_content(
+        model="gemini-2.5-flash-lite",
+        contents="prompt",
+        config=types.GenerateContentConfig(response_schema=ActionableAdvice)
+    )
+
+    assert isinstance(response.parsed, ActionableAdvice)
+    assert response.parsed == stub_instance(ActionableAdvice)
+    assert client.calls[0]["contents"] == "prompt"
+
+
+def test_stub_client_keeps_only_recent_calls():
+    client = StubGeminiClient()
+    for i in range(RECENT_CALLS + 5):
+        client.models.generate_content(model="gemini-2.5-flash-lite", contents=f"prompt {i}")
+
+    assert client.call_count == RECENT_CALLS + 5
+    assert len(client.calls) == RECENT_CALLS
+    assert client.calls[0]["contents"] == "prompt 5"
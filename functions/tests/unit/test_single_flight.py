@@ -0,0 +1,152 @@
+"""
+Unit tests for in-instance single-flight coalescing (no Firestore) and
+lease renewal (in-memory Firestore).
+
+Lease behaviour across instances is covered against the emulator in
+tests/e2e/test_12_single_flight.py.
+"""
+
+import threading
+import time
+
+from single_flight import (
+    FUNCTION_TIMEOUT_SECONDS,
+    LEASE_HEARTBEAT_SECONDS,
+    LEASE_TTL_SECONDS,
+    WAIT_TIMEOUT_SECONDS,
+    SingleFlight,
+)
+
+
+def test_concurrent_callers_compute_once():
+    sf = SingleFlight()
+    store = {}
+    computes = []
+
+    def compute():
+        computes.append(1)
+        time.sleep(0.2)
+        store["result"] = "reading"
+        return "reading"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(sf.run(None, "k", compute, lambda: store.get("result"))))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert computes == [1]
+    assert results == ["reading"] * 5
+
+
+def test_stored_result_skips_compute():
+    sf = SingleFlight()
+    assert sf.run(None, "k", lambda: "fresh", lambda: "stored") == "stored"
+
+
+def test_different_keys_do_not_block():
+    sf = SingleFlight()
+    assert sf.run(None, "a", lambda: "a", lambda: None) == "a"
+    assert sf.run(None, "b", lambda: "b", lambda: None) == "b"
+    assert sf._key_locks == {}
+
+
+def test_concurrent_streams_compute_once():
+    sf = SingleFlight()
+    store = {}
+    computes = []
+
+    def compute():
+        computes.append(1)
+        yield "computed"
+        time.sleep(0.2)
+        store["result"] = "reading"
+        yield "done"
+
+    def lookup():
+        return ["stored"] if "result" in store else None
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(list(sf.stream(None, "k", compute, lookup))))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert computes == [1]
+    assert sorted(results) == [["computed", "done"]] + [["stored"]] * 4
+
+
+def test_closed_stream_releases_key():
+    sf = SingleFlight()
+    events = sf.stream(None, "k", lambda: iter(["computed", "done"]), lambda: None)
+    assert next(events) == "computed"
+    assert "k" in sf._key_locks
+    events.close()
+    assert sf._key_locks == {}
+
+
+def test_unavailable_leases_fall_back_to_compute():
+    class Broken:
+        def collection(self, name):
+            raise RuntimeError("unavailable")
+
+        def transaction(self):
+            raise RuntimeError("unavailable")
+
+    assert SingleFlight().run(Broken(), "k", lambda: "computed", lambda: None) == "computed"
+
+
+def test_owner_renews_lease_while_computing(fake_db):
+    sf = SingleFlight(lease_ttl_seconds=0.2, heartbeat_seconds=0.02)
+    follower = SingleFlight(lease_ttl_seconds=0.2, heartbeat_seconds=0.02)
+
+    def compute():
+        # Outlive the original lease; a follower must still see it held
+        time.sleep(0.5)
+        assert follower._lease_active(fake_db, "k")
+        return "reading"
+
+    assert sf.run(fake_db, "k", compute, lambda: None) == "reading"
+    assert "leases/k" not in fake_db.docs
+
+
+def test_renewal_stops_after_max_hold(fake_db):
+    sf = SingleFlight(lease_ttl_seconds=0.1, heartbeat_seconds=0.02, max_hold_seconds=0.1)
+    follower = SingleFlight()
+
+    def compute():
+        time.sleep(0.4)
+        return follower._lease_active(fake_db, "k")
+
+    assert sf.run(fake_db, "k", compute, lambda: None) is False
+
+
+def test_renewal_stops_once_lease_is_taken_over(fake_db):
+    sf = SingleFlight(lease_ttl_seconds=0.2, heartbeat_seconds=0.02)
+
+    def compute():
+        fake_db.docs["leases/k"]["owner"] = "someone-else"
+        time.sleep(0.1)
+        return fake_db.docs["leases/k"]["owner"]
+
+    assert sf.run(fake_db, "k", compute, lambda: None) == "someone-else"
+    assert fake_db.docs["leases/k"]["owner"] == "someone-else"
+
+
+def test_lease_timings_fit_the_function_timeout():
+    import main
+
+    assert main.get_daily_horoscope.__firebase_endpoint__.timeoutSeconds == FUNCTION_TIMEOUT_SECONDS
+    assert main.get_daily_horoscope_stream.__firebase_endpoint__.timeoutSeconds == FUNCTION_TIMEOUT_SECONDS
+    # A follower can outwait a crashed owner's lease and still generate itself
+    assert LEASE_TTL_SECONDS < WAIT_TIMEOUT_SECONDS < FUNCTION_TIMEOUT_SECONDS
+    assert LEASE_HEARTBEAT_SECONDS < LEASE_TTL_SECONDS / 2
+    assert FUNCTION_TIMEOUT_SECONDS - WAIT_TIMEOUT_SECONDS >= 20
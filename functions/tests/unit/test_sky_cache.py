@@ -0,0 +1,196 @@
+"""
+Unit tests for the shared per-date transit chart (sky) cache.
+"""
+
+import pytest
+
+import astro
+from astro import (
+    SkyCache,
+    SkyStore,
+    FileSkyStore,
+    FirestoreSkyStore,
+    SKY_CACHE_VERSION,
+    compute_birth_chart,
+    get_transit_chart,
+    get_transit_chart_data,
+    clear_sky_cache,
+    NatalChartData,
+)
+
+
+class CountingStore(SkyStore):
+    """In-memory store that records traffic."""
+
+    def __init__(self):
+        self.data = {}
+        self.gets = 0
+        self.puts = 0
+
+    def get(self, date):
+        self.gets += 1
+        return self.data.get(date)
+
+    def put(self, date, chart):
+        self.puts += 1
+        self.data[date] = chart
+
+
+@pytest.fixture(autouse=True)
+def reset_sky_cache():
+    clear_sky_cache()
+    yield
+    clear_sky_cache()
+
+
+@pytest.fixture
+def count_computes(monkeypatch):
+    """Count calls to compute_birth_chart made by the sky cache."""
+    calls = []
+    real = astro.compute_birth_chart
+
+    def counting(*args, **kwargs):
+        calls.append((args, kwargs))
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(astro, "compute_birth_chart", counting)
+    return calls
+
+
+def test_matches_compute_birth_chart():
+    """Cached chart is identical to a direct noon transit computation."""
+    expected, _ = compute_birth_chart("2025-10-17", birth_time="12:00")
+    assert get_transit_chart("2025-10-17") == expected
+
+
+def test_same_date_is_computed_once(count_computes):
+    first = get_transit_chart("2025-10-17")
+    second = get_transit_chart("2025-10-17")
+
+    assert first is second
+    assert len(count_computes) == 1
+
+
+def test_chart_data_model_is_shared():
+    model = get_transit_chart_data("2025-10-17")
+
+    assert isinstance(model, NatalChartData)
+    assert model is get_transit_chart_data("2025-10-17")
+
+
+def test_invalid_date_raises():
+    with pytest.raises(ValueError):
+        get_transit_chart("2025-13-45")
+
+
+def test_lru_eviction(count_computes):
+    cache = SkyCache(maxsize=2)
+    cache.get_chart("2025-01-01")
+    cache.get_chart("2025-01-02")
+    cache.get_chart("2025-01-01")  # Refresh -> 01-02 is now least recent
+    cache.get_chart("2025-01-03")  # Evicts 01-02
+
+    assert len(count_computes) == 3
+    cache.get_chart("2025-01-01")
+    assert len(count_computes) == 3
+    cache.get_chart("2025-01-02")
+    assert len(count_computes) == 4
+
+
+def test_store_hit_skips_compute(count_computes):
+    store = CountingStore()
+    SkyCache(store=store).get_chart("2025-01-01")
+    assert store.puts == 1
+    assert len(count_computes) == 1
+
+    # A fresh instance (e.g. another Cloud Functions container) reads the store
+    other = SkyCache(store=store)
+    chart = other.get_chart("2025-01-01")
+
+    assert chart == store.data["2025-01-01"]
+    assert other.store_hits == 1
+    assert len(count_computes) == 1
+
+
+def test_file_store_round_trip(tmp_path):
+    store = FileSkyStore(tmp_path)
+    assert store.get("2025-01-01") is None
+
+    chart = {"planets": [], "chart_type": "natal"}
+    store.put("2025-01-01", chart)
+
+    assert store.get("2025-01-01") == chart
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_file_store_ignores_corrupt_file(tmp_path):
+    store = FileSkyStore(tmp_path)
+    store._path("2025-01-01").write_text("{not json")
+
+    assert store.get("2025-01-01") is None
+
+
+class _FakeDoc:
+    def __init__(self, data):
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return self._data
+
+
+class _FakeFirestore:
+    def __init__(self):
+        self.docs = {}
+
+    def collection(self, name):
+        return self
+
+    def document(self, doc_id):
+        outer = self
+
+        class _Ref:
+            def get(self):
+                return _FakeDoc(outer.docs.get(doc_id))
+
+            def set(self, data):
+                outer.docs[doc_id] = data
+
+        return _Ref()
+
+
+def test_firestore_store_round_trip():
+    db = _FakeFirestore()
+    store = FirestoreSkyStore(lambda: db)
+    chart = {"planets": [], "chart_type": "natal"}
+
+    store.put("2025-01-01", chart)
+
+    assert db.docs["2025-01-01"]["version"] == SKY_CACHE_VERSION
+    assert store.get("2025-01-01") == chart
+
+
+def test_firestore_store_rejects_stale_version():
+    db = _FakeFirestore()
+    db.docs["2025-01-01"] = {"version": SKY_CACHE_VERSION - 1, "chart": {"planets": []}}
+
+    assert FirestoreSkyStore(lambda: db).get("2025-01-01") is None
+
+
+def test_firestore_store_swallows_errors():
+    def broken():
+        raise RuntimeError("unavailable")
+
+    store = FirestoreSkyStore(broken)
+
+    assert store.get("2025-01-01") is None
+    store.put("2025-01-01", {})  # Must not raise
+
+
+def test_sky_store_is_abstract():
+    class GetOnly(SkyStore):
+        def get(self, date):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
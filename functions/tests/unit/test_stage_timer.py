@@ -0,0 +1,49 @@
+"""
+Unit tests for StageTimer.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from stage_timer import StageTimer
+
+
+def test_sequential_and_concurrent_stages():
+    timer = StageTimer()
+    with timer.stage("reads"):
+        time.sleep(0.02)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        with timer.stage("compute"):
+            slow = pool.submit(timer.timed("synastry", time.sleep), 0.05)
+            timer.timed("context", time.sleep)(0.01)
+            slow.result()
+
+    timings = timer.finish()
+
+    assert set(timings) == {"reads", "compute", "synastry", "context", "total"}
+    assert timings["reads"] >= 20
+    # The slower parallel branch is the critical path of the stage
+    assert timings["compute"] >= timings["synastry"] >= 50 > timings["context"]
+    assert timings["total"] >= timings["reads"] + timings["compute"]
+
+
+def test_stage_recorded_on_error():
+    timer = StageTimer()
+    try:
+        with timer.stage("llm"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert "llm" in timer.timings_ms
+
+
+def test_mark_measures_from_start():
+    timer = StageTimer()
+    time.sleep(0.02)
+    with timer.stage("reads"):
+        time.sleep(0.01)
+    timer.mark("first_chunk")
+    timings = timer.finish()
+    assert timings["first_chunk"] >= 30 > timings["reads"]
+    assert timings["total"] >= timings["first_chunk"]
@@ -7,58 +7,62 @@ Background processing for entity extraction and updates.
 from datetime import datetime
 from firebase_functions import firestore_fn, params
 from firebase_admin import firestore
-from google import genai
-
-from models import (
-    Conversation,
-    UserEntities,
-    MessageRole
-)
-from entity_extraction import (
-    extract_entities_from_message,
-    merge_entities_with_existing,
-    execute_merge_actions,
-    route_people_to_connections
-)
 
 # Import shared secrets (centralized to avoid duplicate declarations)
 from firebase_secrets import GEMINI_API_KEY, POSTHOG_API_KEY
 
+# Extraction costs two Gemini calls per user message. While messages were
+# stored inline, the trigger only ever saw a turn ending in the assistant
+# reply and skipped it, so extraction effectively never ran; it stays off
+# until enabled (ENTITY_EXTRACTION_ENABLED=true in functions/.env).
+ENTITY_EXTRACTION_ENABLED = params.BoolParam(
+    "ENTITY_EXTRACTION_ENABLED",
+    default=False,
+    description="Extract entities from Ask the Stars user messages (2 Gemini calls per message)",
+)
+
 
-@firestore_fn.on_document_written(
-    document="conversations/{conversationId}",
+@firestore_fn.on_document_created(
+    document="conversations/{conversationId}/messages/{messageId}",
     memory=512,  # Entity extraction uses LLM
     secrets=[GEMINI_API_KEY, POSTHOG_API_KEY]
 )
 def extract_entities_on_message(
-    event: firestore_fn.Event[firestore_fn.Change[firestore_fn.DocumentSnapshot] | None]
+    event: firestore_fn.Event[firestore_fn.DocumentSnapshot | None]
 ) -> None:
     """
-    Background trigger: Extract and merge entities when conversation is updated.
+    Background trigger: Extract and merge entities when a message is added.
 
-    Fires when a conversation document is created or updated.
-    Extracts entities from the latest user message only (skips assistant messages).
+    Fires once per message appended to a conversation (conversation_store).
+    Extracts entities from user messages only (skips assistant messages),
+    and only when ENTITY_EXTRACTION_ENABLED is set.
 
     This runs asynchronously after the user receives their response - no user latency.
     """
-    if not event.data or not event.data.after:
-        return
+    from models import Conversation, Message, MessageRole
 
-    conv_data = event.data.after.to_dict()
-    if not conv_data:
+    if not ENTITY_EXTRACTION_ENABLED.value:
         return
 
-    conversation = Conversation(**conv_data)
+    if not event.data:
+        return
 
-    if not conversation.messages:
+    message_data = event.data.to_dict()
+    if not message_data:
         return
 
-    latest_message = conversation.messages[-1]
+    latest_message = Message(**message_data)
 
     # Skip if assistant message (only process user messages)
     if latest_message.role != MessageRole.USER:
         return
 
+    # Written in the same transaction as the message
+    conv_doc = event.data.reference.parent.parent.get()
+    if not conv_doc.exists:
+        return
+    conversation = Conversation(**conv_doc.to_dict())
+
     # Run entity extraction (sync function)
     _extract_and_merge_entities(
         user_id=conversation.user_id,
@@ -80,22 +84,24 @@ def _extract_and_merge_entities(
     Extract entities from message and merge with existing.
 
     Note: Both extract_entities_from_message and merge_entities_with_existing
-    are synchronous functions. extract_entities_from_message creates its own
-    client internally using api_key, while merge_entities_with_existing takes
+    are synchronous functions. extract_entities_from_message gets the shared
+    client for api_key, while merge_entities_with_existing takes
     a gemini_client parameter.
     """
-    client = genai.Client(api_key=gemini_api_key)
-    db = firestore.client()
+    from entity_extraction import (
+        execute_merge_actions,
+        extract_entities_from_message,
+        merge_entities_with_existing,
+        route_people_to_connections,
+    )
+    from gemini_client import get_gemini_client
+    from entity_store import diff_entities, load_entities, save_entity_changes
 
-    # Fetch existing entities (1 read)
-    entities_ref = db.collection('users').document(user_id).collection('entities').document('all')
-    entities_doc = entities_ref.get()
+    client = get_gemini_client(gemini_api_key)
+    db = firestore.client()
 
-    if entities_doc.exists:
-        user_entities = UserEntities(**entities_doc.to_dict())
-        existing_entities = user_entities.entities
-    else:
-        existing_entities = []
+    # Fetch existing entities (1 query over the entity shards)
+    existing_entities = load_entities(db, user_id)
 
     # LLM CALL 1: Extract entities (with PostHog tracking)
     # extract_entities_from_message is SYNC and takes api_key (not gemini_client)
@@ -149,12 +155,9 @@ def _extract_and_merge_entities(
         context_date=horoscope_date
     )
 
-    # Update entities document (1 write) - only non-person or unmatched entities
-    entities_ref.set({
-        'user_id': user_id,
-        'entities': [e.model_dump() for e in filtered_entities],
-        'updated_at': datetime.now().isoformat()
-    })
+    # Write only the entities that changed - routed people leave the entity bank
+    changed, removed = diff_entities(existing_entities, filtered_entities)
+    save_entity_changes(db, user_id, changed, removed)
 
     # Update Connection.arca_notes for matched people
     for update in connection_updates: